@@ -17,7 +17,7 @@ from metricflow.engine.metricflow_engine import (
 )
 from metricflow.engine.models import Dimension, Metric
 from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
-from metricflow.protocols.sql_client import SqlClient
+from metricflow.protocols.sql_client import AsyncSqlClient, SqlClient
 from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
 
 logger = logging.getLogger(__name__)
@@ -30,12 +30,14 @@ class MetricFlowClient:
         self,
         sql_client: SqlClient,
         semantic_manifest: SemanticManifest,
+        async_sql_client: Optional[AsyncSqlClient] = None,
     ):
         """Initializer for MetricFlowClient.
 
         Args:
             sql_client: Client that is connected to your data warehouse.
             semantic_manifest: Model containing all the information about your metric configs.
+            async_sql_client: If specified, used by aquery() to run queries without blocking the event loop.
         """
         self.sql_client = sql_client
         self.semantic_manifest = semantic_manifest
@@ -43,6 +45,7 @@ class MetricFlowClient:
         self.engine = MetricFlowEngine(
             semantic_manifest_lookup=self.semantic_manifest_lookup,
             sql_client=self.sql_client,
+            async_sql_client=async_sql_client,
         )
 
     def _create_mf_request(
@@ -155,6 +158,58 @@ class MetricFlowClient:
         )
         return self.engine.explain(mf_request=mf_request)
 
+    async def aquery(
+        self,
+        metrics: List[str],
+        dimensions: List[str] = [],
+        limit: Optional[int] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        where: Optional[str] = None,
+        order: Optional[List[str]] = None,
+        as_table: Optional[str] = None,
+        sql_optimization_level: int = 4,
+    ) -> MetricFlowQueryResult:
+        """Async version of query() that doesn't block the event loop. Accepts the same arguments as query()."""
+        mf_request = self._create_mf_request(
+            metrics=metrics,
+            dimensions=dimensions,
+            limit=limit,
+            start_time=start_time,
+            end_time=end_time,
+            where=where,
+            order=order,
+            as_table=as_table,
+            sql_optimization_level=sql_optimization_level,
+        )
+        return await self.engine.aquery(mf_request=mf_request)
+
+    async def aexplain(
+        self,
+        metrics: List[str],
+        dimensions: List[str] = [],
+        limit: Optional[int] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        where: Optional[str] = None,
+        order: Optional[List[str]] = None,
+        as_table: Optional[str] = None,
+        sql_optimization_level: int = 4,
+    ) -> MetricFlowExplainResult:
+        """Async version of explain() that doesn't block the event loop. Accepts the same arguments as explain()."""
+        mf_request = self._create_mf_request(
+            metrics=metrics,
+            dimensions=dimensions,
+            limit=limit,
+            start_time=start_time,
+            end_time=end_time,
+            where=where,
+            order=order,
+            as_table=as_table,
+            sql_optimization_level=sql_optimization_level,
+        )
+        return await self.engine.aexplain(mf_request=mf_request)
+
     def list_metrics(self) -> Dict[str, Metric]:
         """Retrieves a list of metric names.
 
@@ -11,6 +11,7 @@ from metricflow.cli.dbt_connectors.adapter_backed_client import AdapterBackedSql
 from metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts, dbtProjectMetadata
 from metricflow.engine.metricflow_engine import MetricFlowEngine
 from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.model.semantic_manifest_lookup_cache import SemanticManifestLookupCache
 from metricflow.protocols.sql_client import SqlClient
 
 logger = logging.getLogger(__name__)
@@ -131,8 +132,18 @@ class CLIContext:
         return self._mf
 
     def _build_semantic_manifest_lookup(self) -> None:
-        """Get the path to the models and create a corresponding SemanticManifestLookup."""
-        self._semantic_manifest_lookup = SemanticManifestLookup(self.semantic_manifest)
+        """Get the path to the models and create a corresponding SemanticManifestLookup.
+
+        The derived indexes are persisted in the dbt target directory so that later invocations don't rebuild them.
+        """
+        cache_directory = pathlib.Path(
+            self._dbt_project_metadata.project_path,
+            self._dbt_project_metadata.dbt_paths.target_path,
+            "metricflow_cache",
+        )
+        self._semantic_manifest_lookup = SemanticManifestLookupCache(str(cache_directory)).load_or_create_lookup(
+            self.semantic_manifest
+        )
 
     @property
     def semantic_manifest_lookup(self) -> SemanticManifestLookup:  # noqa: D
@@ -2,18 +2,23 @@ from __future__ import annotations
 
 import enum
 import logging
+import textwrap
 import time
+from typing import TYPE_CHECKING, Generator, Optional, Sequence, Tuple
 
 import pandas as pd
 from dbt.adapters.base.impl import BaseAdapter
+from dbt.adapters.sql import SQLConnectionManager
+from dbt.clients.agate_helper import table_from_data_flat
 from dbt.exceptions import DbtDatabaseError
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 
-from metricflow.errors.errors import SqlBindParametersNotSupportedError
+from metricflow.dataflow.sql_table import SqlTable
 from metricflow.mf_logging.formatting import indent
 from metricflow.mf_logging.pretty_print import mf_pformat
 from metricflow.protocols.sql_client import SqlEngine
 from metricflow.random_id import random_id
+from metricflow.sql.dry_run_batching import DEFAULT_DRY_RUN_BATCH_SIZE, dry_run_in_batches
 from metricflow.sql.render.big_query import BigQuerySqlQueryPlanRenderer
 from metricflow.sql.render.databricks import DatabricksSqlQueryPlanRenderer
 from metricflow.sql.render.duckdb_renderer import DuckDbSqlQueryPlanRenderer
@@ -23,9 +28,13 @@ from metricflow.sql.render.snowflake import SnowflakeSqlQueryPlanRenderer
 from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
 from metricflow.sql.render.trino import TrinoSqlQueryPlanRenderer
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql.sql_parameterization import substitute_bind_parameters
 from metricflow.sql_request.sql_request_attributes import SqlJsonTag, SqlRequestId, SqlRequestTagSet
 from metricflow.sql_request.sql_statement_metadata import CombinedSqlTags, SqlStatementCommentMetadata
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,26 +74,30 @@ class SupportedAdapterTypes(enum.Enum):
         else:
             assert_values_exhausted(self)
 
-    @property
-    def sql_query_plan_renderer(self) -> SqlQueryPlanRenderer:
-        """Return the SqlQueryPlanRenderer corresponding to the supported adapter type."""
+    def create_sql_query_plan_renderer(self, render_shared_sub_queries_as_ctes: bool = False) -> SqlQueryPlanRenderer:
+        """Return a new SqlQueryPlanRenderer corresponding to the supported adapter type."""
         if self is SupportedAdapterTypes.BIGQUERY:
-            return BigQuerySqlQueryPlanRenderer()
+            return BigQuerySqlQueryPlanRenderer(render_shared_sub_queries_as_ctes=render_shared_sub_queries_as_ctes)
         elif self is SupportedAdapterTypes.DATABRICKS:
-            return DatabricksSqlQueryPlanRenderer()
+            return DatabricksSqlQueryPlanRenderer(render_shared_sub_queries_as_ctes=render_shared_sub_queries_as_ctes)
         elif self is SupportedAdapterTypes.POSTGRES:
-            return PostgresSQLSqlQueryPlanRenderer()
+            return PostgresSQLSqlQueryPlanRenderer(render_shared_sub_queries_as_ctes=render_shared_sub_queries_as_ctes)
         elif self is SupportedAdapterTypes.REDSHIFT:
-            return RedshiftSqlQueryPlanRenderer()
+            return RedshiftSqlQueryPlanRenderer(render_shared_sub_queries_as_ctes=render_shared_sub_queries_as_ctes)
         elif self is SupportedAdapterTypes.SNOWFLAKE:
-            return SnowflakeSqlQueryPlanRenderer()
+            return SnowflakeSqlQueryPlanRenderer(render_shared_sub_queries_as_ctes=render_shared_sub_queries_as_ctes)
         elif self is SupportedAdapterTypes.DUCKDB:
-            return DuckDbSqlQueryPlanRenderer()
+            return DuckDbSqlQueryPlanRenderer(render_shared_sub_queries_as_ctes=render_shared_sub_queries_as_ctes)
         elif self is SupportedAdapterTypes.TRINO:
-            return TrinoSqlQueryPlanRenderer()
+            return TrinoSqlQueryPlanRenderer(render_shared_sub_queries_as_ctes=render_shared_sub_queries_as_ctes)
         else:
             assert_values_exhausted(self)
 
+    @property
+    def sql_query_plan_renderer(self) -> SqlQueryPlanRenderer:
+        """Return the SqlQueryPlanRenderer corresponding to the supported adapter type."""
+        return self.create_sql_query_plan_renderer()
+
 
 class AdapterBackedSqlClient:
     """SqlClient implementation which delegates database operations to a dbt BaseAdapter instance.
@@ -95,11 +108,14 @@ class AdapterBackedSqlClient:
     of the more generic BaseAdapter class.
     """
 
-    def __init__(self, adapter: BaseAdapter):
+    def __init__(self, adapter: BaseAdapter, render_shared_sub_queries_as_ctes: bool = False):
         """Initializer sourced from a BaseAdapter instance.
 
         The dbt BaseAdapter should already be fully initialized, including all credential verification, and
         ready for use for establishing connections and issuing queries.
+
+        If render_shared_sub_queries_as_ctes is set, sub-queries that appear more than once in the SQL for a query are
+        rendered once in a WITH clause.
         """
         self._adapter = adapter
         try:
@@ -111,7 +127,9 @@ class AdapterBackedSqlClient:
             ) from e
 
         self._sql_engine_type = adapter_type.sql_engine_type
-        self._sql_query_plan_renderer = adapter_type.sql_query_plan_renderer
+        self._sql_query_plan_renderer = adapter_type.create_sql_query_plan_renderer(
+            render_shared_sub_queries_as_ctes=render_shared_sub_queries_as_ctes
+        )
         logger.info(f"Initialized AdapterBackedSqlClient with dbt adapter type `{adapter_type.value}`")
 
     @property
@@ -124,6 +142,15 @@ class AdapterBackedSqlClient:
         """Dialect-specific SQL query plan renderer used for converting MetricFlow's query plan to executable SQL."""
         return self._sql_query_plan_renderer
 
+    @property
+    def connection_identity(self) -> str:
+        """Identifies the warehouse using the field that dbt uses to tell connections apart, and the database.
+
+        The field is hashed, as it may contain e.g. a file path or a host name that shouldn't show up in cache keys.
+        """
+        credentials = self._adapter.config.credentials
+        return f"{self._adapter.type()}:{credentials.hashed_unique_field()}:{credentials.database}"
+
     def query(
         self,
         stmt: str,
@@ -138,17 +165,25 @@ class AdapterBackedSqlClient:
                 concrete values for SQL query parameters.
             extra_tags: An object containing JSON serialized tags meant for annotating queries.
         """
+        column_names, rows = self._execute_and_fetch_rows(
+            stmt, sql_bind_parameters=sql_bind_parameters, extra_tags=extra_tags
+        )
+        return pd.DataFrame(rows, columns=column_names)
+
+    def _execute_and_fetch_rows(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters,
+        extra_tags: SqlJsonTag,
+    ) -> Tuple[Sequence[str], Sequence[Sequence[object]]]:
+        """Run the query through the adapter and return the column names and the rows of the result."""
         start = time.time()
         request_id = SqlRequestId(f"mf_rid__{random_id()}")
         combined_tags = AdapterBackedSqlClient._consolidate_tags(json_tags=extra_tags, request_id=request_id)
         statement = SqlStatementCommentMetadata.add_tag_metadata_as_comment(
             sql_statement=stmt, combined_tags=combined_tags
         )
-        if sql_bind_parameters.param_dict:
-            raise SqlBindParametersNotSupportedError(
-                f"Invalid execute statement - we do not support queries with bind parameters through dbt adapters! "
-                f"Bind params: {sql_bind_parameters.param_dict}"
-            )
+        statement = self._substitute_bind_parameters(statement, sql_bind_parameters)
         logger.info(AdapterBackedSqlClient._format_run_query_log_message(statement, sql_bind_parameters))
         with self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
             # returns a Tuple[AdapterResponse, agate.Table] but the decorator converts it to Any
@@ -156,10 +191,118 @@ class AdapterBackedSqlClient:
             logger.info(f"Query returned from dbt Adapter with response {result[0]}")
 
         agate_data = result[1]
-        df = pd.DataFrame([row.values() for row in agate_data.rows], columns=agate_data.column_names)
         stop = time.time()
-        logger.info(f"Finished running the query in {stop - start:.2f}s with {df.shape[0]} row(s) returned")
-        return df
+        logger.info(f"Finished running the query in {stop - start:.2f}s with {len(agate_data.rows)} row(s) returned")
+        return agate_data.column_names, [row.values() for row in agate_data.rows]
+
+    def query_arrow(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> pa.Table:
+        """Query statement; result expected to be data which will be returned as an Apache Arrow table.
+
+        If the adapter's cursor can return Arrow data natively (e.g. DuckDB), the result is fetched directly in that
+        format. Otherwise, the rows are converted column by column, without going through a DataFrame.
+
+        Args:
+            stmt: The SQL query statement to run. This should produce output via a SELECT
+            sql_bind_parameters: The parameter replacement mapping for filling in
+                concrete values for SQL query parameters.
+            extra_tags: An object containing JSON serialized tags meant for annotating queries.
+        """
+        import pyarrow as pa
+
+        connection_manager = self._adapter.connections
+        if not isinstance(connection_manager, SQLConnectionManager):
+            # The adapter only returns complete results as an agate table (e.g. BigQuery), so convert from the rows.
+            column_names, rows = self._execute_and_fetch_rows(
+                stmt, sql_bind_parameters=sql_bind_parameters, extra_tags=extra_tags
+            )
+            return pa.table({column_name: [row[i] for row in rows] for i, column_name in enumerate(column_names)})
+
+        start = time.time()
+        request_id = SqlRequestId(f"mf_rid__{random_id()}")
+        combined_tags = AdapterBackedSqlClient._consolidate_tags(json_tags=extra_tags, request_id=request_id)
+        statement = SqlStatementCommentMetadata.add_tag_metadata_as_comment(
+            sql_statement=stmt, combined_tags=combined_tags
+        )
+        statement = self._substitute_bind_parameters(statement, sql_bind_parameters)
+        logger.info(AdapterBackedSqlClient._format_run_query_log_message(statement, sql_bind_parameters))
+        with self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
+            _, cursor = connection_manager.add_query(sql=statement, auto_begin=True)
+            if hasattr(cursor, "fetch_arrow_table"):
+                table = cursor.fetch_arrow_table()
+            else:
+                column_names = [column[0] for column in cursor.description] if cursor.description is not None else []
+                rows = cursor.fetchall()
+                table = pa.table({column_name: [row[i] for row in rows] for i, column_name in enumerate(column_names)})
+
+        stop = time.time()
+        logger.info(f"Finished running the query in {stop - start:.2f}s with {table.num_rows} row(s) returned")
+        return table
+
+    def query_batches(
+        self,
+        stmt: str,
+        batch_size: int,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Generator[pd.DataFrame, None, None]:
+        """Query statement; the result is yielded as DataFrames with up to batch_size rows each.
+
+        For adapters with a DB-API cursor, rows are fetched from the cursor as the iterator is consumed, and the
+        connection is held open until the iterator is exhausted or closed. Other adapters (e.g. BigQuery) only return
+        complete results, so the result of query() is split up instead.
+
+        Args:
+            stmt: The SQL query statement to run. This should produce output via a SELECT
+            batch_size: The maximum number of rows in each DataFrame.
+            sql_bind_parameters: The parameter replacement mapping for filling in
+                concrete values for SQL query parameters.
+            extra_tags: An object containing JSON serialized tags meant for annotating queries.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"The batch size must be a positive integer. Got: {batch_size}")
+
+        connection_manager = self._adapter.connections
+        if not isinstance(connection_manager, SQLConnectionManager):
+            df = self.query(stmt, sql_bind_parameters=sql_bind_parameters, extra_tags=extra_tags)
+            yield df.iloc[0:batch_size]
+            for start_index in range(batch_size, df.shape[0], batch_size):
+                yield df.iloc[start_index : start_index + batch_size]
+            return
+
+        start = time.time()
+        request_id = SqlRequestId(f"mf_rid__{random_id()}")
+        combined_tags = AdapterBackedSqlClient._consolidate_tags(json_tags=extra_tags, request_id=request_id)
+        statement = SqlStatementCommentMetadata.add_tag_metadata_as_comment(
+            sql_statement=stmt, combined_tags=combined_tags
+        )
+        statement = self._substitute_bind_parameters(statement, sql_bind_parameters)
+        logger.info(AdapterBackedSqlClient._format_run_query_log_message(statement, sql_bind_parameters))
+        row_count = 0
+        batch_count = 0
+        with self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
+            _, cursor = connection_manager.add_query(sql=statement, auto_begin=True)
+            column_names = [column[0] for column in cursor.description] if cursor.description is not None else []
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if len(rows) == 0 and batch_count > 0:
+                    break
+                # Convert via agate so that the values have the same types as the ones returned by query().
+                agate_data = table_from_data_flat(
+                    data=connection_manager.process_results(column_names, rows), column_names=column_names
+                )
+                row_count += len(rows)
+                batch_count += 1
+                yield pd.DataFrame([row.values() for row in agate_data.rows], columns=agate_data.column_names)
+                if len(rows) < batch_size:
+                    break
+
+        stop = time.time()
+        logger.info(f"Finished streaming the query in {stop - start:.2f}s with {row_count} row(s) returned")
 
     def execute(
         self,
@@ -175,11 +318,7 @@ class AdapterBackedSqlClient:
                 concrete values for SQL query parameters.
             extra_tags: An object containing JSON serialized tags meant for annotating queries.
         """
-        if sql_bind_parameters.param_dict:
-            raise SqlBindParametersNotSupportedError(
-                f"Invalid execute statement - we do not support execute commands with bind parameters through dbt "
-                f"adapters! Bind params: {SqlBindParameters.param_dict}"
-            )
+        stmt = self._substitute_bind_parameters(stmt, sql_bind_parameters)
         start = time.time()
         request_id = SqlRequestId(f"mf_rid__{random_id()}")
         combined_tags = AdapterBackedSqlClient._consolidate_tags(json_tags=extra_tags, request_id=request_id)
@@ -196,6 +335,74 @@ class AdapterBackedSqlClient:
         logger.info(f"Finished running the query in {stop - start:.2f}s")
         return None
 
+    def execute_in_transaction(
+        self,
+        statements: Sequence[Tuple[str, SqlBindParameters]],
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> None:
+        """Execute the statements in a single transaction, so either all or none of their changes are applied.
+
+        The statements are run on the same connection and committed after the last one. If a statement fails, the
+        transaction is rolled back.
+
+        Args:
+            statements: The SQL statements to run, with the bind parameters for each.
+            extra_tags: An object containing JSON serialized tags meant for annotating queries.
+        """
+        if not self._sql_engine_type.supports_transactions:
+            raise NotImplementedError(f"Transactions are not supported for {self._sql_engine_type.value}")
+        start = time.time()
+        request_id = SqlRequestId(f"mf_rid__{random_id()}")
+        combined_tags = AdapterBackedSqlClient._consolidate_tags(json_tags=extra_tags, request_id=request_id)
+        with self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
+            try:
+                for stmt, sql_bind_parameters in statements:
+                    statement = SqlStatementCommentMetadata.add_tag_metadata_as_comment(
+                        sql_statement=self._substitute_bind_parameters(stmt, sql_bind_parameters),
+                        combined_tags=combined_tags,
+                    )
+                    logger.info(AdapterBackedSqlClient._format_run_query_log_message(statement, sql_bind_parameters))
+                    result = self._adapter.execute(statement, auto_begin=True, fetch=False)
+                    logger.info(f"Query executed via dbt Adapter with response {result[0]}")
+                self._adapter.commit_if_has_connection()
+            except Exception:
+                logger.info("Rolling back the transaction as a statement failed")
+                self._adapter.connections.rollback_if_open()
+                raise
+        stop = time.time()
+        logger.info(f"Finished running {len(statements)} statement(s) in a transaction in {stop - start:.2f}s")
+
+    def table_exists(self, sql_table: SqlTable) -> bool:
+        """Returns true if the table is listed in the information schema of the data warehouse.
+
+        Names are compared case-insensitively since some engines store unquoted identifiers in upper case.
+        """
+        if self._sql_engine_type is SqlEngine.BIGQUERY:
+            # In BigQuery, the information schema is per dataset, and the dataset is the schema of the table.
+            information_schema_tables = (
+                f"{sql_table.db_name}.{sql_table.schema_name}.INFORMATION_SCHEMA.TABLES"
+                if sql_table.db_name
+                else f"{sql_table.schema_name}.INFORMATION_SCHEMA.TABLES"
+            )
+        else:
+            information_schema_tables = (
+                f"{sql_table.db_name}.information_schema.tables" if sql_table.db_name else "information_schema.tables"
+            )
+        render_key = self.render_bind_parameter_key
+        df = self.query(
+            textwrap.dedent(
+                f"""\
+                SELECT table_name
+                FROM {information_schema_tables}
+                WHERE LOWER(table_schema) = {render_key("schema_name")} AND LOWER(table_name) = {render_key("table_name")}
+                """
+            ),
+            sql_bind_parameters=SqlBindParameters.create_from_dict(
+                {"schema_name": sql_table.schema_name.lower(), "table_name": sql_table.table_name.lower()}
+            ),
+        )
+        return len(df) > 0
+
     def dry_run(
         self,
         stmt: str,
@@ -210,6 +417,7 @@ class AdapterBackedSqlClient:
             sql_bind_parameters: The parameter replacement mapping for filling in
                 concrete values for SQL query parameters.
         """
+        stmt = self._substitute_bind_parameters(stmt, sql_bind_parameters)
         start = time.time()
         logger.info(
             f"Running dry_run of:"
@@ -254,13 +462,47 @@ class AdapterBackedSqlClient:
         logger.info(f"Finished running the dry_run in {stop - start:.2f}s")
         return
 
+    def dry_run_many(
+        self,
+        statements: Sequence[Tuple[str, SqlBindParameters]],
+        max_batch_size: int = DEFAULT_DRY_RUN_BATCH_SIZE,
+    ) -> Tuple[Optional[Exception], ...]:
+        """Dry run many statements, combining them to reduce the number of round trips to the data warehouse.
+
+        Statements are combined into a single probe of up to max_batch_size statements. If the probe fails, the batch is
+        split to find the statements that fail, so the returned exceptions are the same as from calling dry_run().
+
+        Args:
+            statements: The SQL query statements to dry run, with their bind parameters.
+            max_batch_size: The maximum number of statements to combine into a single dry run.
+
+        Returns:
+            The exception for each statement in the same order as statements, or None if the statement is queryable.
+        """
+        return dry_run_in_batches(
+            dry_run=lambda stmt, sql_bind_parameters: self.dry_run(stmt=stmt, sql_bind_parameters=sql_bind_parameters),
+            statements=statements,
+            max_batch_size=max_batch_size,
+        )
+
     def close(self) -> None:  # noqa: D
         self._adapter.cancel_open_connections()
 
     def render_bind_parameter_key(self, bind_parameter_key: str) -> str:
-        """Wrap execution parameter key with syntax accepted by engine."""
-        raise SqlBindParametersNotSupportedError(
-            "We do not support queries with bind parameters through dbt adapters, so we do not have rendering enabled!"
+        """Wrap execution parameter key with syntax accepted by engine.
+
+        dbt adapters don't support bind parameters, so the values are substituted into the statement by the client
+        before it's run. See _substitute_bind_parameters().
+        """
+        return f":{bind_parameter_key}"
+
+    def _substitute_bind_parameters(self, stmt: str, sql_bind_parameters: SqlBindParameters) -> str:
+        """Replace the placeholders for bind parameters in the statement with escaped literals."""
+        return substitute_bind_parameters(
+            sql=stmt,
+            bind_parameters=sql_bind_parameters,
+            timestamp_data_type=self._sql_query_plan_renderer.expr_renderer.timestamp_data_type,
+            backslash_escapes=self._sql_engine_type.uses_backslash_escapes,
         )
 
     @staticmethod
@@ -324,6 +324,9 @@ def query(
                 "🔎 SQL (remove --explain to see data or add --show-dataflow-plan to see the generated dataflow plan):"
             )
         click.echo(sql)
+        if explain_result.cost_estimate is not None:
+            click.echo("")
+            click.echo(textwrap.indent(explain_result.cost_estimate.text, prefix="-- "))
         if display_plans:
             click.echo("Creating temporary directory for storing visualization output.")
             temp_path = tempfile.mkdtemp()
@@ -611,6 +614,13 @@ def _data_warehouse_validations_runner(
     default=1,
     help="Optional. Uses the number of workers specified to run the semantic validations. Should only be used for exceptionally large configs",
 )
+@click.option(
+    "--dw-validation-workers",
+    required=False,
+    type=click.IntRange(min=1),
+    default=1,
+    help="Optional. The number of queries to run at the same time for the data warehouse validations. Default 1.",
+)
 @pass_config
 @exception_handler
 @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
@@ -621,6 +631,7 @@ def validate_configs(
     show_all: bool = False,
     verbose_issues: bool = False,
     semantic_validation_workers: int = 1,
+    dw_validation_workers: int = 1,
 ) -> None:
     """Perform validations against the defined model configurations."""
     cfg.verbose = True
@@ -659,7 +670,7 @@ def validate_configs(
     dw_results = SemanticManifestValidationResults()
     if not skip_dw:
         # fetch dbt adapters. This rebuilds the manifest again, but whatever.
-        dw_validator = DataWarehouseModelValidator(sql_client=cfg.sql_client)
+        dw_validator = DataWarehouseModelValidator(sql_client=cfg.sql_client, max_workers=dw_validation_workers)
         dw_results = _data_warehouse_validations_runner(
             dw_validator=dw_validator, manifest=semantic_manifest, timeout=dw_timeout
         )
@@ -68,10 +68,12 @@ class MetricFlowDagTextFormatter:
 
         # In case this gets used in a multi-threaded context, use a thread-local variable since it has mutable state.
         self._thread_local_data = threading.local()
-        self._thread_local_data.max_width_tracker = MaxWidthTracker(max_width)
 
     @property
     def _max_width_tracker(self) -> MaxWidthTracker:  # noqa: D
+        # The tracker needs to be created in each thread that uses this formatter.
+        if not hasattr(self._thread_local_data, "max_width_tracker"):
+            self._thread_local_data.max_width_tracker = MaxWidthTracker(self._max_width)
         return self._thread_local_data.max_width_tracker
 
     def _displayed_property_on_one_line(self, displayed_property: DisplayedProperty) -> str:
@@ -12,6 +12,7 @@ DATAFLOW_NODE_COMPUTE_METRICS_ID_PREFIX = "cm"
 DATAFLOW_NODE_JOIN_AGGREGATED_MEASURES_BY_GROUPBY_COLUMNS_PREFIX = "jamgc"
 DATAFLOW_NODE_JOIN_TO_STANDARD_OUTPUT_ID_PREFIX = "jso"
 DATAFLOW_NODE_JOIN_SELF_OVER_TIME_RANGE_ID_PREFIX = "jotr"
+DATAFLOW_NODE_WINDOW_OVER_TIME_RANGE_ID_PREFIX = "wotr"
 DATAFLOW_NODE_ORDER_BY_LIMIT_ID_PREFIX = "obl"
 DATAFLOW_NODE_PASS_FILTER_ELEMENTS_ID_PREFIX = "pfe"
 DATAFLOW_NODE_READ_SQL_SOURCE_ID_PREFIX = "rss"
@@ -47,6 +48,8 @@ SQL_EXPR_GENERATE_UUID_PREFIX = "uuid"
 
 SQL_PLAN_SELECT_STATEMENT_ID_PREFIX = "ss"
 SQL_PLAN_TABLE_FROM_CLAUSE_ID_PREFIX = "tfc"
+SQL_PLAN_CTE_FROM_CLAUSE_ID_PREFIX = "cfc"
+SQL_PLAN_COMMON_TABLE_EXPRESSION_PREFIX = "cte"
 
 EXEC_NODE_READ_SQL_QUERY = "rsq"
 EXEC_NODE_NOOP = "noop"
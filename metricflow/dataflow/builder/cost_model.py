@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import logging
+import weakref
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from metricflow.dataflow.dataflow_plan import DataflowPlan, DataflowPlanNode, ReadSqlSourceNode
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.inference.context.data_warehouse import DataWarehouseInferenceContext
+from metricflow.sql.sql_plan import SqlQueryPlanNode, SqlTableFromClauseNode
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TableScanEstimate:
+    """The estimated number of rows read from a table."""
+
+    sql_table: SqlTable
+    row_count: int
+    # Whether the row count is based on statistics for the table, rather than a default.
+    from_table_statistics: bool = True
+
+
+@dataclass(frozen=True)
+class DataflowCostEstimate:
+    """The estimated cost of computing the output of a part of a dataflow plan.
+
+    The cost is measured as the number of rows that are read from tables. A table that is read by more than one node (e.g.
+    in different branches of the plan) has an estimate for each read. A node that's shared by branches is counted once.
+    """
+
+    table_scan_estimates: Tuple[TableScanEstimate, ...]
+
+    @property
+    def row_count(self) -> int:
+        """The estimated number of rows read from all tables."""
+        return sum(table_scan_estimate.row_count for table_scan_estimate in self.table_scan_estimates)
+
+    @property
+    def from_table_statistics(self) -> bool:
+        """Whether the row counts for all tables are based on statistics for the tables."""
+        return all(table_scan_estimate.from_table_statistics for table_scan_estimate in self.table_scan_estimates)
+
+    def merge(self, other: DataflowCostEstimate) -> DataflowCostEstimate:  # noqa: D
+        return DataflowCostEstimate(table_scan_estimates=self.table_scan_estimates + other.table_scan_estimates)
+
+    @property
+    def text(self) -> str:
+        """A summary of the estimate for explain output."""
+        lines = [f"Estimated rows read: {self.row_count}"]
+        for table_scan_estimate in self.table_scan_estimates:
+            lines.append(f"  {table_scan_estimate.sql_table.sql}: {table_scan_estimate.row_count}")
+        return "\n".join(lines)
+
+
+class DataflowCostModel(ABC):
+    """Estimates the cost of computing the output of dataflow plan nodes from the sizes of the tables that they read.
+
+    This is used by the dataflow plan builder to choose between the source nodes that can satisfy a query, and to show
+    the estimates for a plan in explain output. Subclasses only need to provide the size of a table.
+    """
+
+    def __init__(self) -> None:  # noqa: D
+        # Nodes are immutable, so the estimates are cached. The nodes are referenced weakly so that the cache doesn't
+        # keep plans alive.
+        self._node_to_cost_estimate: weakref.WeakKeyDictionary[
+            DataflowPlanNode, DataflowCostEstimate
+        ] = weakref.WeakKeyDictionary()
+
+    @abstractmethod
+    def estimate_table_row_count(self, sql_table: SqlTable) -> int:
+        """Return the estimated number of rows in the table."""
+        raise NotImplementedError
+
+    def has_table_statistics(self, sql_table: SqlTable) -> bool:
+        """Return true if the estimated number of rows in the table is based on statistics, rather than a default."""
+        return True
+
+    def estimate_node_cost(self, node: DataflowPlanNode) -> DataflowCostEstimate:
+        """Return the estimated cost of reading the tables that are needed to compute the output of the node."""
+        cost_estimate = self._node_to_cost_estimate.get(node)
+        if cost_estimate is not None:
+            return cost_estimate
+
+        table_scan_estimates: List[TableScanEstimate] = []
+        visited_nodes: Set[DataflowPlanNode] = set()
+        nodes_to_visit: List[DataflowPlanNode] = [node]
+        while len(nodes_to_visit) > 0:
+            current_node = nodes_to_visit.pop()
+            if current_node in visited_nodes:
+                continue
+            visited_nodes.add(current_node)
+            if isinstance(current_node, ReadSqlSourceNode):
+                for sql_table in DataflowCostModel._tables_read_by_sql_node(current_node.data_set.sql_select_node):
+                    table_scan_estimates.append(
+                        TableScanEstimate(
+                            sql_table=sql_table,
+                            row_count=self.estimate_table_row_count(sql_table),
+                            from_table_statistics=self.has_table_statistics(sql_table),
+                        )
+                    )
+            nodes_to_visit.extend(current_node.parent_nodes)
+
+        cost_estimate = DataflowCostEstimate(table_scan_estimates=tuple(table_scan_estimates))
+        self._node_to_cost_estimate[node] = cost_estimate
+        return cost_estimate
+
+    def estimate_recipe_cost(
+        self, source_node: DataflowPlanNode, nodes_to_join: Sequence[DataflowPlanNode]
+    ) -> DataflowCostEstimate:
+        """Return the estimated cost of reading from the source node and joining the given nodes to it."""
+        cost_estimate = self.estimate_node_cost(source_node)
+        for node_to_join in nodes_to_join:
+            cost_estimate = cost_estimate.merge(self.estimate_node_cost(node_to_join))
+        return cost_estimate
+
+    def estimate_plan_cost(self, dataflow_plan: DataflowPlan) -> DataflowCostEstimate:
+        """Return the estimated cost of computing the outputs of all sink nodes in the plan."""
+        cost_estimate = DataflowCostEstimate(table_scan_estimates=())
+        for sink_node in dataflow_plan.sink_output_nodes:
+            cost_estimate = cost_estimate.merge(self.estimate_node_cost(sink_node))
+        return cost_estimate
+
+    @staticmethod
+    def _tables_read_by_sql_node(sql_node: SqlQueryPlanNode) -> Sequence[SqlTable]:
+        if isinstance(sql_node, SqlTableFromClauseNode):
+            return (sql_node.sql_table,)
+        return tuple(
+            sql_table
+            for parent_node in sql_node.parent_nodes
+            for sql_table in DataflowCostModel._tables_read_by_sql_node(parent_node)
+        )
+
+
+class TableStatisticsCostModel(DataflowCostModel):
+    """Estimates costs using row counts for tables that are gathered from the data warehouse or supplied by the user.
+
+    Tables without a row count are assumed to have default_row_count rows.
+    """
+
+    DEFAULT_ROW_COUNT = 1_000_000
+
+    def __init__(  # noqa: D
+        self, table_row_counts: Mapping[SqlTable, int], default_row_count: int = DEFAULT_ROW_COUNT
+    ) -> None:
+        self._table_row_counts = dict(table_row_counts)
+        self._default_row_count = default_row_count
+        super().__init__()
+
+    @staticmethod
+    def from_inference_context(
+        context: DataWarehouseInferenceContext, default_row_count: int = DEFAULT_ROW_COUNT
+    ) -> TableStatisticsCostModel:
+        """Create a cost model using the row counts in the table statistics from a DataWarehouseInferenceContext."""
+        table_row_counts: Dict[SqlTable, int] = {}
+        for sql_table, table_properties in context.tables.items():
+            row_count: Optional[int] = max(
+                (column_properties.row_count for column_properties in table_properties.columns.values()),
+                default=None,
+            )
+            if row_count is not None:
+                table_row_counts[sql_table] = row_count
+        return TableStatisticsCostModel(table_row_counts=table_row_counts, default_row_count=default_row_count)
+
+    def has_table_statistics(self, sql_table: SqlTable) -> bool:  # noqa: D
+        return sql_table in self._table_row_counts
+
+    def estimate_table_row_count(self, sql_table: SqlTable) -> int:  # noqa: D
+        row_count = self._table_row_counts.get(sql_table)
+        if row_count is None:
+            logger.debug(f"No row count for {sql_table.sql}, so using the default of {self._default_row_count}")
+            return self._default_row_count
+        return row_count
@@ -17,17 +17,22 @@ from dbt_semantic_interfaces.protocols.metric import (
 from dbt_semantic_interfaces.references import (
     MeasureReference,
     MetricReference,
+    SemanticModelReference,
     TimeDimensionReference,
 )
+from dbt_semantic_interfaces.type_enums.aggregation_type import AggregationType
 from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
 from dbt_semantic_interfaces.validations.unique_valid_name import MetricFlowReservedKeywords
 
 from metricflow.dag.id_generation import DATAFLOW_PLAN_PREFIX, IdGeneratorRegistry
+from metricflow.dataflow.builder.cost_model import DataflowCostEstimate, DataflowCostModel
+from metricflow.dataflow.builder.dataflow_recipe_cache import DataflowRecipeCache, DataflowRecipeCacheKey
 from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
 from metricflow.dataflow.builder.node_evaluator import (
     JoinLinkableInstancesRecipe,
     LinkableInstanceSatisfiabilityEvaluation,
     NodeEvaluatorForLinkableInstances,
+    NodeJoinMetadataCache,
 )
 from metricflow.dataflow.dataflow_plan import (
     AddGeneratedUuidColumnNode,
@@ -50,9 +55,11 @@ from metricflow.dataflow.dataflow_plan import (
     SemiAdditiveJoinNode,
     SinkOutput,
     WhereConstraintNode,
+    WindowOverTimeRangeNode,
     WriteToResultDataframeNode,
     WriteToResultTableNode,
 )
+from metricflow.dataflow.dataflow_plan_node_interner import DataflowPlanNodeInterner
 from metricflow.dataflow.optimizer.dataflow_plan_optimizer import DataflowPlanOptimizer
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.dataset.dataset import DataSet
@@ -62,12 +69,14 @@ from metricflow.mf_logging.formatting import indent
 from metricflow.mf_logging.pretty_print import mf_pformat
 from metricflow.mf_logging.runtime import log_runtime
 from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.model.semantics.semantic_model_lookup import SemanticModelLookup
 from metricflow.plan_conversion.column_resolver import DunderColumnAssociationResolver
 from metricflow.plan_conversion.node_processor import PreJoinNodeProcessor
 from metricflow.query.group_by_item.filter_spec_resolution.filter_location import WhereFilterLocation
 from metricflow.query.group_by_item.filter_spec_resolution.filter_spec_lookup import FilterSpecResolutionLookUp
 from metricflow.specs.column_assoc import ColumnAssociationResolver
 from metricflow.specs.specs import (
+    DEFAULT_TIME_GRANULARITY,
     ConstantPropertySpec,
     CumulativeMeasureDescription,
     EntitySpec,
@@ -88,6 +97,7 @@ from metricflow.specs.specs import (
 )
 from metricflow.specs.where_filter_transform import WhereSpecFactory
 from metricflow.sql.sql_plan import SqlJoinType
+from metricflow.time.time_granularity import is_period_end, is_period_start
 
 logger = logging.getLogger(__name__)
 
@@ -99,6 +109,8 @@ class DataflowRecipe:
     source_node: BaseOutput
     required_local_linkable_specs: Tuple[LinkableInstanceSpec, ...]
     join_linkable_instances_recipes: Tuple[JoinLinkableInstancesRecipe, ...]
+    # The estimated cost of the recipe, if the builder has a cost model.
+    cost_estimate: Optional[DataflowCostEstimate] = None
 
     @property
     def join_targets(self) -> List[JoinDescription]:
@@ -127,7 +139,36 @@ class DataflowPlanBuilder:
         semantic_manifest_lookup: SemanticManifestLookup,
         node_output_resolver: Optional[DataflowPlanNodeOutputDataSetResolver] = None,
         column_association_resolver: Optional[ColumnAssociationResolver] = None,
+        dataflow_recipe_cache: Optional[DataflowRecipeCache] = None,
+        node_interner: Optional[DataflowPlanNodeInterner] = None,
+        use_window_functions_for_cumulative_metrics: bool = False,
+        rollup_source_nodes: Sequence[BaseOutput] = (),
+        cost_model: Optional[DataflowCostModel] = None,
     ) -> None:
+        """Constructor.
+
+        If dataflow_recipe_cache is specified, the recipes found for the measures and linkable specs in a query are
+        stored there and reused when later queries need the same ones.
+
+        If node_interner is specified, the nodes in the generated plans are interned so that structurally identical
+        subtrees within a plan, and across plans, are the same node objects.
+
+        If use_window_functions_for_cumulative_metrics is set, cumulative metrics with additive measures that are
+        queried by metric_time__day (and optionally other group-by items) are computed by aggregating the measure by day
+        and summing over a window of rows, instead of joining each input row to all days in its window before
+        aggregating. The SQL engine needs to support window functions with frames (see
+        SqlQueryPlanRenderer.supports_window_functions).
+
+        rollup_source_nodes are nodes that read measures from pre-aggregated rollup tables (see
+        SourceNodeBuilder.create_from_rollup_tables()). They're considered as sources for measures in addition to
+        source_nodes, and when one can satisfy a query with as few joins as the other candidates, the one with the
+        fewest linkable specs (i.e. the smallest rollup) is used. They're not used as the targets of joins.
+
+        If cost_model is specified, the recipe with the lowest estimated cost (i.e. the fewest rows read from the source
+        node and the nodes joined to it) is used instead of the one with the fewest joins, and nodes are joined in
+        order of their estimated size. Rows read from rollup tables without statistics aren't included in the estimate,
+        and rollup nodes are used over other candidates with the same cost.
+        """
         self._semantic_model_lookup = semantic_manifest_lookup.semantic_model_lookup
         self._metric_lookup = semantic_manifest_lookup.metric_lookup
         self._time_spine_source = semantic_manifest_lookup.time_spine_source
@@ -152,6 +193,19 @@ class DataflowPlanBuilder:
             if not node_output_resolver
             else node_output_resolver
         )
+        self._node_join_metadata_cache = NodeJoinMetadataCache(
+            semantic_model_lookup=self._semantic_model_lookup, node_data_set_resolver=self._node_data_set_resolver
+        )
+        self._dataflow_recipe_cache = dataflow_recipe_cache
+        self._node_interner = node_interner
+        self._use_window_functions_for_cumulative_metrics = use_window_functions_for_cumulative_metrics
+        self._rollup_source_nodes = tuple(rollup_source_nodes)
+        self._cost_model = cost_model
+
+    @property
+    def dataflow_recipe_cache(self) -> Optional[DataflowRecipeCache]:
+        """The cache for the recipes found for queries, if one was specified."""
+        return self._dataflow_recipe_cache
 
     def build_plan(
         self,
@@ -227,6 +281,8 @@ class DataflowPlanBuilder:
             limit=query_spec.limit,
             output_selection_specs=output_selection_specs,
         )
+        if self._node_interner is not None:
+            sink_node = self._node_interner.intern(sink_node)
 
         plan_id = IdGeneratorRegistry.for_class(DataflowPlanBuilder).create_id(DATAFLOW_PLAN_PREFIX)
 
@@ -657,6 +713,8 @@ class DataflowPlanBuilder:
         sink_node = self.build_sink_node(
             parent_node=output_node, order_by_specs=query_spec.order_by_specs, limit=query_spec.limit
         )
+        if self._node_interner is not None:
+            sink_node = self._node_interner.intern(sink_node)
 
         plan_id = IdGeneratorRegistry.for_class(DataflowPlanBuilder).create_id(DATAFLOW_PLAN_PREFIX)
 
@@ -711,14 +769,15 @@ class DataflowPlanBuilder:
         return semantic_model_names
 
     def _sort_by_suitability(self, nodes: Sequence[BaseOutput]) -> Sequence[BaseOutput]:
-        """Sort nodes by the number of linkable specs.
+        """Sort nodes by the estimated number of rows, if there is a cost model, and then the number of linkable specs.
 
         The lower the number of linkable specs means less aggregation required.
         """
 
-        def sort_function(node: BaseOutput) -> int:
+        def sort_function(node: BaseOutput) -> Tuple[int, int]:
             data_set = self._node_data_set_resolver.get_output_data_set(node)
-            return len(data_set.instance_set.spec_set.linkable_specs)
+            row_count = self._cost_model.estimate_node_cost(node).row_count if self._cost_model is not None else 0
+            return row_count, len(data_set.instance_set.spec_set.linkable_specs)
 
         return sorted(nodes, key=sort_function)
 
@@ -735,6 +794,71 @@ class DataflowPlanBuilder:
                 nodes.append(source_node)
         return nodes
 
+    def _is_rollup_source_node(self, node: BaseOutput) -> bool:
+        if isinstance(node, ConstrainTimeRangeNode):
+            parent_node = node.parent_node
+            assert isinstance(parent_node, BaseOutput)
+            return self._is_rollup_source_node(parent_node)
+        return node in self._rollup_source_nodes
+
+    def _rollup_granularity(self, rollup_source_node: BaseOutput) -> TimeGranularity:
+        """Return the finest granularity of metric_time in a rollup node, which is the granularity of the rollup table."""
+        metric_time_granularities = [
+            instance.spec.time_granularity
+            for instance in self._node_data_set_resolver.get_output_data_set(
+                rollup_source_node
+            ).instance_set.time_dimension_instances
+            if instance.spec.reference == self._metric_time_dimension_reference
+            and len(instance.spec.entity_links) == 0
+            and instance.spec.date_part is None
+        ]
+        return min(metric_time_granularities, key=lambda granularity: granularity.to_int())
+
+    def _select_rollup_source_nodes(
+        self,
+        time_range_constraint: Optional[TimeRangeConstraint],
+        min_granularity: Optional[TimeGranularity],
+    ) -> Tuple[BaseOutput, ...]:
+        """Return the rollup nodes that have the same rows as the semantic models when the time range is constrained.
+
+        Since the time range is constrained using the values of metric_time in the rollup table, the rows within the
+        range are the same only if the range starts and ends at the boundaries of periods in the rollup granularity.
+        If min_granularity is specified, rollup nodes with a coarser granularity are excluded as well.
+        """
+        selected_nodes = []
+        for node in self._rollup_source_nodes:
+            rollup_granularity = self._rollup_granularity(node)
+            if min_granularity is not None and rollup_granularity.to_int() > min_granularity.to_int():
+                logger.info(
+                    f"Not using rollup node {node.node_id} since its granularity {rollup_granularity.name} is coarser "
+                    f"than {min_granularity.name}."
+                )
+            elif time_range_constraint is None or (
+                is_period_start(rollup_granularity, time_range_constraint.start_time)
+                and is_period_end(rollup_granularity, time_range_constraint.end_time)
+            ):
+                selected_nodes.append(node)
+            else:
+                logger.info(
+                    f"Not using rollup node {node.node_id} since the time range constraint {time_range_constraint} "
+                    f"does not start and end on {rollup_granularity.name} boundaries."
+                )
+        return tuple(selected_nodes)
+
+    def _agg_time_dimension_granularity(self, measure_spec_properties: MeasureSpecProperties) -> TimeGranularity:
+        """Return the granularity that the aggregation time dimension of the measures is defined with."""
+        semantic_model = self._semantic_model_lookup.get_by_reference(
+            SemanticModelReference(semantic_model_name=measure_spec_properties.semantic_model_name)
+        )
+        assert semantic_model is not None
+        agg_time_dimension = SemanticModelLookup.get_dimension_from_semantic_model(
+            semantic_model=semantic_model,
+            dimension_reference=measure_spec_properties.agg_time_dimension.dimension_reference(),
+        )
+        if agg_time_dimension.type_params is None:
+            return DEFAULT_TIME_GRANULARITY
+        return agg_time_dimension.type_params.time_granularity
+
     def _select_read_nodes_with_linkable_specs(
         self, linkable_specs: LinkableSpecSet, read_nodes: Sequence[ReadSqlSourceNode]
     ) -> List[ReadSqlSourceNode]:
@@ -807,6 +931,74 @@ class DataflowPlanBuilder:
         linkable_spec_set: LinkableSpecSet,
         measure_spec_properties: Optional[MeasureSpecProperties] = None,
         time_range_constraint: Optional[TimeRangeConstraint] = None,
+        exclude_coarse_rollups: bool = False,
+    ) -> Optional[DataflowRecipe]:
+        """Find the recipe for the measures / linkable specs, or get it from the recipe cache.
+
+        If exclude_coarse_rollups is set, rollup nodes that are coarser than the defined granularity of the aggregation
+        time dimension are not used. That's needed for measures that are joined to a time spine or over a time range
+        before aggregation (cumulative metrics and offsets), since those joins use the defined granularity.
+        """
+        dataflow_recipe_cache = self._dataflow_recipe_cache
+        # Whether a rollup can be used depends on the values in the time range constraint, which aren't in the key.
+        if len(self._rollup_source_nodes) > 0 and time_range_constraint is not None:
+            dataflow_recipe_cache = None
+        cache_key = (
+            DataflowRecipeCacheKey.create(
+                measure_specs=measure_spec_properties.measure_specs if measure_spec_properties else None,
+                linkable_spec_set=linkable_spec_set,
+                has_time_range_constraint=time_range_constraint is not None,
+                exclude_coarse_rollups=exclude_coarse_rollups,
+            )
+            if dataflow_recipe_cache is not None
+            else None
+        )
+        if dataflow_recipe_cache is None or cache_key is None:
+            return self._search_for_dataflow_recipe(
+                linkable_spec_set=linkable_spec_set,
+                measure_spec_properties=measure_spec_properties,
+                time_range_constraint=time_range_constraint,
+                exclude_coarse_rollups=exclude_coarse_rollups,
+            )
+
+        is_cached, dataflow_recipe = dataflow_recipe_cache.get(cache_key)
+        if not is_cached:
+            dataflow_recipe = self._search_for_dataflow_recipe(
+                linkable_spec_set=linkable_spec_set,
+                measure_spec_properties=measure_spec_properties,
+                time_range_constraint=time_range_constraint,
+                exclude_coarse_rollups=exclude_coarse_rollups,
+            )
+            dataflow_recipe_cache.put(cache_key, dataflow_recipe)
+            return dataflow_recipe
+
+        logger.info(f"Using the cached dataflow recipe for {cache_key}")
+        if dataflow_recipe is None or time_range_constraint is None:
+            return dataflow_recipe
+
+        # The cached recipe could have been found for a different time range, so constrain the source node to the
+        # time range for this query.
+        source_node = dataflow_recipe.source_node
+        if (
+            not isinstance(source_node, ConstrainTimeRangeNode)
+            or source_node.time_range_constraint == time_range_constraint
+        ):
+            return dataflow_recipe
+        parent_node = source_node.parent_node
+        assert isinstance(parent_node, BaseOutput)
+        return DataflowRecipe(
+            source_node=ConstrainTimeRangeNode(parent_node=parent_node, time_range_constraint=time_range_constraint),
+            required_local_linkable_specs=dataflow_recipe.required_local_linkable_specs,
+            join_linkable_instances_recipes=dataflow_recipe.join_linkable_instances_recipes,
+            cost_estimate=dataflow_recipe.cost_estimate,
+        )
+
+    def _search_for_dataflow_recipe(
+        self,
+        linkable_spec_set: LinkableSpecSet,
+        measure_spec_properties: Optional[MeasureSpecProperties] = None,
+        time_range_constraint: Optional[TimeRangeConstraint] = None,
+        exclude_coarse_rollups: bool = False,
     ) -> Optional[DataflowRecipe]:
         linkable_specs = linkable_spec_set.as_tuple
         potential_source_nodes: Sequence[BaseOutput]
@@ -814,7 +1006,16 @@ class DataflowPlanBuilder:
         if measure_spec_properties:
             source_nodes = self._source_nodes
             potential_source_nodes = self._select_source_nodes_with_measures(
-                measure_specs=set(measure_spec_properties.measure_specs), source_nodes=source_nodes
+                measure_specs=set(measure_spec_properties.measure_specs),
+                source_nodes=tuple(source_nodes)
+                + self._select_rollup_source_nodes(
+                    time_range_constraint=time_range_constraint,
+                    min_granularity=(
+                        self._agg_time_dimension_granularity(measure_spec_properties)
+                        if exclude_coarse_rollups
+                        else None
+                    ),
+                ),
             )
             default_join_type = SqlJoinType.LEFT_OUTER
         else:
@@ -875,12 +1076,20 @@ class DataflowPlanBuilder:
             semantic_model_lookup=self._semantic_model_lookup,
             nodes_available_for_joins=self._sort_by_suitability(nodes_available_for_joins),
             node_data_set_resolver=self._node_data_set_resolver,
+            node_join_metadata_cache=self._node_join_metadata_cache,
         )
 
         # Dict from the node that contains the source node to the evaluation results.
         node_to_evaluation: Dict[BaseOutput, LinkableInstanceSatisfiabilityEvaluation] = {}
+        # Dict from the node that contains the source node to the estimated cost, if there's a cost model.
+        node_to_cost_estimate: Dict[BaseOutput, DataflowCostEstimate] = {}
 
-        for node in self._sort_by_suitability(potential_source_nodes):
+        # Rollup nodes are evaluated first so that, without a cost model, the search can stop at a rollup node that
+        # doesn't need joins.
+        sorted_potential_source_nodes = sorted(
+            self._sort_by_suitability(potential_source_nodes), key=lambda node: not self._is_rollup_source_node(node)
+        )
+        for node in sorted_potential_source_nodes:
             data_set = self._node_data_set_resolver.get_output_data_set(node)
 
             if measure_spec_properties:
@@ -923,6 +1132,14 @@ class DataflowPlanBuilder:
             logger.info(f"Found candidate with node ID '{node.node_id}' with {num_joins_required} joins required.")
 
             node_to_evaluation[node] = evaluation
+            if self._cost_model is not None:
+                node_to_cost_estimate[node] = self._cost_model.estimate_recipe_cost(
+                    source_node=node,
+                    nodes_to_join=[join_recipe.node_to_join for join_recipe in evaluation.join_recipes],
+                )
+                logger.info(f"Estimated cost for node ID '{node.node_id}' is:\n{node_to_cost_estimate[node].text}")
+                # A node that needs joins could still be cheaper, so keep evaluating the other nodes.
+                continue
 
             # Since are evaluating nodes with the lowest cost first, if we find one without requiring any joins, then
             # this is going to be the lowest cost solution.
@@ -933,17 +1150,36 @@ class DataflowPlanBuilder:
         logger.info(f"Found {len(node_to_evaluation)} candidate source nodes.")
 
         if len(node_to_evaluation) > 0:
-            # Find evaluation with lowest number of joins.
-            node_with_lowest_cost_plan = min(
-                node_to_evaluation, key=lambda node: len(node_to_evaluation[node].join_recipes)
-            )
+
+            def candidate_sort_key(node: BaseOutput) -> Tuple[int, int, bool]:
+                """Sort by the estimated cost, then the number of joins, with rollup nodes before the others.
+
+                Without statistics for a rollup table, it would be estimated to have the default number of rows even
+                though it's smaller than the table of its semantic model. The rows read from it are then left out of
+                the estimate, so that it's picked as it would be without a cost model.
+                """
+                is_rollup = self._is_rollup_source_node(node)
+                row_count = 0
+                cost_estimate = node_to_cost_estimate.get(node)
+                if cost_estimate is not None:
+                    row_count = cost_estimate.row_count
+                    if is_rollup and self._cost_model is not None:
+                        source_cost_estimate = self._cost_model.estimate_node_cost(node)
+                        if not source_cost_estimate.from_table_statistics:
+                            row_count -= source_cost_estimate.row_count
+                return row_count, len(node_to_evaluation[node].join_recipes), not is_rollup
+
+            # Find evaluation with lowest estimated cost, or the lowest number of joins if there is no cost model.
+            node_with_lowest_cost_plan = min(node_to_evaluation, key=candidate_sort_key)
             evaluation = node_to_evaluation[node_with_lowest_cost_plan]
+            cost_estimate = node_to_cost_estimate.get(node_with_lowest_cost_plan)
 
             logger.info(
                 "Lowest cost plan is:"
                 + indent(f"\nnode:\n{indent(node_with_lowest_cost_plan.text_structure())}")
                 + indent(f"\nevaluation:\n{indent(mf_pformat(evaluation))}")
                 + indent(f"\njoins: {len(node_to_evaluation[node_with_lowest_cost_plan].join_recipes)}")
+                + (indent(f"\n{cost_estimate.text}") if cost_estimate is not None else "")
             )
 
             # Nodes containing the linkable instances will be joined to the source node, so these
@@ -967,6 +1203,7 @@ class DataflowPlanBuilder:
                     + required_local_time_dimension_specs
                 ),
                 join_linkable_instances_recipes=node_to_evaluation[node_with_lowest_cost_plan].join_recipes,
+                cost_estimate=cost_estimate,
             )
 
         logger.error("No recipe could be constructed.")
@@ -1209,6 +1446,51 @@ class DataflowPlanBuilder:
 
         return required_linkable_specs, extraneous_linkable_specs
 
+    def _can_use_window_functions_for_cumulative_measure(
+        self,
+        metric_input_measure_spec: MetricInputMeasureSpec,
+        queried_linkable_specs: LinkableSpecSet,
+        non_additive_dimension_spec: Optional[NonAdditiveDimensionSpec],
+    ) -> bool:
+        """Returns true if the cumulative measure can be computed with window functions (see WindowOverTimeRangeNode).
+
+        Since the measure is aggregated by day before the window is applied, this is only possible when the measure
+        can be re-aggregated with a sum, and the query is grouped by metric_time__day. The query can also be grouped by
+        other items, as long as they don't include metric_time at other granularities.
+        """
+        cumulative_description = metric_input_measure_spec.cumulative_description
+        if not self._use_window_functions_for_cumulative_metrics or cumulative_description is None:
+            return False
+
+        if not (
+            len(queried_linkable_specs.metric_time_specs) == 1
+            and queried_linkable_specs.metric_time_specs[0].time_granularity is TimeGranularity.DAY
+            and queried_linkable_specs.metric_time_specs[0].date_part is None
+        ):
+            return False
+
+        # Filters on metric_time are applied to the time spine values when joining over the time range.
+        if any(
+            filter_spec.linkable_spec_set.contains_metric_time for filter_spec in metric_input_measure_spec.filter_specs
+        ):
+            return False
+
+        if (
+            non_additive_dimension_spec is not None
+            or metric_input_measure_spec.before_aggregation_time_spine_join_description is not None
+        ):
+            return False
+
+        cumulative_window = cumulative_description.cumulative_window
+        if (
+            cumulative_window is not None
+            and cumulative_window.granularity not in WindowOverTimeRangeNode.WINDOW_GRANULARITY_TO_DAY_COUNT
+        ):
+            return False
+
+        measure = self._semantic_model_lookup.get_measure(metric_input_measure_spec.measure_spec.reference)
+        return measure.agg in (AggregationType.SUM, AggregationType.COUNT, AggregationType.SUM_BOOLEAN)
+
     def _build_aggregated_measure_from_measure_source_node(
         self,
         metric_input_measure_spec: MetricInputMeasureSpec,
@@ -1257,6 +1539,11 @@ class DataflowPlanBuilder:
         before_aggregation_time_spine_join_description = (
             metric_input_measure_spec.before_aggregation_time_spine_join_description
         )
+        use_window_functions = self._can_use_window_functions_for_cumulative_measure(
+            metric_input_measure_spec=metric_input_measure_spec,
+            queried_linkable_specs=queried_linkable_specs,
+            non_additive_dimension_spec=non_additive_dimension_spec,
+        )
 
         if measure_recipe is None:
             logger.info(
@@ -1272,6 +1559,7 @@ class DataflowPlanBuilder:
                 if not before_aggregation_time_spine_join_description
                 else None,
                 linkable_spec_set=required_linkable_specs,
+                exclude_coarse_rollups=cumulative or before_aggregation_time_spine_join_description is not None,
             )
             logger.info(
                 f"With {len(self._source_nodes)} source nodes, finding a recipe took "
@@ -1289,7 +1577,7 @@ class DataflowPlanBuilder:
         # If a cumulative metric is queried with metric_time, join over time range.
         # Otherwise, the measure will be aggregated over all time.
         time_range_node: Optional[JoinOverTimeRangeNode] = None
-        if cumulative and queried_linkable_specs.contains_metric_time:
+        if cumulative and queried_linkable_specs.contains_metric_time and not use_window_functions:
             time_range_node = JoinOverTimeRangeNode(
                 parent_node=measure_recipe.source_node,
                 window=cumulative_window,
@@ -1350,6 +1638,7 @@ class DataflowPlanBuilder:
             cumulative_metric_adjusted_time_constraint is not None
             and time_range_constraint is not None
             and queried_linkable_specs.contains_metric_time
+            and not use_window_functions
         ):
             cumulative_metric_constrained_node = ConstrainTimeRangeNode(
                 unaggregated_measure_node, time_range_constraint
@@ -1398,11 +1687,22 @@ class DataflowPlanBuilder:
                 include_specs=InstanceSpecSet(measure_specs=(measure_spec,)).merge(queried_linkable_specs.as_spec_set),
             )
 
-        aggregate_measures_node = AggregateMeasuresNode(
+        aggregate_measures_node: BaseOutput = AggregateMeasuresNode(
             parent_node=pre_aggregate_node,
             metric_input_measure_specs=(metric_input_measure_spec,),
         )
 
+        if use_window_functions:
+            # The time spine needs to include the days before the constraint that are in the window of the first day.
+            aggregate_measures_node = WindowOverTimeRangeNode(
+                parent_node=aggregate_measures_node,
+                window=cumulative_window,
+                grain_to_date=cumulative_grain_to_date,
+                time_range_constraint=cumulative_metric_adjusted_time_constraint,
+            )
+            if time_range_constraint is not None:
+                aggregate_measures_node = ConstrainTimeRangeNode(aggregate_measures_node, time_range_constraint)
+
         # Joining to time spine after aggregation is for measures that specify `join_to_timespine`` in the YAML spec.
         after_aggregation_time_spine_join_description = (
             metric_input_measure_spec.after_aggregation_time_spine_join_description
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
+
+from metricflow.specs.specs import LinkableSpecSet, MeasureSpec
+
+if TYPE_CHECKING:
+    from metricflow.dataflow.builder.dataflow_plan_builder import DataflowRecipe
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DataflowRecipeCacheKey:
+    """The inputs to the search for a dataflow recipe that determine the recipe that's chosen.
+
+    The values of the time range constraint are excluded as the constraint doesn't change the specs that are available
+    in a node, so only whether there is a constraint is included. The join type is determined by whether there are
+    measures. exclude_coarse_rollups limits the rollup nodes that are candidates.
+    """
+
+    measure_specs: Optional[Tuple[MeasureSpec, ...]]
+    linkable_spec_set: LinkableSpecSet
+    has_time_range_constraint: bool
+    exclude_coarse_rollups: bool = False
+
+    @staticmethod
+    def create(
+        measure_specs: Optional[Sequence[MeasureSpec]],
+        linkable_spec_set: LinkableSpecSet,
+        has_time_range_constraint: bool,
+        exclude_coarse_rollups: bool = False,
+    ) -> Optional[DataflowRecipeCacheKey]:
+        """Create the key for the inputs, or return None if the inputs can't be hashed."""
+        key = DataflowRecipeCacheKey(
+            measure_specs=tuple(measure_specs) if measure_specs is not None else None,
+            linkable_spec_set=linkable_spec_set,
+            has_time_range_constraint=has_time_range_constraint,
+            exclude_coarse_rollups=exclude_coarse_rollups,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            logger.debug(f"Not caching the dataflow recipe for {key} as it can't be hashed")
+            return None
+        return key
+
+
+class DataflowRecipeCache:
+    """A bounded LRU cache from the inputs of a dataflow recipe search to the recipe that was found.
+
+    Searching for a recipe evaluates every candidate source node against the nodes available for joins, which is
+    repeated for every group of measures in every query. Queries for derived metrics that share base measures, or
+    dashboards that only vary filters, find the same recipes, so this lets those searches be skipped. Since recipes
+    only depend on the semantic manifest, entries don't expire. This class is thread-safe.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Constructor.
+
+        Args:
+            max_size: The maximum number of recipes to keep. The least-recently used recipe is evicted when full.
+        """
+        if max_size <= 0:
+            raise ValueError(f"The maximum size of the cache must be a positive integer. Got: {max_size}")
+        self._max_size = max_size
+        self._entries: OrderedDict[DataflowRecipeCacheKey, Optional[DataflowRecipe]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+
+    def get(self, key: DataflowRecipeCacheKey) -> Tuple[bool, Optional[DataflowRecipe]]:
+        """Return whether there was an entry for the key, and the cached recipe.
+
+        The recipe can be None for a hit, as searches that don't find a recipe are cached as well.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._miss_count += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hit_count += 1
+            return True, self._entries[key]
+
+    def put(self, key: DataflowRecipeCacheKey, recipe: Optional[DataflowRecipe]) -> None:
+        """Add the recipe for the key, evicting the least-recently used recipes if the cache is full."""
+        with self._lock:
+            self._entries[key] = recipe
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all recipes from the cache. The hit / miss counts are not reset."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hit_count(self) -> int:
+        """The number of lookups that returned a cached recipe."""
+        return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """The number of lookups that did not find a recipe."""
+        return self._miss_count
+
+    def __len__(self) -> int:  # noqa: D
+        with self._lock:
+            return len(self._entries)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from metricflow.dataflow.dataflow_plan import (
     DataflowPlanNode,
@@ -60,14 +60,36 @@ class DataflowPlanNodeOutputDataSetResolver(DataflowToSqlQueryPlanConverter):
         semantic_manifest_lookup: SemanticManifestLookup,
     ) -> None:
         self._node_to_output_data_set: Dict[DataflowPlanNode, SqlDataSet] = {}
+        # Allows data sets to be reused for nodes that are different objects, but are structurally identical.
+        self._structural_fingerprint_to_output_data_sets: Dict[int, List[Tuple[DataflowPlanNode, SqlDataSet]]] = {}
         super().__init__(
             column_association_resolver=column_association_resolver,
             semantic_manifest_lookup=semantic_manifest_lookup,
         )
 
     def get_output_data_set(self, node: DataflowPlanNode) -> SqlDataSet:  # noqa: D
-        """Cached since this will be called repeatedly during the computation of multiple metrics."""
-        if node not in self._node_to_output_data_set:
-            self._node_to_output_data_set[node] = node.accept(self)
+        """Cached since this will be called repeatedly during the computation of multiple metrics.
 
-        return self._node_to_output_data_set[node]
+        The cache is also used for the parents of the node, and for nodes that are structurally identical to a node
+        that was resolved before, so the data set for a subtree is only computed once.
+        """
+        output_data_set = self._node_to_output_data_set.get(node)
+        if output_data_set is not None:
+            return output_data_set
+
+        nodes_and_data_sets = self._structural_fingerprint_to_output_data_sets.setdefault(
+            node.structural_fingerprint, []
+        )
+        for other_node, other_output_data_set in nodes_and_data_sets:
+            if other_node.structurally_identical(node):
+                output_data_set = other_output_data_set
+                break
+
+        if output_data_set is None:
+            output_data_set = node.accept(self)
+            nodes_and_data_sets.append((node, output_data_set))
+        self._node_to_output_data_set[node] = output_data_set
+        return output_data_set
+
+    def _get_parent_data_set(self, parent_node: DataflowPlanNode) -> SqlDataSet:
+        return self.get_output_data_set(parent_node)
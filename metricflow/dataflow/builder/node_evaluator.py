@@ -18,10 +18,13 @@ from __future__ import annotations
 
 import itertools
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary
 
 from dbt_semantic_interfaces.naming.keywords import METRIC_TIME_ELEMENT_NAME
+from dbt_semantic_interfaces.references import EntityReference, SemanticModelReference
 
 from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
 from metricflow.dataflow.builder.partitions import PartitionJoinResolver
@@ -36,12 +39,18 @@ from metricflow.dataflow.dataflow_plan import (
 )
 from metricflow.dataset.dataset import DataSet
 from metricflow.dataset.sql_dataset import SqlDataSet
-from metricflow.instances import InstanceSet
+from metricflow.instances import EntityInstance, InstanceSet
 from metricflow.mf_logging.pretty_print import mf_pformat
 from metricflow.model.semantics.semantic_model_join_evaluator import SemanticModelJoinEvaluator
 from metricflow.plan_conversion.instance_converters import CreateValidityWindowJoinDescription
 from metricflow.protocols.semantics import SemanticModelAccessor
-from metricflow.specs.specs import InstanceSpecSet, LinkableInstanceSpec, LinkableSpecSet, LinklessEntitySpec
+from metricflow.specs.specs import (
+    EntitySpec,
+    InstanceSpecSet,
+    LinkableInstanceSpec,
+    LinkableSpecSet,
+    LinklessEntitySpec,
+)
 from metricflow.sql.sql_plan import SqlJoinType
 
 logger = logging.getLogger(__name__)
@@ -128,6 +137,102 @@ class JoinLinkableInstancesRecipe:
         )
 
 
+@dataclass(frozen=True)
+class JoinableEntityInNode:
+    """An entity in a node that the node could be joined on.
+
+    Attributes:
+        entity_spec: The spec for the entity, without links.
+        semantic_model_reference: The semantic model that the entity is defined in.
+    """
+
+    entity_spec: LinklessEntitySpec
+    semantic_model_reference: SemanticModelReference
+
+
+@dataclass(frozen=True)
+class NodeJoinMetadata:
+    """Information needed to evaluate joining a node to a start node, which doesn't depend on the start node.
+
+    Attributes:
+        spec_set: The specs in the output data set of the node.
+        linkable_specs: The linkable specs in the output data set of the node.
+        joinable_entities: The entities in the node that it could be joined on, in the order of the data set.
+        validity_window: The validity window of the node, if it's an SCD.
+    """
+
+    spec_set: InstanceSpecSet
+    linkable_specs: FrozenSet[LinkableInstanceSpec]
+    joinable_entities: Tuple[JoinableEntityInNode, ...]
+    validity_window: Optional[ValidityWindowJoinDescription]
+
+
+class NodeJoinMetadataCache:
+    """Computes NodeJoinMetadata for nodes, reusing the results so that they can be shared across queries.
+
+    Nodes are weakly referenced so that nodes created for a single query (e.g. multi-hop join nodes) don't accumulate.
+    """
+
+    def __init__(  # noqa: D
+        self,
+        semantic_model_lookup: SemanticModelAccessor,
+        node_data_set_resolver: DataflowPlanNodeOutputDataSetResolver,
+    ) -> None:
+        self._semantic_model_lookup = semantic_model_lookup
+        self._node_data_set_resolver = node_data_set_resolver
+        self._node_to_metadata: WeakKeyDictionary[BaseOutput, NodeJoinMetadata] = WeakKeyDictionary()
+
+    def get(self, node: BaseOutput) -> NodeJoinMetadata:  # noqa: D
+        metadata = self._node_to_metadata.get(node)
+        if metadata is None:
+            metadata = self._create_metadata(node)
+            self._node_to_metadata[node] = metadata
+        return metadata
+
+    def _create_metadata(self, node: BaseOutput) -> NodeJoinMetadata:
+        data_set: SqlDataSet = self._node_data_set_resolver.get_output_data_set(node)
+        spec_set = data_set.instance_set.spec_set
+        entity_spec_to_instance: Dict[EntitySpec, EntityInstance] = {}
+        for instance in data_set.instance_set.entity_instances:
+            entity_spec_to_instance.setdefault(instance.spec, instance)
+
+        joinable_entities = []
+        for entity_spec in spec_set.entity_specs:
+            # If an entity has links, what that means and whether it can be used is unclear at the moment,
+            # so skip it.
+            if len(entity_spec.entity_links) > 0:
+                continue
+
+            entity_instance = entity_spec_to_instance.get(entity_spec)
+            if entity_instance is None:
+                raise RuntimeError(f"Could not find entity instance with name ({entity_spec})")
+
+            assert len(entity_instance.defined_from) == 1, f"Did not get exactly 1 defined_from in {entity_instance}"
+
+            entity_in_node = self._semantic_model_lookup.get_entity_in_semantic_model(entity_instance.defined_from[0])
+            if entity_in_node is None:
+                raise RuntimeError(f"Invalid SemanticModelElementReference {entity_instance.defined_from[0]}")
+
+            joinable_entities.append(
+                JoinableEntityInNode(
+                    entity_spec=LinklessEntitySpec.from_element_name(entity_spec.element_name),
+                    semantic_model_reference=entity_instance.defined_from[0].semantic_model_reference,
+                )
+            )
+
+        return NodeJoinMetadata(
+            spec_set=spec_set,
+            linkable_specs=frozenset(spec_set.linkable_specs),
+            joinable_entities=tuple(joinable_entities),
+            # Nodes without joinable entities (e.g. the time spine) aren't joined on an entity, so they don't need one.
+            validity_window=CreateValidityWindowJoinDescription(self._semantic_model_lookup).transform(
+                instance_set=data_set.instance_set
+            )
+            if len(joinable_entities) > 0
+            else None,
+        )
+
+
 @dataclass(frozen=True)
 class LinkableInstanceSatisfiabilityEvaluation:
     """Evaluation for a node on the ability to get linkable instances that we need to resolve a query.
@@ -162,6 +267,7 @@ class NodeEvaluatorForLinkableInstances:
         semantic_model_lookup: SemanticModelAccessor,
         nodes_available_for_joins: Sequence[BaseOutput],
         node_data_set_resolver: DataflowPlanNodeOutputDataSetResolver,
+        node_join_metadata_cache: Optional[NodeJoinMetadataCache] = None,
     ) -> None:
         """Constructor.
 
@@ -170,12 +276,26 @@ class NodeEvaluatorForLinkableInstances:
             nodes_available_for_joins: Nodes that contain linkable instances and may be joined with the "start_node"
             (e.g. the node containing a desired measure) to retrieve the needed linkable instances.
             node_data_set_resolver: Figures out what data set is output by a node.
+            node_join_metadata_cache: Shared cache of the join metadata for nodes. If not specified, a new one is used.
         """
         self._semantic_model_lookup = semantic_model_lookup
         self._nodes_available_for_joins = nodes_available_for_joins
         self._node_data_set_resolver = node_data_set_resolver
         self._partition_resolver = PartitionJoinResolver(self._semantic_model_lookup)
         self._join_evaluator = SemanticModelJoinEvaluator(self._semantic_model_lookup)
+        self._node_join_metadata_cache = node_join_metadata_cache or NodeJoinMetadataCache(
+            semantic_model_lookup=semantic_model_lookup, node_data_set_resolver=node_data_set_resolver
+        )
+
+        # Index from an entity to the (node index, entity index) of the nodes that can be joined on it. This allows the
+        # candidates for a linkable spec to be found without checking every node.
+        self._entity_to_join_candidates: Dict[LinklessEntitySpec, List[Tuple[int, int]]] = defaultdict(list)
+        self._node_join_metadata: List[NodeJoinMetadata] = []
+        for node_index, node in enumerate(nodes_available_for_joins):
+            node_join_metadata = self._node_join_metadata_cache.get(node)
+            self._node_join_metadata.append(node_join_metadata)
+            for entity_index, joinable_entity in enumerate(node_join_metadata.joinable_entities):
+                self._entity_to_join_candidates[joinable_entity.entity_spec].append((node_index, entity_index))
 
     def _find_joinable_candidate_nodes_that_can_satisfy_linkable_specs(
         self,
@@ -188,145 +308,118 @@ class NodeEvaluatorForLinkableInstances:
 
         The returned list is ordered by the number of "needed_linkable_specs" that it can satisfy.
         """
-        candidates_for_join: List[JoinLinkableInstancesRecipe] = []
         start_node_spec_set = start_node_instance_set.spec_set
-        for right_node in self._nodes_available_for_joins:
-            # If right node is time spine source node, use cross join.
-            if right_node == time_spine_source_node:
-                needed_metric_time_specs = LinkableSpecSet.from_specs(needed_linkable_specs).metric_time_specs
-                candidates_for_join.append(
-                    JoinLinkableInstancesRecipe(
-                        node_to_join=right_node,
-                        join_on_entity=None,
-                        satisfiable_linkable_specs=list(needed_metric_time_specs),
-                        join_on_partition_dimensions=(),
-                        join_on_partition_time_dimensions=(),
-                        join_type=SqlJoinType.CROSS_JOIN,
-                    )
-                )
-                continue
 
-            data_set_in_right_node: SqlDataSet = self._node_data_set_resolver.get_output_data_set(right_node)
-            linkable_specs_in_right_node = data_set_in_right_node.instance_set.spec_set.linkable_specs
-            entity_specs_in_right_node = data_set_in_right_node.instance_set.spec_set.entity_specs
+        # The semantic model of the entity in the start node that would be used for joining on an entity.
+        entity_reference_to_left_semantic_model: Dict[EntityReference, SemanticModelReference] = {}
+        for instance in start_node_instance_set.entity_instances:
+            if instance.spec.reference not in entity_reference_to_left_semantic_model:
+                assert len(instance.defined_from) == 1
+                entity_reference_to_left_semantic_model[instance.spec.reference] = instance.defined_from[
+                    0
+                ].semantic_model_reference
+
+        # Map from the (node index, entity index) of a candidate to the needed linkable specs that it can satisfy.
+        candidate_to_satisfiable_linkable_specs: Dict[Tuple[int, int], List[LinkableInstanceSpec]] = {}
+        # Whether the entity at (node index, entity index) can be used to join the node to the start node.
+        candidate_to_join_validity: Dict[Tuple[int, int], bool] = {}
+
+        # If right node is time spine source node, use cross join. An entity index of -1 is used for these candidates.
+        if time_spine_source_node is not None:
+            for node_index, node in enumerate(self._nodes_available_for_joins):
+                if node == time_spine_source_node:
+                    candidate_to_satisfiable_linkable_specs[(node_index, -1)] = list(
+                        LinkableSpecSet.from_specs(needed_linkable_specs).metric_time_specs
+                    )
 
-            # For each unlinked entity in the data set, create a candidate for joining.
-            # For a data set to be useful for satisfying a linkable spec, it needs to have the entity
-            # and the linkable spec without the entity. This allows joining based on the entity, which will
-            # then produce the linkable spec. See comments further below for more details.
+        for needed_linkable_spec in needed_linkable_specs:
+            if len(needed_linkable_spec.entity_links) == 0:
+                assert (
+                    needed_linkable_spec.element_name == METRIC_TIME_ELEMENT_NAME
+                ), "Only metric_time should have 0 entity links."
+                continue
 
-            for entity_spec_in_right_node in entity_specs_in_right_node:
-                # If an entity has links, what that means and whether it can be used is unclear at the moment,
-                # so skip it.
-                if len(entity_spec_in_right_node.entity_links) > 0:
+            # If the entity in the data set matches the link, then it can be used for joins. For example,
+            # if the node has the entity "user_id", and dimension "country" then it can be used for
+            # satisfying "user_id__country".
+            #
+            # Multi-hop example:
+            # required_linkable_spec = "user_id__device_id__platform"
+            # entity_spec_in_data_set = "user_id"
+            #
+            # Then the data set must contain "device_id__platform", which is realized with
+            #
+            # required_linkable_spec.remove_first_entity_link()
+            #
+            # We might also need to check the entity type and see if it's the type of join we're allowing,
+            # but since we're doing all left joins now, it's been left out.
+            required_entity_spec = LinklessEntitySpec.from_reference(needed_linkable_spec.entity_links[0])
+            needed_linkable_spec_in_node = needed_linkable_spec.without_first_entity_link
+            for candidate in self._entity_to_join_candidates.get(required_entity_spec, ()):
+                node_index, entity_index = candidate
+                if self._nodes_available_for_joins[node_index] == time_spine_source_node:
+                    continue
+                if needed_linkable_spec_in_node not in self._node_join_metadata[node_index].linkable_specs:
                     continue
 
-                entity_instance_in_right_node = None
-                for instance in data_set_in_right_node.instance_set.entity_instances:
-                    if instance.spec == entity_spec_in_right_node:
-                        entity_instance_in_right_node = instance
-                        break
-
-                if entity_instance_in_right_node is None:
-                    raise RuntimeError(f"Could not find entity instance with name ({entity_spec_in_right_node})")
-
-                assert (
-                    len(entity_instance_in_right_node.defined_from) == 1
-                ), f"Did not get exactly 1 defined_from in {entity_instance_in_right_node}"
-
-                entity_in_right_node = self._semantic_model_lookup.get_entity_in_semantic_model(
-                    entity_instance_in_right_node.defined_from[0]
-                )
-                if entity_in_right_node is None:
-                    raise RuntimeError(
-                        f"Invalid SemanticModelElementReference {entity_instance_in_right_node.defined_from[0]}"
+                is_valid_join = candidate_to_join_validity.get(candidate)
+                if is_valid_join is None:
+                    joinable_entity = self._node_join_metadata[node_index].joinable_entities[entity_index]
+                    left_semantic_model_reference = entity_reference_to_left_semantic_model.get(
+                        joinable_entity.entity_spec.reference
                     )
-
-                entity_instance_in_left_node = None
-                for instance in start_node_instance_set.entity_instances:
-                    if instance.spec.reference == entity_spec_in_right_node.reference:
-                        entity_instance_in_left_node = instance
-                        break
-
-                if entity_instance_in_left_node is None:
                     # The right node can have a superset of entities.
-                    continue
-
-                assert len(entity_instance_in_left_node.defined_from) == 1
-                assert len(entity_instance_in_right_node.defined_from) == 1
-
-                if not self._join_evaluator.is_valid_semantic_model_join(
-                    left_semantic_model_reference=entity_instance_in_left_node.defined_from[0].semantic_model_reference,
-                    right_semantic_model_reference=entity_instance_in_right_node.defined_from[
-                        0
-                    ].semantic_model_reference,
-                    on_entity_reference=entity_spec_in_right_node.reference,
-                ):
-                    continue
+                    is_valid_join = (
+                        left_semantic_model_reference is not None
+                        and self._join_evaluator.is_valid_semantic_model_join(
+                            left_semantic_model_reference=left_semantic_model_reference,
+                            right_semantic_model_reference=joinable_entity.semantic_model_reference,
+                            on_entity_reference=joinable_entity.entity_spec.reference,
+                        )
+                    )
+                    candidate_to_join_validity[candidate] = is_valid_join
 
-                linkless_entity_spec_in_node = LinklessEntitySpec.from_element_name(
-                    entity_spec_in_right_node.element_name
-                )
+                if is_valid_join:
+                    candidate_to_satisfiable_linkable_specs.setdefault(candidate, []).append(needed_linkable_spec)
 
-                satisfiable_linkable_specs = []
-                for needed_linkable_spec in needed_linkable_specs:
-                    if len(needed_linkable_spec.entity_links) == 0:
-                        assert (
-                            needed_linkable_spec.element_name == METRIC_TIME_ELEMENT_NAME
-                        ), "Only metric_time should have 0 entity links."
-                        continue
-
-                    # If the entity in the data set matches the link, then it can be used for joins. For example,
-                    # if the node has the entity "user_id", and dimension "country" then it can be used for
-                    # satisfying "user_id__country".
-                    #
-                    # Multi-hop example:
-                    # required_linkable_spec = "user_id__device_id__platform"
-                    # entity_spec_in_data_set = "user_id"
-                    #
-                    # Then the data set must contain "device_id__platform", which is realized with
-                    #
-                    # required_linkable_spec.remove_first_entity_link()
-                    #
-                    # We might also need to check the entity type and see if it's the type of join we're allowing,
-                    # but since we're doing all left joins now, it's been left out.
-
-                    required_entity_matches_data_set_entity = (
-                        LinklessEntitySpec.from_reference(needed_linkable_spec.entity_links[0])
-                        == linkless_entity_spec_in_node
-                    )
-                    needed_linkable_spec_in_node = (
-                        needed_linkable_spec.without_first_entity_link in linkable_specs_in_right_node
+        # Create the candidates in the order of the nodes, and the entities within the nodes.
+        candidates_for_join: List[JoinLinkableInstancesRecipe] = []
+        for (node_index, entity_index), satisfiable_linkable_specs in sorted(
+            candidate_to_satisfiable_linkable_specs.items()
+        ):
+            right_node = self._nodes_available_for_joins[node_index]
+            if entity_index == -1:
+                candidates_for_join.append(
+                    JoinLinkableInstancesRecipe(
+                        node_to_join=right_node,
+                        join_on_entity=None,
+                        satisfiable_linkable_specs=satisfiable_linkable_specs,
+                        join_on_partition_dimensions=(),
+                        join_on_partition_time_dimensions=(),
+                        join_type=SqlJoinType.CROSS_JOIN,
                     )
-                    if required_entity_matches_data_set_entity and needed_linkable_spec_in_node:
-                        satisfiable_linkable_specs.append(needed_linkable_spec)
+                )
+                continue
 
-                # If this node can satisfy some linkable specs, it could be useful to join on, so add it to the
-                # candidate list.
-                if len(satisfiable_linkable_specs) > 0:
-                    join_on_partition_dimensions = self._partition_resolver.resolve_partition_dimension_joins(
+            # This node can satisfy some linkable specs, so it could be useful to join on.
+            node_join_metadata = self._node_join_metadata[node_index]
+            candidates_for_join.append(
+                JoinLinkableInstancesRecipe(
+                    node_to_join=right_node,
+                    join_on_entity=node_join_metadata.joinable_entities[entity_index].entity_spec,
+                    satisfiable_linkable_specs=satisfiable_linkable_specs,
+                    join_on_partition_dimensions=self._partition_resolver.resolve_partition_dimension_joins(
                         start_node_spec_set=start_node_spec_set,
-                        node_to_join_spec_set=data_set_in_right_node.instance_set.spec_set,
-                    )
-                    join_on_partition_time_dimensions = self._partition_resolver.resolve_partition_time_dimension_joins(
+                        node_to_join_spec_set=node_join_metadata.spec_set,
+                    ),
+                    join_on_partition_time_dimensions=self._partition_resolver.resolve_partition_time_dimension_joins(
                         start_node_spec_set=start_node_spec_set,
-                        node_to_join_spec_set=data_set_in_right_node.instance_set.spec_set,
-                    )
-                    validity_window_join_description = CreateValidityWindowJoinDescription(
-                        self._semantic_model_lookup
-                    ).transform(instance_set=data_set_in_right_node.instance_set)
-
-                    candidates_for_join.append(
-                        JoinLinkableInstancesRecipe(
-                            node_to_join=right_node,
-                            join_on_entity=linkless_entity_spec_in_node,
-                            satisfiable_linkable_specs=satisfiable_linkable_specs,
-                            join_on_partition_dimensions=join_on_partition_dimensions,
-                            join_on_partition_time_dimensions=join_on_partition_time_dimensions,
-                            validity_window=validity_window_join_description,
-                            join_type=default_join_type,
-                        )
-                    )
+                        node_to_join_spec_set=node_join_metadata.spec_set,
+                    ),
+                    validity_window=node_join_metadata.validity_window,
+                    join_type=default_join_type,
+                )
+            )
 
         # Return with the candidate set that can satisfy the most linkable specs at the front.
         return sorted(
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from typing import List, Sequence
 
-from dbt_semantic_interfaces.references import TimeDimensionReference
+from dbt_semantic_interfaces.protocols.dimension import DimensionType
+from dbt_semantic_interfaces.protocols.semantic_model import SemanticModel
+from dbt_semantic_interfaces.references import SemanticModelReference, TimeDimensionReference
 
+from metricflow.aggregation_properties import is_expansive
 from metricflow.dataflow.dataflow_plan import (
     BaseOutput,
     MetricTimeDimensionTransformNode,
@@ -12,6 +15,7 @@ from metricflow.dataflow.dataflow_plan import (
 from metricflow.dataset.convert_semantic_model import SemanticModelToDataSetConverter
 from metricflow.dataset.semantic_model_adapter import SemanticModelDataSet
 from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.plan_conversion.rollup_table import RollupTable
 from metricflow.plan_conversion.time_spine import TimeSpineSource
 
 
@@ -51,6 +55,100 @@ class SourceNodeBuilder:
                     )
         return source_nodes
 
+    def create_from_rollup_tables(
+        self, rollup_tables: Sequence[RollupTable], data_set_converter: SemanticModelToDataSetConverter
+    ) -> Sequence[BaseOutput]:
+        """Creates source nodes that read measures from rollup tables instead of the tables of the semantic models.
+
+        Raises a ValueError if a rollup table refers to elements that don't exist, or that can't be read from a rollup.
+        """
+        source_nodes: List[BaseOutput] = []
+        for rollup_table in rollup_tables:
+            semantic_model = self._validate_rollup_table(rollup_table)
+            data_set = data_set_converter.create_sql_rollup_data_set(
+                semantic_model=semantic_model, rollup_table=rollup_table
+            )
+            source_nodes.append(
+                MetricTimeDimensionTransformNode(
+                    parent_node=ReadSqlSourceNode(data_set),
+                    aggregation_time_dimension_reference=TimeDimensionReference(
+                        element_name=rollup_table.time_dimension_name
+                    ),
+                )
+            )
+        return source_nodes
+
+    def _validate_rollup_table(self, rollup_table: RollupTable) -> SemanticModel:
+        """Checks that the rollup table can be read instead of the semantic model, and returns the semantic model."""
+        semantic_model = self._semantic_manifest_lookup.semantic_model_lookup.get_by_reference(
+            SemanticModelReference(semantic_model_name=rollup_table.semantic_model_name)
+        )
+        if semantic_model is None:
+            raise ValueError(
+                f"The rollup table {rollup_table.sql_table.sql} refers to the semantic model "
+                f"'{rollup_table.semantic_model_name}', but it does not exist."
+            )
+        if len(rollup_table.measure_names) == 0:
+            raise ValueError(f"The rollup table {rollup_table.sql_table.sql} does not have any measures.")
+
+        measures = {measure.name: measure for measure in semantic_model.measures}
+        for measure_name in rollup_table.measure_names:
+            measure = measures.get(measure_name)
+            if measure is None:
+                raise ValueError(
+                    f"The rollup table {rollup_table.sql_table.sql} has the measure '{measure_name}', but it does not "
+                    f"exist in the semantic model '{semantic_model.name}'."
+                )
+            if not is_expansive(measure.agg):
+                raise ValueError(
+                    f"The measure '{measure_name}' can't be read from the rollup table {rollup_table.sql_table.sql} "
+                    f"since {measure.agg.name} values can't be aggregated again."
+                )
+            if measure.non_additive_dimension is not None:
+                raise ValueError(
+                    f"The measure '{measure_name}' can't be read from the rollup table {rollup_table.sql_table.sql} "
+                    f"since it has a non-additive dimension."
+                )
+            agg_time_dimension = (
+                self._semantic_manifest_lookup.semantic_model_lookup.get_agg_time_dimension_for_measure(
+                    measure.reference
+                )
+            )
+            if agg_time_dimension.element_name != rollup_table.time_dimension_name:
+                raise ValueError(
+                    f"The measure '{measure_name}' has the aggregation time dimension "
+                    f"'{agg_time_dimension.element_name}', but the time dimension in the rollup table "
+                    f"{rollup_table.sql_table.sql} is '{rollup_table.time_dimension_name}'."
+                )
+
+        dimensions = {dimension.name: dimension for dimension in semantic_model.dimensions}
+        time_dimension = dimensions[rollup_table.time_dimension_name]
+        if time_dimension.type_params is not None and (
+            rollup_table.time_granularity.to_int() < time_dimension.type_params.time_granularity.to_int()
+        ):
+            raise ValueError(
+                f"The time dimension in the rollup table {rollup_table.sql_table.sql} has the granularity "
+                f"{rollup_table.time_granularity.name}, but '{time_dimension.name}' is defined with the coarser "
+                f"granularity {time_dimension.type_params.time_granularity.name}."
+            )
+        for dimension_name in rollup_table.dimension_names:
+            dimension = dimensions.get(dimension_name)
+            if dimension is None or dimension.type is not DimensionType.CATEGORICAL:
+                raise ValueError(
+                    f"The rollup table {rollup_table.sql_table.sql} has the dimension '{dimension_name}', but it is "
+                    f"not a categorical dimension in the semantic model '{semantic_model.name}'."
+                )
+
+        entity_names = {entity.name for entity in semantic_model.entities}
+        for entity_name in rollup_table.entity_names:
+            if entity_name not in entity_names:
+                raise ValueError(
+                    f"The rollup table {rollup_table.sql_table.sql} has the entity '{entity_name}', but it does not "
+                    f"exist in the semantic model '{semantic_model.name}'."
+                )
+
+        return semantic_model
+
     def create_read_nodes_from_data_sets(
         self, data_sets: Sequence[SemanticModelDataSet]
     ) -> Sequence[ReadSqlSourceNode]:
@@ -6,7 +6,7 @@ import logging
 import textwrap
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+from typing import Generic, Hashable, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 import jinja2
 from dbt_semantic_interfaces.protocols.metric import MetricTimeWindow
@@ -31,6 +31,7 @@ from metricflow.dag.id_generation import (
     DATAFLOW_NODE_SEMI_ADDITIVE_JOIN_ID_PREFIX,
     DATAFLOW_NODE_SET_MEASURE_AGGREGATION_TIME,
     DATAFLOW_NODE_WHERE_CONSTRAINT_ID_PREFIX,
+    DATAFLOW_NODE_WINDOW_OVER_TIME_RANGE_ID_PREFIX,
     DATAFLOW_NODE_WRITE_TO_RESULT_DATAFRAME_ID_PREFIX,
 )
 from metricflow.dag.mf_dag import DagId, DagNode, DisplayedProperty, MetricFlowDag, NodeId
@@ -63,6 +64,13 @@ logger = logging.getLogger(__name__)
 NodeSelfT = TypeVar("NodeSelfT", bound="DataflowPlanNode")
 
 
+def _metric_time_window_parameters(window: Optional[MetricTimeWindow]) -> Optional[Tuple[int, TimeGranularity]]:
+    """Return the values of a window for use in DataflowPlanNode.structural_parameters."""
+    if window is None:
+        return None
+    return window.count, window.granularity
+
+
 class DataflowPlanNode(DagNode, Visitable, ABC):
     """A node in the graph representation of the dataflow.
 
@@ -78,6 +86,7 @@ class DataflowPlanNode(DagNode, Visitable, ABC):
             parent_nodes: data comes from the parent nodes.
         """
         self._parent_nodes = parent_nodes
+        self._structural_fingerprint: Optional[int] = None
         super().__init__(node_id=node_id)
 
     @property
@@ -98,6 +107,51 @@ class DataflowPlanNode(DagNode, Visitable, ABC):
         """
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def structural_parameters(self) -> Tuple[Hashable, ...]:
+        """Return the parameters that determine the output of this node, aside from the parent nodes.
+
+        Two nodes of the same class with equal parameters and structurally identical parents output the same data. Unlike
+        functionally_identical(), this includes all parameters, and the values need to be hashable.
+        """
+        raise NotImplementedError
+
+    @property
+    def structural_fingerprint(self) -> int:
+        """Return a hash of the class, parameters, and parents of this node, so it's the same for identical subtrees.
+
+        Nodes are immutable, so this is only computed once. Different subtrees can have the same fingerprint, so use
+        structurally_identical() to check if they are identical. This uses hash(), which is salted per process for
+        strings, and some parameters are hashed by identity, so the fingerprint is only meaningful within a process and
+        shouldn't be persisted or compared across processes.
+        """
+        if self._structural_fingerprint is None:
+            self._structural_fingerprint = hash(
+                (
+                    self.__class__,
+                    self.structural_parameters,
+                    tuple(parent_node.structural_fingerprint for parent_node in self.parent_nodes),
+                )
+            )
+        return self._structural_fingerprint
+
+    def structurally_identical(self, other_node: DataflowPlanNode) -> bool:
+        """Returns true if the subtree rooted at this node computes the same data as the subtree of the other node."""
+        if other_node is self:
+            return True
+        if (
+            other_node.structural_fingerprint != self.structural_fingerprint
+            or other_node.__class__ is not self.__class__
+            or other_node.structural_parameters != self.structural_parameters
+            or len(other_node.parent_nodes) != len(self.parent_nodes)
+        ):
+            return False
+        return all(
+            parent_node.structurally_identical(other_parent_node)
+            for parent_node, other_parent_node in zip(self.parent_nodes, other_node.parent_nodes)
+        )
+
     @abstractmethod
     def with_new_parents(self: NodeSelfT, new_parent_nodes: Sequence[BaseOutput]) -> NodeSelfT:
         """Creates a node with the same behavior as this node, but with a different set of parents.
@@ -168,6 +222,10 @@ class DataflowPlanNodeVisitor(Generic[VisitorOutputT], ABC):
     def visit_join_over_time_range_node(self, node: JoinOverTimeRangeNode) -> VisitorOutputT:  # noqa: D
         pass
 
+    @abstractmethod
+    def visit_window_over_time_range_node(self, node: WindowOverTimeRangeNode) -> VisitorOutputT:  # noqa: D
+        pass
+
     @abstractmethod
     def visit_semi_additive_join_node(self, node: SemiAdditiveJoinNode) -> VisitorOutputT:  # noqa: D
         pass
@@ -250,6 +308,10 @@ class ReadSqlSourceNode(BaseOutput):
     def functionally_identical(self, other_node: DataflowPlanNode) -> bool:  # noqa: D
         return isinstance(other_node, self.__class__) and other_node.data_set == self.data_set
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (self.data_set,)
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> ReadSqlSourceNode:  # noqa: D
         assert len(new_parent_nodes) == 0
         return ReadSqlSourceNode(data_set=self.data_set)
@@ -348,6 +410,19 @@ class JoinToBaseOutputNode(BaseOutput):
                 return False
         return True
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return tuple(
+            (
+                join_target.join_on_entity,
+                join_target.join_type,
+                join_target.join_on_partition_dimensions,
+                join_target.join_on_partition_time_dimensions,
+                join_target.validity_window,
+            )
+            for join_target in self._join_targets
+        )
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> JoinToBaseOutputNode:  # noqa: D
         assert len(new_parent_nodes) > 1
         new_left_node = new_parent_nodes[0]
@@ -440,6 +515,10 @@ class JoinOverTimeRangeNode(BaseOutput):
             and other_node.time_range_constraint == self.time_range_constraint
         )
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (self.grain_to_date, _metric_time_window_parameters(self.window), self.time_range_constraint)
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> JoinOverTimeRangeNode:  # noqa: D
         assert len(new_parent_nodes) == 1
         return JoinOverTimeRangeNode(
@@ -513,6 +592,10 @@ class AggregateMeasuresNode(AggregatedMeasuresOutput):
             and other_node.metric_input_measure_specs == self.metric_input_measure_specs
         )
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return tuple(self.metric_input_measure_specs)
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> AggregateMeasuresNode:  # noqa: D
         assert len(new_parent_nodes) == 1
         return AggregateMeasuresNode(
@@ -644,6 +727,15 @@ class SemiAdditiveJoinNode(BaseOutput):
             and other_node.queried_time_dimension_spec == self.queried_time_dimension_spec
         )
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (
+            tuple(self.entity_specs),
+            self.time_dimension_spec,
+            self.agg_by_function,
+            self.queried_time_dimension_spec,
+        )
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> SemiAdditiveJoinNode:  # noqa: D
         assert len(new_parent_nodes) == 1
 
@@ -757,6 +849,16 @@ class JoinToTimeSpineNode(BaseOutput, ABC):
             and other_node.join_type == self.join_type
         )
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (
+            tuple(self.requested_metric_time_dimension_specs),
+            self.time_range_constraint,
+            _metric_time_window_parameters(self.offset_window),
+            self.offset_to_grain,
+            self.join_type,
+        )
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> JoinToTimeSpineNode:  # noqa: D
         assert len(new_parent_nodes) == 1
         return JoinToTimeSpineNode(
@@ -818,6 +920,10 @@ class ComputeMetricsNode(ComputedMetricsOutput):
 
         return isinstance(other_node, self.__class__) and other_node.metric_specs == self.metric_specs
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return tuple(self.metric_specs)
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> ComputeMetricsNode:  # noqa: D
         assert len(new_parent_nodes) == 1
         return ComputeMetricsNode(
@@ -889,6 +995,10 @@ class OrderByLimitNode(ComputedMetricsOutput):
             and other_node.limit == self.limit
         )
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (tuple(self.order_by_specs), self.limit)
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> OrderByLimitNode:  # noqa: D
         assert len(new_parent_nodes) == 1
 
@@ -951,6 +1061,10 @@ class MetricTimeDimensionTransformNode(BaseOutput):
             and other_node.aggregation_time_dimension_reference == self.aggregation_time_dimension_reference
         )
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (self.aggregation_time_dimension_reference,)
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> MetricTimeDimensionTransformNode:  # noqa: D
         assert len(new_parent_nodes) == 1
         return MetricTimeDimensionTransformNode(
@@ -1013,6 +1127,10 @@ class WriteToResultDataframeNode(SinkOutput):
     def functionally_identical(self, other_node: DataflowPlanNode) -> bool:  # noqa: D
         return isinstance(other_node, self.__class__)
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return ()
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> WriteToResultDataframeNode:  # noqa: D
         assert len(new_parent_nodes) == 1
         return WriteToResultDataframeNode(parent_node=new_parent_nodes[0])
@@ -1062,6 +1180,10 @@ class WriteToResultTableNode(SinkOutput):
     def functionally_identical(self, other_node: DataflowPlanNode) -> bool:  # noqa: D
         return isinstance(other_node, self.__class__) and other_node.output_sql_table == self.output_sql_table
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (self.output_sql_table,)
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> WriteToResultTableNode:  # noqa: D
         return WriteToResultTableNode(
             parent_node=new_parent_nodes[0],
@@ -1129,6 +1251,10 @@ class FilterElementsNode(BaseOutput):
             and other_node.distinct == self.distinct
         )
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (self.include_specs, self.distinct, self._replace_description)
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> FilterElementsNode:  # noqa: D
         assert len(new_parent_nodes) == 1
         return FilterElementsNode(
@@ -1176,6 +1302,10 @@ class WhereConstraintNode(AggregatedMeasuresOutput):
     def functionally_identical(self, other_node: DataflowPlanNode) -> bool:  # noqa: D
         return isinstance(other_node, self.__class__) and other_node.where == self.where
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (self.where,)
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> WhereConstraintNode:  # noqa: D
         assert len(new_parent_nodes) == 1
         return WhereConstraintNode(
@@ -1207,8 +1337,12 @@ class CombineAggregatedOutputsNode(ComputedMetricsOutput):
     def functionally_identical(self, other_node: DataflowPlanNode) -> bool:  # noqa: D
         return isinstance(other_node, self.__class__)
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return ()
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> CombineAggregatedOutputsNode:  # noqa: D
-        assert len(new_parent_nodes) == 1
+        assert len(new_parent_nodes) == len(self.parent_nodes)
         return CombineAggregatedOutputsNode(parent_nodes=new_parent_nodes)
 
 
@@ -1260,6 +1394,10 @@ class ConstrainTimeRangeNode(AggregatedMeasuresOutput, BaseOutput):
     def functionally_identical(self, other_node: DataflowPlanNode) -> bool:  # noqa: D
         return isinstance(other_node, self.__class__) and self.time_range_constraint == other_node.time_range_constraint
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (self.time_range_constraint,)
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> ConstrainTimeRangeNode:  # noqa: D
         assert len(new_parent_nodes) == 1
         return ConstrainTimeRangeNode(
@@ -1268,6 +1406,113 @@ class ConstrainTimeRangeNode(AggregatedMeasuresOutput, BaseOutput):
         )
 
 
+class WindowOverTimeRangeNode(AggregatedMeasuresOutput, BaseOutput):
+    """Computes cumulative measures from measures that were aggregated by metric_time using window functions.
+
+    This is an alternative to JoinOverTimeRangeNode for additive measures. Instead of joining every input row to every
+    time spine row in its window before aggregation, the measures are aggregated by day first, and then summed over a
+    window of rows in the time spine. The parent should have the measures aggregated by metric_time at DAY granularity,
+    and it may also have other group-by items, in which case the window is computed separately for each group.
+    """
+
+    # The number of days in the window granularities that are supported.
+    WINDOW_GRANULARITY_TO_DAY_COUNT = {TimeGranularity.DAY: 1, TimeGranularity.WEEK: 7}
+
+    def __init__(
+        self,
+        parent_node: BaseOutput,
+        window: Optional[MetricTimeWindow],
+        grain_to_date: Optional[TimeGranularity],
+        time_range_constraint: Optional[TimeRangeConstraint] = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            parent_node: node with the measures aggregated by metric_time.
+            window: time window to sum over. The granularity must be a fixed number of days (i.e. DAY or WEEK).
+            grain_to_date: indicates time range should start from the beginning of this time granularity
+            (eg month to day)
+            time_range_constraint: time range of the time spine. This should include the rows that are in the window
+            for the first row that's needed.
+        """
+        if window and grain_to_date:
+            raise RuntimeError(
+                f"This node cannot be initialized with both window and grain_to_date set. This configuration should "
+                f"have been prevented by model validation. window: {window}. grain_to_date: {grain_to_date}."
+            )
+        if window and window.granularity not in WindowOverTimeRangeNode.WINDOW_GRANULARITY_TO_DAY_COUNT:
+            raise RuntimeError(f"The window for this node must be in days or weeks. Got: {window}")
+        self._window = window
+        self._grain_to_date = grain_to_date
+        self._time_range_constraint = time_range_constraint
+        super().__init__(node_id=self.create_unique_id(), parent_nodes=[parent_node])
+
+    @classmethod
+    def id_prefix(cls) -> str:  # noqa: D
+        return DATAFLOW_NODE_WINDOW_OVER_TIME_RANGE_ID_PREFIX
+
+    def accept(self, visitor: DataflowPlanNodeVisitor[VisitorOutputT]) -> VisitorOutputT:  # noqa: D
+        return visitor.visit_window_over_time_range_node(self)
+
+    @property
+    def description(self) -> str:  # noqa: D
+        return """Window Over Time Range"""
+
+    @property
+    def parent_node(self) -> BaseOutput:  # noqa: D
+        assert len(self.parent_nodes) == 1
+        parent_node = self.parent_nodes[0]
+        assert isinstance(parent_node, BaseOutput)
+        return parent_node
+
+    @property
+    def window(self) -> Optional[MetricTimeWindow]:  # noqa: D
+        return self._window
+
+    @property
+    def grain_to_date(self) -> Optional[TimeGranularity]:  # noqa: D
+        return self._grain_to_date
+
+    @property
+    def time_range_constraint(self) -> Optional[TimeRangeConstraint]:  # noqa: D
+        return self._time_range_constraint
+
+    @property
+    def window_day_count(self) -> Optional[int]:
+        """The number of days in the window, or None if there isn't a window."""
+        if self.window is None:
+            return None
+        return self.window.count * WindowOverTimeRangeNode.WINDOW_GRANULARITY_TO_DAY_COUNT[self.window.granularity]
+
+    @property
+    def displayed_properties(self) -> List[DisplayedProperty]:  # noqa: D
+        return super().displayed_properties + [
+            DisplayedProperty("window_day_count", self.window_day_count),
+            DisplayedProperty("grain_to_date", self.grain_to_date),
+        ]
+
+    def functionally_identical(self, other_node: DataflowPlanNode) -> bool:  # noqa: D
+        return (
+            isinstance(other_node, self.__class__)
+            and other_node.grain_to_date == self.grain_to_date
+            and other_node.window_day_count == self.window_day_count
+            and other_node.time_range_constraint == self.time_range_constraint
+        )
+
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (self.grain_to_date, _metric_time_window_parameters(self.window), self.time_range_constraint)
+
+    def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> WindowOverTimeRangeNode:  # noqa: D
+        assert len(new_parent_nodes) == 1
+        return WindowOverTimeRangeNode(
+            parent_node=new_parent_nodes[0],
+            window=self.window,
+            grain_to_date=self.grain_to_date,
+            time_range_constraint=self.time_range_constraint,
+        )
+
+
 class MinMaxNode(BaseOutput):
     """Calculate the min and max of a single instance data set."""
 
@@ -1293,6 +1538,10 @@ class MinMaxNode(BaseOutput):
     def functionally_identical(self, other_node: DataflowPlanNode) -> bool:  # noqa: D
         return isinstance(other_node, self.__class__)
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return ()
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> MinMaxNode:  # noqa: D
         assert len(new_parent_nodes) == 1
         return MinMaxNode(parent_node=new_parent_nodes[0])
@@ -1327,6 +1576,10 @@ class AddGeneratedUuidColumnNode(BaseOutput):
     def functionally_identical(self, other_node: DataflowPlanNode) -> bool:  # noqa: D
         return isinstance(other_node, self.__class__)
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return ()
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> AddGeneratedUuidColumnNode:  # noqa: D
         assert len(new_parent_nodes) == 1
         return AddGeneratedUuidColumnNode(parent_node=new_parent_nodes[0])
@@ -1448,6 +1701,18 @@ class JoinConversionEventsNode(BaseOutput):
             and other_node.constant_properties == self.constant_properties
         )
 
+    @property
+    def structural_parameters(self) -> Tuple[Hashable, ...]:  # noqa: D
+        return (
+            self.base_time_dimension_spec,
+            self.conversion_time_dimension_spec,
+            self.conversion_measure_spec,
+            tuple(self.unique_identifier_keys),
+            self.entity_spec,
+            _metric_time_window_parameters(self.window),
+            tuple(self.constant_properties) if self.constant_properties is not None else None,
+        )
+
     def with_new_parents(self, new_parent_nodes: Sequence[BaseOutput]) -> JoinConversionEventsNode:  # noqa: D
         assert len(new_parent_nodes) == 2
         return JoinConversionEventsNode(
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from typing import Dict, List, TypeVar
+
+from metricflow.dataflow.dataflow_plan import BaseOutput, DataflowPlanNode
+
+logger = logging.getLogger(__name__)
+
+NodeT = TypeVar("NodeT", bound=DataflowPlanNode)
+
+
+class DataflowPlanNodeInterner:
+    """Returns the same node object for subtrees that are structurally identical (i.e. hash-consing).
+
+    When a node is interned, its parents are interned first, so all nodes in the returned subtree are ones that have
+    been interned. Identical subtrees in a plan, or across plans, then become shared nodes, so results that are
+    cached by node (e.g. the output data set) are only computed once. This class is thread-safe.
+
+    Nodes are referenced weakly, so an interned node is only kept while it's used elsewhere (e.g. by a cached plan).
+    """
+
+    def __init__(self, min_fingerprint_count_to_prune: int = 1024) -> None:
+        """Constructor.
+
+        Args:
+            min_fingerprint_count_to_prune: The number of structural fingerprints that are tracked before the ones
+            whose nodes have all been released are first removed.
+        """
+        self._structural_fingerprint_to_nodes: Dict[int, weakref.WeakSet[DataflowPlanNode]] = {}
+        self._min_fingerprint_count_to_prune = min_fingerprint_count_to_prune
+        # Fingerprints without nodes are removed when the number of fingerprints reaches this count.
+        self._fingerprint_count_to_prune = min_fingerprint_count_to_prune
+        # Maps the nodes that were passed in to the interned node, so that shared parents are only interned once.
+        self._node_to_interned_node: weakref.WeakKeyDictionary[
+            DataflowPlanNode, weakref.ReferenceType[DataflowPlanNode]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.RLock()
+        self._hit_count = 0
+        self._miss_count = 0
+
+    def intern(self, node: NodeT) -> NodeT:
+        """Return the previously interned node that's structurally identical to the given node.
+
+        If there isn't one, the given node is interned and returned. If the parents of the node were replaced by
+        interned nodes, a copy of the node with those parents is interned instead.
+        """
+        with self._lock:
+            interned_node_ref = self._node_to_interned_node.get(node)
+            interned_node = interned_node_ref() if interned_node_ref is not None else None
+            if interned_node is not None:
+                assert isinstance(interned_node, node.__class__)
+                return interned_node
+
+            interned_parent_nodes: List[BaseOutput] = []
+            for parent_node in node.parent_nodes:
+                interned_parent_node = self.intern(parent_node)
+                assert isinstance(interned_parent_node, BaseOutput)
+                interned_parent_nodes.append(interned_parent_node)
+
+            node_with_interned_parents = node
+            if any(
+                interned_parent_node is not parent_node
+                for interned_parent_node, parent_node in zip(interned_parent_nodes, node.parent_nodes)
+            ):
+                node_with_interned_parents = node.with_new_parents(interned_parent_nodes)
+
+            interned_node = self._find_or_add(node_with_interned_parents)
+            # The value is a weak reference as the interned node is often the given node.
+            self._node_to_interned_node[node] = weakref.ref(interned_node)
+            assert isinstance(interned_node, node.__class__)
+            return interned_node
+
+    def _find_or_add(self, node: DataflowPlanNode) -> DataflowPlanNode:
+        nodes = self._structural_fingerprint_to_nodes.get(node.structural_fingerprint)
+        if nodes is None:
+            self._prune_fingerprints_if_needed()
+            nodes = weakref.WeakSet()
+            self._structural_fingerprint_to_nodes[node.structural_fingerprint] = nodes
+
+        for other_node in list(nodes):
+            # As the parents of both nodes are interned, this only needs to compare the parents by identity.
+            if other_node.structurally_identical(node):
+                self._hit_count += 1
+                return other_node
+
+        self._miss_count += 1
+        nodes.add(node)
+        return node
+
+    def _prune_fingerprints_if_needed(self) -> None:
+        """Remove the fingerprints whose nodes have all been released, once enough fingerprints have been added.
+
+        The threshold is doubled from the number of fingerprints that are left, so the cost is amortized over the
+        fingerprints that are added.
+        """
+        if len(self._structural_fingerprint_to_nodes) < self._fingerprint_count_to_prune:
+            return
+
+        released_fingerprints = [
+            fingerprint for fingerprint, nodes in self._structural_fingerprint_to_nodes.items() if len(nodes) == 0
+        ]
+        for fingerprint in released_fingerprints:
+            del self._structural_fingerprint_to_nodes[fingerprint]
+        self._fingerprint_count_to_prune = max(
+            2 * len(self._structural_fingerprint_to_nodes), self._min_fingerprint_count_to_prune
+        )
+        logger.debug(f"Removed {len(released_fingerprints)} fingerprints without nodes from the interner")
+
+    @property
+    def hit_count(self) -> int:
+        """The number of interned nodes that were replaced by an existing node."""
+        return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """The number of interned nodes that didn't match an existing node."""
+        return self._miss_count
+
+    @property
+    def fingerprint_count(self) -> int:
+        """The number of structural fingerprints that are tracked, including ones whose nodes may have been released."""
+        with self._lock:
+            return len(self._structural_fingerprint_to_nodes)
+
+    def __len__(self) -> int:
+        """The number of interned nodes that are still in use."""
+        with self._lock:
+            return sum(len(nodes) for nodes in self._structural_fingerprint_to_nodes.values())
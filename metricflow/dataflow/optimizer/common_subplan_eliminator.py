@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import logging
+
+from metricflow.dag.id_generation import OPTIMIZED_DATAFLOW_PLAN_PREFIX, IdGeneratorRegistry
+from metricflow.dataflow.dataflow_plan import DataflowPlan
+from metricflow.dataflow.dataflow_plan_node_interner import DataflowPlanNodeInterner
+from metricflow.dataflow.optimizer.dataflow_plan_optimizer import DataflowPlanOptimizer
+
+logger = logging.getLogger(__name__)
+
+
+class CommonSubplanEliminator(DataflowPlanOptimizer):
+    """Replaces structurally identical subplans anywhere in a dataflow plan with a single, shared subplan.
+
+    When a query has several metrics that are computed from the same measures (e.g. derived metrics that share an input
+    metric), the builder creates a separate branch for each of them. After this optimizer runs, those branches share
+    the same nodes, so the SQL for shared aggregations can be generated once and referenced through a common table
+    expression (CTE) instead of being repeated for every metric.
+
+    Since this only merges nodes that produce identical outputs, it can be run before or after other optimizers. It's
+    generally run last so that branches that other optimizers produce are merged as well.
+    """
+
+    def __init__(self) -> None:  # noqa: D
+        self._log_level = logging.DEBUG
+
+    def optimize(self, dataflow_plan: DataflowPlan) -> DataflowPlan:  # noqa: D
+        node_interner = DataflowPlanNodeInterner()
+        sink_output_nodes = [node_interner.intern(sink_node) for sink_node in dataflow_plan.sink_output_nodes]
+
+        logger.log(
+            level=self._log_level,
+            msg=f"Found {node_interner.hit_count} node(s) that could be replaced by a shared node. Optimized:\n\n"
+            f"{dataflow_plan.sink_output_node.text_structure()}\n\n"
+            f"to:\n\n"
+            f"{sink_output_nodes[0].text_structure()}",
+        )
+
+        plan_id = IdGeneratorRegistry.for_class(self.__class__).create_id(OPTIMIZED_DATAFLOW_PLAN_PREFIX)
+        logger.log(level=self._log_level, msg=f"Optimized plan ID is {plan_id}")
+        return DataflowPlan(plan_id=plan_id, sink_output_nodes=sink_output_nodes)
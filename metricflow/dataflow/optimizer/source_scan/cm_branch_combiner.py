@@ -24,6 +24,7 @@ from metricflow.dataflow.dataflow_plan import (
     ReadSqlSourceNode,
     SemiAdditiveJoinNode,
     WhereConstraintNode,
+    WindowOverTimeRangeNode,
     WriteToResultDataframeNode,
     WriteToResultTableNode,
 )
@@ -186,6 +187,13 @@ class ComputeMetricsBranchCombiner(DataflowPlanNodeVisitor[ComputeMetricsBranchC
         return combined_parents
 
     def _default_handler(self, current_right_node: BaseOutput) -> ComputeMetricsBranchCombinerResult:  # noqa: D
+        # If the branches are identical, the combination is either branch, so there's no need to go through the parents.
+        if self._current_left_node.structurally_identical(current_right_node):
+            self._log_combine_success(
+                left_node=self._current_left_node, right_node=current_right_node, combined_node=current_right_node
+            )
+            return ComputeMetricsBranchCombinerResult(current_right_node)
+
         combined_parent_nodes = self._combine_parent_branches(current_right_node)
         if combined_parent_nodes is None:
             return ComputeMetricsBranchCombinerResult()
@@ -400,6 +408,12 @@ class ComputeMetricsBranchCombiner(DataflowPlanNodeVisitor[ComputeMetricsBranchC
         self._log_visit_node_type(node)
         return self._default_handler(node)
 
+    def visit_window_over_time_range_node(  # noqa: D
+        self, node: WindowOverTimeRangeNode
+    ) -> ComputeMetricsBranchCombinerResult:
+        self._log_visit_node_type(node)
+        return self._default_handler(node)
+
     def visit_semi_additive_join_node(  # noqa: D
         self, node: SemiAdditiveJoinNode
     ) -> ComputeMetricsBranchCombinerResult:
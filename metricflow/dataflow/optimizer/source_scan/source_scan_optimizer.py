@@ -27,6 +27,7 @@ from metricflow.dataflow.dataflow_plan import (
     SemiAdditiveJoinNode,
     SinkOutput,
     WhereConstraintNode,
+    WindowOverTimeRangeNode,
     WriteToResultDataframeNode,
     WriteToResultTableNode,
 )
@@ -296,6 +297,10 @@ class SourceScanOptimizer(
         self._log_visit_node_type(node)
         return self._default_base_output_handler(node)
 
+    def visit_window_over_time_range_node(self, node: WindowOverTimeRangeNode) -> OptimizeBranchResult:  # noqa: D
+        self._log_visit_node_type(node)
+        return self._default_base_output_handler(node)
+
     def visit_semi_additive_join_node(self, node: SemiAdditiveJoinNode) -> OptimizeBranchResult:  # noqa: D
         self._log_visit_node_type(node)
         return self._default_base_output_handler(node)
@@ -5,6 +5,9 @@ import re
 from dataclasses import dataclass
 from typing import List, Optional, Sequence, Tuple
 
+from dbt_semantic_interfaces.implementations.elements.dimension import PydanticDimension, PydanticDimensionTypeParams
+from dbt_semantic_interfaces.implementations.elements.entity import PydanticEntity
+from dbt_semantic_interfaces.implementations.elements.measure import PydanticMeasure
 from dbt_semantic_interfaces.protocols.dimension import Dimension, DimensionType
 from dbt_semantic_interfaces.protocols.entity import Entity
 from dbt_semantic_interfaces.protocols.measure import Measure
@@ -30,6 +33,7 @@ from metricflow.instances import (
 )
 from metricflow.model.semantics.semantic_model_lookup import SemanticModelLookup
 from metricflow.model.spec_converters import MeasureConverter
+from metricflow.plan_conversion.rollup_table import RollupTable
 from metricflow.plan_conversion.time_spine import TIME_SPINE_DATA_SET_DESCRIPTION, TimeSpineSource
 from metricflow.specs.column_assoc import ColumnAssociationResolver
 from metricflow.specs.specs import (
@@ -416,6 +420,83 @@ class SemanticModelToDataSetConverter:
 
     def create_sql_source_data_set(self, semantic_model: SemanticModel) -> SemanticModelDataSet:
         """Create an SQL source data set from a semantic model in the model."""
+        return self._create_sql_data_set(
+            semantic_model=semantic_model,
+            measures=semantic_model.measures,
+            dimensions=semantic_model.dimensions,
+            entities=semantic_model.entities,
+            sql_table=SqlTable.from_string(semantic_model.node_relation.relation_name),
+            description=f"Read Elements From Semantic Model '{semantic_model.name}'",
+        )
+
+    def create_sql_rollup_data_set(
+        self, semantic_model: SemanticModel, rollup_table: RollupTable
+    ) -> SemanticModelDataSet:
+        """Create an SQL source data set that reads the elements of a semantic model from a rollup table.
+
+        The elements are read from the columns named after them, and the time dimension is defined at the granularity
+        of the rollup table. The rollup table should have been validated against the semantic model.
+        """
+        measures = [
+            PydanticMeasure(
+                name=measure.name,
+                agg=measure.agg,
+                description=measure.description,
+                create_metric=None,
+                agg_params=None,
+                metadata=None,
+                agg_time_dimension=rollup_table.time_dimension_name,
+            )
+            for measure in semantic_model.measures
+            if measure.name in rollup_table.measure_names
+        ]
+        dimensions = [
+            PydanticDimension(
+                name=dimension.name,
+                description=dimension.description,
+                type=dimension.type,
+                type_params=None,
+                metadata=None,
+            )
+            for dimension in semantic_model.dimensions
+            if dimension.name in rollup_table.dimension_names
+        ]
+        dimensions.append(
+            PydanticDimension(
+                name=rollup_table.time_dimension_name,
+                description=None,
+                type=DimensionType.TIME,
+                type_params=PydanticDimensionTypeParams(time_granularity=rollup_table.time_granularity),
+                metadata=None,
+            )
+        )
+        entities = [
+            PydanticEntity(name=entity.name, description=entity.description, type=entity.type, role=entity.role)
+            for entity in semantic_model.entities
+            if entity.name in rollup_table.entity_names
+        ]
+        return self._create_sql_data_set(
+            semantic_model=semantic_model,
+            measures=measures,
+            dimensions=dimensions,
+            entities=entities,
+            sql_table=rollup_table.sql_table,
+            description=(
+                f"Read Elements From Rollup Table '{rollup_table.sql_table.sql}' for Semantic Model "
+                f"'{semantic_model.name}'"
+            ),
+        )
+
+    def _create_sql_data_set(
+        self,
+        semantic_model: SemanticModel,
+        measures: Sequence[Measure],
+        dimensions: Sequence[Dimension],
+        entities: Sequence[Entity],
+        sql_table: SqlTable,
+        description: str,
+    ) -> SemanticModelDataSet:
+        """Create an SQL data set with the given elements of the semantic model, read from the given table."""
         # Gather all instances and columns from all semantic models.
         all_measure_instances: List[MeasureInstance] = []
         all_dimension_instances: List[DimensionInstance] = []
@@ -426,10 +507,10 @@ class SemanticModelToDataSetConverter:
         from_source_alias = IdGeneratorRegistry.for_class(self.__class__).create_id(f"{semantic_model.name}_src")
 
         # Handle measures
-        if len(semantic_model.measures) > 0:
+        if len(measures) > 0:
             measure_instances, select_columns = self._convert_measures(
                 semantic_model_name=semantic_model.name,
-                measures=semantic_model.measures,
+                measures=measures,
                 table_alias=from_source_alias,
             )
             all_measure_instances.extend(measure_instances)
@@ -447,7 +528,7 @@ class SemanticModelToDataSetConverter:
         conversion_results = [
             self._convert_dimensions(
                 semantic_model_name=semantic_model.name,
-                dimensions=semantic_model.dimensions,
+                dimensions=dimensions,
                 entity_links=entity_links,
                 table_alias=from_source_alias,
             )
@@ -482,7 +563,7 @@ class SemanticModelToDataSetConverter:
         for entity_links in possible_entity_links:
             entity_instances, select_columns = self._create_entity_instances(
                 semantic_model_name=semantic_model.name,
-                entities=semantic_model.entities,
+                entities=entities,
                 entity_links=entity_links,
                 table_alias=from_source_alias,
             )
@@ -491,10 +572,10 @@ class SemanticModelToDataSetConverter:
 
         # Generate the "from" clause depending on whether it's an SQL query or an SQL table.
         from_source: Optional[SqlQueryPlanNode] = None
-        from_source = SqlTableFromClauseNode(sql_table=SqlTable.from_string(semantic_model.node_relation.relation_name))
+        from_source = SqlTableFromClauseNode(sql_table=sql_table)
 
         select_statement_node = SqlSelectStatementNode(
-            description=f"Read Elements From Semantic Model '{semantic_model.name}'",
+            description=description,
             select_columns=tuple(all_select_columns),
             from_source=from_source,
             from_source_alias=from_source_alias,
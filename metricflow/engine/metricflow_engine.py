@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import functools
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Sequence, Set, Tuple
 
 import pandas as pd
 from dbt_semantic_interfaces.implementations.elements.dimension import PydanticDimensionTypeParams
@@ -13,9 +15,23 @@ from dbt_semantic_interfaces.implementations.filters.where_filter import Pydanti
 from dbt_semantic_interfaces.references import EntityReference, MeasureReference, MetricReference
 from dbt_semantic_interfaces.type_enums import DimensionType
 
+from metricflow.dag.id_generation import EXEC_PLAN_PREFIX, IdGeneratorRegistry
+from metricflow.dag.mf_dag import NodeId
+from metricflow.dataflow.builder.cost_model import DataflowCostEstimate, DataflowCostModel
 from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.builder.dataflow_recipe_cache import DataflowRecipeCache
 from metricflow.dataflow.builder.source_node import SourceNodeBuilder
-from metricflow.dataflow.dataflow_plan import DataflowPlan
+from metricflow.dataflow.dataflow_plan import (
+    CombineAggregatedOutputsNode,
+    ConstrainTimeRangeNode,
+    DataflowPlan,
+    DataflowPlanNode,
+    JoinOverTimeRangeNode,
+    JoinToTimeSpineNode,
+    WriteToResultTableNode,
+)
+from metricflow.dataflow.optimizer.common_subplan_eliminator import CommonSubplanEliminator
+from metricflow.dataflow.optimizer.dataflow_plan_optimizer import DataflowPlanOptimizer
 from metricflow.dataflow.optimizer.source_scan.source_scan_optimizer import (
     SourceScanOptimizer,
 )
@@ -24,10 +40,21 @@ from metricflow.dataset.convert_semantic_model import SemanticModelToDataSetConv
 from metricflow.dataset.dataset import DataSet
 from metricflow.dataset.semantic_model_adapter import SemanticModelDataSet
 from metricflow.engine.models import Dimension, Entity, Measure, Metric, SavedQuery
+from metricflow.engine.query_plan_cache import QueryPlanCache, QueryPlanCacheKey
 from metricflow.engine.time_source import ServerTimeSource
 from metricflow.errors.errors import ExecutionException
-from metricflow.execution.execution_plan import ExecutionPlan, SqlQuery
-from metricflow.execution.executor import SequentialPlanExecutor
+from metricflow.execution.execution_plan import (
+    DataFrameBatches,
+    ExecutionPlan,
+    ExecutionPlanTask,
+    IncrementalTableWrite,
+    ResultFormat,
+    SelectSqlQueryToDataFrameTask,
+    SelectSqlQueryToTableTask,
+    SqlQuery,
+)
+from metricflow.execution.executor import ExecutionResults, ParallelPlanExecutor
+from metricflow.execution.result_cache import ResultCache
 from metricflow.filters.time_constraint import TimeRangeConstraint
 from metricflow.mf_logging.formatting import indent
 from metricflow.mf_logging.pretty_print import mf_pformat
@@ -43,19 +70,24 @@ from metricflow.plan_conversion.dataflow_to_execution import (
     DataflowToExecutionPlanConverter,
 )
 from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
+from metricflow.plan_conversion.rollup_table import RollupTable
 from metricflow.protocols.query_parameter import GroupByParameter, MetricQueryParameter, OrderByQueryParameter
-from metricflow.protocols.sql_client import SqlClient
+from metricflow.protocols.sql_client import AsyncSqlClient, SqlClient
 from metricflow.query.query_exceptions import InvalidQueryException
 from metricflow.query.query_parser import MetricFlowQueryParser
 from metricflow.random_id import random_id
 from metricflow.specs.column_assoc import ColumnAssociationResolver
 from metricflow.specs.query_param_implementations import SavedQueryParameter
-from metricflow.specs.specs import InstanceSpecSet, MetricFlowQuerySpec
+from metricflow.specs.specs import InstanceSpecSet, MetricFlowQuerySpec, MetricSpec
 from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
+from metricflow.sql.sql_parameterization import bind_time_range_constraint, time_range_bind_parameter_value
 from metricflow.telemetry.models import TelemetryLevel
 from metricflow.telemetry.reporter import TelemetryReporter, log_call
 from metricflow.time.time_source import TimeSource
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 _telemetry_reporter = TelemetryReporter(report_levels_higher_or_equal_to=TelemetryLevel.USAGE)
 _telemetry_reporter.add_python_log_handler()
@@ -94,6 +126,15 @@ class MetricFlowQueryRequest:
     output_table: If specified, output the result data to this table instead of a result dataframe.
     sql_optimization_level: The level of optimization for the generated SQL.
     query_type: Type of MetricFlow query.
+    result_batch_size: If specified, stream the result as dataframes with up to this many rows each, available through
+    MetricFlowQueryResult.result_df_batches instead of result_df.
+    result_format: The format of the result. If ARROW, the result is available through
+    MetricFlowQueryResult.result_arrow_table instead of result_df. Can't be combined with result_batch_size.
+    result_cache_ttl_seconds: If the engine has a result cache, overrides the default TTL for the result of this query.
+    incremental_lookback: If specified with output_table, and the table already has rows, only the rows from the latest
+    metric_time in the table minus this lookback onwards are recomputed and replaced. The query must group by
+    metric_time. The table is only read when the query is run, so the plans from explain() rebuild the whole table. Not
+    supported for engines where the rows can't be replaced atomically (see SqlEngine.supports_incremental_writes).
     """
 
     request_id: MetricFlowRequestId
@@ -112,6 +153,10 @@ class MetricFlowQueryRequest:
     output_table: Optional[str] = None
     sql_optimization_level: SqlQueryOptimizationLevel = SqlQueryOptimizationLevel.O4
     query_type: MetricFlowQueryType = MetricFlowQueryType.METRIC
+    result_batch_size: Optional[int] = None
+    result_format: ResultFormat = ResultFormat.PANDAS
+    result_cache_ttl_seconds: Optional[float] = None
+    incremental_lookback: Optional[datetime.timedelta] = None
 
     @staticmethod
     def create_with_random_request_id(  # noqa: D
@@ -130,6 +175,10 @@ class MetricFlowQueryRequest:
         sql_optimization_level: SqlQueryOptimizationLevel = SqlQueryOptimizationLevel.O4,
         query_type: MetricFlowQueryType = MetricFlowQueryType.METRIC,
         min_max_only: bool = False,
+        result_batch_size: Optional[int] = None,
+        result_format: ResultFormat = ResultFormat.PANDAS,
+        result_cache_ttl_seconds: Optional[float] = None,
+        incremental_lookback: Optional[datetime.timedelta] = None,
     ) -> MetricFlowQueryRequest:
         return MetricFlowQueryRequest(
             request_id=MetricFlowRequestId(mf_rid=f"{random_id()}"),
@@ -148,18 +197,31 @@ class MetricFlowQueryRequest:
             sql_optimization_level=sql_optimization_level,
             query_type=query_type,
             min_max_only=min_max_only,
+            result_batch_size=result_batch_size,
+            result_format=result_format,
+            result_cache_ttl_seconds=result_cache_ttl_seconds,
+            incremental_lookback=incremental_lookback,
         )
 
 
 @dataclass(frozen=True)
 class MetricFlowQueryResult:  # noqa: D
-    """The result of a query and context on how it was generated."""
+    """The result of a query and context on how it was generated.
+
+    If the result was requested in batches, result_df_batches is an iterator of dataframes that fetches rows from the
+    data warehouse as it's consumed. It can only be iterated over once, and it holds a connection until it's exhausted,
+    so callers that stop iterating early should call result_df_batches.close(). If the result was requested in the
+    Arrow format, result_arrow_table is set instead of result_df. Use result_arrow_table.to_pandas() if a dataframe is
+    needed.
+    """
 
     query_spec: MetricFlowQuerySpec
     dataflow_plan: DataflowPlan
     sql: str
     result_df: Optional[pd.DataFrame] = None
     result_table: Optional[SqlTable] = None
+    result_df_batches: Optional[DataFrameBatches] = None
+    result_arrow_table: Optional[pa.Table] = None
 
 
 @dataclass(frozen=True)
@@ -170,22 +232,35 @@ class MetricFlowExplainResult:
     dataflow_plan: DataflowPlan
     execution_plan: ExecutionPlan
     output_table: Optional[SqlTable] = None
+    # The estimated cost of the dataflow plan, if the engine has a cost model.
+    cost_estimate: Optional[DataflowCostEstimate] = None
+
+    @property
+    def rendered_sqls(self) -> Tuple[SqlQuery, ...]:
+        """Return the SQL queries that would be run for the given query, one for each sink node in the dataflow plan."""
+        sql_queries = []
+        for task in self.execution_plan.sink_nodes:
+            sql_query = task.sql_query
+            if not sql_query:
+                raise NotImplementedError(
+                    f"Execution plan tasks without a SQL query not yet supported. Got tasks: {self.execution_plan.tasks}"
+                )
+            sql_queries.append(sql_query)
+        return tuple(sql_queries)
 
     @property
     def rendered_sql(self) -> SqlQuery:
-        """Return the SQL query that would be run for the given query."""
-        if len(self.execution_plan.tasks) != 1:
-            raise NotImplementedError(
-                f"Multiple tasks in the execution plan not yet supported. Got tasks: {self.execution_plan.tasks}"
-            )
+        """Return the SQL query that would be run for the given query.
 
-        sql_query = self.execution_plan.tasks[0].sql_query
-        if not sql_query:
-            raise NotImplementedError(
-                f"Execution plan tasks without a SQL query not yet supported. Got tasks: {self.execution_plan.tasks}"
+        Only valid for plans with a single sink node. For plans with multiple sink nodes, use rendered_sqls.
+        """
+        rendered_sqls = self.rendered_sqls
+        if len(rendered_sqls) != 1:
+            raise ValueError(
+                f"Expected the execution plan to produce exactly 1 SQL query, but got {len(rendered_sqls)}. Use "
+                f"rendered_sqls to get the SQL for plans with multiple sink nodes."
             )
-
-        return sql_query
+        return rendered_sqls[0]
 
     @property
     def rendered_sql_without_descriptions(self) -> SqlQuery:
@@ -202,6 +277,17 @@ class MetricFlowExplainResult:
         )
 
 
+@dataclass(frozen=True)
+class _PlannedQuery:
+    """The plans for a query that's run for one or more of the requests passed to query_many()."""
+
+    explain_result: MetricFlowExplainResult
+    # The index and the spec of each request that gets its result from this query.
+    indexed_query_specs: Tuple[Tuple[int, MetricFlowQuerySpec], ...]
+    # Whether the query computes metrics for multiple requests, so the result needs to be split for each request.
+    split_by_metric: bool = False
+
+
 class AbstractMetricFlowEngine(ABC):
     """Query interface for clients."""
 
@@ -319,6 +405,14 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         time_source: TimeSource = ServerTimeSource(),
         query_parser: Optional[MetricFlowQueryParser] = None,
         column_association_resolver: Optional[ColumnAssociationResolver] = None,
+        async_sql_client: Optional[AsyncSqlClient] = None,
+        query_plan_cache: Optional[QueryPlanCache] = None,
+        result_cache: Optional[ResultCache] = None,
+        parameterize_time_constraints: bool = False,
+        dataflow_recipe_cache: Optional[DataflowRecipeCache] = None,
+        eliminate_common_subplans: bool = False,
+        rollup_tables: Sequence[RollupTable] = (),
+        cost_model: Optional[DataflowCostModel] = None,
     ) -> None:
         """Initializer for MetricFlowEngine.
 
@@ -328,9 +422,59 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         - time_spine_source
 
         These parameters are mainly there to be overridden during tests.
+
+        If async_sql_client is specified, it's used to run queries from aquery() without blocking the event loop. It
+        should be connected to the same data warehouse as sql_client.
+
+        If query_plan_cache is specified, the plans generated for a request are stored there and reused for later
+        requests with the same parameters, skipping query parsing, planning, and rendering.
+
+        If result_cache is specified, the results of queries into a dataframe are stored there and reused for later
+        queries with the same SQL, instead of running them in the data warehouse again.
+
+        If parameterize_time_constraints is set, the bounds of time constraints are passed to the SQL client as bind
+        parameters instead of being rendered into the SQL. Queries that only differ in the time constraint then have the
+        same SQL, which lets the data warehouse reuse its compiled plans. With a query_plan_cache, the plans are also
+        reused for requests that only differ in the time constraint, unless rollup_tables are specified. Those requests
+        are still parsed to adjust the time constraint to the query. Literals in filters are rendered into the SQL as
+        written.
+
+        If dataflow_recipe_cache is specified, the source nodes and joins chosen for a group of measures and group-by
+        items are stored there and reused when building the dataflow plans for later queries that need the same ones.
+
+        If eliminate_common_subplans is set, identical aggregations in the dataflow plan for a query (e.g. for derived
+        metrics that share input metrics) are merged, and the SQL for them is generated once as a CTE.
+
+        The SQL for queries is rendered with the SqlQueryPlanRenderer of sql_client, so options for rendering (e.g.
+        rendering shared sub-queries as CTEs) are configured when creating the client.
+
+        Cumulative metrics that are queried by metric_time__day are computed with window functions over the daily
+        aggregates when the measure is additive and the SQL engine supports them, instead of joining each input row to
+        every day in its window.
+
+        Similarly, the rows for semi-additive measures (e.g. the latest balance for each account) are selected with a
+        window function in a single pass over the input, instead of by joining the input to an aggregation of itself.
+        Engines without QUALIFY use an equivalent sub-query.
+
+        rollup_tables are tables with measures that have been pre-aggregated to a coarser grain (e.g. daily by
+        country). When the group-by items and filters in a query can be satisfied from a rollup table, the measures
+        are read from it and aggregated again instead of being aggregated from the table of the semantic model. If
+        multiple rollup tables can be used, the one with the fewest group-by items is used.
+
+        If cost_model is specified, it's used to estimate the number of rows read by the sources that can satisfy a
+        query, and the cheapest one is used instead of the one with the fewest joins. The estimates for the plan are
+        included in the explain result. See TableStatisticsCostModel for a model based on the row counts of tables.
         """
         self._semantic_manifest_lookup = semantic_manifest_lookup
         self._sql_client = sql_client
+        self._async_sql_client = async_sql_client
+        self._query_plan_cache = query_plan_cache
+        # Whether rollup tables can be used depends on the time constraint, so plans that use them can't be reused for
+        # other time constraints.
+        self._share_plans_across_time_ranges = parameterize_time_constraints and len(rollup_tables) == 0
+        self._result_cache = result_cache
+        self._eliminate_common_subplans = eliminate_common_subplans
+        self._cost_model = cost_model
         self._column_association_resolver = column_association_resolver or (
             DunderColumnAssociationResolver(semantic_manifest_lookup)
         )
@@ -348,26 +492,37 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         source_node_builder = SourceNodeBuilder(self._semantic_manifest_lookup)
         source_nodes = source_node_builder.create_from_data_sets(self._source_data_sets)
         read_nodes = source_node_builder.create_read_nodes_from_data_sets(self._source_data_sets)
+        rollup_source_nodes = source_node_builder.create_from_rollup_tables(
+            rollup_tables=rollup_tables, data_set_converter=converter
+        )
         time_spine_source_node = SourceNodeBuilder.build_time_spine_source_node(
             time_spine_source=self._time_spine_source, data_set_converter=converter
         )
 
+        sql_plan_renderer = self._sql_client.sql_query_plan_renderer
         self._dataflow_plan_builder = DataflowPlanBuilder(
             source_nodes=source_nodes,
             read_nodes=read_nodes,
             time_spine_source_node=time_spine_source_node,
             semantic_manifest_lookup=self._semantic_manifest_lookup,
+            dataflow_recipe_cache=dataflow_recipe_cache,
+            use_window_functions_for_cumulative_metrics=sql_plan_renderer.supports_window_functions,
+            rollup_source_nodes=rollup_source_nodes,
+            cost_model=cost_model,
         )
         self._to_sql_query_plan_converter = DataflowToSqlQueryPlanConverter(
             column_association_resolver=self._column_association_resolver,
             semantic_manifest_lookup=self._semantic_manifest_lookup,
+            bind_parameter_key_renderer=sql_client.render_bind_parameter_key if parameterize_time_constraints else None,
+            use_window_functions_for_semi_additive_joins=sql_plan_renderer.supports_window_functions,
         )
         self._to_execution_plan_converter = DataflowToExecutionPlanConverter(
             sql_plan_converter=self._to_sql_query_plan_converter,
-            sql_plan_renderer=self._sql_client.sql_query_plan_renderer,
+            sql_plan_renderer=sql_plan_renderer,
             sql_client=sql_client,
+            result_cache=result_cache,
         )
-        self._executor = SequentialPlanExecutor()
+        self._executor = ParallelPlanExecutor()
 
         self._query_parser = query_parser or MetricFlowQueryParser(
             semantic_manifest_lookup=self._semantic_manifest_lookup,
@@ -376,40 +531,523 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def query(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:  # noqa: D
         logger.info(f"Starting query request:\n{indent(mf_pformat(mf_request))}")
-        explain_result = self._create_execution_plan(mf_request)
-        execution_plan = explain_result.execution_plan
+        explain_result = self._create_execution_plan(mf_request, read_incremental_window=True)
+        MetricFlowEngine._check_single_sink_node(explain_result)
+        (query_result,) = self._execute_explain_result(explain_result)
+
+        logger.info(f"Finished query request: {mf_request.request_id}")
+        return query_result
+
+    @staticmethod
+    def _check_single_sink_node(explain_result: MetricFlowExplainResult) -> None:
+        """Raise an exception if the plan doesn't have a single sink node, before any queries are run."""
+        sink_node_count = len(explain_result.dataflow_plan.sink_output_nodes)
+        if sink_node_count != 1:
+            raise ExecutionException(
+                f"Expected a single result for the query, but the dataflow plan has {sink_node_count} sink nodes. Use "
+                f"execute_dataflow_plan() to get a result for each sink node."
+            )
+
+    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    def query_many(self, mf_requests: Sequence[MetricFlowQueryRequest]) -> Tuple[MetricFlowQueryResult, ...]:
+        """Run the requests and return one result for each request, in the same order.
+
+        Requests that only differ in the metrics that they ask for (i.e. they have the same group-by items, time
+        constraint, and filters) are planned together. If all of their metrics can be computed from the same scan of a
+        semantic model, they are run as a single query, and the result of that query is split back out for each
+        request. Otherwise, identical requests are only run once. Requests that have a limit, an order, or an output
+        table, or that ask for results in a different format, are run on their own.
+
+        The queries for the requests are run in a single execution plan with a leaf task for each query, so queries that
+        don't depend on each other are run concurrently. Requests for results in batches are streamed separately.
+        """
+        results: Dict[int, MetricFlowQueryResult] = {}
+        planned_queries: List[_PlannedQuery] = []
+        batch_key_to_indexed_query_specs: Dict[Hashable, List[Tuple[int, MetricFlowQuerySpec]]] = {}
+        for i, mf_request in enumerate(mf_requests):
+            batch_key: Optional[Hashable] = None
+            if self._can_combine_request(mf_request):
+                query_spec = self._parse_query_spec(mf_request)
+                batch_key = self._create_batch_key(mf_request, query_spec)
+            if mf_request.result_batch_size is not None:
+                # Identical requests can share plans through the query plan cache, but each needs its own stream.
+                results[i] = self.query(mf_request)
+            elif batch_key is None:
+                explain_result = self._create_execution_plan(mf_request, read_incremental_window=True)
+                MetricFlowEngine._check_single_sink_node(explain_result)
+                planned_queries.append(
+                    _PlannedQuery(explain_result=explain_result, indexed_query_specs=((i, explain_result.query_spec),))
+                )
+            else:
+                batch_key_to_indexed_query_specs.setdefault(batch_key, []).append((i, query_spec))
+
+        for indexed_query_specs in batch_key_to_indexed_query_specs.values():
+            metric_names: List[str] = []
+            metric_specs_to_indexed_query_specs: Dict[
+                Tuple[MetricSpec, ...], List[Tuple[int, MetricFlowQuerySpec]]
+            ] = {}
+            for i, query_spec in indexed_query_specs:
+                metric_specs_to_indexed_query_specs.setdefault(query_spec.metric_specs, []).append((i, query_spec))
+                for metric_spec in query_spec.metric_specs:
+                    if metric_spec.element_name not in metric_names:
+                        metric_names.append(metric_spec.element_name)
+
+            combined_explain_result = self._plan_combined_metrics(mf_requests[indexed_query_specs[0][0]], metric_names)
+            if combined_explain_result is not None:
+                logger.info(f"Planned requests {[i for i, _ in indexed_query_specs]} as a single query")
+                planned_queries.append(
+                    _PlannedQuery(
+                        explain_result=combined_explain_result,
+                        indexed_query_specs=tuple(indexed_query_specs),
+                        split_by_metric=True,
+                    )
+                )
+                continue
+
+            # Identical requests are still only run once.
+            for indexed_query_specs_for_metrics in metric_specs_to_indexed_query_specs.values():
+                explain_result = self._create_execution_plan(
+                    mf_requests[indexed_query_specs_for_metrics[0][0]], read_incremental_window=True
+                )
+                MetricFlowEngine._check_single_sink_node(explain_result)
+                planned_queries.append(
+                    _PlannedQuery(
+                        explain_result=explain_result, indexed_query_specs=tuple(indexed_query_specs_for_metrics)
+                    )
+                )
+
+        execution_results = self._execute_explain_results(
+            [planned_query.explain_result for planned_query in planned_queries]
+        )
+        for planned_query in planned_queries:
+            (query_result,) = self._create_query_results(planned_query.explain_result, execution_results)
+            for i, query_spec in planned_query.indexed_query_specs:
+                results[i] = (
+                    self._split_combined_result(query_result, query_spec)
+                    if planned_query.split_by_metric
+                    else replace(query_result, query_spec=query_spec)
+                )
+
+        return tuple(results[i] for i in range(len(mf_requests)))
+
+    def _plan_combined_metrics(
+        self, mf_request: MetricFlowQueryRequest, metric_names: Sequence[str]
+    ) -> Optional[MetricFlowExplainResult]:
+        """Plan the request for the given metrics instead, if the result can be split back out by metric.
 
-        if len(execution_plan.tasks) != 1:
-            raise NotImplementedError("Multiple tasks not yet supported.")
+        That's the case when all metrics are computed from the same aggregation. Every row then has values for all
+        metrics, so the rows in a query for a subset of the metrics are the same. When the metrics are computed
+        separately and combined, a row can exist for some metrics but not for others, and that can't be distinguished
+        from a row where the metrics are NULL. In that case, this returns None.
+        """
+        combined_request = replace(
+            mf_request,
+            request_id=MetricFlowRequestId(mf_rid=f"{random_id()}"),
+            metric_names=metric_names,
+            metrics=None,
+        )
+        try:
+            explain_result = self._create_execution_plan(combined_request)
+        except InvalidQueryException as e:
+            logger.info(f"Unable to combine the requests for metrics {metric_names}: {e}")
+            return None
+
+        if self._combines_aggregated_outputs(explain_result.dataflow_plan):
+            logger.info(f"Not combining the requests for metrics {metric_names} as they're computed separately")
+            return None
+
+        return explain_result
+
+    @staticmethod
+    def _can_combine_request(mf_request: MetricFlowQueryRequest) -> bool:
+        """Returns true if the result for the request can be taken from a query that includes other metrics."""
+        return (
+            mf_request.saved_query_name is None
+            and mf_request.query_type is MetricFlowQueryType.METRIC
+            and mf_request.limit is None
+            and not mf_request.order_by_names
+            and not mf_request.order_by
+            and not mf_request.min_max_only
+            and mf_request.output_table is None
+            and mf_request.result_batch_size is None
+            and mf_request.result_format is ResultFormat.PANDAS
+        )
+
+    @staticmethod
+    def _create_batch_key(mf_request: MetricFlowQueryRequest, query_spec: MetricFlowQuerySpec) -> Optional[Hashable]:
+        """Returns the key for the requests that can be combined with this one, or None if it can't be hashed.
+
+        The resolutions of the group-by items in filters depend on the metrics in the query, so they're excluded. They
+        are resolved again when the combined request is parsed.
+        """
+        batch_key = (
+            replace(query_spec, metric_specs=(), filter_spec_resolution_lookup=None),
+            mf_request.sql_optimization_level,
+            mf_request.result_cache_ttl_seconds,
+        )
+        try:
+            hash(batch_key)
+        except TypeError:
+            logger.debug(f"Not combining request {mf_request.request_id} with others as it can't be hashed")
+            return None
+        return batch_key
+
+    @staticmethod
+    def _combines_aggregated_outputs(dataflow_plan: DataflowPlan) -> bool:
+        """Returns true if the plan computes metrics separately, and then combines them."""
+        nodes_to_visit: List[DataflowPlanNode] = list(dataflow_plan.sink_output_nodes)
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            if isinstance(node, CombineAggregatedOutputsNode):
+                return True
+            nodes_to_visit.extend(node.parent_nodes)
+        return False
+
+    def _split_combined_result(
+        self, combined_result: MetricFlowQueryResult, query_spec: MetricFlowQuerySpec
+    ) -> MetricFlowQueryResult:
+        """Return the result for the query spec from the result of a query that may include other metrics."""
+        combined_result_df = combined_result.result_df
+        assert combined_result_df is not None, "Expected the result of the combined query to be in a dataframe"
+
+        combined_metric_column_names = {
+            self._column_association_resolver.resolve_spec(metric_spec).column_name
+            for metric_spec in combined_result.query_spec.metric_specs
+        }
+        metric_column_names = [
+            self._column_association_resolver.resolve_spec(metric_spec).column_name
+            for metric_spec in query_spec.metric_specs
+        ]
+        result_df = combined_result_df[
+            [column for column in combined_result_df.columns if column not in combined_metric_column_names]
+            + metric_column_names
+        ]
+        return replace(combined_result, query_spec=query_spec, result_df=result_df)
+
+    def execute_dataflow_plan(
+        self,
+        query_specs: Sequence[MetricFlowQuerySpec],
+        dataflow_plan: DataflowPlan,
+        result_batch_size: Optional[int] = None,
+        result_format: ResultFormat = ResultFormat.PANDAS,
+    ) -> Tuple[MetricFlowQueryResult, ...]:
+        """Run the queries for a dataflow plan and return one result for each sink node, in the same order.
+
+        query_specs should have the spec for each sink node, in the same order, and it's included in the result for
+        that sink node. The queries for different sink nodes don't depend on each other, so they are run concurrently.
+        See MetricFlowQueryRequest for a description of result_batch_size and result_format.
+        """
+        if len(query_specs) != len(dataflow_plan.sink_output_nodes):
+            raise ValueError(
+                f"Expected a query spec for each of the {len(dataflow_plan.sink_output_nodes)} sink nodes in the "
+                f"dataflow plan, but got {len(query_specs)}"
+            )
+        execution_plan = self._to_execution_plan_converter.convert_to_execution_plan(
+            dataflow_plan, result_batch_size=result_batch_size, result_format=result_format
+        )
+        return self._execute_explain_result(
+            MetricFlowExplainResult(
+                query_spec=query_specs[0], dataflow_plan=dataflow_plan, execution_plan=execution_plan
+            ),
+            query_specs=query_specs,
+        )
 
-        task = execution_plan.tasks[0]
+    def _execute_explain_result(
+        self,
+        explain_result: MetricFlowExplainResult,
+        query_specs: Optional[Sequence[MetricFlowQuerySpec]] = None,
+    ) -> Tuple[MetricFlowQueryResult, ...]:
+        execution_plan = explain_result.execution_plan
+        logger.info(f"Running tasks in:\n{execution_plan.text_structure()}")
+        execution_results = self._executor.execute_plan(execution_plan)
+        logger.info("Finished running tasks in execution plan")
+        return self._create_query_results(explain_result, execution_results, query_specs)
+
+    def _execute_explain_results(self, explain_results: Sequence[MetricFlowExplainResult]) -> ExecutionResults:
+        """Run the tasks in the execution plans for multiple queries as a single plan, with a leaf task for each query.
 
-        logger.info(f"Sequentially running tasks in:\n" f"{execution_plan.text_structure()}")
+        Plans for identical requests can be shared through the query plan cache, so each task is only included once.
+        """
+        leaf_tasks: Dict[NodeId, ExecutionPlanTask] = {}
+        for explain_result in explain_results:
+            for task in explain_result.execution_plan.sink_nodes:
+                leaf_tasks.setdefault(task.task_id, task)
+        execution_plan = ExecutionPlan(
+            plan_id=IdGeneratorRegistry.for_class(self.__class__).create_id(EXEC_PLAN_PREFIX),
+            leaf_tasks=list(leaf_tasks.values()),
+        )
+        logger.info(f"Running tasks in:\n{execution_plan.text_structure()}")
         execution_results = self._executor.execute_plan(execution_plan)
         logger.info("Finished running tasks in execution plan")
+        return execution_results
 
-        if execution_results.contains_task_errors:
-            raise ExecutionException(f"Got errors while executing tasks:\n{execution_results.get_result(task.task_id)}")
+    async def _aexecute_explain_result(
+        self, explain_result: MetricFlowExplainResult
+    ) -> Tuple[MetricFlowQueryResult, ...]:
+        """Similar to _execute_explain_result, but awaits the queries using the async SQL client if possible.
 
-        task_execution_result = execution_results.get_result(task.task_id)
+        Only plans where all tasks are independent queries into a dataframe can be run using the async client. Other
+        plans are run by the executor in a worker thread.
+        """
+        execution_plan = explain_result.execution_plan
+        query_tasks = [
+            task
+            for task in execution_plan.tasks
+            if isinstance(task, SelectSqlQueryToDataFrameTask)
+            and len(task.parent_nodes) == 0
+            and task.batch_size is None
+            and task.result_format is ResultFormat.PANDAS
+        ]
+        async_sql_client = self._async_sql_client
+        if async_sql_client is None or len(query_tasks) != len(execution_plan.tasks):
+            return await asyncio.get_running_loop().run_in_executor(None, self._execute_explain_result, explain_result)
 
-        assert task_execution_result.sql, "Task execution should have returned SQL that was run"
+        logger.info(f"Running tasks asynchronously in:\n{execution_plan.text_structure()}")
+        task_results = await asyncio.gather(*(task.execute_async(async_sql_client) for task in query_tasks))
+        logger.info("Finished running tasks in execution plan")
 
-        logger.info(f"Finished query request: {mf_request.request_id}")
-        return MetricFlowQueryResult(
-            query_spec=explain_result.query_spec,
-            dataflow_plan=explain_result.dataflow_plan,
-            sql=task_execution_result.sql,
-            result_df=task_execution_result.df,
-            result_table=explain_result.output_table,
+        execution_results = ExecutionResults()
+        for task, task_result in zip(query_tasks, task_results):
+            execution_results.add_result(task.task_id, task_result)
+        return self._create_query_results(explain_result, execution_results)
+
+    def _create_query_results(
+        self,
+        explain_result: MetricFlowExplainResult,
+        execution_results: ExecutionResults,
+        query_specs: Optional[Sequence[MetricFlowQuerySpec]] = None,
+    ) -> Tuple[MetricFlowQueryResult, ...]:
+        """Create a result for each sink node. query_specs has the spec for each sink node, if it's not the query's."""
+        execution_plan = explain_result.execution_plan
+        dataflow_plan = explain_result.dataflow_plan
+        if query_specs is None:
+            query_specs = tuple(explain_result.query_spec for _ in dataflow_plan.sink_output_nodes)
+        assert len(execution_plan.sink_nodes) == len(dataflow_plan.sink_output_nodes), (
+            f"Expected one leaf task for each sink node in the dataflow plan. Got tasks: {execution_plan.sink_nodes} "
+            f"for sink nodes: {dataflow_plan.sink_output_nodes}"
         )
+        if execution_results.contains_task_errors:
+            raise ExecutionException(
+                f"Got errors while executing tasks:\n"
+                f"{mf_pformat([result for result in execution_results.all_results().values() if result.errors])}"
+            )
+
+        query_results = []
+        for query_spec, sink_node, task in zip(query_specs, dataflow_plan.sink_output_nodes, execution_plan.sink_nodes):
+            task_execution_result = execution_results.get_result(task.task_id)
+            assert task_execution_result.sql, "Task execution should have returned SQL that was run"
+            query_results.append(
+                MetricFlowQueryResult(
+                    query_spec=query_spec,
+                    dataflow_plan=dataflow_plan,
+                    sql=task_execution_result.sql,
+                    result_df=task_execution_result.df,
+                    result_table=(
+                        sink_node.output_sql_table if isinstance(sink_node, WriteToResultTableNode) else None
+                    ),
+                    result_df_batches=task_execution_result.df_batches,
+                    result_arrow_table=task_execution_result.arrow_table,
+                )
+            )
+        return tuple(query_results)
 
     @property
     def all_time_constraint(self) -> TimeRangeConstraint:
         """TimeRangeConstraint representing the min & max dates supported."""
         return TimeRangeConstraint.all_time()
 
-    def _create_execution_plan(self, mf_query_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
+    @property
+    def query_plan_cache(self) -> Optional[QueryPlanCache]:
+        """The cache for the plans generated for requests, if one was specified."""
+        return self._query_plan_cache
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        """The cache for the results of queries, if one was specified. Use this to invalidate results."""
+        return self._result_cache
+
+    def _create_execution_plan(
+        self, mf_query_request: MetricFlowQueryRequest, read_incremental_window: bool = False
+    ) -> MetricFlowExplainResult:
+        """Create the plans for the request, or get them from the query plan cache.
+
+        If read_incremental_window is set, the output table of an incremental write is read to find the rows that need
+        to be replaced. This should only be done when the query is run. Otherwise, the plans rebuild the whole table.
+        """
+        query_plan_cache = self._query_plan_cache
+        exclude_time_constraint_bounds = self._share_plans_across_time_ranges and (
+            mf_query_request.time_constraint_start is not None or mf_query_request.time_constraint_end is not None
+        )
+        cache_key = (
+            QueryPlanCacheKey.from_request(
+                mf_query_request, exclude_time_constraint_bounds=exclude_time_constraint_bounds
+            )
+            if query_plan_cache is not None
+            else None
+        )
+        if query_plan_cache is None or cache_key is None:
+            return self._build_execution_plan(mf_query_request, read_incremental_window=read_incremental_window)
+
+        if not exclude_time_constraint_bounds:
+            explain_result = query_plan_cache.get(cache_key)
+            if explain_result is not None:
+                logger.info(f"Using cached plans for request {mf_query_request.request_id}")
+                return explain_result
+
+            explain_result = self._build_execution_plan(mf_query_request)
+            query_plan_cache.put(cache_key, explain_result)
+            return explain_result
+
+        # The request is still parsed to get the time constraint adjusted to the granularity of the query.
+        query_spec = self._parse_query_spec(mf_query_request)
+        explain_result = query_plan_cache.get(
+            cache_key,
+            is_usable=lambda cached_explain_result: (
+                cached_explain_result.query_spec.time_range_constraint == query_spec.time_range_constraint
+                or MetricFlowEngine._time_range_constraint_is_bound(cached_explain_result)
+            ),
+        )
+        if explain_result is not None:
+            logger.info(
+                f"Using cached plans for request {mf_query_request.request_id} with the time constraint "
+                f"{query_spec.time_range_constraint}"
+            )
+            return MetricFlowEngine._bind_time_range_constraint(explain_result, query_spec)
+
+        explain_result = self._build_execution_plan(mf_query_request, query_spec=query_spec)
+        query_plan_cache.put(cache_key, explain_result)
+        return explain_result
+
+    @staticmethod
+    def _time_range_constraint_is_bound(explain_result: MetricFlowExplainResult) -> bool:
+        """Returns true if the plans can be used for a different time constraint by changing the bind parameters.
+
+        That's not the case if the time constraint was changed while building the dataflow plan (e.g. to include the
+        rows in the window of a cumulative metric), or if the bounds appear in the SQL (e.g. in a comment).
+        """
+        time_range_constraint = explain_result.query_spec.time_range_constraint
+        if time_range_constraint is None:
+            return False
+
+        nodes_to_visit: List[DataflowPlanNode] = list(explain_result.dataflow_plan.sink_output_nodes)
+        visited_node_ids: Set[NodeId] = set()
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            if node.node_id in visited_node_ids:
+                continue
+            visited_node_ids.add(node.node_id)
+            if isinstance(node, (ConstrainTimeRangeNode, JoinOverTimeRangeNode, JoinToTimeSpineNode)) and (
+                node.time_range_constraint not in (None, time_range_constraint)
+            ):
+                return False
+            nodes_to_visit.extend(node.parent_nodes)
+
+        bind_parameter_values = (
+            time_range_bind_parameter_value(time_range_constraint.start_time),
+            time_range_bind_parameter_value(time_range_constraint.end_time),
+        )
+        for task in explain_result.execution_plan.tasks:
+            sql_query = task.sql_query
+            if (
+                not isinstance(task, (SelectSqlQueryToDataFrameTask, SelectSqlQueryToTableTask))
+                or len(task.parent_nodes) > 0
+                or sql_query is None
+                or any(value in sql_query.sql_query for value in bind_parameter_values)
+            ):
+                return False
+        return True
+
+    @staticmethod
+    def _bind_time_range_constraint(
+        explain_result: MetricFlowExplainResult, query_spec: MetricFlowQuerySpec
+    ) -> MetricFlowExplainResult:
+        """Return the cached plans with the bind parameters for the time constraint set from the query spec.
+
+        The dataflow plan is not changed, so it still shows the time constraint that the plans were built for.
+        """
+        time_range_constraint = query_spec.time_range_constraint
+        assert time_range_constraint is not None
+        leaf_tasks: List[ExecutionPlanTask] = []
+        for task in explain_result.execution_plan.sink_nodes:
+            assert isinstance(task, (SelectSqlQueryToDataFrameTask, SelectSqlQueryToTableTask))
+            sql_query = task.sql_query
+            assert sql_query is not None
+            leaf_tasks.append(
+                task.with_bind_parameters(bind_time_range_constraint(sql_query.bind_parameters, time_range_constraint))
+            )
+        return replace(
+            explain_result,
+            query_spec=query_spec,
+            execution_plan=ExecutionPlan(plan_id=explain_result.execution_plan.dag_id.id_str, leaf_tasks=leaf_tasks),
+        )
+
+    def _build_execution_plan(
+        self,
+        mf_query_request: MetricFlowQueryRequest,
+        query_spec: Optional[MetricFlowQuerySpec] = None,
+        read_incremental_window: bool = False,
+    ) -> MetricFlowExplainResult:
+        """Build the plans for the request. If the request has already been parsed, query_spec is the result.
+
+        See _create_execution_plan() for read_incremental_window.
+        """
+        if mf_query_request.result_batch_size is not None and mf_query_request.result_format is not ResultFormat.PANDAS:
+            raise InvalidQueryException(
+                f"Results can only be returned in batches using the {ResultFormat.PANDAS} format. Got: "
+                f"{mf_query_request.result_format}"
+            )
+        if query_spec is None:
+            query_spec = self._parse_query_spec(mf_query_request)
+
+        output_table: Optional[SqlTable] = None
+        if mf_query_request.output_table is not None:
+            output_table = SqlTable.from_string(mf_query_request.output_table)
+
+        incremental_write: Optional[IncrementalTableWrite] = None
+        if mf_query_request.incremental_lookback is not None:
+            query_spec, incremental_write = self._constrain_to_incremental_window(
+                mf_query_request=mf_query_request,
+                query_spec=query_spec,
+                output_table=output_table,
+                read_output_table=read_incremental_window,
+            )
+
+        output_selection_specs: Optional[InstanceSpecSet] = None
+        if mf_query_request.query_type == MetricFlowQueryType.DIMENSION_VALUES:
+            # Filter result by dimension columns if it's a dimension values query
+            if len(query_spec.entity_specs) > 0:
+                raise InvalidQueryException("Querying dimension values for entities is not allowed.")
+            output_selection_specs = InstanceSpecSet(
+                dimension_specs=query_spec.dimension_specs,
+                time_dimension_specs=query_spec.time_dimension_specs,
+            )
+
+        if query_spec.metric_specs:
+            dataflow_plan = self._build_metrics_dataflow_plan(
+                query_spec=query_spec,
+                output_table=output_table,
+                output_selection_specs=output_selection_specs,
+            )
+        else:
+            dataflow_plan = self._dataflow_plan_builder.build_plan_for_distinct_values(query_spec=query_spec)
+
+        execution_plan = self._to_execution_plan_converter.convert_to_execution_plan(
+            dataflow_plan,
+            result_batch_size=mf_query_request.result_batch_size,
+            result_format=mf_query_request.result_format,
+            result_cache_ttl_seconds=mf_query_request.result_cache_ttl_seconds,
+            incremental_write=incremental_write,
+        )
+
+        return MetricFlowExplainResult(
+            query_spec=query_spec,
+            dataflow_plan=dataflow_plan,
+            execution_plan=execution_plan,
+            output_table=output_table,
+            cost_estimate=self._cost_model.estimate_plan_cost(dataflow_plan) if self._cost_model is not None else None,
+        )
+
+    def _parse_query_spec(self, mf_query_request: MetricFlowQueryRequest) -> MetricFlowQuerySpec:
         if mf_query_request.saved_query_name is not None:
             if mf_query_request.metrics or mf_query_request.metric_names:
                 raise InvalidQueryException("Metrics can't be specified with a saved query.")
@@ -443,50 +1081,121 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                 min_max_only=mf_query_request.min_max_only,
             )
         logger.info(f"Query spec is:\n{mf_pformat(query_spec)}")
+        return query_spec
 
-        output_table: Optional[SqlTable] = None
-        if mf_query_request.output_table is not None:
-            output_table = SqlTable.from_string(mf_query_request.output_table)
-
-        output_selection_specs: Optional[InstanceSpecSet] = None
-        if mf_query_request.query_type == MetricFlowQueryType.DIMENSION_VALUES:
-            # Filter result by dimension columns if it's a dimension values query
-            if len(query_spec.entity_specs) > 0:
-                raise InvalidQueryException("Querying dimension values for entities is not allowed.")
-            output_selection_specs = InstanceSpecSet(
-                dimension_specs=query_spec.dimension_specs,
-                time_dimension_specs=query_spec.time_dimension_specs,
-            )
-
-        if query_spec.metric_specs:
-            dataflow_plan = self._dataflow_plan_builder.build_plan(
-                query_spec=query_spec,
-                output_sql_table=output_table,
-                output_selection_specs=output_selection_specs,
-                optimizers=(SourceScanOptimizer(),),
+    def _constrain_to_incremental_window(
+        self,
+        mf_query_request: MetricFlowQueryRequest,
+        query_spec: MetricFlowQuerySpec,
+        output_table: Optional[SqlTable],
+        read_output_table: bool,
+    ) -> Tuple[MetricFlowQuerySpec, Optional[IncrementalTableWrite]]:
+        """Return the query spec constrained to the rows that need to be recomputed in the output table.
+
+        The window starts at the latest metric_time in the output table minus the lookback. If the output table doesn't
+        exist or doesn't have any rows, the query spec is returned as is so that the table is fully rebuilt. That's also
+        the case if read_output_table is not set, as the output table is only read when the query is run.
+        """
+        incremental_lookback = mf_query_request.incremental_lookback
+        assert incremental_lookback is not None
+        if output_table is None:
+            raise InvalidQueryException("An incremental lookback can only be specified with an output table.")
+        if incremental_lookback < datetime.timedelta(0):
+            raise InvalidQueryException(f"The incremental lookback can't be negative. Got: {incremental_lookback}")
+        sql_engine_type = self._sql_client.sql_engine_type
+        if not sql_engine_type.supports_incremental_writes:
+            raise InvalidQueryException(
+                f"Writing to an output table incrementally isn't supported for {sql_engine_type.value}, as the rows in "
+                f"the table can't be replaced atomically. Remove the incremental lookback to rebuild the table instead."
             )
-        else:
-            dataflow_plan = self._dataflow_plan_builder.build_plan_for_distinct_values(query_spec=query_spec)
 
-        if len(dataflow_plan.sink_output_nodes) > 1:
-            raise NotImplementedError(
-                f"Multiple output nodes in the dataflow plan not yet supported. "
-                f"Got tasks: {dataflow_plan.sink_output_nodes}"
+        metric_time_specs = tuple(
+            spec for spec in query_spec.time_dimension_specs if spec.is_metric_time and spec.date_part is None
+        )
+        if len(metric_time_specs) != 1:
+            raise InvalidQueryException(
+                f"Writing to an output table incrementally requires the query to group by metric_time at exactly one "
+                f"granularity. Got: {mf_pformat(query_spec.time_dimension_specs)}"
             )
+        time_column_name = self._column_association_resolver.resolve_spec(metric_time_specs[0]).column_name
+
+        if not read_output_table:
+            logger.info(f"Not reading the high-water mark of {output_table} as the query isn't being run")
+            return query_spec, None
+
+        high_water_mark = self._read_high_water_mark(output_table=output_table, time_column_name=time_column_name)
+        if high_water_mark is None:
+            logger.info(f"{output_table} doesn't have a high-water mark, so the table will be rebuilt")
+            return query_spec, None
+
+        window_start = high_water_mark - incremental_lookback
+        if mf_query_request.time_constraint_start is not None:
+            window_start = max(window_start, mf_query_request.time_constraint_start)
+        logger.info(f"High-water mark of {output_table} is {high_water_mark}, so recomputing from {window_start}")
+
+        # Parse the query again so that the start of the window is adjusted to the granularity of metric_time.
+        query_spec = self._parse_query_spec(replace(mf_query_request, time_constraint_start=window_start))
+        time_range_constraint = query_spec.time_range_constraint
+        assert time_range_constraint is not None
+        return query_spec, IncrementalTableWrite(
+            time_column_name=time_column_name,
+            start_time=time_range_constraint.start_time,
+            end_time=time_range_constraint.end_time,
+        )
 
-        execution_plan = self._to_execution_plan_converter.convert_to_execution_plan(dataflow_plan)
+    def _read_high_water_mark(self, output_table: SqlTable, time_column_name: str) -> Optional[datetime.datetime]:
+        """Return the latest value of the time column in the output table, or None if the table doesn't have one.
 
-        return MetricFlowExplainResult(
+        Errors other than the table not existing are raised, as rebuilding the table would discard its rows.
+        """
+        if not self._sql_client.table_exists(output_table):
+            return None
+        df = self._sql_client.query(f"SELECT MAX({time_column_name}) AS high_water_mark FROM {output_table.sql}")
+        high_water_mark = df.iloc[0, 0]
+        if pd.isna(high_water_mark):
+            return None
+        return pd.Timestamp(high_water_mark).to_pydatetime()
+
+    def _build_metrics_dataflow_plan(
+        self,
+        query_spec: MetricFlowQuerySpec,
+        output_table: Optional[SqlTable] = None,
+        output_selection_specs: Optional[InstanceSpecSet] = None,
+    ) -> DataflowPlan:
+        optimizers: List[DataflowPlanOptimizer] = [SourceScanOptimizer()]
+        if self._eliminate_common_subplans:
+            optimizers.append(CommonSubplanEliminator())
+        return self._dataflow_plan_builder.build_plan(
             query_spec=query_spec,
-            dataflow_plan=dataflow_plan,
-            execution_plan=execution_plan,
-            output_table=output_table,
+            output_sql_table=output_table,
+            output_selection_specs=output_selection_specs,
+            optimizers=optimizers,
         )
 
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def explain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:  # noqa: D
         return self._create_execution_plan(mf_request)
 
+    async def aquery(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:
+        """Async version of query().
+
+        Building the plans is CPU-bound, so it's done in a worker thread to avoid blocking the event loop. If an
+        async_sql_client was provided, the queries are awaited. Otherwise, they're run in a worker thread.
+        """
+        logger.info(f"Starting async query request:\n{indent(mf_pformat(mf_request))}")
+        explain_result = await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self._create_execution_plan, mf_request, read_incremental_window=True)
+        )
+        MetricFlowEngine._check_single_sink_node(explain_result)
+        (query_result,) = await self._aexecute_explain_result(explain_result)
+
+        logger.info(f"Finished async query request: {mf_request.request_id}")
+        return query_result
+
+    async def aexplain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
+        """Async version of explain(). The plans are built in a worker thread to avoid blocking the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(None, self._create_execution_plan, mf_request)
+
     def get_measures_for_metrics(self, metric_names: List[str]) -> List[Measure]:  # noqa: D
         metrics = self._semantic_manifest_lookup.metric_lookup.get_metrics(
             metric_references=[MetricReference(element_name=metric_name) for metric_name in metric_names]
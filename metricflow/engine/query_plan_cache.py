@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Tuple
+
+from metricflow.execution.execution_plan import ResultFormat
+from metricflow.protocols.query_parameter import GroupByParameter, MetricQueryParameter, OrderByQueryParameter
+from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
+
+if TYPE_CHECKING:
+    from metricflow.engine.metricflow_engine import (
+        MetricFlowExplainResult,
+        MetricFlowQueryRequest,
+        MetricFlowQueryType,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_names(names: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    """Names are resolved case-insensitively, so requests that only differ in case result in the same plan."""
+    if names is None:
+        return None
+    return tuple(name.strip().lower() for name in names)
+
+
+@dataclass(frozen=True)
+class QueryPlanCacheKey:
+    """The parts of a MetricFlowQueryRequest that determine the generated plans.
+
+    The request ID is excluded as it's different for every request. Fields added to MetricFlowQueryRequest that affect
+    the plans need to be added here as well.
+
+    When the bounds of time constraints are passed as bind parameters, the plans for requests that only differ in the
+    bounds can be shared, so the key only includes which bounds are specified. See from_request().
+    """
+
+    saved_query_name: Optional[str]
+    metric_names: Optional[Tuple[str, ...]]
+    metrics: Optional[Tuple[MetricQueryParameter, ...]]
+    group_by_names: Optional[Tuple[str, ...]]
+    group_by: Optional[Tuple[GroupByParameter, ...]]
+    limit: Optional[int]
+    has_time_constraint_start: bool
+    has_time_constraint_end: bool
+    time_constraint_start: Optional[datetime.datetime]
+    time_constraint_end: Optional[datetime.datetime]
+    where_constraint: Optional[str]
+    order_by_names: Optional[Tuple[str, ...]]
+    order_by: Optional[Tuple[OrderByQueryParameter, ...]]
+    min_max_only: bool
+    output_table: Optional[str]
+    sql_optimization_level: SqlQueryOptimizationLevel
+    query_type: MetricFlowQueryType
+    result_batch_size: Optional[int]
+    result_format: ResultFormat
+    result_cache_ttl_seconds: Optional[float]
+
+    @staticmethod
+    def from_request(
+        mf_request: MetricFlowQueryRequest, exclude_time_constraint_bounds: bool = False
+    ) -> Optional[QueryPlanCacheKey]:
+        """Create the key for the request, or return None if the request contains parameters that can't be hashed.
+
+        None is also returned for requests that write incrementally, as those plans depend on the rows in the output
+        table.
+
+        If exclude_time_constraint_bounds is set, requests that only differ in the bounds of the time constraint have
+        the same key. The cached plans then need to be checked and bound to the time constraint of the request.
+        """
+        if mf_request.incremental_lookback is not None:
+            return None
+        key = QueryPlanCacheKey(
+            saved_query_name=mf_request.saved_query_name.lower() if mf_request.saved_query_name is not None else None,
+            metric_names=_normalize_names(mf_request.metric_names),
+            metrics=tuple(mf_request.metrics) if mf_request.metrics is not None else None,
+            group_by_names=_normalize_names(mf_request.group_by_names),
+            group_by=tuple(mf_request.group_by) if mf_request.group_by is not None else None,
+            limit=mf_request.limit,
+            has_time_constraint_start=mf_request.time_constraint_start is not None,
+            has_time_constraint_end=mf_request.time_constraint_end is not None,
+            time_constraint_start=mf_request.time_constraint_start if not exclude_time_constraint_bounds else None,
+            time_constraint_end=mf_request.time_constraint_end if not exclude_time_constraint_bounds else None,
+            where_constraint=mf_request.where_constraint.strip() if mf_request.where_constraint is not None else None,
+            order_by_names=_normalize_names(mf_request.order_by_names),
+            order_by=tuple(mf_request.order_by) if mf_request.order_by is not None else None,
+            min_max_only=mf_request.min_max_only,
+            output_table=mf_request.output_table,
+            sql_optimization_level=mf_request.sql_optimization_level,
+            query_type=mf_request.query_type,
+            result_batch_size=mf_request.result_batch_size,
+            result_format=mf_request.result_format,
+            result_cache_ttl_seconds=mf_request.result_cache_ttl_seconds,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            logger.debug(f"Not caching the plan for request {mf_request.request_id} as it can't be hashed")
+            return None
+        return key
+
+
+@dataclass(frozen=True)
+class _QueryPlanCacheEntry:
+    explain_result: MetricFlowExplainResult
+    creation_time: float
+
+
+class QueryPlanCache:
+    """A bounded LRU cache from query requests to the plans generated for them.
+
+    Generating the plans for a query is relatively slow, so this is useful when the same requests are issued
+    repeatedly, e.g. by dashboards. Entries expire after ttl_seconds so that the cache doesn't hold onto plans for
+    requests that are no longer being made. This class is thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl_seconds: Optional[float] = 3600.0,
+        time_function: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            max_size: The maximum number of plans to keep. The least-recently used plan is evicted when full.
+            ttl_seconds: The number of seconds after which a plan expires. If None, plans don't expire.
+            time_function: Returns the current time in seconds. Overridden in tests.
+        """
+        if max_size <= 0:
+            raise ValueError(f"The maximum size of the cache must be a positive integer. Got: {max_size}")
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._time_function = time_function
+        self._entries: OrderedDict[QueryPlanCacheKey, _QueryPlanCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+
+    def get(
+        self,
+        key: QueryPlanCacheKey,
+        is_usable: Optional[Callable[[MetricFlowExplainResult], bool]] = None,
+    ) -> Optional[MetricFlowExplainResult]:
+        """Return the cached plans for the key, or None if there aren't any that haven't expired.
+
+        If is_usable is specified, cached plans for which it returns false are also not returned, and are replaced on
+        the next put() for the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                del self._entries[key]
+                entry = None
+            if entry is not None and is_usable is not None and not is_usable(entry.explain_result):
+                entry = None
+
+            if entry is None:
+                self._miss_count += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hit_count += 1
+            return entry.explain_result
+
+    def put(self, key: QueryPlanCacheKey, explain_result: MetricFlowExplainResult) -> None:
+        """Add the plans for the key, evicting the least-recently used plans if the cache is full."""
+        with self._lock:
+            self._entries[key] = _QueryPlanCacheEntry(
+                explain_result=explain_result, creation_time=self._time_function()
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all plans from the cache. The hit / miss counts are not reset."""
+        with self._lock:
+            self._entries.clear()
+
+    def _is_expired(self, entry: _QueryPlanCacheEntry) -> bool:
+        return self._ttl_seconds is not None and self._time_function() - entry.creation_time >= self._ttl_seconds
+
+    @property
+    def hit_count(self) -> int:
+        """The number of lookups that returned cached plans."""
+        return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """The number of lookups that did not find plans, including ones that found expired plans."""
+        return self._miss_count
+
+    def __len__(self) -> int:  # noqa: D
+        with self._lock:
+            return len(self._entries)
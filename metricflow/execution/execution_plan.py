@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import datetime
 import logging
 import textwrap
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, FrozenSet, Generator, Iterator, List, Optional, Sequence, Set, Tuple
 
 import jinja2
 import pandas as pd
@@ -13,11 +15,15 @@ import pandas as pd
 from metricflow.dag.id_generation import EXEC_NODE_READ_SQL_QUERY, EXEC_NODE_WRITE_TO_TABLE
 from metricflow.dag.mf_dag import DagId, DagNode, DisplayedProperty, MetricFlowDag, NodeId
 from metricflow.dataflow.sql_table import SqlTable
-from metricflow.protocols.sql_client import SqlClient
+from metricflow.execution.result_cache import ResultCache
+from metricflow.protocols.sql_client import AsyncSqlClient, SqlClient, SqlEngine
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.sql_request.sql_request_attributes import SqlJsonTag
 from metricflow.visitor import Visitable
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +73,14 @@ class SqlQuery:
     bind_parameters: SqlBindParameters
 
 
+class ResultFormat(Enum):
+    """The format in which a task that reads the result of a query returns the data."""
+
+    PANDAS = "pandas"
+    # Requires the optional pyarrow dependency.
+    ARROW = "arrow"
+
+
 @dataclass(frozen=True)
 class TaskExecutionError(Exception):
     """Error if a task fails."""
@@ -74,6 +88,49 @@ class TaskExecutionError(Exception):
     error_str: str
 
 
+class DataFrameBatches(Iterator[pd.DataFrame]):
+    """The batches of a query result that's streamed from the data warehouse, which can be iterated over once.
+
+    The query holds a connection until the batches are exhausted, so callers that stop iterating early should call
+    close() (e.g. through contextlib.closing()) to release it. end_time is set once the stream is exhausted or closed.
+    """
+
+    def __init__(self, batches: Generator[pd.DataFrame, None, None], description: str) -> None:  # noqa: D
+        self._batches = batches
+        self._description = description
+        self._start_time = time.time()
+        self._end_time: Optional[float] = None
+
+    def __iter__(self) -> DataFrameBatches:  # noqa: D
+        return self
+
+    def __next__(self) -> pd.DataFrame:  # noqa: D
+        try:
+            return next(self._batches)
+        except StopIteration:
+            self._finish()
+            raise
+        except Exception:
+            # The generator is closed when it raises an exception, so the connection has already been released.
+            self._finish()
+            raise
+
+    def close(self) -> None:
+        """Stop the query and release the connection. Has no effect if the batches were already exhausted."""
+        self._batches.close()
+        self._finish()
+
+    @property
+    def end_time(self) -> Optional[float]:
+        """The time when the batches were exhausted or closed, or None if they're still being streamed."""
+        return self._end_time
+
+    def _finish(self) -> None:
+        if self._end_time is None:
+            self._end_time = time.time()
+            logger.info(f"Finished streaming {self._description} in {self._end_time - self._start_time:.2f}s")
+
+
 @dataclass(frozen=True)
 class TaskExecutionResult:
     """The results of running a task."""
@@ -87,10 +144,24 @@ class TaskExecutionResult:
     bind_params: Optional[SqlBindParameters] = None
     # If the task produces a dataframe as a result, it's stored here.
     df: Optional[pd.DataFrame] = None
+    # If the task streams the result in batches, the iterator of dataframes is stored here. The query runs as the
+    # iterator is consumed, so errors from the query are raised during iteration. end_time is when the stream was set
+    # up, and the time when it finished is recorded in df_batches.
+    df_batches: Optional[DataFrameBatches] = None
+    # If the task produces an Arrow table as a result, it's stored here.
+    arrow_table: Optional[pa.Table] = None
 
 
 class SelectSqlQueryToDataFrameTask(ExecutionPlanTask):
-    """A task that runs a SELECT and puts that result into a dataframe."""
+    """A task that runs a SELECT and puts that result into a dataframe.
+
+    If batch_size is set, the result is instead returned as an iterator of dataframes with up to that many rows each.
+    If result_format is ARROW, the result is returned as an Arrow table instead of a dataframe.
+
+    If result_cache is set, dataframe results are looked up in / stored in the cache instead of always running the
+    query. semantic_model_names are the semantic models that the query reads from, and are used to invalidate cached
+    results when the data for a semantic model changes.
+    """
 
     def __init__(  # noqa: D
         self,
@@ -99,11 +170,23 @@ class SelectSqlQueryToDataFrameTask(ExecutionPlanTask):
         bind_parameters: SqlBindParameters,
         extra_sql_tags: SqlJsonTag = SqlJsonTag(),
         parent_nodes: Optional[List[ExecutionPlanTask]] = None,
+        batch_size: Optional[int] = None,
+        result_format: ResultFormat = ResultFormat.PANDAS,
+        result_cache: Optional[ResultCache] = None,
+        semantic_model_names: FrozenSet[str] = frozenset(),
+        result_cache_ttl_seconds: Optional[float] = None,
     ) -> None:
+        if batch_size is not None and result_format is not ResultFormat.PANDAS:
+            raise ValueError(f"Returning results in batches is only supported for {ResultFormat.PANDAS}")
         self._sql_client = sql_client
         self._sql_query = sql_query
         self._bind_parameters = bind_parameters
         self._extra_sql_tags = extra_sql_tags
+        self._batch_size = batch_size
+        self._result_format = result_format
+        self._result_cache = result_cache
+        self._semantic_model_names = semantic_model_names
+        self._result_cache_ttl_seconds = result_cache_ttl_seconds
         super().__init__(task_id=self.create_unique_id(), parent_nodes=parent_nodes or [])
 
     @classmethod
@@ -122,15 +205,121 @@ class SelectSqlQueryToDataFrameTask(ExecutionPlanTask):
     def bind_parameters(self) -> SqlBindParameters:  # noqa: D
         return self._bind_parameters
 
+    @property
+    def batch_size(self) -> Optional[int]:  # noqa: D
+        return self._batch_size
+
+    @property
+    def result_format(self) -> ResultFormat:  # noqa: D
+        return self._result_format
+
+    @property
+    def semantic_model_names(self) -> FrozenSet[str]:  # noqa: D
+        return self._semantic_model_names
+
+    def with_bind_parameters(self, bind_parameters: SqlBindParameters) -> SelectSqlQueryToDataFrameTask:
+        """Return a new task that runs the same query with different values for the bind parameters."""
+        return SelectSqlQueryToDataFrameTask(
+            sql_client=self._sql_client,
+            sql_query=self._sql_query,
+            bind_parameters=bind_parameters,
+            extra_sql_tags=self._extra_sql_tags,
+            parent_nodes=list(self.parent_nodes),
+            batch_size=self._batch_size,
+            result_format=self._result_format,
+            result_cache=self._result_cache,
+            semantic_model_names=self._semantic_model_names,
+            result_cache_ttl_seconds=self._result_cache_ttl_seconds,
+        )
+
+    def _get_cached_df(self) -> Optional[pd.DataFrame]:
+        if self._result_cache is None:
+            return None
+        df = self._result_cache.get(ResultCache.warehouse_id(self._sql_client), self._sql_query, self.bind_parameters)
+        if df is not None:
+            logger.info(f"Using cached result for the query in {self.task_id}")
+        return df
+
+    def _cache_df(self, df: pd.DataFrame) -> None:
+        if self._result_cache is not None:
+            self._result_cache.put(
+                ResultCache.warehouse_id(self._sql_client),
+                self._sql_query,
+                self.bind_parameters,
+                df,
+                semantic_model_names=self._semantic_model_names,
+                ttl_seconds=self._result_cache_ttl_seconds,
+            )
+
     def execute(self) -> TaskExecutionResult:  # noqa: D
         start_time = time.time()
 
-        df = self._sql_client.query(
-            self._sql_query,
-            sql_bind_parameters=self.bind_parameters,
-            extra_tags=self._extra_sql_tags,
+        if self._batch_size is not None:
+            df_batches = DataFrameBatches(
+                self._sql_client.query_batches(
+                    self._sql_query,
+                    batch_size=self._batch_size,
+                    sql_bind_parameters=self.bind_parameters,
+                    extra_tags=self._extra_sql_tags,
+                ),
+                description=f"the result of {self.task_id}",
+            )
+            return TaskExecutionResult(
+                start_time=start_time,
+                end_time=time.time(),
+                sql=self._sql_query,
+                bind_params=self.bind_parameters,
+                df_batches=df_batches,
+            )
+
+        if self._result_format is ResultFormat.ARROW:
+            arrow_table = self._sql_client.query_arrow(
+                self._sql_query,
+                sql_bind_parameters=self.bind_parameters,
+                extra_tags=self._extra_sql_tags,
+            )
+            return TaskExecutionResult(
+                start_time=start_time,
+                end_time=time.time(),
+                sql=self._sql_query,
+                bind_params=self.bind_parameters,
+                arrow_table=arrow_table,
+            )
+
+        df = self._get_cached_df()
+        if df is None:
+            df = self._sql_client.query(
+                self._sql_query,
+                sql_bind_parameters=self.bind_parameters,
+                extra_tags=self._extra_sql_tags,
+            )
+            self._cache_df(df)
+
+        end_time = time.time()
+        return TaskExecutionResult(
+            start_time=start_time, end_time=end_time, sql=self._sql_query, bind_params=self.bind_parameters, df=df
         )
 
+    async def execute_async(self, async_sql_client: AsyncSqlClient) -> TaskExecutionResult:
+        """Similar to execute(), but awaits the query through the given client instead of blocking.
+
+        Streaming the result in batches or returning an Arrow table is not supported through an AsyncSqlClient.
+        """
+        assert self._batch_size is None, "Streaming results in batches is not supported through an AsyncSqlClient"
+        assert (
+            self._result_format is ResultFormat.PANDAS
+        ), f"Only {ResultFormat.PANDAS} results are supported through an AsyncSqlClient"
+        start_time = time.time()
+
+        df = self._get_cached_df()
+        if df is None:
+            df = await async_sql_client.query(
+                self._sql_query,
+                sql_bind_parameters=self.bind_parameters,
+                extra_tags=self._extra_sql_tags,
+            )
+            self._cache_df(df)
+
         end_time = time.time()
         return TaskExecutionResult(
             start_time=start_time, end_time=end_time, sql=self._sql_query, bind_params=self.bind_parameters, df=df
@@ -147,10 +336,55 @@ class SelectSqlQueryToDataFrameTask(ExecutionPlanTask):
         return f"{self.__class__.__name__}(sql_query='{self._sql_query}')"
 
 
+@dataclass(frozen=True)
+class IncrementalTableWrite:
+    """Describes the rows of an existing table that are replaced when query results are written incrementally.
+
+    Rows where the time column is in [start_time, end_time] are deleted, and the results of the query, which only cover
+    that time range, are inserted in their place.
+    """
+
+    time_column_name: str
+    start_time: datetime.datetime
+    end_time: datetime.datetime
+
+
 class SelectSqlQueryToTableTask(ExecutionPlanTask):
-    """A task that runs a SELECT and puts that result into a table."""
+    """A task that runs a SELECT and puts that result into a table.
 
-    def __init__(  # noqa: D
+    By default, the table is replaced. If incremental_write is specified, the table is expected to exist, and only the
+    rows in the time range described by incremental_write are replaced. If the engine supports transactions, the rows
+    are deleted and the new rows are inserted in a single transaction. Otherwise, the rows are replaced with a single
+    statement in the dialect of the engine (a MERGE in BigQuery and an INSERT ... REPLACE WHERE in Databricks).
+    Incremental writes aren't supported for other engines.
+    """
+
+    # Keys for the bind parameters used to select the rows that are replaced in an incremental write.
+    INCREMENTAL_START_TIME_BIND_PARAMETER_KEY = "incremental_start_time"
+    INCREMENTAL_END_TIME_BIND_PARAMETER_KEY = "incremental_end_time"
+
+    # For engines without transactions, a statement that replaces the rows in the time range with the query result.
+    # NULL times are never in the time range, so those rows are kept, as they would be by a DELETE.
+    _REPLACE_ROWS_TEMPLATES: Dict[SqlEngine, str] = {
+        SqlEngine.BIGQUERY: """\
+            MERGE INTO {{ output_table }} output_rows
+            USING (
+              {{ select_query | indent(2) }}
+            ) incremental_rows
+            ON FALSE
+            WHEN NOT MATCHED BY SOURCE AND output_rows.{{ time_column }} BETWEEN {{ start_time }} AND {{ end_time }} THEN
+              DELETE
+            WHEN NOT MATCHED THEN
+              INSERT ({{ column_list }}) VALUES ({{ column_list }})
+            """,
+        SqlEngine.DATABRICKS: """\
+            INSERT INTO {{ output_table }} ({{ column_list }})
+            REPLACE WHERE {{ time_column }} BETWEEN {{ start_time }} AND {{ end_time }}
+            {{ select_query }}
+            """,
+    }
+
+    def __init__(
         self,
         sql_client: SqlClient,
         sql_query: str,
@@ -158,12 +392,33 @@ class SelectSqlQueryToTableTask(ExecutionPlanTask):
         output_table: SqlTable,
         extra_sql_tags: SqlJsonTag = SqlJsonTag(),
         parent_nodes: Optional[List[ExecutionPlanTask]] = None,
+        incremental_write: Optional[IncrementalTableWrite] = None,
+        column_names: Optional[Sequence[str]] = None,
     ) -> None:
+        """Constructor.
+
+        Args:
+            sql_client: The client to use for running the statements.
+            sql_query: The SELECT query whose result is written to the table.
+            bind_parameters: The bind parameters for the query.
+            output_table: The table to write to.
+            extra_sql_tags: Tags to supply to the SQL client when running statements.
+            parent_nodes: Tasks that need to run before this one.
+            incremental_write: If specified, only the rows in this time range are replaced.
+            column_names: The names of the columns in the result of the query, in order. Required for an incremental
+            write, as the columns are listed explicitly when writing to the existing table.
+        """
+        if incremental_write is not None and column_names is None:
+            raise ValueError("The column names of the query result are required for an incremental write.")
+        if incremental_write is not None and not sql_client.sql_engine_type.supports_incremental_writes:
+            raise ValueError(f"Incremental writes aren't supported for {sql_client.sql_engine_type.value}.")
         self._sql_client = sql_client
         self._sql_query = sql_query
         self._output_table = output_table
         self._bind_parameters = bind_parameters
         self._extra_sql_tags = extra_sql_tags
+        self._incremental_write = incremental_write
+        self._column_names = tuple(column_names) if column_names is not None else None
         super().__init__(task_id=self.create_unique_id(), parent_nodes=parent_nodes or [])
 
     @classmethod
@@ -180,40 +435,132 @@ class SelectSqlQueryToTableTask(ExecutionPlanTask):
             DisplayedProperty(key="sql_query", value=self._sql_query),
             DisplayedProperty(key="output_table", value=self._output_table),
             DisplayedProperty(key="bind_parameters", value=self._bind_parameters),
+            DisplayedProperty(key="incremental_write", value=self._incremental_write),
         ]
 
+    @property
+    def incremental_write(self) -> Optional[IncrementalTableWrite]:  # noqa: D
+        return self._incremental_write
+
+    def with_bind_parameters(self, bind_parameters: SqlBindParameters) -> SelectSqlQueryToTableTask:
+        """Return a new task that runs the same query with different values for the bind parameters."""
+        return SelectSqlQueryToTableTask(
+            sql_client=self._sql_client,
+            sql_query=self._sql_query,
+            bind_parameters=bind_parameters,
+            output_table=self._output_table,
+            extra_sql_tags=self._extra_sql_tags,
+            parent_nodes=list(self.parent_nodes),
+            incremental_write=self._incremental_write,
+            column_names=self._column_names,
+        )
+
     def execute(self) -> TaskExecutionResult:  # noqa: D
         start_time = time.time()
-        logger.info(f"Dropping table {self._output_table} in case it already exists")
-        self._sql_client.execute(f"DROP TABLE IF EXISTS {self._output_table.sql}")
-        logger.info(f"Creating table {self._output_table} using a SELECT query")
         sql_query = self.sql_query
         assert sql_query
-        self._sql_client.execute(
-            sql_query.sql_query,
-            sql_bind_parameters=sql_query.bind_parameters,
-            extra_tags=self._extra_sql_tags,
-        )
+        delete_query = self.delete_query
+        if self._incremental_write is None:
+            logger.info(f"Dropping table {self._output_table} in case it already exists")
+            self._sql_client.execute(f"DROP TABLE IF EXISTS {self._output_table.sql}")
+            logger.info(f"Creating table {self._output_table} using a SELECT query")
+            self._sql_client.execute(
+                sql_query.sql_query,
+                sql_bind_parameters=sql_query.bind_parameters,
+                extra_tags=self._extra_sql_tags,
+            )
+        elif delete_query is not None:
+            logger.info(
+                f"Replacing rows in {self._output_table} from {self._incremental_write.start_time} to "
+                f"{self._incremental_write.end_time} in a transaction"
+            )
+            self._sql_client.execute_in_transaction(
+                (
+                    (delete_query.sql_query, delete_query.bind_parameters),
+                    (sql_query.sql_query, sql_query.bind_parameters),
+                ),
+                extra_tags=self._extra_sql_tags,
+            )
+        else:
+            logger.info(
+                f"Replacing rows in {self._output_table} from {self._incremental_write.start_time} to "
+                f"{self._incremental_write.end_time} in a single statement, as "
+                f"{self._sql_client.sql_engine_type.value} doesn't support transactions"
+            )
+            self._sql_client.execute(
+                sql_query.sql_query,
+                sql_bind_parameters=sql_query.bind_parameters,
+                extra_tags=self._extra_sql_tags,
+            )
 
         end_time = time.time()
         return TaskExecutionResult(start_time=start_time, end_time=end_time, sql=self._sql_query)
 
+    def _render_incremental_template(self, template: str) -> str:
+        """Render a template for an incremental write, which can use the names of the table, columns, and time range."""
+        incremental_write = self._incremental_write
+        column_names = self._column_names
+        assert incremental_write is not None and column_names is not None
+        render_key = self._sql_client.render_bind_parameter_key
+        return jinja2.Template(textwrap.dedent(template), undefined=jinja2.StrictUndefined).render(
+            output_table=self._output_table.sql,
+            column_list=", ".join(column_names),
+            time_column=incremental_write.time_column_name,
+            start_time=render_key(self.INCREMENTAL_START_TIME_BIND_PARAMETER_KEY),
+            end_time=render_key(self.INCREMENTAL_END_TIME_BIND_PARAMETER_KEY),
+            select_query=self._sql_query,
+        )
+
+    def _incremental_bind_parameters(self) -> SqlBindParameters:
+        """The bind parameters for the time range of an incremental write."""
+        assert self._incremental_write is not None
+        return SqlBindParameters.create_from_dict(
+            {
+                self.INCREMENTAL_START_TIME_BIND_PARAMETER_KEY: self._incremental_write.start_time,
+                self.INCREMENTAL_END_TIME_BIND_PARAMETER_KEY: self._incremental_write.end_time,
+            }
+        )
+
+    @property
+    def delete_query(self) -> Optional[SqlQuery]:
+        """For an incremental write in a transaction, the query that deletes the rows that are replaced."""
+        if self._incremental_write is None or not self._sql_client.sql_engine_type.supports_transactions:
+            return None
+        query_text = self._render_incremental_template(
+            """\
+            DELETE FROM {{ output_table }}
+            WHERE {{ time_column }} BETWEEN {{ start_time }} AND {{ end_time }}
+            """
+        )
+        return SqlQuery(sql_query=query_text, bind_parameters=self._incremental_bind_parameters())
+
     @property
     def sql_query(self) -> Optional[SqlQuery]:  # noqa: D
-        query_text = jinja2.Template(
-            textwrap.dedent(
+        if self._incremental_write is None:
+            query_text = jinja2.Template(
+                textwrap.dedent(
+                    """\
+                    CREATE TABLE {{ output_table }} AS (
+                      {{ select_query | indent(2) }}
+                    )
+                    """
+                ),
+                undefined=jinja2.StrictUndefined,
+            ).render(output_table=self._output_table.sql, select_query=self._sql_query)
+            return SqlQuery(sql_query=query_text, bind_parameters=self._bind_parameters)
+
+        if self._sql_client.sql_engine_type.supports_transactions:
+            query_text = self._render_incremental_template(
                 """\
-                CREATE TABLE {{ output_table }} AS (
-                  {{ select_query | indent(2) }}
-                )
+                INSERT INTO {{ output_table }} ({{ column_list }})
+                {{ select_query }}
                 """
-            ),
-            undefined=jinja2.StrictUndefined,
-        ).render(output_table=self._output_table.sql, select_query=self._sql_query)
+            )
+            return SqlQuery(sql_query=query_text, bind_parameters=self._bind_parameters)
 
+        query_text = self._render_incremental_template(self._REPLACE_ROWS_TEMPLATES[self._sql_client.sql_engine_type])
         return SqlQuery(
-            sql_query=query_text,
-            bind_parameters=self._bind_parameters,
+            sql_query=query_text, bind_parameters=self._bind_parameters.combine(self._incremental_bind_parameters())
         )
 
     def __repr__(self) -> str:  # noqa: D
@@ -234,17 +581,18 @@ class ExecutionPlan(MetricFlowDag[ExecutionPlanTask]):
 
     @property
     def tasks(self) -> Sequence[ExecutionPlanTask]:
-        """Return all tasks in this plan."""
-        if len(self.sink_nodes) == 0:
-            return []
-
-        def recursively_get_tasks(task: ExecutionPlanTask) -> List[ExecutionPlanTask]:
-            tasks_to_return = []
+        """Return all tasks in this plan, with each task listed once and after the tasks that it depends on."""
+        tasks_to_return: List[ExecutionPlanTask] = []
+        visited_task_ids: Set[NodeId] = set()
+
+        def recursively_get_tasks(task: ExecutionPlanTask) -> None:
+            if task.task_id in visited_task_ids:
+                return
+            visited_task_ids.add(task.task_id)
             for parent_node in task.parent_nodes:
-                tasks_to_return.extend(recursively_get_tasks(parent_node))
+                recursively_get_tasks(parent_node)
             tasks_to_return.append(task)
 
-            return tasks_to_return
-
-        assert len(self.sink_nodes) == 1
-        return recursively_get_tasks(self.sink_nodes[0])
+        for sink_node in self.sink_nodes:
+            recursively_get_tasks(sink_node)
+        return tasks_to_return
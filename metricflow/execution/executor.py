@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Dict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set
 
 from metricflow.dag.mf_dag import NodeId
 from metricflow.execution.execution_plan import ExecutionPlan, ExecutionPlanTask, TaskExecutionResult
@@ -35,6 +37,30 @@ class ExecutionResults:
     def all_results(self) -> Dict[NodeId, TaskExecutionResult]:  # noqa: D
         return self._results
 
+    def task_runtimes(self) -> Dict[NodeId, float]:
+        """Returns the time in seconds that each task took to execute, in the order that the results were added."""
+        return OrderedDict((task_id, result.end_time - result.start_time) for task_id, result in self._results.items())
+
+
+def _execute_task(task: ExecutionPlanTask) -> TaskExecutionResult:
+    """Execute a single task and log the outcome."""
+    result = None
+    logger.info(f"Started task ID: {task.node_id}")
+    try:
+        result = task.execute()
+        return result
+    finally:
+        if result:
+            runtime = f"{result.end_time - result.start_time:.2f}s"
+            if result.errors:
+                logger.info(f"Finished task ID: {task.node_id} with errors: {result.errors} in {runtime}")
+            elif result.df_batches is not None:
+                logger.info(f"Started streaming the result of task ID: {task.node_id} in {runtime}")
+            else:
+                logger.info(f"Finished task ID: {task.node_id} successfully in {runtime}")
+        else:
+            logger.info(f"Task ID: {task.node_id} exited unexpectedly")
+
 
 class ExecutionPlanExecutor(ABC):
     """Runs the tasks in an execution plan."""
@@ -57,20 +83,7 @@ class SequentialPlanExecutor(ExecutionPlanExecutor):
             if results.contains_task_errors:
                 return
 
-        result = None
-        logger.info(f"Started task ID: {current_task.node_id}")
-        try:
-            result = current_task.execute()
-            results.add_result(current_task.task_id, result)
-        finally:
-            if result:
-                runtime = f"{result.end_time - result.start_time:.2f}s"
-                if result.errors:
-                    logger.info(f"Finished task ID: {current_task.node_id} with errors: {result.errors} in {runtime}")
-                else:
-                    logger.info(f"Finished task ID: {current_task.node_id} successfully in {runtime}")
-            else:
-                logger.info(f"Task ID: {current_task.node_id} exited unexpectedly")
+        results.add_result(current_task.task_id, _execute_task(current_task))
 
     def execute_plan(self, plan: ExecutionPlan) -> ExecutionResults:  # noqa: D
         results = ExecutionResults()
@@ -79,3 +92,82 @@ class SequentialPlanExecutor(ExecutionPlanExecutor):
             self._execute_dfs(leaf_node, results)
 
         return results
+
+
+class ParallelPlanExecutor(ExecutionPlanExecutor):
+    """Execute tasks concurrently in a bounded thread pool, starting each task once all of its parents have finished.
+
+    Tasks that don't depend on each other (e.g. the queries for separate sink nodes) are run at the same time. If a task
+    returns errors or raises an exception, tasks that have not started yet are cancelled. Tasks that are already running
+    are allowed to finish, and their results are recorded.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """Constructor.
+
+        Args:
+            max_workers: The maximum number of tasks to run at the same time. If None, the default for
+            ThreadPoolExecutor is used.
+        """
+        self._max_workers = max_workers
+
+    def execute_plan(self, plan: ExecutionPlan) -> ExecutionResults:  # noqa: D
+        results = ExecutionResults()
+        tasks = plan.tasks
+
+        # For each task, the IDs of the parent tasks that need to finish before it can start.
+        unfinished_parent_ids: Dict[NodeId, Set[NodeId]] = {
+            task.task_id: {parent_task.task_id for parent_task in task.parent_nodes} for task in tasks
+        }
+        child_tasks: Dict[NodeId, List[ExecutionPlanTask]] = {task.task_id: [] for task in tasks}
+        for task in tasks:
+            for parent_task in task.parent_nodes:
+                child_tasks[parent_task.task_id].append(task)
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mf_plan_executor") as pool:
+            running_tasks: Dict[Future[TaskExecutionResult], ExecutionPlanTask] = {}
+
+            def _submit(task: ExecutionPlanTask) -> None:
+                running_tasks[pool.submit(_execute_task, task)] = task
+
+            for task in tasks:
+                if len(unfinished_parent_ids[task.task_id]) == 0:
+                    _submit(task)
+
+            stop_submitting = False
+            raised_exception: Optional[BaseException] = None
+            while running_tasks:
+                done_futures, _ = wait(running_tasks.keys(), return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    finished_task = running_tasks.pop(future)
+                    if future.cancelled():
+                        continue
+                    exception = future.exception()
+                    if exception is not None:
+                        raised_exception = raised_exception or exception
+                        stop_submitting = True
+                        continue
+
+                    result = future.result()
+                    results.add_result(finished_task.task_id, result)
+                    if result.errors:
+                        stop_submitting = True
+                    if stop_submitting:
+                        continue
+
+                    for child_task in child_tasks[finished_task.task_id]:
+                        parent_ids = unfinished_parent_ids[child_task.task_id]
+                        parent_ids.discard(finished_task.task_id)
+                        if len(parent_ids) == 0:
+                            _submit(child_task)
+
+                if stop_submitting:
+                    for pending_future in running_tasks:
+                        pending_future.cancel()
+
+        logger.info(f"Finished running {len(results.all_results())} task(s) in {time.time() - start_time:.2f}s")
+        if raised_exception is not None:
+            raise raised_exception
+
+        return results
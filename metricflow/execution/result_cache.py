@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, Optional
+
+import pandas as pd
+
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+
+logger = logging.getLogger(__name__)
+
+# Subquery aliases are generated from a counter, so the SQL for the same query is different every time that it's
+# planned. The aliases are renumbered in the order that they appear so that those queries have the same key.
+_SUBQUERY_ALIAS_PATTERN = re.compile(r"\bsubq_(\d+)\b")
+
+
+@dataclass(frozen=True)
+class ResultCacheEntry:
+    """The result of a query, along with the information needed to decide when it should no longer be used.
+
+    Attributes:
+        df: The result of the query.
+        semantic_model_names: The names of the semantic models that the query reads from.
+        expiration_time: The time (seconds since the epoch) after which the result should not be used.
+    """
+
+    df: pd.DataFrame
+    semantic_model_names: FrozenSet[str]
+    expiration_time: Optional[float]
+
+
+class ResultCacheStorage(ABC):
+    """Stores the entries of a ResultCache. Implementations should be thread-safe."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[ResultCacheEntry]:
+        """Return the entry for the key, or None if there isn't one."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: str, entry: ResultCacheEntry) -> None:
+        """Store the entry for the key, replacing any existing entry."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, key: str) -> None:
+        """Remove the entry for the key, if there is one."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_for_semantic_model(self, semantic_model_name: str) -> None:
+        """Remove all entries for queries that read from the given semantic model."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError
+
+
+class InMemoryResultCacheStorage(ResultCacheStorage):
+    """Stores entries in memory, evicting the least-recently used ones when the results exceed the size limit."""
+
+    def __init__(self, max_size_bytes: int = 256 * 1024 * 1024) -> None:
+        """Constructor.
+
+        Args:
+            max_size_bytes: The maximum total in-memory size of the stored results.
+        """
+        self._max_size_bytes = max_size_bytes
+        self._entries: OrderedDict[str, ResultCacheEntry] = OrderedDict()
+        self._entry_sizes: Dict[str, int] = {}
+        self._total_size_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ResultCacheEntry]:  # noqa: D
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            # Copy so that changes to the returned dataframe don't affect the cached result.
+            return ResultCacheEntry(
+                df=entry.df.copy(),
+                semantic_model_names=entry.semantic_model_names,
+                expiration_time=entry.expiration_time,
+            )
+
+    def put(self, key: str, entry: ResultCacheEntry) -> None:  # noqa: D
+        entry_size = int(entry.df.memory_usage(deep=True).sum())
+        if entry_size > self._max_size_bytes:
+            logger.info(f"Not caching result with size {entry_size} bytes as it's larger than the cache")
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = ResultCacheEntry(
+                df=entry.df.copy(),
+                semantic_model_names=entry.semantic_model_names,
+                expiration_time=entry.expiration_time,
+            )
+            self._entry_sizes[key] = entry_size
+            self._total_size_bytes += entry_size
+            while self._total_size_bytes > self._max_size_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def remove(self, key: str) -> None:  # noqa: D
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        if key in self._entries:
+            del self._entries[key]
+            self._total_size_bytes -= self._entry_sizes.pop(key)
+
+    def remove_for_semantic_model(self, semantic_model_name: str) -> None:  # noqa: D
+        with self._lock:
+            for key in [
+                key for key, entry in self._entries.items() if semantic_model_name in entry.semantic_model_names
+            ]:
+                self._remove(key)
+
+    def clear(self) -> None:  # noqa: D
+        with self._lock:
+            self._entries.clear()
+            self._entry_sizes.clear()
+            self._total_size_bytes = 0
+
+    @property
+    def total_size_bytes(self) -> int:
+        """The total in-memory size of the stored results."""
+        return self._total_size_bytes
+
+
+class DiskResultCacheStorage(ResultCacheStorage):
+    """Stores entries as Arrow IPC files in a local directory so that they can be shared between processes.
+
+    When the files exceed the size limit, the least-recently used ones are deleted. Requires the optional pyarrow
+    dependency.
+    """
+
+    _FILE_SUFFIX = ".arrow"
+    _SEMANTIC_MODEL_NAMES_METADATA_KEY = b"mf_semantic_model_names"
+    _EXPIRATION_TIME_METADATA_KEY = b"mf_expiration_time"
+
+    def __init__(self, directory: str, max_size_bytes: int = 1024 * 1024 * 1024) -> None:
+        """Constructor.
+
+        Args:
+            directory: The directory for the files. It's created if it doesn't exist.
+            max_size_bytes: The maximum total size of the files.
+        """
+        self._directory = directory
+        self._max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + DiskResultCacheStorage._FILE_SUFFIX)
+
+    def _paths(self) -> Iterable[str]:
+        for file_name in os.listdir(self._directory):
+            if file_name.endswith(DiskResultCacheStorage._FILE_SUFFIX):
+                yield os.path.join(self._directory, file_name)
+
+    @staticmethod
+    def _read_semantic_model_names(path: str) -> FrozenSet[str]:
+        import pyarrow as pa
+
+        with pa.OSFile(path, "rb") as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+        return frozenset(json.loads(metadata.get(DiskResultCacheStorage._SEMANTIC_MODEL_NAMES_METADATA_KEY, b"[]")))
+
+    def get(self, key: str) -> Optional[ResultCacheEntry]:  # noqa: D
+        import pyarrow as pa
+
+        path = self._path(key)
+        with self._lock:
+            try:
+                with pa.OSFile(path, "rb") as source:
+                    table = pa.ipc.open_file(source).read_all()
+                # Update the modification time to track the least-recently used files.
+                os.utime(path)
+            except FileNotFoundError:
+                return None
+
+        metadata = table.schema.metadata or {}
+        expiration_time = metadata.get(DiskResultCacheStorage._EXPIRATION_TIME_METADATA_KEY)
+        return ResultCacheEntry(
+            df=table.to_pandas(),
+            semantic_model_names=frozenset(
+                json.loads(metadata.get(DiskResultCacheStorage._SEMANTIC_MODEL_NAMES_METADATA_KEY, b"[]"))
+            ),
+            expiration_time=float(expiration_time) if expiration_time is not None else None,
+        )
+
+    def put(self, key: str, entry: ResultCacheEntry) -> None:  # noqa: D
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(entry.df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[DiskResultCacheStorage._SEMANTIC_MODEL_NAMES_METADATA_KEY] = json.dumps(
+            sorted(entry.semantic_model_names)
+        ).encode()
+        if entry.expiration_time is not None:
+            metadata[DiskResultCacheStorage._EXPIRATION_TIME_METADATA_KEY] = str(entry.expiration_time).encode()
+        table = table.replace_schema_metadata(metadata)
+
+        path = self._path(key)
+        # Write to a temporary file first so that readers in other processes never see a partially written file.
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with pa.OSFile(temp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        with self._lock:
+            os.replace(temp_path, path)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least-recently used files until the total size is within the limit."""
+        file_stats = []
+        for path in self._paths():
+            try:
+                file_stats.append((path, os.stat(path)))
+            except FileNotFoundError:
+                # Deleted by another process.
+                continue
+        total_size_bytes = sum(stat.st_size for _, stat in file_stats)
+        for path, stat in sorted(file_stats, key=lambda path_and_stat: path_and_stat[1].st_mtime):
+            if total_size_bytes <= self._max_size_bytes:
+                break
+            self._delete(path)
+            total_size_bytes -= stat.st_size
+
+    @staticmethod
+    def _delete(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def remove(self, key: str) -> None:  # noqa: D
+        with self._lock:
+            DiskResultCacheStorage._delete(self._path(key))
+
+    def remove_for_semantic_model(self, semantic_model_name: str) -> None:  # noqa: D
+        with self._lock:
+            for path in list(self._paths()):
+                try:
+                    semantic_model_names = DiskResultCacheStorage._read_semantic_model_names(path)
+                except FileNotFoundError:
+                    continue
+                if semantic_model_name in semantic_model_names:
+                    DiskResultCacheStorage._delete(path)
+
+    def clear(self) -> None:  # noqa: D
+        with self._lock:
+            for path in list(self._paths()):
+                DiskResultCacheStorage._delete(path)
+
+
+class ResultCache:
+    """Caches the results of queries, keyed by the data warehouse, the SQL, and the bind parameters.
+
+    This avoids running the same query in the data warehouse when the underlying data hasn't changed, e.g. when a
+    dashboard is reloaded. Results expire after a TTL, and can be invalidated by semantic model when the data for the
+    semantic model is updated.
+    """
+
+    def __init__(
+        self,
+        storage: ResultCacheStorage,
+        default_ttl_seconds: Optional[float] = 3600.0,
+        time_function: Callable[[], float] = time.time,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            storage: Where to store the results.
+            default_ttl_seconds: The number of seconds after which a result expires, if not specified for the query.
+            If None, results don't expire by default.
+            time_function: Returns the current time in seconds since the epoch. Overridden in tests.
+        """
+        self._storage = storage
+        self._default_ttl_seconds = default_ttl_seconds
+        self._time_function = time_function
+        self._lock = threading.Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+
+    @staticmethod
+    def warehouse_id(sql_client: SqlClient) -> str:
+        """Return the ID of the data warehouse that the client runs queries in, for use with get() and put()."""
+        return f"{sql_client.sql_engine_type.value}:{sql_client.connection_identity}"
+
+    @staticmethod
+    def _create_key(warehouse_id: str, sql: str, bind_parameters: SqlBindParameters) -> str:
+        alias_numbers: Dict[str, int] = {}
+
+        def _renumber_alias(match: re.Match[str]) -> str:
+            return f"subq_{alias_numbers.setdefault(match.group(1), len(alias_numbers))}"
+
+        normalized_sql = _SUBQUERY_ALIAS_PATTERN.sub(_renumber_alias, sql)
+        key_text = "\n".join((warehouse_id, normalized_sql, repr(tuple(bind_parameters.param_dict.items()))))
+        return hashlib.sha256(key_text.encode()).hexdigest()
+
+    def get(self, warehouse_id: str, sql: str, bind_parameters: SqlBindParameters) -> Optional[pd.DataFrame]:
+        """Return the cached result of the query, or None if there isn't one that hasn't expired.
+
+        warehouse_id identifies the data warehouse that the query is run in (see warehouse_id()), so that engines for
+        different warehouses can share the storage for the cache.
+        """
+        key = ResultCache._create_key(warehouse_id, sql, bind_parameters)
+        entry = self._storage.get(key)
+        if entry is not None and entry.expiration_time is not None and self._time_function() >= entry.expiration_time:
+            self._storage.remove(key)
+            entry = None
+
+        with self._lock:
+            if entry is None:
+                self._miss_count += 1
+                return None
+            self._hit_count += 1
+        return entry.df
+
+    def put(
+        self,
+        warehouse_id: str,
+        sql: str,
+        bind_parameters: SqlBindParameters,
+        df: pd.DataFrame,
+        semantic_model_names: Iterable[str],
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """Store the result of the query.
+
+        Args:
+            warehouse_id: Identifies the data warehouse that the query was run in. See warehouse_id().
+            sql: The SQL of the query.
+            bind_parameters: The bind parameters used with the query.
+            df: The result of the query.
+            semantic_model_names: The names of the semantic models that the query reads from.
+            ttl_seconds: If specified, overrides the default TTL for this result.
+        """
+        ttl_seconds = ttl_seconds if ttl_seconds is not None else self._default_ttl_seconds
+        self._storage.put(
+            ResultCache._create_key(warehouse_id, sql, bind_parameters),
+            ResultCacheEntry(
+                df=df,
+                semantic_model_names=frozenset(semantic_model_names),
+                expiration_time=self._time_function() + ttl_seconds if ttl_seconds is not None else None,
+            ),
+        )
+
+    def invalidate_semantic_model(self, semantic_model_name: str) -> None:
+        """Remove the cached results of queries that read from the given semantic model.
+
+        This should be called when the data for the semantic model is updated.
+        """
+        logger.info(f"Invalidating cached results for semantic model '{semantic_model_name}'")
+        self._storage.remove_for_semantic_model(semantic_model_name)
+
+    def clear(self) -> None:
+        """Remove all cached results. The hit / miss counts are not reset."""
+        self._storage.clear()
+
+    @property
+    def hit_count(self) -> int:
+        """The number of lookups that returned a cached result."""
+        return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """The number of lookups that did not find a result, including ones that found an expired result."""
+        return self._miss_count
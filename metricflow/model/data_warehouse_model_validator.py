@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import collections
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from functools import partial
-from math import floor
 from time import perf_counter
 from typing import Callable, DefaultDict, Dict, List, Optional, Sequence, Tuple, TypeVar
 
@@ -41,6 +41,7 @@ from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanCon
 from metricflow.plan_conversion.time_spine import TimeSpineSource
 from metricflow.protocols.sql_client import SqlClient
 from metricflow.specs.specs import InstanceSpecSet, LinkableInstanceSpec, MeasureSpec
+from metricflow.sql.dry_run_batching import DEFAULT_DRY_RUN_BATCH_SIZE
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 
 
@@ -443,6 +444,21 @@ class DataWarehouseTaskBuilder:
         return tasks
 
 
+@dataclass(frozen=True)
+class _TaskResult:
+    """The result of running a DataWarehouseValidationTask.
+
+    Attributes:
+        completed: False if the task was skipped because the timeout was hit.
+        error: The error if the query for the task failed.
+        subtask_results: The results of the batches of subtasks that were run because the task failed.
+    """
+
+    completed: bool
+    error: Optional[ValidationError] = None
+    subtask_results: Tuple[Future[Tuple[_TaskResult, ...]], ...] = ()
+
+
 class DataWarehouseModelValidator:
     """A Validator for checking specific tasks for the manifest against the Data Warehouse.
 
@@ -452,51 +468,124 @@ class DataWarehouseModelValidator:
     them (assuming the manifest has passed these validations before use).
     """
 
-    def __init__(self, sql_client: SqlClient) -> None:  # noqa: D
+    def __init__(
+        self, sql_client: SqlClient, max_workers: int = 1, dry_run_batch_size: int = DEFAULT_DRY_RUN_BATCH_SIZE
+    ) -> None:
+        """Constructor.
+
+        Args:
+            sql_client: The client used to dry run the queries for the tasks.
+            max_workers: The maximum number of batches of tasks to dry run at the same time. Values greater than 1
+            require that the SQL client can be used from multiple threads.
+            dry_run_batch_size: The maximum number of queries to dry run in a single round trip to the data warehouse.
+            See SqlClient.dry_run_many().
+        """
+        if max_workers < 1:
+            raise ValueError(f"The maximum number of workers must be a positive integer. Got: {max_workers}")
+        if dry_run_batch_size < 1:
+            raise ValueError(f"The dry run batch size must be a positive integer. Got: {dry_run_batch_size}")
         self._sql_client = sql_client
+        self._max_workers = max_workers
+        self._dry_run_batch_size = dry_run_batch_size
 
     def run_tasks(
         self, tasks: List[DataWarehouseValidationTask], timeout: Optional[int] = None
     ) -> SemanticManifestValidationResults:
         """Runs the list of tasks as queries agains the data warehouse, returning any found issues.
 
+        The queries for the tasks are dry run in batches, and up to max_workers batches are run at the same time. The
+        subtasks of a task that fails are run as well, and the issues are returned in the same order as if the tasks
+        were run one after another.
+
         Args:
             tasks: A list of tasks to run against the data warehouse
-            timeout: An optional timeout. Default is None. When the timeout is hit, function will return early.
+            timeout: An optional timeout. Default is None. When the timeout is hit, tasks that haven't been started are
+            skipped, and the function returns once the running tasks finish.
 
         Returns:
             A list of validation issues discovered when running the passed in tasks against the data warehosue
         """
         # Used for keeping track if we go past the max time
-        start_time = perf_counter()
+        deadline = perf_counter() + timeout if timeout is not None else None
 
-        issues: List[ValidationIssue] = []
-        # TODO: Asyncio implementation
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mf_dw_validator") as pool:
+            batch_results = self._submit_tasks(pool=pool, tasks=tasks, deadline=deadline)
+            issues = DataWarehouseModelValidator._collect_issues(batch_results)
+
+        return SemanticManifestValidationResults.from_issues_sequence(issues)
+
+    def _submit_tasks(
+        self, pool: ThreadPoolExecutor, tasks: Sequence[DataWarehouseValidationTask], deadline: Optional[float]
+    ) -> List[Future[Tuple[_TaskResult, ...]]]:
+        return [
+            pool.submit(self._run_task_batch, pool, tasks[i : i + self._dry_run_batch_size], deadline)
+            for i in range(0, len(tasks), self._dry_run_batch_size)
+        ]
+
+    def _run_task_batch(
+        self, pool: ThreadPoolExecutor, tasks: Sequence[DataWarehouseValidationTask], deadline: Optional[float]
+    ) -> Tuple[_TaskResult, ...]:
+        """Dry run the queries for the tasks, submitting the subtasks of the ones that fail to the pool."""
+        if deadline is not None and perf_counter() > deadline:
+            return tuple(_TaskResult(completed=False) for _ in tasks)
+
+        exceptions: List[Optional[Exception]] = [None] * len(tasks)
+        queries: List[Tuple[int, Tuple[str, SqlBindParameters]]] = []
         for index, task in enumerate(tasks):
-            if timeout is not None and perf_counter() - start_time > timeout:
-                issues.append(
-                    ValidationWarning(
-                        context=None,
-                        message=f"Hit timeout before completing all tasks. Completed {index}/{len(tasks)} tasks.",
-                    )
-                )
-                break
             try:
-                (query_string, query_params) = task.query_and_params_callable()
-                self._sql_client.dry_run(stmt=query_string, sql_bind_parameters=query_params)
+                queries.append((index, task.query_and_params_callable()))
             except Exception as e:
-                issues.append(
-                    ValidationError(
+                exceptions[index] = e
+        dry_run_exceptions = self._sql_client.dry_run_many(
+            statements=[query for _, query in queries], max_batch_size=self._dry_run_batch_size
+        )
+        for (index, _), exception in zip(queries, dry_run_exceptions):
+            exceptions[index] = exception
+
+        task_results: List[_TaskResult] = []
+        for task, exception in zip(tasks, exceptions):
+            if exception is None:
+                task_results.append(_TaskResult(completed=True))
+                continue
+            task_results.append(
+                _TaskResult(
+                    completed=True,
+                    error=ValidationError(
                         context=task.context,
-                        message=task.error_message + f"\nReceived following error from data warehouse:\n{e}",
-                        extra_detail="".join(traceback.format_tb(e.__traceback__)),
-                    )
+                        message=task.error_message + f"\nReceived following error from data warehouse:\n{exception}",
+                        extra_detail="".join(traceback.format_tb(exception.__traceback__)),
+                    ),
+                    subtask_results=tuple(
+                        self._submit_tasks(pool=pool, tasks=task.on_fail_subtasks, deadline=deadline)
+                    ),
                 )
-                if task.on_fail_subtasks:
-                    sub_task_timeout = floor(timeout - (perf_counter() - start_time)) if timeout else None
-                    issues += self.run_tasks(tasks=task.on_fail_subtasks, timeout=sub_task_timeout).all_issues
+            )
+        return tuple(task_results)
 
-        return SemanticManifestValidationResults.from_issues_sequence(issues)
+    @staticmethod
+    def _collect_issues(batch_results: Sequence[Future[Tuple[_TaskResult, ...]]]) -> List[ValidationIssue]:
+        """Wait for the tasks and return their issues, with the issues for the subtasks following the failed task."""
+        issues: List[ValidationIssue] = []
+        task_count = 0
+        completed_count = 0
+        for batch_result in batch_results:
+            for task_result in batch_result.result():
+                task_count += 1
+                if not task_result.completed:
+                    continue
+                completed_count += 1
+                if task_result.error is not None:
+                    issues.append(task_result.error)
+                issues += DataWarehouseModelValidator._collect_issues(task_result.subtask_results)
+
+        if completed_count < task_count:
+            issues.append(
+                ValidationWarning(
+                    context=None,
+                    message=f"Hit timeout before completing all tasks. Completed {completed_count}/{task_count} tasks.",
+                )
+            )
+        return issues
 
     def validate_semantic_models(
         self, manifest: SemanticManifest, timeout: Optional[int] = None
@@ -18,10 +18,21 @@ logger = logging.getLogger(__name__)
 class SemanticManifestLookup:
     """Adds semantics information to the user configured model."""
 
-    def __init__(self, semantic_manifest: SemanticManifest) -> None:  # noqa: D
+    def __init__(self, semantic_manifest: SemanticManifest, warm_up_in_background: bool = False) -> None:
+        """Constructor.
+
+        Args:
+            semantic_manifest: the manifest to look up elements in.
+            warm_up_in_background: if set, the indexes of the valid group-by-items for metrics are built in a
+            background thread instead of when they are first needed. See ValidLinkableSpecResolver.
+        """
         self._semantic_manifest = semantic_manifest
         self._semantic_model_lookup = SemanticModelLookup(semantic_manifest)
-        self._metric_lookup = MetricLookup(self._semantic_manifest, self._semantic_model_lookup)
+        self._metric_lookup = MetricLookup(
+            self._semantic_manifest,
+            self._semantic_model_lookup,
+            warm_up_linkable_elements_in_background=warm_up_in_background,
+        )
 
     @property
     def semantic_manifest(self) -> SemanticManifest:  # noqa: D
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Optional
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.model.semantics.linkable_spec_resolver import LinkableElementIndexSnapshot
+
+logger = logging.getLogger(__name__)
+
+# Increment when the contents of the snapshot change so that snapshots from other versions aren't loaded.
+_SNAPSHOT_FORMAT_VERSION = 1
+
+
+def _metricflow_version() -> str:
+    try:
+        return version("metricflow")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class SemanticManifestLookupCache:
+    """Persists the indexes derived from a semantic manifest so that they don't need to be rebuilt on every start.
+
+    Snapshots are stored as pickle files in a directory, keyed by a hash of the manifest JSON and the MetricFlow
+    version, so a snapshot is only used for the exact manifest and code that created it. As pickle files can run
+    arbitrary code when loaded, the directory should only be writable by trusted users.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """Constructor.
+
+        Args:
+            directory: The directory to store snapshots in. It's created if it doesn't exist.
+        """
+        self._directory = Path(directory)
+
+    @staticmethod
+    def snapshot_key(semantic_manifest: SemanticManifest) -> Optional[str]:
+        """Return the key for the snapshot of the manifest, or None if the manifest can't be serialized."""
+        if not isinstance(semantic_manifest, PydanticSemanticManifest):
+            return None
+        hasher = hashlib.sha256()
+        hasher.update(f"{_metricflow_version()}:{_SNAPSHOT_FORMAT_VERSION}:".encode())
+        hasher.update(semantic_manifest.json(sort_keys=True).encode())
+        return hasher.hexdigest()
+
+    def _snapshot_path(self, key: str) -> Path:
+        return self._directory / f"semantic_manifest_lookup_{key}.pickle"
+
+    def load_or_create_lookup(self, semantic_manifest: SemanticManifest) -> SemanticManifestLookup:
+        """Create a lookup for the manifest, loading its indexes from the snapshot if one exists.
+
+        If there isn't a snapshot, the indexes are built and a snapshot is written for later calls. Snapshots that
+        can't be read or written are logged and otherwise ignored.
+        """
+        semantic_manifest_lookup = SemanticManifestLookup(semantic_manifest)
+        key = SemanticManifestLookupCache.snapshot_key(semantic_manifest)
+        if key is None:
+            logger.info(f"Not using a snapshot as {type(semantic_manifest)} manifests can't be serialized")
+            return semantic_manifest_lookup
+
+        linkable_spec_resolver = semantic_manifest_lookup.metric_lookup.linkable_spec_resolver
+        snapshot = self._load_snapshot(key)
+        if snapshot is not None:
+            linkable_spec_resolver.load_index_snapshot(snapshot)
+            return semantic_manifest_lookup
+
+        self._write_snapshot(key, linkable_spec_resolver.create_index_snapshot())
+        return semantic_manifest_lookup
+
+    def _load_snapshot(self, key: str) -> Optional[LinkableElementIndexSnapshot]:
+        path = self._snapshot_path(key)
+        start_time = time.time()
+        try:
+            with open(path, "rb") as f:
+                snapshot = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.exception(f"Unable to load the snapshot at {path}, so rebuilding it")
+            return None
+
+        if not isinstance(snapshot, LinkableElementIndexSnapshot):
+            logger.warning(f"Ignoring the snapshot at {path} as it contains an unexpected {type(snapshot)}")
+            return None
+        logger.info(f"Loaded the semantic manifest snapshot at {path} in {time.time() - start_time:.2f}s")
+        return snapshot
+
+    def _write_snapshot(self, key: str, snapshot: LinkableElementIndexSnapshot) -> None:
+        path = self._snapshot_path(key)
+        temporary_path: Optional[str] = None
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so that other processes never read a partially written snapshot.
+            with tempfile.NamedTemporaryFile(dir=self._directory, suffix=".tmp", delete=False) as f:
+                temporary_path = f.name
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, path)
+        except Exception:
+            logger.exception(f"Unable to write the semantic manifest snapshot to {path}")
+            if temporary_path is not None and os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            return
+        logger.info(f"Wrote the semantic manifest snapshot to {path}")
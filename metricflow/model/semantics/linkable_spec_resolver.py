@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass
@@ -442,6 +443,21 @@ class SemanticModelJoinPath:
         return self.path_elements[-1].semantic_model_reference
 
 
+@dataclass(frozen=True)
+class LinkableElementIndexSnapshot:
+    """The valid linkable elements computed by a ValidLinkableSpecResolver, for persisting between processes.
+
+    Attributes:
+        metric_to_linkable_element_sets: The linkable elements for each measure of a metric, keyed by metric name.
+        measure_to_linkable_element_set: All valid linkable elements for a measure.
+        no_metric_linkable_element_set: The elements that can be queried without metrics.
+    """
+
+    metric_to_linkable_element_sets: Dict[str, Tuple[LinkableElementSet, ...]]
+    measure_to_linkable_element_set: Dict[MeasureReference, LinkableElementSet]
+    no_metric_linkable_element_set: Optional[LinkableElementSet]
+
+
 class ValidLinkableSpecResolver:
     """Figures out what linkable specs are valid for a given metric.
 
@@ -453,13 +469,19 @@ class ValidLinkableSpecResolver:
         semantic_manifest: SemanticManifest,
         semantic_model_lookup: SemanticModelAccessor,
         max_entity_links: int,
+        warm_up_in_background: bool = False,
     ) -> None:
         """Constructor.
 
+        The valid linkable elements for a metric are computed when they are first needed and then reused, so the time
+        to construct this doesn't grow with the size of the manifest.
+
         Args:
             semantic_manifest: the model to use.
             semantic_model_lookup: used to look up entities for a semantic model.
             max_entity_links: the maximum number of joins to do when computing valid elements.
+            warm_up_in_background: if set, the valid linkable elements for all metrics are computed in a background
+            thread so that they are ready by the time the first query is made.
         """
         self._semantic_manifest = semantic_manifest
         self._semantic_model_lookup = semantic_model_lookup
@@ -478,16 +500,86 @@ class ValidLinkableSpecResolver:
             for entity in semantic_model.entities:
                 self._entity_to_semantic_model[entity.reference.element_name].append(semantic_model)
 
-        self._metric_to_linkable_element_sets: Dict[str, List[LinkableElementSet]] = {}
+        self._metrics = {metric.name: metric for metric in self._semantic_manifest.metrics}
+
+        # Memoized results, guarded by the lock as they can also be computed by the warm-up thread.
+        self._lock = threading.RLock()
+        self._metric_to_linkable_element_sets: Dict[str, Sequence[LinkableElementSet]] = {}
+        self._measure_to_linkable_element_set: Dict[MeasureReference, LinkableElementSet] = {}
+        self._no_metric_linkable_element_set: Optional[LinkableElementSet] = None
+        # The semantic models that can be joined to a semantic model, by the entity they're joined on.
+        self._join_graph: Dict[
+            SemanticModelReference, Sequence[Tuple[EntityReference, Sequence[SemanticModelReference]]]
+        ] = {}
+        self._join_path_to_linkable_element_set: Dict[
+            Tuple[SemanticModelJoinPath, FrozenSet[LinkableElementProperties]], LinkableElementSet
+        ] = {}
+        self._semantic_model_to_joined_elements: Dict[SemanticModelReference, LinkableElementSet] = {}
+
+        self._warm_up_thread: Optional[threading.Thread] = None
+        if warm_up_in_background:
+            self._warm_up_thread = threading.Thread(
+                target=self.warm_up, name="mf_linkable_spec_resolver_warm_up", daemon=True
+            )
+            self._warm_up_thread.start()
 
+    def warm_up(self) -> None:
+        """Compute the valid linkable elements for all metrics, and for queries without metrics."""
         start_time = time.time()
-        for metric in self._semantic_manifest.metrics:
+        for metric_name in self._metrics:
+            self._get_linkable_element_sets_for_metric(metric_name)
+        self._get_no_metric_linkable_element_set()
+        logger.info(f"Building valid group-by-item indexes took: {time.time() - start_time:.2f}s")
+
+    def wait_for_warm_up(self, timeout: Optional[float] = None) -> None:
+        """Block until the background warm-up is done, if one was started."""
+        if self._warm_up_thread is not None:
+            self._warm_up_thread.join(timeout=timeout)
+
+    def create_index_snapshot(self) -> LinkableElementIndexSnapshot:
+        """Return a snapshot of the valid linkable elements for all metrics, computing any that haven't been yet."""
+        self.warm_up()
+        with self._lock:
+            return LinkableElementIndexSnapshot(
+                metric_to_linkable_element_sets={
+                    metric_name: tuple(linkable_element_sets)
+                    for metric_name, linkable_element_sets in self._metric_to_linkable_element_sets.items()
+                },
+                measure_to_linkable_element_set=dict(self._measure_to_linkable_element_set),
+                no_metric_linkable_element_set=self._no_metric_linkable_element_set,
+            )
+
+    def load_index_snapshot(self, snapshot: LinkableElementIndexSnapshot) -> None:
+        """Use the valid linkable elements from the snapshot instead of computing them.
+
+        The snapshot must have been created by a resolver for the same manifest.
+        """
+        with self._lock:
+            self._metric_to_linkable_element_sets.update(snapshot.metric_to_linkable_element_sets)
+            self._measure_to_linkable_element_set.update(snapshot.measure_to_linkable_element_set)
+            if snapshot.no_metric_linkable_element_set is not None:
+                self._no_metric_linkable_element_set = snapshot.no_metric_linkable_element_set
+
+    def _get_linkable_element_sets_for_metric(self, metric_name: str) -> Sequence[LinkableElementSet]:
+        """Return the linkable elements for each measure of the metric, computing them on first access.
+
+        Returns an empty sequence for unknown metrics.
+        """
+        with self._lock:
+            linkable_element_sets = self._metric_to_linkable_element_sets.get(metric_name)
+            if linkable_element_sets is not None:
+                return linkable_element_sets
+
+            metric = self._metrics.get(metric_name)
+            if metric is None:
+                return ()
+
             linkable_sets_for_measure = []
             for measure in metric.measure_references:
                 # Cumulative metrics currently can't be queried by other time granularities.
                 if metric.type is MetricType.CUMULATIVE:
                     linkable_sets_for_measure.append(
-                        self._get_linkable_element_set_for_measure(measure).filter(
+                        self._get_unfiltered_linkable_element_set_for_measure(measure).filter(
                             with_any_of=LinkableElementProperties.all_properties(),
                             without_all_of=frozenset(
                                 {
@@ -502,7 +594,7 @@ class ValidLinkableSpecResolver:
                     or metric.type is MetricType.DERIVED
                     or metric.type is MetricType.RATIO
                 ):
-                    linkable_sets_for_measure.append(self._get_linkable_element_set_for_measure(measure))
+                    linkable_sets_for_measure.append(self._get_unfiltered_linkable_element_set_for_measure(measure))
                 elif metric.type is MetricType.CONVERSION:
                     conversion_type_params = metric.type_params.conversion_type_params
                     assert (
@@ -512,25 +604,31 @@ class ValidLinkableSpecResolver:
                         # Only can query against the base measure's linkable elements
                         # as it joins everything back to the base measure data set so
                         # there is no way of getting the conversion elements
-                        linkable_sets_for_measure.append(self._get_linkable_element_set_for_measure(measure))
+                        linkable_sets_for_measure.append(self._get_unfiltered_linkable_element_set_for_measure(measure))
                 else:
                     assert_values_exhausted(metric.type)
 
-            self._metric_to_linkable_element_sets[metric.name] = linkable_sets_for_measure
+            self._metric_to_linkable_element_sets[metric_name] = linkable_sets_for_measure
+            return linkable_sets_for_measure
 
-        # If no metrics are specified, the query interface supports distinct dimension values from a single semantic
-        # model.
-        linkable_element_sets_to_merge: List[LinkableElementSet] = []
+    def _get_no_metric_linkable_element_set(self) -> LinkableElementSet:
+        """Return the elements that can be queried without metrics, computing them on first access."""
+        with self._lock:
+            if self._no_metric_linkable_element_set is not None:
+                return self._no_metric_linkable_element_set
 
-        for semantic_model in semantic_manifest.semantic_models:
-            linkable_element_sets_to_merge.append(self._get_elements_in_semantic_model(semantic_model))
+            # If no metrics are specified, the query interface supports distinct dimension values from a single
+            # semantic model.
+            linkable_element_sets_to_merge: List[LinkableElementSet] = []
 
-        metric_time_elements_for_no_metrics = self._get_metric_time_elements(measure_reference=None)
-        self._no_metric_linkable_element_set = LinkableElementSet.merge_by_path_key(
-            linkable_element_sets_to_merge + [metric_time_elements_for_no_metrics]
-        )
+            for semantic_model in self._semantic_manifest.semantic_models:
+                linkable_element_sets_to_merge.append(self._get_elements_in_semantic_model(semantic_model))
 
-        logger.info(f"Building valid group-by-item indexes took: {time.time() - start_time:.2f}s")
+            metric_time_elements_for_no_metrics = self._get_metric_time_elements(measure_reference=None)
+            self._no_metric_linkable_element_set = LinkableElementSet.merge_by_path_key(
+                linkable_element_sets_to_merge + [metric_time_elements_for_no_metrics]
+            )
+            return self._no_metric_linkable_element_set
 
     def _get_semantic_model_for_measure(self, measure_reference: MeasureReference) -> SemanticModel:  # noqa: D
         semantic_models_where_measure_was_found = []
@@ -613,22 +711,51 @@ class ValidLinkableSpecResolver:
             },
         )
 
-    def _get_semantic_models_with_joinable_entity(
-        self,
-        left_semantic_model_reference: SemanticModelReference,
-        entity_reference: EntityReference,
-    ) -> Sequence[SemanticModel]:
-        # May switch to non-cached implementation.
-        semantic_models = self._entity_to_semantic_model[entity_reference.element_name]
-        valid_semantic_models = []
-        for semantic_model in semantic_models:
-            if self._join_evaluator.is_valid_semantic_model_join(
-                left_semantic_model_reference=left_semantic_model_reference,
-                right_semantic_model_reference=semantic_model.reference,
-                on_entity_reference=entity_reference,
-            ):
-                valid_semantic_models.append(semantic_model)
-        return valid_semantic_models
+    def _get_join_graph_edges(
+        self, left_semantic_model_reference: SemanticModelReference
+    ) -> Sequence[Tuple[EntityReference, Sequence[SemanticModelReference]]]:
+        """Return the semantic models that can be joined to the given one, for each of its entities.
+
+        The edges of the join graph are computed once per semantic model, and shared by all join paths through it.
+        """
+        with self._lock:
+            edges = self._join_graph.get(left_semantic_model_reference)
+            if edges is not None:
+                return edges
+
+            left_semantic_model = self._semantic_model_lookup.get_by_reference(left_semantic_model_reference)
+            assert left_semantic_model
+            edges = tuple(
+                (
+                    entity.reference,
+                    tuple(
+                        semantic_model.reference
+                        for semantic_model in self._entity_to_semantic_model[entity.reference.element_name]
+                        if self._join_evaluator.is_valid_semantic_model_join(
+                            left_semantic_model_reference=left_semantic_model_reference,
+                            right_semantic_model_reference=semantic_model.reference,
+                            on_entity_reference=entity.reference,
+                        )
+                    ),
+                )
+                for entity in left_semantic_model.entities
+            )
+            self._join_graph[left_semantic_model_reference] = edges
+            return edges
+
+    def _get_linkable_element_set_for_join_path(
+        self, join_path: SemanticModelJoinPath, with_properties: FrozenSet[LinkableElementProperties]
+    ) -> LinkableElementSet:
+        """Return the elements for the join path, reusing the result for paths shared by multiple semantic models."""
+        with self._lock:
+            key = (join_path, with_properties)
+            linkable_element_set = self._join_path_to_linkable_element_set.get(key)
+            if linkable_element_set is None:
+                linkable_element_set = join_path.create_linkable_element_set(
+                    semantic_model_accessor=self._semantic_model_lookup, with_properties=with_properties
+                )
+                self._join_path_to_linkable_element_set[key] = linkable_element_set
+            return linkable_element_set
 
     @staticmethod
     def _get_time_granularity_for_dimension(
@@ -731,67 +858,84 @@ class ValidLinkableSpecResolver:
 
     def _get_joined_elements(self, measure_semantic_model: SemanticModel) -> LinkableElementSet:
         """Get the elements that can be generated by joining other models to the given model."""
-        # Create single-hop elements
-        join_paths = []
-        for entity in measure_semantic_model.entities:
-            semantic_models = self._get_semantic_models_with_joinable_entity(
-                left_semantic_model_reference=measure_semantic_model.reference,
-                entity_reference=entity.reference,
-            )
-            for semantic_model in semantic_models:
-                if semantic_model.name == measure_semantic_model.name:
-                    continue
-                join_paths.append(
-                    SemanticModelJoinPath(
-                        path_elements=(
-                            SemanticModelJoinPathElement(
-                                semantic_model_reference=semantic_model.reference,
-                                join_on_entity=entity.reference,
-                            ),
+        with self._lock:
+            joined_elements = self._semantic_model_to_joined_elements.get(measure_semantic_model.reference)
+            if joined_elements is not None:
+                return joined_elements
+
+            # Create single-hop elements
+            join_paths = []
+            for entity_reference, semantic_model_references in self._get_join_graph_edges(
+                measure_semantic_model.reference
+            ):
+                for semantic_model_reference in semantic_model_references:
+                    if semantic_model_reference == measure_semantic_model.reference:
+                        continue
+                    join_paths.append(
+                        SemanticModelJoinPath(
+                            path_elements=(
+                                SemanticModelJoinPathElement(
+                                    semantic_model_reference=semantic_model_reference,
+                                    join_on_entity=entity_reference,
+                                ),
+                            )
                         )
                     )
-                )
-        single_hop_elements = LinkableElementSet.merge_by_path_key(
-            [
-                join_path.create_linkable_element_set(
-                    semantic_model_accessor=self._semantic_model_lookup,
-                    with_properties=frozenset({LinkableElementProperties.JOINED}),
-                )
+            single_hop_properties = frozenset({LinkableElementProperties.JOINED})
+            linkable_element_sets = [
+                self._get_linkable_element_set_for_join_path(join_path, single_hop_properties)
                 for join_path in join_paths
             ]
-        )
 
-        # Create multi-hop elements. At each iteration, we generate the list of valid elements based on the current join
-        # path, extend all paths to include the next valid semantic model, then repeat.
-        multi_hop_elements = LinkableElementSet(path_key_to_linkable_dimensions={}, path_key_to_linkable_entities={})
-
-        for i in range(self._max_entity_links - 1):
-            new_join_paths: List[SemanticModelJoinPath] = []
-            for join_path in join_paths:
-                new_join_paths.extend(
-                    self._find_next_possible_paths(
-                        measure_semantic_model=measure_semantic_model, current_join_path=join_path
+            # Create multi-hop elements. At each iteration, we generate the list of valid elements based on the current
+            # join path, extend all paths to include the next valid semantic model, then repeat.
+            multi_hop_properties = frozenset({LinkableElementProperties.JOINED, LinkableElementProperties.MULTI_HOP})
+            for i in range(self._max_entity_links - 1):
+                new_join_paths: List[SemanticModelJoinPath] = []
+                for join_path in join_paths:
+                    new_join_paths.extend(
+                        self._find_next_possible_paths(
+                            measure_semantic_model=measure_semantic_model, current_join_path=join_path
+                        )
                     )
-                )
 
-            if len(new_join_paths) == 0:
-                break
+                if len(new_join_paths) == 0:
+                    break
 
-            multi_hop_elements = LinkableElementSet.merge_by_path_key(
-                (multi_hop_elements,)
-                + tuple(
-                    new_join_path.create_linkable_element_set(
-                        semantic_model_accessor=self._semantic_model_lookup,
-                        with_properties=frozenset(
-                            {LinkableElementProperties.JOINED, LinkableElementProperties.MULTI_HOP}
-                        ),
-                    )
+                linkable_element_sets.extend(
+                    self._get_linkable_element_set_for_join_path(new_join_path, multi_hop_properties)
                     for new_join_path in new_join_paths
                 )
-            )
-            join_paths = new_join_paths
+                join_paths = new_join_paths
+
+            joined_elements = LinkableElementSet.merge_by_path_key(linkable_element_sets)
+            self._semantic_model_to_joined_elements[measure_semantic_model.reference] = joined_elements
+            return joined_elements
+
+    def _get_unfiltered_linkable_element_set_for_measure(
+        self, measure_reference: MeasureReference
+    ) -> LinkableElementSet:
+        """Return all valid linkable elements for the measure, computing them on first access."""
+        with self._lock:
+            linkable_element_set = self._measure_to_linkable_element_set.get(measure_reference)
+            if linkable_element_set is not None:
+                return linkable_element_set
+
+            measure_semantic_model = self._get_semantic_model_for_measure(measure_reference)
+
+            elements_in_semantic_model = self._get_elements_in_semantic_model(measure_semantic_model)
+            metric_time_elements = self._get_metric_time_elements(measure_reference)
+            joined_elements = self._get_joined_elements(measure_semantic_model)
 
-        return LinkableElementSet.merge_by_path_key((single_hop_elements, multi_hop_elements))
+            linkable_element_set = LinkableElementSet.merge_by_path_key(
+                (
+                    elements_in_semantic_model,
+                    metric_time_elements,
+                    joined_elements,
+                )
+            )
+            self._measure_to_linkable_element_set[measure_reference] = linkable_element_set
+            return linkable_element_set
 
     def _get_linkable_element_set_for_measure(
         self,
@@ -800,19 +944,7 @@ class ValidLinkableSpecResolver:
         without_any_of: FrozenSet[LinkableElementProperties] = frozenset(),
     ) -> LinkableElementSet:
         """See get_linkable_element_set_for_measure()."""
-        measure_semantic_model = self._get_semantic_model_for_measure(measure_reference)
-
-        elements_in_semantic_model = self._get_elements_in_semantic_model(measure_semantic_model)
-        metric_time_elements = self._get_metric_time_elements(measure_reference)
-        joined_elements = self._get_joined_elements(measure_semantic_model)
-
-        return LinkableElementSet.merge_by_path_key(
-            (
-                elements_in_semantic_model,
-                metric_time_elements,
-                joined_elements,
-            )
-        ).filter(
+        return self._get_unfiltered_linkable_element_set_for_measure(measure_reference).filter(
             with_any_of=with_any_of,
             without_any_of=without_any_of,
         )
@@ -839,7 +971,7 @@ class ValidLinkableSpecResolver:
 
         A distinct group-by-item values query does not include any metrics.
         """
-        return self._no_metric_linkable_element_set.filter(with_any_of=with_any_of, without_any_of=without_any_of)
+        return self._get_no_metric_linkable_element_set().filter(with_any_of=with_any_of, without_any_of=without_any_of)
 
     def get_linkable_elements_for_metrics(
         self,
@@ -850,7 +982,7 @@ class ValidLinkableSpecResolver:
         """Gets the valid linkable elements that are common to all requested metrics."""
         linkable_element_sets = []
         for metric_reference in metric_references:
-            element_sets = self._metric_to_linkable_element_sets.get(metric_reference.element_name)
+            element_sets = self._get_linkable_element_sets_for_metric(metric_reference.element_name)
             if not element_sets:
                 raise UnknownMetricLinkingError(f"Unknown metric: {metric_reference} in element set")
 
@@ -871,38 +1003,30 @@ class ValidLinkableSpecResolver:
         self, measure_semantic_model: SemanticModel, current_join_path: SemanticModelJoinPath
     ) -> Sequence[SemanticModelJoinPath]:
         """Generate the set of possible paths that are 1 semantic model join longer that the "current_join_path"."""
-        last_semantic_model_in_path = self._semantic_model_lookup.get_by_reference(
-            current_join_path.last_semantic_model_reference
+        entities_in_path = set(path_element.join_on_entity for path_element in current_join_path.path_elements)
+        semantic_models_in_path = set(
+            path_element.semantic_model_reference for path_element in current_join_path.path_elements
         )
-        assert last_semantic_model_in_path
+        semantic_models_in_path.add(measure_semantic_model.reference)
         new_join_paths = []
 
-        for entity in last_semantic_model_in_path.entities:
-            entity_reference = entity.reference
-
+        for entity_reference, semantic_model_references in self._get_join_graph_edges(
+            current_join_path.last_semantic_model_reference
+        ):
             # Don't create cycles in the join path by joining on the same entity.
-            if entity_reference in set(x.join_on_entity for x in current_join_path.path_elements):
+            if entity_reference in entities_in_path:
                 continue
 
-            semantic_models_that_can_be_joined = self._get_semantic_models_with_joinable_entity(
-                left_semantic_model_reference=last_semantic_model_in_path.reference,
-                entity_reference=entity.reference,
-            )
-            for semantic_model in semantic_models_that_can_be_joined:
+            for semantic_model_reference in semantic_model_references:
                 # Don't create cycles in the join path by repeating a semantic model in the path.
-                if semantic_model.name == measure_semantic_model.name or any(
-                    tuple(
-                        path_element.semantic_model_reference == semantic_model.reference
-                        for path_element in current_join_path.path_elements
-                    )
-                ):
+                if semantic_model_reference in semantic_models_in_path:
                     continue
 
                 new_join_path = SemanticModelJoinPath(
                     path_elements=current_join_path.path_elements
                     + (
                         SemanticModelJoinPathElement(
-                            semantic_model_reference=semantic_model.reference, join_on_entity=entity_reference
+                            semantic_model_reference=semantic_model_reference, join_on_entity=entity_reference
                         ),
                     )
                 )
@@ -25,7 +25,10 @@ logger = logging.getLogger(__name__)
 
 class MetricLookup(MetricAccessor):  # noqa: D
     def __init__(  # noqa: D
-        self, semantic_manifest: SemanticManifest, semantic_model_lookup: SemanticModelLookup
+        self,
+        semantic_manifest: SemanticManifest,
+        semantic_model_lookup: SemanticModelLookup,
+        warm_up_linkable_elements_in_background: bool = False,
     ) -> None:
         self._semantic_manifest = semantic_manifest
         self._metrics: Dict[MetricReference, Metric] = {}
@@ -38,8 +41,13 @@ class MetricLookup(MetricAccessor):  # noqa: D
             semantic_manifest=self._semantic_manifest,
             semantic_model_lookup=semantic_model_lookup,
             max_entity_links=MAX_JOIN_HOPS,
+            warm_up_in_background=warm_up_linkable_elements_in_background,
         )
 
+    @property
+    def linkable_spec_resolver(self) -> ValidLinkableSpecResolver:  # noqa: D
+        return self._linkable_spec_resolver
+
     def element_specs_for_metrics(
         self,
         metric_references: Sequence[MetricReference],
@@ -1,35 +1,46 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional, Union
+from typing import FrozenSet, List, Optional, Set, Union
 
 from metricflow.dag.id_generation import EXEC_PLAN_PREFIX, SQL_QUERY_PLAN_PREFIX, IdGeneratorRegistry
 from metricflow.dataflow.dataflow_plan import (
     BaseOutput,
     ComputedMetricsOutput,
     DataflowPlan,
+    DataflowPlanNode,
+    ReadSqlSourceNode,
     SinkNodeVisitor,
     WriteToResultDataframeNode,
     WriteToResultTableNode,
 )
 from metricflow.dataflow.sql_table import SqlTable
+from metricflow.dataset.semantic_model_adapter import SemanticModelDataSet
 from metricflow.execution.execution_plan import (
     ExecutionPlan,
     ExecutionPlanTask,
+    IncrementalTableWrite,
+    ResultFormat,
     SelectSqlQueryToDataFrameTask,
     SelectSqlQueryToTableTask,
 )
+from metricflow.execution.result_cache import ResultCache
 from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
 from metricflow.protocols.sql_client import SqlClient
 from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
-from metricflow.sql.sql_plan import SqlQueryPlan
+from metricflow.sql.sql_parameterization import canonicalize_generated_bind_parameter_keys
+from metricflow.sql.sql_plan import SqlQueryPlan, SqlSelectStatementNode
 from metricflow.sql_request.sql_request_attributes import SqlJsonTag
 
 logger = logging.getLogger(__name__)
 
 
-class DataflowToExecutionPlanConverter(SinkNodeVisitor[ExecutionPlan]):
-    """Converts a dataflow plan to an execution plan."""
+class DataflowToExecutionPlanConverter:
+    """Converts a dataflow plan to an execution plan.
+
+    Each sink node in the dataflow plan is converted into a separate leaf task in the execution plan. Since the tasks
+    don't depend on each other, they can be run concurrently by the executor.
+    """
 
     def __init__(
         self,
@@ -37,6 +48,7 @@ class DataflowToExecutionPlanConverter(SinkNodeVisitor[ExecutionPlan]):
         sql_plan_renderer: SqlQueryPlanRenderer,
         sql_client: SqlClient,
         extra_sql_tags: SqlJsonTag = SqlJsonTag(),
+        result_cache: Optional[ResultCache] = None,
     ) -> None:
         """Constructor.
 
@@ -45,17 +57,24 @@ class DataflowToExecutionPlanConverter(SinkNodeVisitor[ExecutionPlan]):
             sql_plan_renderer: Converts a SQL query plan to SQL text
             sql_client: The client to use for running queries.
             extra_sql_tags: Tags to supply to the SQL client when running statements.
+            result_cache: If specified, tasks that write to a dataframe use this to cache results.
         """
         self._sql_plan_converter = sql_plan_converter
         self._sql_plan_renderer = sql_plan_renderer
         self._sql_client = sql_client
+        self._result_cache = result_cache
         self._sql_tags = extra_sql_tags
 
-    def _build_execution_plan(  # noqa: D
+    def build_leaf_task(
         self,
         node: Union[BaseOutput, ComputedMetricsOutput],
         output_table: Optional[SqlTable] = None,
-    ) -> ExecutionPlan:
+        result_batch_size: Optional[int] = None,
+        result_format: ResultFormat = ResultFormat.PANDAS,
+        result_cache_ttl_seconds: Optional[float] = None,
+        incremental_write: Optional[IncrementalTableWrite] = None,
+    ) -> ExecutionPlanTask:
+        """Build the task that runs the query for the given node and writes the result to a dataframe or a table."""
         sql_plan = self._sql_plan_converter.convert_to_sql_query_plan(
             sql_engine_type=self._sql_client.sql_engine_type,
             sql_query_plan_id=IdGeneratorRegistry.for_class(SqlQueryPlan).create_id(SQL_QUERY_PLAN_PREFIX),
@@ -65,38 +84,121 @@ class DataflowToExecutionPlanConverter(SinkNodeVisitor[ExecutionPlan]):
         logger.debug(f"Generated SQL query plan is:\n{sql_plan.text_structure()}")
 
         render_result = self._sql_plan_renderer.render_sql_query_plan(sql_plan)
-
-        leaf_task: ExecutionPlanTask
+        sql, bind_parameters = canonicalize_generated_bind_parameter_keys(
+            render_result.sql,
+            render_result.bind_parameters,
+            self._sql_client.render_bind_parameter_key,
+            backslash_escapes=self._sql_client.sql_engine_type.uses_backslash_escapes,
+        )
 
         if not output_table:
-            leaf_task = SelectSqlQueryToDataFrameTask(
+            return SelectSqlQueryToDataFrameTask(
                 sql_client=self._sql_client,
-                sql_query=render_result.sql,
-                bind_parameters=render_result.bind_parameters,
+                sql_query=sql,
+                bind_parameters=bind_parameters,
                 extra_sql_tags=self._sql_tags,
+                batch_size=result_batch_size,
+                result_format=result_format,
+                result_cache=self._result_cache,
+                semantic_model_names=DataflowToExecutionPlanConverter._semantic_model_names_read_by(node),
+                result_cache_ttl_seconds=result_cache_ttl_seconds,
             )
         else:
-            leaf_task = SelectSqlQueryToTableTask(
+            render_node = sql_plan.render_node
+            return SelectSqlQueryToTableTask(
                 sql_client=self._sql_client,
-                sql_query=render_result.sql,
-                bind_parameters=render_result.bind_parameters,
+                sql_query=sql,
+                bind_parameters=bind_parameters,
                 output_table=output_table,
                 extra_sql_tags=self._sql_tags,
+                incremental_write=incremental_write,
+                column_names=(
+                    tuple(select_column.column_alias for select_column in render_node.select_columns)
+                    if isinstance(render_node, SqlSelectStatementNode)
+                    else None
+                ),
             )
 
+    @staticmethod
+    def _semantic_model_names_read_by(node: DataflowPlanNode) -> FrozenSet[str]:
+        """Return the names of the semantic models that are read by the given node or its parents."""
+        semantic_model_names: Set[str] = set()
+        visited_node_ids = set()
+        nodes_to_visit = [node]
+        while nodes_to_visit:
+            current_node = nodes_to_visit.pop()
+            if current_node.node_id in visited_node_ids:
+                continue
+            visited_node_ids.add(current_node.node_id)
+            if isinstance(current_node, ReadSqlSourceNode) and isinstance(current_node.data_set, SemanticModelDataSet):
+                semantic_model_names.add(current_node.data_set.semantic_model_reference.semantic_model_name)
+            nodes_to_visit.extend(current_node.parent_nodes)
+        return frozenset(semantic_model_names)
+
+    def convert_to_execution_plan(
+        self,
+        dataflow_plan: DataflowPlan,
+        result_batch_size: Optional[int] = None,
+        result_format: ResultFormat = ResultFormat.PANDAS,
+        result_cache_ttl_seconds: Optional[float] = None,
+        incremental_write: Optional[IncrementalTableWrite] = None,
+    ) -> ExecutionPlan:
+        """Convert the dataflow plan to an execution plan.
+
+        The leaf tasks in the execution plan are in the same order as the sink nodes in the dataflow plan.
+
+        Args:
+            dataflow_plan: The plan to convert.
+            result_batch_size: If specified, tasks that write to a dataframe will instead return an iterator of
+            dataframes with up to this many rows each.
+            result_format: The format of the result of tasks that write to a dataframe.
+            result_cache_ttl_seconds: If specified, overrides the default TTL of results stored in the result cache.
+            incremental_write: If specified, tasks that write to a table only replace the rows in this time range
+            instead of replacing the table.
+        """
+        sink_node_converter = _SinkNodeToTaskConverter(
+            parent_converter=self,
+            result_batch_size=result_batch_size,
+            result_format=result_format,
+            result_cache_ttl_seconds=result_cache_ttl_seconds,
+            incremental_write=incremental_write,
+        )
+        leaf_tasks: List[ExecutionPlanTask] = [
+            sink_node.accept_sink_node_visitor(sink_node_converter) for sink_node in dataflow_plan.sink_output_nodes
+        ]
         return ExecutionPlan(
-            plan_id=IdGeneratorRegistry.for_class(self.__class__).create_id(EXEC_PLAN_PREFIX), leaf_tasks=[leaf_task]
+            plan_id=IdGeneratorRegistry.for_class(self.__class__).create_id(EXEC_PLAN_PREFIX), leaf_tasks=leaf_tasks
         )
 
-    def visit_write_to_result_dataframe_node(self, node: WriteToResultDataframeNode) -> ExecutionPlan:  # noqa: D
-        logger.info(f"Generating SQL query plan from {node.node_id} -> {node.parent_node.node_id}")
-        return self._build_execution_plan(node.parent_node)
 
-    def visit_write_to_result_table_node(self, node: WriteToResultTableNode) -> ExecutionPlan:  # noqa: D
+class _SinkNodeToTaskConverter(SinkNodeVisitor[ExecutionPlanTask]):
+    """Converts a sink node to a leaf task. Created for each conversion to hold the options for that plan."""
+
+    def __init__(  # noqa: D
+        self,
+        parent_converter: DataflowToExecutionPlanConverter,
+        result_batch_size: Optional[int],
+        result_format: ResultFormat,
+        result_cache_ttl_seconds: Optional[float],
+        incremental_write: Optional[IncrementalTableWrite],
+    ) -> None:
+        self._parent_converter = parent_converter
+        self._result_batch_size = result_batch_size
+        self._result_format = result_format
+        self._result_cache_ttl_seconds = result_cache_ttl_seconds
+        self._incremental_write = incremental_write
+
+    def visit_write_to_result_dataframe_node(self, node: WriteToResultDataframeNode) -> ExecutionPlanTask:  # noqa: D
         logger.info(f"Generating SQL query plan from {node.node_id} -> {node.parent_node.node_id}")
-        return self._build_execution_plan(node.parent_node, node.output_sql_table)
+        return self._parent_converter.build_leaf_task(
+            node.parent_node,
+            result_batch_size=self._result_batch_size,
+            result_format=self._result_format,
+            result_cache_ttl_seconds=self._result_cache_ttl_seconds,
+        )
 
-    def convert_to_execution_plan(self, dataflow_plan: DataflowPlan) -> ExecutionPlan:
-        """Convert the dataflow plan to an execution plan."""
-        assert len(dataflow_plan.sink_output_nodes) == 1, "Only 1 sink node in the plan is currently supported."
-        return dataflow_plan.sink_output_nodes[0].accept_sink_node_visitor(self)
+    def visit_write_to_result_table_node(self, node: WriteToResultTableNode) -> ExecutionPlanTask:  # noqa: D
+        logger.info(f"Generating SQL query plan from {node.node_id} -> {node.parent_node.node_id}")
+        return self._parent_converter.build_leaf_task(
+            node.parent_node, output_table=node.output_sql_table, incremental_write=self._incremental_write
+        )
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import logging
-from collections import OrderedDict
-from typing import List, Optional, Sequence, Tuple, Union
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.protocols.metric import MetricInputMeasure, MetricType
 from dbt_semantic_interfaces.references import MetricModelReference
 from dbt_semantic_interfaces.type_enums.aggregation_type import AggregationType
 from dbt_semantic_interfaces.type_enums.conversion_calculation_type import ConversionCalculationType
+from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
 from dbt_semantic_interfaces.validations.unique_valid_name import MetricFlowReservedKeywords
 
 from metricflow.aggregation_properties import AggregationState
-from metricflow.dag.id_generation import IdGeneratorRegistry
+from metricflow.dag.id_generation import SQL_PLAN_COMMON_TABLE_EXPRESSION_PREFIX, IdGeneratorRegistry
 from metricflow.dataflow.dataflow_plan import (
     AddGeneratedUuidColumnNode,
     AggregateMeasuresNode,
@@ -21,6 +23,7 @@ from metricflow.dataflow.dataflow_plan import (
     ComputedMetricsOutput,
     ComputeMetricsNode,
     ConstrainTimeRangeNode,
+    DataflowPlanNode,
     DataflowPlanNodeVisitor,
     FilterElementsNode,
     JoinConversionEventsNode,
@@ -33,13 +36,21 @@ from metricflow.dataflow.dataflow_plan import (
     ReadSqlSourceNode,
     SemiAdditiveJoinNode,
     WhereConstraintNode,
+    WindowOverTimeRangeNode,
     WriteToResultDataframeNode,
     WriteToResultTableNode,
 )
 from metricflow.dataset.dataset import DataSet
 from metricflow.dataset.sql_dataset import SqlDataSet
 from metricflow.filters.time_constraint import TimeRangeConstraint
-from metricflow.instances import InstanceSet, MetadataInstance, MetricInstance, TimeDimensionInstance
+from metricflow.instances import (
+    DimensionInstance,
+    EntityInstance,
+    InstanceSet,
+    MetadataInstance,
+    MetricInstance,
+    TimeDimensionInstance,
+)
 from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
 from metricflow.plan_conversion.instance_converters import (
     AddLinkToLinkableElements,
@@ -77,6 +88,7 @@ from metricflow.plan_conversion.time_spine import TIME_SPINE_DATA_SET_DESCRIPTIO
 from metricflow.protocols.sql_client import SqlEngine
 from metricflow.specs.column_assoc import ColumnAssociation, ColumnAssociationResolver, SingleColumnCorrelationKey
 from metricflow.specs.specs import (
+    InstanceSpec,
     InstanceSpecSet,
     MeasureSpec,
     MetadataSpec,
@@ -87,6 +99,7 @@ from metricflow.sql.optimizer.optimization_levels import (
     SqlQueryOptimizationLevel,
     SqlQueryOptimizerConfiguration,
 )
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.sql.sql_exprs import (
     SqlAggregateFunctionExpression,
     SqlBetweenExpression,
@@ -100,16 +113,26 @@ from metricflow.sql.sql_exprs import (
     SqlFunction,
     SqlFunctionExpression,
     SqlGenerateUuidExpression,
+    SqlIsNullExpression,
     SqlLogicalExpression,
     SqlLogicalOperator,
     SqlRatioComputationExpression,
     SqlStringExpression,
     SqlStringLiteralExpression,
+    SqlWindowFrame,
     SqlWindowFunction,
     SqlWindowFunctionExpression,
     SqlWindowOrderByArgument,
 )
+from metricflow.sql.sql_parameterization import (
+    GENERATED_BIND_PARAMETER_KEY_PREFIX,
+    TIME_RANGE_END_BIND_PARAMETER_KEY_PREFIX,
+    TIME_RANGE_START_BIND_PARAMETER_KEY_PREFIX,
+    time_range_bind_parameter_value,
+)
 from metricflow.sql.sql_plan import (
+    SqlCommonTableExpression,
+    SqlCteFromClauseNode,
     SqlJoinDescription,
     SqlJoinType,
     SqlOrderByDescription,
@@ -119,32 +142,10 @@ from metricflow.sql.sql_plan import (
     SqlSelectStatementNode,
     SqlTableFromClauseNode,
 )
-from metricflow.time.time_constants import ISO8601_PYTHON_FORMAT
 
 logger = logging.getLogger(__name__)
 
 
-def _make_time_range_comparison_expr(
-    table_alias: str, column_alias: str, time_range_constraint: TimeRangeConstraint
-) -> SqlExpressionNode:
-    """Build an expression like "ds BETWEEN CAST('2020-01-01' AS TIMESTAMP) AND CAST('2020-01-02' AS TIMESTAMP)."""
-    # TODO: Update when adding < day granularity support.
-    return SqlBetweenExpression(
-        column_arg=SqlColumnReferenceExpression(
-            SqlColumnReference(
-                table_alias=table_alias,
-                column_name=column_alias,
-            )
-        ),
-        start_expr=SqlStringLiteralExpression(
-            literal_value=time_range_constraint.start_time.strftime(ISO8601_PYTHON_FORMAT),
-        ),
-        end_expr=SqlStringLiteralExpression(
-            literal_value=time_range_constraint.end_time.strftime(ISO8601_PYTHON_FORMAT),
-        ),
-    )
-
-
 class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
     """Generates an SQL query plan from a node in the a metric dataflow plan."""
 
@@ -152,6 +153,8 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         self,
         column_association_resolver: ColumnAssociationResolver,
         semantic_manifest_lookup: SemanticManifestLookup,
+        bind_parameter_key_renderer: Optional[Callable[[str], str]] = None,
+        use_window_functions_for_semi_additive_joins: bool = False,
     ) -> None:
         """Constructor.
 
@@ -159,20 +162,150 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
             column_association_resolver: controls how columns for instances are generated and used between nested
             queries.
             semantic_manifest_lookup: Self-explanatory.
+            bind_parameter_key_renderer: If specified, the bounds of time range constraints are passed as bind parameters
+            instead of being rendered into the SQL. This function renders the placeholder for the bind parameter with the
+            given key e.g. SqlClient.render_bind_parameter_key().
+            use_window_functions_for_semi_additive_joins: If set, the rows for semi-additive measures are filtered with
+            a window function in a QUALIFY clause, instead of by joining to a sub-query that aggregates the non-additive
+            dimension. This avoids reading the input twice. For engines without QUALIFY, the renderer uses a sub-query.
         """
         self._column_association_resolver = column_association_resolver
+        self._bind_parameter_key_renderer = bind_parameter_key_renderer
+        self._use_window_functions_for_semi_additive_joins = use_window_functions_for_semi_additive_joins
         self._metric_lookup = semantic_manifest_lookup.metric_lookup
         self._semantic_model_lookup = semantic_manifest_lookup.semantic_model_lookup
         self._time_spine_source = semantic_manifest_lookup.time_spine_source
+        # Tracks the CTEs for the plan that's being converted. This is thread-local as the same converter can be used
+        # to convert plans concurrently.
+        self._cte_conversion_state = threading.local()
 
     @property
     def column_association_resolver(self) -> ColumnAssociationResolver:  # noqa: D
         return self._column_association_resolver
 
+    def _get_parent_data_set(self, parent_node: DataflowPlanNode) -> SqlDataSet:
+        """Return the data set output by the parent of the node that's being converted.
+
+        If the parent is an aggregation that's shared with other nodes, the query for it is converted once into a CTE,
+        and the returned data set reads from that CTE.
+        """
+        nodes_to_convert_to_ctes: Optional[Set[DataflowPlanNode]] = getattr(
+            self._cte_conversion_state, "nodes_to_convert_to_ctes", None
+        )
+        if nodes_to_convert_to_ctes is None or parent_node not in nodes_to_convert_to_ctes:
+            return parent_node.accept(self)
+        return self._read_from_cte(parent_node)
+
+    def _read_from_cte(self, parent_node: DataflowPlanNode, data_set: Optional[SqlDataSet] = None) -> SqlDataSet:
+        """Return a data set that reads the output of the node from a CTE, adding the CTE to the query if needed.
+
+        If data_set is specified, it's the output of the node that was already converted, and it's used for the CTE.
+        This should only be called when converting a plan with convert_to_sql_query_plan().
+        """
+        node_to_cte: Dict[DataflowPlanNode, Tuple[str, InstanceSet]] = self._cte_conversion_state.node_to_cte
+        if parent_node not in node_to_cte:
+            cte_data_set = data_set or parent_node.accept(self)
+            cte_name = IdGeneratorRegistry.for_class(self.__class__).create_id(
+                prefix=SQL_PLAN_COMMON_TABLE_EXPRESSION_PREFIX
+            )
+            # The parents of the node are converted first, so the CTEs that this one reads from are already listed.
+            self._cte_conversion_state.common_table_expressions.append(
+                SqlCommonTableExpression(name=cte_name, select_node=cte_data_set.sql_select_node)
+            )
+            node_to_cte[parent_node] = (cte_name, cte_data_set.instance_set)
+
+        cte_name, cte_instance_set = node_to_cte[parent_node]
+        from_cte_alias = self._next_unique_table_alias()
+        return SqlDataSet(
+            instance_set=cte_instance_set,
+            sql_select_node=SqlSelectStatementNode(
+                description=f"Read From {cte_name}",
+                select_columns=cte_instance_set.transform(
+                    CreateSelectColumnsForInstances(from_cte_alias, self._column_association_resolver)
+                ).as_tuple(),
+                from_source=SqlCteFromClauseNode(cte_name=cte_name),
+                from_source_alias=from_cte_alias,
+                joins_descs=(),
+                group_bys=(),
+                order_bys=(),
+            ),
+        )
+
+    @property
+    def _converting_to_sql_query_plan(self) -> bool:
+        """Returns true if a plan is being converted with convert_to_sql_query_plan(), so CTEs can be added to it."""
+        return hasattr(self._cte_conversion_state, "node_to_cte")
+
+    @staticmethod
+    def _find_nodes_to_convert_to_ctes(dataflow_plan_node: DataflowPlanNode) -> Set[DataflowPlanNode]:
+        """Return the aggregation nodes that are read by more than one node in the DAG of the given node.
+
+        Those nodes are only shared after an optimizer like CommonSubplanEliminator has merged identical branches.
+        """
+        consumer_counts: Dict[DataflowPlanNode, int] = defaultdict(int)
+        visited_nodes: Set[DataflowPlanNode] = set()
+        nodes_to_visit: List[DataflowPlanNode] = [dataflow_plan_node]
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            if node in visited_nodes:
+                continue
+            visited_nodes.add(node)
+            for parent_node in node.parent_nodes:
+                consumer_counts[parent_node] += 1
+                nodes_to_visit.append(parent_node)
+
+        return {
+            node
+            for node, consumer_count in consumer_counts.items()
+            if consumer_count > 1 and isinstance(node, (AggregateMeasuresNode, ComputeMetricsNode))
+        }
+
     def _next_unique_table_alias(self) -> str:
         """Return the next unique table alias to use in generating queries."""
         return IdGeneratorRegistry.for_class(self.__class__).create_id(prefix="subq")
 
+    @staticmethod
+    def _next_bind_parameter_key(prefix: str = GENERATED_BIND_PARAMETER_KEY_PREFIX) -> str:
+        """Return the next unique key for a bind parameter that was generated from a literal."""
+        return IdGeneratorRegistry.for_class(SqlBindParameters).create_id(prefix=prefix)
+
+    def _make_string_literal_expr(
+        self, literal_value: str, bind_parameter_key_prefix: str = GENERATED_BIND_PARAMETER_KEY_PREFIX
+    ) -> SqlExpressionNode:
+        """Build an expression for a string literal, which is a bind parameter if literals are being parameterized."""
+        if self._bind_parameter_key_renderer is None:
+            return SqlStringLiteralExpression(literal_value=literal_value)
+
+        key = DataflowToSqlQueryPlanConverter._next_bind_parameter_key(bind_parameter_key_prefix)
+        return SqlStringExpression(
+            sql_expr=self._bind_parameter_key_renderer(key),
+            bind_parameters=SqlBindParameters.create_from_dict({key: literal_value}),
+            requires_parenthesis=False,
+            used_columns=(),
+        )
+
+    def _make_time_range_comparison_expr(
+        self, table_alias: str, column_alias: str, time_range_constraint: TimeRangeConstraint
+    ) -> SqlExpressionNode:
+        """Build an expression like "ds BETWEEN CAST('2020-01-01' AS TIMESTAMP) AND CAST('2020-01-02' AS TIMESTAMP)."""
+        # TODO: Update when adding < day granularity support.
+        return SqlBetweenExpression(
+            column_arg=SqlColumnReferenceExpression(
+                SqlColumnReference(
+                    table_alias=table_alias,
+                    column_name=column_alias,
+                )
+            ),
+            start_expr=self._make_string_literal_expr(
+                literal_value=time_range_bind_parameter_value(time_range_constraint.start_time),
+                bind_parameter_key_prefix=TIME_RANGE_START_BIND_PARAMETER_KEY_PREFIX,
+            ),
+            end_expr=self._make_string_literal_expr(
+                literal_value=time_range_bind_parameter_value(time_range_constraint.end_time),
+                bind_parameter_key_prefix=TIME_RANGE_END_BIND_PARAMETER_KEY_PREFIX,
+            ),
+        )
+
     def _make_time_spine_data_set(
         self,
         metric_time_dimension_instance: TimeDimensionInstance,
@@ -221,7 +354,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
                     from_source_alias=time_spine_table_alias,
                     joins_descs=(),
                     group_bys=(),
-                    where=_make_time_range_comparison_expr(
+                    where=self._make_time_range_comparison_expr(
                         table_alias=time_spine_table_alias,
                         column_alias=time_spine_source.time_column_name,
                         time_range_constraint=time_range_constraint,
@@ -256,7 +389,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
                     from_source_alias=time_spine_table_alias,
                     joins_descs=(),
                     group_bys=select_columns,
-                    where=_make_time_range_comparison_expr(
+                    where=self._make_time_range_comparison_expr(
                         table_alias=time_spine_table_alias,
                         column_alias=time_spine_source.time_column_name,
                         time_range_constraint=time_range_constraint,
@@ -278,7 +411,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         """Generate time range join SQL."""
         table_alias_to_instance_set: OrderedDict[str, InstanceSet] = OrderedDict()
 
-        input_data_set = node.parent_node.accept(self)
+        input_data_set = self._get_parent_data_set(node.parent_node)
         input_data_set_alias = self._next_unique_table_alias()
 
         metric_time_dimension_spec: Optional[TimeDimensionSpec] = None
@@ -369,6 +502,290 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
             ),
         )
 
+    def visit_window_over_time_range_node(self, node: WindowOverTimeRangeNode) -> SqlDataSet:
+        """Generate SQL that sums the aggregated measures over the window using window functions.
+
+        The time spine is joined to the aggregated measures so that there's a row for every day, and the window is then
+        a fixed number of rows. e.g. for a 7-day window:
+
+            SELECT
+              metric_time__day
+              , SUM(bookings) OVER (ORDER BY metric_time__day ROWS BETWEEN 6 PRECEDING AND CURRENT ROW) AS bookings
+            FROM time_spine LEFT OUTER JOIN aggregated_measures ON ...
+
+        If the measures are also grouped by other items, there's a row for every day and group instead, starting from the
+        first day of the group, and the window is partitioned by the group:
+
+            SELECT
+              metric_time__day
+              , country
+              , SUM(bookings) OVER (
+                PARTITION BY country ORDER BY metric_time__day ROWS BETWEEN 6 PRECEDING AND CURRENT ROW
+              ) AS bookings
+            FROM time_spine
+            INNER JOIN (
+              SELECT country, MIN(metric_time__day) AS metric_time__day__first_day FROM aggregated_measures GROUP BY country
+            ) groups ON time_spine.metric_time__day >= groups.metric_time__day__first_day
+            LEFT OUTER JOIN aggregated_measures ON ...
+
+        In that case, the aggregated measures are read twice, so they're computed once in a CTE. Days without any input
+        rows in the window are then removed, so the result matches JoinOverTimeRangeNode.
+        """
+        input_data_set = self._get_parent_data_set(node.parent_node)
+
+        metric_time_dimension_instances = input_data_set.metric_time_dimension_instances
+        assert (
+            len(metric_time_dimension_instances) == 1
+            and metric_time_dimension_instances[0].spec.time_granularity is TimeGranularity.DAY
+            and metric_time_dimension_instances[0].spec.date_part is None
+        ), f"Expected a single metric_time dimension at a daily granularity. Got: {metric_time_dimension_instances}"
+        metric_time_dimension_instance = metric_time_dimension_instances[0]
+        metric_time_column_name = self.column_association_resolver.resolve_spec(
+            metric_time_dimension_instance.spec
+        ).column_name
+        input_metric_time_column_name = input_data_set.column_association_for_time_dimension(
+            metric_time_dimension_instance.spec
+        ).column_name
+        # The columns for the other group-by items in the input, and the names of the columns in the output.
+        group_instances: Tuple[Union[DimensionInstance, TimeDimensionInstance, EntityInstance], ...] = (
+            tuple(input_data_set.instance_set.dimension_instances)
+            + tuple(
+                instance
+                for instance in input_data_set.instance_set.time_dimension_instances
+                if instance.spec != metric_time_dimension_instance.spec
+            )
+            + tuple(input_data_set.instance_set.entity_instances)
+        )
+        group_column_names = tuple(instance.associated_column.column_name for instance in group_instances)
+        group_output_column_names = tuple(
+            self._column_association_resolver.resolve_spec(instance.spec).column_name for instance in group_instances
+        )
+
+        time_spine_data_set = self._make_time_spine_data_set(
+            metric_time_dimension_instance=metric_time_dimension_instance,
+            metric_time_dimension_column_name=metric_time_column_name,
+            time_spine_source=self._time_spine_source,
+            time_range_constraint=node.time_range_constraint,
+        )
+        time_spine_data_set_alias = self._next_unique_table_alias()
+        time_spine_column_expr = SqlColumnReferenceExpression(
+            SqlColumnReference(table_alias=time_spine_data_set_alias, column_name=metric_time_column_name)
+        )
+
+        join_descs: List[SqlJoinDescription] = []
+        groups_data_set_alias: Optional[str] = None
+        if len(group_column_names) > 0:
+            # The groups and the measures for each day are read from the same aggregation.
+            if self._converting_to_sql_query_plan:
+                groups_input_data_set = self._read_from_cte(node.parent_node, input_data_set)
+                input_data_set = self._read_from_cte(node.parent_node)
+            else:
+                groups_input_data_set = node.parent_node.accept(self)
+            groups_data_set_alias = self._next_unique_table_alias()
+            join_descs.append(
+                self._make_window_groups_join_description(
+                    groups_input_data_set=groups_input_data_set,
+                    groups_data_set_alias=groups_data_set_alias,
+                    group_column_names=group_column_names,
+                    metric_time_column_name=input_metric_time_column_name,
+                    time_spine_column_expr=time_spine_column_expr,
+                )
+            )
+
+        input_data_set_alias = self._next_unique_table_alias()
+        input_metric_time_column_expr = SqlColumnReferenceExpression(
+            SqlColumnReference(table_alias=input_data_set_alias, column_name=input_metric_time_column_name)
+        )
+        metric_time_equality_expr = SqlComparisonExpression(
+            left_expr=time_spine_column_expr,
+            comparison=SqlComparison.EQUALS,
+            right_expr=input_metric_time_column_expr,
+        )
+        if groups_data_set_alias is not None:
+            join_descs.append(
+                SqlQueryPlanJoinBuilder.make_column_equality_sql_join_description(
+                    right_source_node=input_data_set.sql_select_node,
+                    left_source_alias=groups_data_set_alias,
+                    right_source_alias=input_data_set_alias,
+                    column_equality_descriptions=tuple(
+                        ColumnEqualityDescription(
+                            left_column_alias=column_name, right_column_alias=column_name, treat_nulls_as_equal=True
+                        )
+                        for column_name in group_column_names
+                    ),
+                    join_type=SqlJoinType.LEFT_OUTER,
+                    additional_on_conditions=(metric_time_equality_expr,),
+                )
+            )
+        else:
+            join_descs.append(
+                SqlJoinDescription(
+                    right_source=input_data_set.sql_select_node,
+                    right_source_alias=input_data_set_alias,
+                    join_type=SqlJoinType.LEFT_OUTER,
+                    on_condition=metric_time_equality_expr,
+                )
+            )
+
+        # Partition by the group, and by the start of the grain for grain-to-date metrics. The window is then a number
+        # of rows, as there's a row for every day.
+        partition_by_args: List[SqlExpressionNode] = [
+            SqlColumnReferenceExpression(SqlColumnReference(table_alias=groups_data_set_alias, column_name=column_name))
+            for column_name in group_column_names
+            if groups_data_set_alias is not None
+        ]
+        if node.grain_to_date is not None:
+            partition_by_args.append(
+                SqlDateTruncExpression(time_granularity=node.grain_to_date, arg=time_spine_column_expr)
+            )
+        window_day_count = node.window_day_count
+        frame = SqlWindowFrame(
+            preceding_rows=window_day_count - 1 if window_day_count is not None else None, following_rows=0
+        )
+
+        def _window_function_expr(
+            sql_function: SqlWindowFunction, arg: SqlExpressionNode
+        ) -> SqlWindowFunctionExpression:
+            return SqlWindowFunctionExpression(
+                sql_function=sql_function,
+                sql_function_args=[arg],
+                partition_by_args=partition_by_args,
+                order_by_args=[SqlWindowOrderByArgument(expr=time_spine_column_expr)],
+                frame=frame,
+            )
+
+        # The number of input rows in the window, so that days without any can be removed.
+        row_count_column_name = f"{metric_time_column_name}__row_count"
+        window_select_columns = (
+            (SqlSelectColumn(expr=time_spine_column_expr, column_alias=metric_time_column_name),)
+            + tuple(
+                SqlSelectColumn(
+                    expr=SqlColumnReferenceExpression(
+                        SqlColumnReference(table_alias=groups_data_set_alias, column_name=column_name)
+                    ),
+                    column_alias=output_column_name,
+                )
+                for column_name, output_column_name in zip(group_column_names, group_output_column_names)
+                if groups_data_set_alias is not None
+            )
+            + (
+                SqlSelectColumn(
+                    expr=_window_function_expr(SqlWindowFunction.COUNT, input_metric_time_column_expr),
+                    column_alias=row_count_column_name,
+                ),
+            )
+            + tuple(
+                SqlSelectColumn(
+                    expr=_window_function_expr(
+                        SqlWindowFunction.SUM,
+                        SqlColumnReferenceExpression(
+                            SqlColumnReference(
+                                table_alias=input_data_set_alias,
+                                column_name=measure_instance.associated_column.column_name,
+                            )
+                        ),
+                    ),
+                    column_alias=self._column_association_resolver.resolve_spec(measure_instance.spec).column_name,
+                )
+                for measure_instance in input_data_set.instance_set.measure_instances
+            )
+        )
+        window_select_node = SqlSelectStatementNode(
+            description=node.description,
+            select_columns=window_select_columns,
+            from_source=time_spine_data_set.sql_select_node,
+            from_source_alias=time_spine_data_set_alias,
+            joins_descs=tuple(join_descs),
+            group_bys=(),
+            where=None,
+            order_bys=(),
+        )
+
+        # The output instances are the same as the input instances.
+        output_instance_set = ChangeAssociatedColumns(self._column_association_resolver).transform(
+            input_data_set.instance_set
+        )
+        window_select_node_alias = self._next_unique_table_alias()
+        return SqlDataSet(
+            instance_set=output_instance_set,
+            sql_select_node=SqlSelectStatementNode(
+                description="Remove Days Without Rows In Window",
+                select_columns=output_instance_set.transform(
+                    CreateSelectColumnsForInstances(window_select_node_alias, self._column_association_resolver)
+                ).as_tuple(),
+                from_source=window_select_node,
+                from_source_alias=window_select_node_alias,
+                joins_descs=(),
+                group_bys=(),
+                where=SqlComparisonExpression(
+                    left_expr=SqlColumnReferenceExpression(
+                        SqlColumnReference(table_alias=window_select_node_alias, column_name=row_count_column_name)
+                    ),
+                    comparison=SqlComparison.GREATER_THAN,
+                    right_expr=SqlStringExpression(sql_expr="0", requires_parenthesis=False, used_columns=()),
+                ),
+                order_bys=(),
+            ),
+        )
+
+    def _make_window_groups_join_description(
+        self,
+        groups_input_data_set: SqlDataSet,
+        groups_data_set_alias: str,
+        group_column_names: Sequence[str],
+        metric_time_column_name: str,
+        time_spine_column_expr: SqlColumnReferenceExpression,
+    ) -> SqlJoinDescription:
+        """Return the join of the groups in the input to the time spine days from the first day of each group."""
+        groups_input_data_set_alias = self._next_unique_table_alias()
+        first_day_column_name = f"{metric_time_column_name}__first_day"
+        group_select_columns = tuple(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression(
+                    SqlColumnReference(table_alias=groups_input_data_set_alias, column_name=column_name)
+                ),
+                column_alias=column_name,
+            )
+            for column_name in group_column_names
+        )
+        groups_select_node = SqlSelectStatementNode(
+            description="Find The First Day Of Each Group",
+            select_columns=group_select_columns
+            + (
+                SqlSelectColumn(
+                    expr=SqlAggregateFunctionExpression(
+                        sql_function=SqlFunction.MIN,
+                        sql_function_args=[
+                            SqlColumnReferenceExpression(
+                                SqlColumnReference(
+                                    table_alias=groups_input_data_set_alias, column_name=metric_time_column_name
+                                )
+                            )
+                        ],
+                    ),
+                    column_alias=first_day_column_name,
+                ),
+            ),
+            from_source=groups_input_data_set.sql_select_node,
+            from_source_alias=groups_input_data_set_alias,
+            joins_descs=(),
+            group_bys=group_select_columns,
+            where=None,
+            order_bys=(),
+        )
+        return SqlJoinDescription(
+            right_source=groups_select_node,
+            right_source_alias=groups_data_set_alias,
+            join_type=SqlJoinType.INNER,
+            on_condition=SqlComparisonExpression(
+                left_expr=time_spine_column_expr,
+                comparison=SqlComparison.GREATER_THAN_OR_EQUALS,
+                right_expr=SqlColumnReferenceExpression(
+                    SqlColumnReference(table_alias=groups_data_set_alias, column_name=first_day_column_name)
+                ),
+            ),
+        )
+
     def visit_join_to_base_output_node(self, node: JoinToBaseOutputNode) -> SqlDataSet:
         """Generates the query that realizes the behavior of the JoinToStandardOutputNode."""
         # Keep a mapping between the table aliases that would be used in the query and the MDO instances in that source.
@@ -378,7 +795,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
         # Convert the dataflow from the left node to a DataSet and add context for it to table_alias_to_instance_set
         # A DataSet is a bundle of the SQL query (in object form) and the MDO instances that the SQL query contains.
-        from_data_set = node.left_node.accept(self)
+        from_data_set = self._get_parent_data_set(node.left_node)
         from_data_set_alias = self._next_unique_table_alias()
         table_alias_to_instance_set[from_data_set_alias] = from_data_set.instance_set
 
@@ -392,7 +809,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
             join_on_entity = join_description.join_on_entity
 
             right_node_to_join: BaseOutput = join_description.join_node
-            right_data_set: SqlDataSet = right_node_to_join.accept(self)
+            right_data_set: SqlDataSet = self._get_parent_data_set(right_node_to_join)
             right_data_set_alias = self._next_unique_table_alias()
 
             sql_join_desc = SqlQueryPlanJoinBuilder.make_base_output_join_description(
@@ -478,7 +895,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
         """
         # Get the data from the parent, and change measure instances to the aggregated state.
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._get_parent_data_set(node.parent_node)
         aggregated_instance_set = from_data_set.instance_set.transform(
             ChangeMeasureAggregationState(
                 {
@@ -542,7 +959,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
     def visit_compute_metrics_node(self, node: ComputeMetricsNode) -> SqlDataSet:
         """Generates the query that realizes the behavior of ComputeMetricsNode."""
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._get_parent_data_set(node.parent_node)
         from_data_set_alias = self._next_unique_table_alias()
 
         # TODO: Check that all measures for the metrics are in the input instance set
@@ -712,7 +1129,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         return metric_expr
 
     def visit_order_by_limit_node(self, node: OrderByLimitNode) -> SqlDataSet:  # noqa: D
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._get_parent_data_set(node.parent_node)
         output_instance_set = from_data_set.instance_set
         from_data_set_alias = self._next_unique_table_alias()
 
@@ -767,7 +1184,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
     def visit_pass_elements_filter_node(self, node: FilterElementsNode) -> SqlDataSet:
         """Generates the query that realizes the behavior of FilterElementsNode."""
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._get_parent_data_set(node.parent_node)
         output_instance_set = from_data_set.instance_set.transform(FilterElements(node.include_specs))
         from_data_set_alias = self._next_unique_table_alias()
 
@@ -797,7 +1214,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
     def visit_where_constraint_node(self, node: WhereConstraintNode) -> SqlDataSet:
         """Adds where clause to SQL statement from parent node."""
-        parent_data_set: SqlDataSet = node.parent_node.accept(self)
+        parent_data_set: SqlDataSet = self._get_parent_data_set(node.parent_node)
         # Since we're copying the instance set from the parent to conveniently generate the output instance set for this
         # node, we'll need to change the column names.
         output_instance_set = parent_data_set.instance_set.transform(
@@ -871,7 +1288,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         table_alias_to_instance_set: OrderedDict[str, InstanceSet] = OrderedDict()
 
         for parent_node in node.parent_nodes:
-            parent_sql_data_set = parent_node.accept(self)
+            parent_sql_data_set = self._get_parent_data_set(parent_node)
             table_alias = self._next_unique_table_alias()
             parent_data_sets.append(AnnotatedSqlDataSet(data_set=parent_sql_data_set, alias=table_alias))
             table_alias_to_instance_set[table_alias] = parent_sql_data_set.instance_set
@@ -957,7 +1374,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
         instead of this: DATE_TRUNC('month', ds) >= '2020-01-01' AND DATE_TRUNC('month', ds <= '2020-02-01')
         """
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._get_parent_data_set(node.parent_node)
         from_data_set_alias = self._next_unique_table_alias()
 
         time_dimension_instances_for_metric_time = sorted(
@@ -972,7 +1389,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         time_dimension_instance_for_metric_time = time_dimension_instances_for_metric_time[0]
 
         # Build an expression like "ds >= CAST('2020-01-01' AS TIMESTAMP) AND ds <= CAST('2020-01-02' AS TIMESTAMP)"
-        constrain_metric_time_column_condition = _make_time_range_comparison_expr(
+        constrain_metric_time_column_condition = self._make_time_range_comparison_expr(
             table_alias=from_data_set_alias,
             column_alias=time_dimension_instance_for_metric_time.associated_column.column_name,
             time_range_constraint=node.time_range_constraint,
@@ -985,7 +1402,8 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         return SqlDataSet(
             instance_set=output_instance_set,
             sql_select_node=SqlSelectStatementNode(
-                description=node.description,
+                # The time range is a bind parameter when parameterizing, so keep it out of the SQL comment as well.
+                description=node.description if self._bind_parameter_key_renderer is None else "Constrain Time Range",
                 # This creates select expressions for all columns referenced in the instance set.
                 select_columns=output_instance_set.transform(
                     CreateSelectColumnsForInstances(from_data_set_alias, self._column_association_resolver)
@@ -1006,8 +1424,23 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         dataflow_plan_node: Union[BaseOutput, ComputedMetricsOutput],
         optimization_level: SqlQueryOptimizationLevel = SqlQueryOptimizationLevel.O4,
     ) -> SqlQueryPlan:
-        """Create an SQL query plan that represents the computation up to the given dataflow plan node."""
-        sql_select_node: SqlQueryPlanNode = dataflow_plan_node.accept(self).sql_select_node
+        """Create an SQL query plan that represents the computation up to the given dataflow plan node.
+
+        Aggregations in the dataflow plan that are read by more than one node are converted into CTEs, so that they are
+        only computed once in the query.
+        """
+        self._cte_conversion_state.nodes_to_convert_to_ctes = self._find_nodes_to_convert_to_ctes(dataflow_plan_node)
+        self._cte_conversion_state.node_to_cte = {}
+        self._cte_conversion_state.common_table_expressions = []
+        try:
+            sql_select_node: SqlQueryPlanNode = dataflow_plan_node.accept(self).sql_select_node
+            common_table_expressions: List[
+                SqlCommonTableExpression
+            ] = self._cte_conversion_state.common_table_expressions
+        finally:
+            del self._cte_conversion_state.nodes_to_convert_to_ctes
+            del self._cte_conversion_state.node_to_cte
+            del self._cte_conversion_state.common_table_expressions
 
         # TODO: Make this a more generally accessible attribute instead of checking against the
         # BigQuery-ness of the engine
@@ -1018,8 +1451,17 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         ):
             logger.info(f"Applying optimizer: {optimizer.__class__.__name__}")
             sql_select_node = optimizer.optimize(sql_select_node)
-
-        return SqlQueryPlan(plan_id=sql_query_plan_id, render_node=sql_select_node)
+            # The query in a CTE is optimized on its own, as it's not a parent of the nodes that read from it.
+            common_table_expressions = [
+                SqlCommonTableExpression(name=cte.name, select_node=optimizer.optimize(cte.select_node))
+                for cte in common_table_expressions
+            ]
+
+        return SqlQueryPlan(
+            plan_id=sql_query_plan_id,
+            render_node=sql_select_node,
+            common_table_expressions=common_table_expressions,
+        )
 
     def visit_metric_time_dimension_transform_node(self, node: MetricTimeDimensionTransformNode) -> SqlDataSet:
         """Implement the behavior of the MetricTimeDimensionTransformNode.
@@ -1029,7 +1471,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         matching the one defined in the node will be passed. In addition, an additional time dimension instance for
         "metric time" will be included. See DataSet.metric_time_dimension_reference().
         """
-        input_data_set: SqlDataSet = node.parent_node.accept(self)
+        input_data_set: SqlDataSet = self._get_parent_data_set(node.parent_node)
 
         # Find which measures have an aggregation time dimension that is the same as the one specified in the node.
         # Only these measures will be in the output data set.
@@ -1114,6 +1556,80 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
             ),
         )
 
+    def _convert_semi_additive_join_node_using_window_function(self, node: SemiAdditiveJoinNode) -> SqlDataSet:
+        """Implements the behaviour of SemiAdditiveJoinNode by filtering rows with a window function.
+
+        This produces the same rows as the join in visit_semi_additive_join_node, but only reads the input once:
+
+            SELECT ...
+            FROM input a
+            WHERE a.ds IS NOT NULL AND a.user IS NOT NULL
+            QUALIFY a.ds = MAX(a.ds) OVER (PARTITION BY a.user)
+
+        Rows with NULL values in the join columns are removed, as they wouldn't match in the join. All rows with the
+        latest (or earliest) value are kept, so ROW_NUMBER() can't be used here.
+        """
+        from_data_set: SqlDataSet = self._get_parent_data_set(node.parent_node)
+        from_data_set_alias = self._next_unique_table_alias()
+
+        output_instance_set = from_data_set.instance_set.transform(
+            ChangeAssociatedColumns(self._column_association_resolver)
+        )
+
+        def _column_expr(spec: InstanceSpec) -> SqlColumnReferenceExpression:
+            return SqlColumnReferenceExpression(
+                SqlColumnReference(
+                    table_alias=from_data_set_alias,
+                    column_name=self.column_association_resolver.resolve_spec(spec).column_name,
+                )
+            )
+
+        time_dimension_column_expr = _column_expr(node.time_dimension_spec)
+        entity_column_exprs = [_column_expr(entity_spec) for entity_spec in node.entity_specs]
+        partition_by_args: List[SqlExpressionNode] = list(entity_column_exprs)
+        # The time dimension for the query groups the rows in the same way as in the join, as it's derived from the
+        # non-additive dimension.
+        if node.queried_time_dimension_spec:
+            partition_by_args.append(_column_expr(node.queried_time_dimension_spec))
+
+        agg_by_function_to_window_function = {
+            AggregationType.MIN: SqlWindowFunction.MIN,
+            AggregationType.MAX: SqlWindowFunction.MAX,
+        }
+        if node.agg_by_function not in agg_by_function_to_window_function:
+            raise RuntimeError(f"Unsupported aggregation for a semi-additive join: {node.agg_by_function}")
+
+        not_null_exprs = tuple(
+            SqlIsNullExpression(arg=column_expr, negated=True)
+            for column_expr in [time_dimension_column_expr] + entity_column_exprs
+        )
+        return SqlDataSet(
+            instance_set=output_instance_set,
+            sql_select_node=SqlSelectStatementNode(
+                description=node.description,
+                select_columns=output_instance_set.transform(
+                    CreateSelectColumnsForInstances(from_data_set_alias, self._column_association_resolver)
+                ).as_tuple(),
+                from_source=from_data_set.sql_select_node,
+                from_source_alias=from_data_set_alias,
+                joins_descs=(),
+                group_bys=(),
+                where=not_null_exprs[0]
+                if len(not_null_exprs) == 1
+                else SqlLogicalExpression(operator=SqlLogicalOperator.AND, args=not_null_exprs),
+                order_bys=(),
+                qualify=SqlComparisonExpression(
+                    left_expr=time_dimension_column_expr,
+                    comparison=SqlComparison.EQUALS,
+                    right_expr=SqlWindowFunctionExpression(
+                        sql_function=agg_by_function_to_window_function[node.agg_by_function],
+                        sql_function_args=[time_dimension_column_expr],
+                        partition_by_args=partition_by_args,
+                    ),
+                ),
+            ),
+        )
+
     def visit_semi_additive_join_node(self, node: SemiAdditiveJoinNode) -> SqlDataSet:
         """Implements the behaviour of SemiAdditiveJoinNode.
 
@@ -1121,7 +1637,10 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         specified dimension that is non-additive. Then that dataset would be joined with the input data
         on that dimension along with grouping by entities that are also passed in.
         """
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        if self._use_window_functions_for_semi_additive_joins:
+            return self._convert_semi_additive_join_node_using_window_function(node)
+
+        from_data_set: SqlDataSet = self._get_parent_data_set(node.parent_node)
 
         from_data_set_alias = self._next_unique_table_alias()
 
@@ -1236,7 +1755,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         )
 
     def visit_join_to_time_spine_node(self, node: JoinToTimeSpineNode) -> SqlDataSet:  # noqa: D
-        parent_data_set = node.parent_node.accept(self)
+        parent_data_set = self._get_parent_data_set(node.parent_node)
         parent_alias = self._next_unique_table_alias()
 
         # Build time spine dataset
@@ -1357,7 +1876,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         )
 
     def visit_min_max_node(self, node: MinMaxNode) -> SqlDataSet:  # noqa: D
-        parent_data_set = node.parent_node.accept(self)
+        parent_data_set = self._get_parent_data_set(node.parent_node)
         parent_table_alias = self._next_unique_table_alias()
         assert (
             len(parent_data_set.sql_select_node.select_columns) == 1
@@ -1403,7 +1922,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         Builds a new dataset that is the same as the output dataset, but with an additional column
         that contains a randomly generated UUID.
         """
-        input_data_set: SqlDataSet = node.parent_node.accept(self)
+        input_data_set: SqlDataSet = self._get_parent_data_set(node.parent_node)
         input_data_set_alias = self._next_unique_table_alias()
 
         gen_uuid_spec = MetadataSpec.from_name(MetricFlowReservedKeywords.MF_INTERNAL_UUID.value)
@@ -1449,10 +1968,10 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         successful conversion. Duplication may exist in the result due to a single base event
         being able to link to multiple conversion events.
         """
-        base_data_set: SqlDataSet = node.base_node.accept(self)
+        base_data_set: SqlDataSet = self._get_parent_data_set(node.base_node)
         base_data_set_alias = self._next_unique_table_alias()
 
-        conversion_data_set: SqlDataSet = node.conversion_node.accept(self)
+        conversion_data_set: SqlDataSet = self._get_parent_data_set(node.conversion_node)
         conversion_data_set_alias = self._next_unique_table_alias()
 
         base_time_dimension_column_name = self._column_association_resolver.resolve_spec(
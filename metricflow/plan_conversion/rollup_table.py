@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Tuple
+
+from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
+
+from metricflow.dataflow.sql_table import SqlTable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RollupTable:
+    """Defines a table that contains measures from a semantic model pre-aggregated to a coarser grain.
+
+    The table should have one row for each combination of values of the listed dimensions, entities, and the time
+    dimension truncated to time_granularity. The columns should be named after those elements, and each measure
+    column should contain the measure aggregated over the rows of the semantic model in that group (e.g. the count of
+    rows for a COUNT measure). Since the values are aggregated again when reading from the table, only measures with
+    an expansive aggregation type (SUM, MIN, MAX, COUNT, SUM_BOOLEAN) can be included.
+    """
+
+    sql_table: SqlTable
+    semantic_model_name: str
+    measure_names: Tuple[str, ...]
+    # Name of the aggregation time dimension of the measures.
+    time_dimension_name: str
+    # The time granularity that the values in the time dimension column have been truncated to.
+    time_granularity: TimeGranularity = TimeGranularity.DAY
+    dimension_names: Tuple[str, ...] = ()
+    entity_names: Tuple[str, ...] = ()
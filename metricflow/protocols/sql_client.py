@@ -2,14 +2,19 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from enum import Enum
-from typing import Protocol
+from typing import TYPE_CHECKING, Generator, Optional, Protocol, Sequence, Tuple
 
 from pandas import DataFrame
 
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.sql.dry_run_batching import DEFAULT_DRY_RUN_BATCH_SIZE
 from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.sql_request.sql_request_attributes import SqlJsonTag
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class SqlEngine(Enum):
     """Enumeration of supported SQL engines.
@@ -25,6 +30,25 @@ class SqlEngine(Enum):
     DATABRICKS = "Databricks"
     TRINO = "Trino"
 
+    @property
+    def uses_backslash_escapes(self) -> bool:
+        """Returns true if the engine treats backslashes in string literals as escape characters."""
+        return self in (SqlEngine.BIGQUERY, SqlEngine.DATABRICKS, SqlEngine.REDSHIFT, SqlEngine.SNOWFLAKE)
+
+    @property
+    def supports_transactions(self) -> bool:
+        """Returns true if statements that modify tables can be run in a transaction through the dbt adapter."""
+        return self not in (SqlEngine.BIGQUERY, SqlEngine.DATABRICKS, SqlEngine.TRINO)
+
+    @property
+    def supports_incremental_writes(self) -> bool:
+        """Returns true if the rows in a time range of a table can be replaced atomically.
+
+        Engines with transactions delete and insert the rows in a transaction. BigQuery and Databricks replace the rows in
+        a single statement. See SelectSqlQueryToTableTask.
+        """
+        return self.supports_transactions or self in (SqlEngine.BIGQUERY, SqlEngine.DATABRICKS)
+
 
 class SqlClient(Protocol):
     """Base interface for SqlClient instances used inside MetricFlow.
@@ -48,6 +72,16 @@ class SqlClient(Protocol):
         """
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def connection_identity(self) -> str:
+        """Identifies the data warehouse that this client connects to.
+
+        Clients for different warehouses, or different databases in the same warehouse, should return different values.
+        This is used in the keys for cached query results.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def query(
         self,
@@ -58,6 +92,36 @@ class SqlClient(Protocol):
         """Base query method, upon execution will run a query that returns a pandas DataFrame."""
         raise NotImplementedError
 
+    @abstractmethod
+    def query_arrow(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> pa.Table:
+        """Similar to query, but returns the result as an Apache Arrow table. Requires pyarrow to be installed.
+
+        Engines that produce Arrow data natively can return it without converting the values to Python objects.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def query_batches(
+        self,
+        stmt: str,
+        batch_size: int,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Generator[DataFrame, None, None]:
+        """Similar to query, but yields the result as DataFrames with up to batch_size rows each.
+
+        The query is run when iteration starts, and rows are fetched as the generator is consumed, so large results can
+        be processed in bounded memory. At least one DataFrame is yielded so that the column names are available even
+        if the result is empty. The connection for the query is held until the generator is exhausted, so callers that
+        stop early should call close() on it.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def execute(
         self,
@@ -68,6 +132,23 @@ class SqlClient(Protocol):
         """Base execute method."""
         raise NotImplementedError
 
+    @abstractmethod
+    def execute_in_transaction(
+        self,
+        statements: Sequence[Tuple[str, SqlBindParameters]],
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> None:
+        """Execute the statements in a single transaction, so either all or none of their changes are applied.
+
+        Raises NotImplementedError if the engine doesn't support transactions. See SqlEngine.supports_transactions.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def table_exists(self, sql_table: SqlTable) -> bool:
+        """Returns true if the table is listed in the schema of the data warehouse."""
+        raise NotImplementedError
+
     @abstractmethod
     def dry_run(
         self,
@@ -77,6 +158,19 @@ class SqlClient(Protocol):
         """Base dry_run method."""
         raise NotImplementedError
 
+    @abstractmethod
+    def dry_run_many(
+        self,
+        statements: Sequence[Tuple[str, SqlBindParameters]],
+        max_batch_size: int = DEFAULT_DRY_RUN_BATCH_SIZE,
+    ) -> Tuple[Optional[Exception], ...]:
+        """Dry run many statements, combining them to reduce the number of round trips to the data warehouse.
+
+        Returns the exception raised for each statement by dry_run(), or None if the statement is queryable, in the same
+        order as statements.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def close(self) -> None:  # noqa: D
         """Close the connections / engines used by this client."""
@@ -86,3 +180,57 @@ class SqlClient(Protocol):
     def render_bind_parameter_key(self, bind_parameter_key: str) -> str:
         """Wrap the bind parameter key with syntax accepted by engine."""
         raise NotImplementedError
+
+
+class AsyncSqlClient(Protocol):
+    """Interface for SqlClient instances that don't block the event loop while waiting on the data warehouse.
+
+    The methods mirror the ones in SqlClient, but are coroutines. This allows a service that runs in an event loop to
+    have many queries in flight without dedicating a thread to each one.
+    """
+
+    @property
+    @abstractmethod
+    def sql_engine_type(self) -> SqlEngine:
+        """Enumerated value representing the underlying SqlEngine for this AsyncSqlClient instance."""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def sql_query_plan_renderer(self) -> SqlQueryPlanRenderer:
+        """Dialect-specific SQL query plan renderer used for converting MetricFlow's query plan to executable SQL."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def query(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> DataFrame:
+        """Base query method, upon execution will run a query that returns a pandas DataFrame."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def execute(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> None:
+        """Base execute method."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def dry_run(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+    ) -> None:
+        """Base dry_run method."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:  # noqa: D
+        """Close the connections / engines used by this client."""
+        raise NotImplementedError
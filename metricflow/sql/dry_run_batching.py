@@ -0,0 +1,107 @@
+"""Helpers for dry running many statements with few round trips to the data warehouse."""
+from __future__ import annotations
+
+import logging
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+
+logger = logging.getLogger(__name__)
+
+# The default maximum number of statements to combine into a single dry run.
+DEFAULT_DRY_RUN_BATCH_SIZE = 50
+
+
+def _strip_statement(stmt: str) -> str:
+    """Remove trailing whitespace and semicolons so that the statement can be used as a subquery."""
+    return stmt.strip().rstrip(";").rstrip()
+
+
+def render_dry_run_probe(stmts: Sequence[str]) -> str:
+    """Render a single statement that is only valid if all of the given statements are valid.
+
+    Each statement becomes a subquery that doesn't return any rows, and the subqueries are combined with UNION ALL. The
+    statements are on separate lines so that trailing comments don't comment out the rest of the probe.
+    """
+    return "\nUNION ALL\n".join(
+        f"SELECT 1 AS mf_dry_run_probe FROM (\n{_strip_statement(stmt)}\n) mf_dry_run_probe_{i}\nWHERE 1 = 0"
+        for i, stmt in enumerate(stmts)
+    )
+
+
+def _has_conflicting_keys(bind_parameters: SqlBindParameters, other_bind_parameters: SqlBindParameters) -> bool:
+    param_dict = bind_parameters.param_dict
+    return any(
+        key in param_dict and param_dict[key] != value for key, value in other_bind_parameters.param_dict.items()
+    )
+
+
+def _group_statements(
+    statements: Sequence[Tuple[str, SqlBindParameters]], max_batch_size: int
+) -> List[List[Tuple[int, str, SqlBindParameters]]]:
+    """Group the statements into batches, keeping statements with conflicting bind parameters in separate batches."""
+    batches: List[List[Tuple[int, str, SqlBindParameters]]] = []
+    batch_bind_parameters = SqlBindParameters()
+    for index, (stmt, bind_parameters) in enumerate(statements):
+        if (
+            len(batches) == 0
+            or len(batches[-1]) >= max_batch_size
+            or _has_conflicting_keys(batch_bind_parameters, bind_parameters)
+        ):
+            batches.append([])
+            batch_bind_parameters = SqlBindParameters()
+        batches[-1].append((index, stmt, bind_parameters))
+        batch_bind_parameters = batch_bind_parameters.combine(bind_parameters)
+    return batches
+
+
+def dry_run_in_batches(
+    dry_run: Callable[[str, SqlBindParameters], None],
+    statements: Sequence[Tuple[str, SqlBindParameters]],
+    max_batch_size: int = DEFAULT_DRY_RUN_BATCH_SIZE,
+) -> Tuple[Optional[Exception], ...]:
+    """Dry run the statements using as few calls to dry_run as possible.
+
+    Statements are combined into probes of up to max_batch_size statements. If a probe fails, it's split in half until
+    the statements that fail are found, which are then dry run individually so that the exceptions are the same as
+    from dry running each statement.
+
+    Args:
+        dry_run: Dry runs a statement with the given bind parameters, raising an exception if it isn't queryable.
+        statements: The statements to dry run, with their bind parameters.
+        max_batch_size: The maximum number of statements to combine into a single dry run.
+
+    Returns:
+        The exception for each statement in the same order as statements, or None if the statement is queryable.
+    """
+    if max_batch_size < 1:
+        raise ValueError(f"The maximum batch size must be a positive integer. Got: {max_batch_size}")
+
+    exceptions: List[Optional[Exception]] = [None] * len(statements)
+
+    def _dry_run_batch(batch: Sequence[Tuple[int, str, SqlBindParameters]]) -> None:
+        if len(batch) == 1:
+            index, stmt, bind_parameters = batch[0]
+            try:
+                dry_run(stmt, bind_parameters)
+            except Exception as e:
+                exceptions[index] = e
+            return
+
+        bind_parameters = SqlBindParameters()
+        for _, _, statement_bind_parameters in batch:
+            bind_parameters = bind_parameters.combine(statement_bind_parameters)
+        try:
+            dry_run(render_dry_run_probe([stmt for _, stmt, _ in batch]), bind_parameters)
+            return
+        except Exception as e:
+            logger.info(f"Dry run of {len(batch)} statements failed, so splitting the batch to find the failures: {e}")
+
+        midpoint = len(batch) // 2
+        _dry_run_batch(batch[:midpoint])
+        _dry_run_batch(batch[midpoint:])
+
+    for batch in _group_statements(statements, max_batch_size):
+        _dry_run_batch(batch)
+
+    return tuple(exceptions)
@@ -9,6 +9,7 @@ from metricflow.sql.sql_exprs import (
     SqlExpressionTreeLineage,
 )
 from metricflow.sql.sql_plan import (
+    SqlCteFromClauseNode,
     SqlJoinDescription,
     SqlQueryPlanNode,
     SqlQueryPlanNodeVisitor,
@@ -39,6 +40,13 @@ class SqlColumnPrunerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
         """
         self._required_column_aliases = required_column_aliases
 
+    def _prune_parent(self, parent_node: SqlQueryPlanNode, required_column_aliases: Set[str]) -> SqlQueryPlanNode:
+        """Prune the columns from a parent (i.e. a source in the FROM or JOIN clauses) of the node being visited.
+
+        Subclasses can override this to apply other changes to the parents in the same traversal.
+        """
+        return parent_node.accept(SqlColumnPrunerVisitor(required_column_aliases=required_column_aliases))
+
     def _search_for_expressions(
         self, select_node: SqlSelectStatementNode, pruned_select_columns: Tuple[SqlSelectColumn, ...]
     ) -> SqlExpressionTreeLineage:
@@ -65,6 +73,9 @@ class SqlColumnPrunerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
         if select_node.where:
             all_expr_search_results.append(select_node.where.lineage)
 
+        if select_node.qualify:
+            all_expr_search_results.append(select_node.qualify.lineage)
+
         return SqlExpressionTreeLineage.combine(all_expr_search_results)
 
     def _prune_columns_from_grandparents(
@@ -73,22 +84,24 @@ class SqlColumnPrunerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
         """Assume that you need all columns from the parent and prune the grandparents."""
         pruned_from_source: SqlQueryPlanNode
         if node.from_source.as_select_node:
-            from_visitor = SqlColumnPrunerVisitor(
-                required_column_aliases={x.column_alias for x in node.from_source.as_select_node.select_columns}
+            pruned_from_source = self._prune_parent(
+                node.from_source.as_select_node,
+                required_column_aliases={x.column_alias for x in node.from_source.as_select_node.select_columns},
             )
-            pruned_from_source = node.from_source.as_select_node.accept(from_visitor)
         else:
             pruned_from_source = node.from_source
         pruned_join_descriptions: List[SqlJoinDescription] = []
         for join_description in node.join_descs:
             right_source_as_select_node = join_description.right_source.as_select_node
             if right_source_as_select_node:
-                right_source_visitor = SqlColumnPrunerVisitor(
-                    required_column_aliases={x.column_alias for x in right_source_as_select_node.select_columns}
-                )
                 pruned_join_descriptions.append(
                     SqlJoinDescription(
-                        right_source=join_description.right_source.accept(right_source_visitor),
+                        right_source=self._prune_parent(
+                            join_description.right_source,
+                            required_column_aliases={
+                                x.column_alias for x in right_source_as_select_node.select_columns
+                            },
+                        ),
                         right_source_alias=join_description.right_source_alias,
                         on_condition=join_description.on_condition,
                         join_type=join_description.join_type,
@@ -108,17 +121,19 @@ class SqlColumnPrunerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
             where=node.where,
             limit=node.limit,
             distinct=node.distinct,
+            qualify=node.qualify,
         )
 
     def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlQueryPlanNode:  # noqa: D
         # Remove columns that are not needed from this SELECT statement because the parent SELECT statement doesn't
         # need them. However, keep columns that are in group bys because that changes the meaning of the query.
         # Similarly, if this node is a distinct select node, keep all columns as it may return a different result set.
+        group_by_columns = set(node.group_bys)
         pruned_select_columns = tuple(
             select_column
             for select_column in node.select_columns
             if select_column.column_alias in self._required_column_aliases
-            or select_column in node.group_bys
+            or select_column in group_by_columns
             or node.distinct
         )
 
@@ -159,18 +174,20 @@ class SqlColumnPrunerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
 
         # Once we know which column aliases are required from which source aliases, replace the sources with new SELECT
         # statements.
-        from_source_pruner = SqlColumnPrunerVisitor(
-            required_column_aliases=source_alias_to_required_column_alias[node.from_source_alias]
+        pruned_from_source = self._prune_parent(
+            node.from_source,
+            required_column_aliases=source_alias_to_required_column_alias[node.from_source_alias],
         )
-        pruned_from_source = node.from_source.accept(from_source_pruner)
         pruned_join_descriptions: List[SqlJoinDescription] = []
         for join_description in node.join_descs:
-            join_source_pruner = SqlColumnPrunerVisitor(
-                required_column_aliases=source_alias_to_required_column_alias[join_description.right_source_alias]
-            )
             pruned_join_descriptions.append(
                 SqlJoinDescription(
-                    right_source=join_description.right_source.accept(join_source_pruner),
+                    right_source=self._prune_parent(
+                        join_description.right_source,
+                        required_column_aliases=source_alias_to_required_column_alias[
+                            join_description.right_source_alias
+                        ],
+                    ),
                     right_source_alias=join_description.right_source_alias,
                     on_condition=join_description.on_condition,
                     join_type=join_description.join_type,
@@ -188,6 +205,7 @@ class SqlColumnPrunerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
             where=node.where,
             limit=node.limit,
             distinct=node.distinct,
+            qualify=node.qualify,
         )
 
     def visit_table_from_clause_node(self, node: SqlTableFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
@@ -198,6 +216,10 @@ class SqlColumnPrunerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
         """Pruning cannot be done here since this is an arbitrary user-provided SQL query."""
         return node
 
+    def visit_cte_from_clause_node(self, node: SqlCteFromClauseNode) -> SqlQueryPlanNode:
+        """Pruning cannot be done here since the CTE can be read by other nodes that need all of its columns."""
+        return node
+
 
 class SqlColumnPrunerOptimizer(SqlQueryPlanOptimizer):
     """Removes unnecessary columns in the SELECT clauses."""
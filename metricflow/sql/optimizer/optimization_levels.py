@@ -4,7 +4,7 @@ from enum import Enum
 from typing import Sequence
 
 from metricflow.sql.optimizer.column_pruner import SqlColumnPrunerOptimizer
-from metricflow.sql.optimizer.rewriting_sub_query_reducer import SqlRewritingSubQueryReducer
+from metricflow.sql.optimizer.rewriting_sub_query_reducer import SqlColumnPruningSubQueryReducer
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
 from metricflow.sql.optimizer.sub_query_reducer import SqlSubQueryReducer
 from metricflow.sql.optimizer.table_alias_simplifier import SqlTableAliasSimplifier
@@ -37,8 +37,9 @@ class SqlQueryOptimizerConfiguration:
         elif level is SqlQueryOptimizationLevel.O3:
             return (SqlColumnPrunerOptimizer(), SqlSubQueryReducer(), SqlTableAliasSimplifier())
         elif level is SqlQueryOptimizationLevel.O4:
+            # Same as running SqlColumnPrunerOptimizer, SqlRewritingSubQueryReducer, and SqlTableAliasSimplifier, but
+            # with fewer traversals of the plan.
             return (
-                SqlColumnPrunerOptimizer(),
-                SqlRewritingSubQueryReducer(use_column_alias_in_group_bys=use_column_alias_in_group_by),
-                SqlTableAliasSimplifier(),
+                SqlColumnPruningSubQueryReducer(),
+                SqlTableAliasSimplifier(rewrite_group_bys_to_column_aliases=use_column_alias_in_group_by),
             )
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from typing import List, Optional, Sequence, Set, Tuple
 
+from metricflow.sql.optimizer.column_pruner import SqlColumnPrunerVisitor
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
 from metricflow.sql.sql_exprs import (
     SqlColumnAliasReferenceExpression,
@@ -13,8 +14,10 @@ from metricflow.sql.sql_exprs import (
     SqlExpressionTreeLineage,
     SqlLogicalExpression,
     SqlLogicalOperator,
+    SqlWindowFunctionExpression,
 )
 from metricflow.sql.sql_plan import (
+    SqlCteFromClauseNode,
     SqlJoinDescription,
     SqlOrderByDescription,
     SqlQueryPlanNode,
@@ -109,6 +112,7 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
             where=node.where,
             limit=node.limit,
             distinct=node.distinct,
+            qualify=node.qualify,
         )
 
     @staticmethod
@@ -191,6 +195,7 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
             and len(node.order_bys) == 0
             and not node.limit
             and not node.where
+            and not node.qualify
         )
 
     def _current_node_can_be_reduced(self, node: SqlSelectStatementNode) -> bool:  # noqa: D
@@ -225,6 +230,10 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
         if parent_select_node.distinct:
             return False
 
+        # A QUALIFY is evaluated after the other clauses in the same SELECT, so don't reduce if either node has one.
+        if node.qualify or parent_select_node.qualify:
+            return False
+
         # Skip this case for simplicity of reasoning.
         if len(node.order_bys) > 0 and len(parent_select_node.order_bys) > 0:
             return False
@@ -261,6 +270,15 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
             ):
                 return False
 
+        # WHERE and GROUP BY are evaluated before window functions, so avoid reducing as they could reference a window
+        # function expression in the parent.
+        if (node.where or len(node.group_bys) > 0) and any(
+            isinstance(function_expr, SqlWindowFunctionExpression)
+            for select_column in parent_select_node.select_columns
+            for function_expr in select_column.expr.lineage.function_exprs
+        ):
+            return False
+
         # If the parent has a GROUP BY and this has a WHERE, avoid reducing as the WHERE could reference an
         # aggregation expression.
         if len(parent_select_node.group_bys) > 0 and node.where:
@@ -400,6 +418,10 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
         ON bookings_src.listing_id = dim_listings_src.listing_id
         GROUP BY bookings_src.ds
         """
+        # Re-writing a QUALIFY with the column replacements isn't supported.
+        if node.qualify:
+            return node
+
         # Check that there aren't any duplicates in source aliases, or else there would be a collision when reduced.
         # This check is conservative as it checks for duplicates in this node and parent nodes, but depending on
         # on which sources get reduced, there may not be a collision.
@@ -532,8 +554,10 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
         )
 
     def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlQueryPlanNode:  # noqa: D
-        node_with_reduced_parents = self._reduce_parents(node)
+        return self.reduce_node_with_reduced_parents(self._reduce_parents(node))
 
+    def reduce_node_with_reduced_parents(self, node_with_reduced_parents: SqlSelectStatementNode) -> SqlQueryPlanNode:
+        """Reduce the given node, assuming that its parents have already been reduced."""
         if len(node_with_reduced_parents.parent_nodes) > 1:
             return SqlRewritingSubQueryReducerVisitor._rewrite_node_with_join(node_with_reduced_parents)
 
@@ -575,7 +599,7 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
         # parent as long as the parent has no limits.
         column_replacements = SqlRewritingSubQueryReducerVisitor._get_column_replacements(
             parent_node=parent_select_node,
-            parent_node_alias=node.from_source_alias,
+            parent_node_alias=node_with_reduced_parents.from_source_alias,
         )
         new_order_bys: List[SqlOrderByDescription] = []
         # Handle ORDER BY differently to avoid this hazard with expression rewriting:
@@ -619,14 +643,14 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
             new_limit = min(new_limit, parent_select_node.limit)
 
         new_group_bys: Tuple[SqlSelectColumn, ...] = ()
-        if node.group_bys and parent_select_node.group_bys:
+        if node_with_reduced_parents.group_bys and parent_select_node.group_bys:
             raise RuntimeError(
                 "Attempting to reduce sub-queries when this and the parent have GROUP BYs. This should have been "
                 "prevent by _should_reduce()"
             )
-        elif node.group_bys:
+        elif node_with_reduced_parents.group_bys:
             new_group_bys = SqlRewritingSubQueryReducerVisitor._rewrite_select_columns(
-                old_select_columns=node.group_bys, column_replacements=column_replacements
+                old_select_columns=node_with_reduced_parents.group_bys, column_replacements=column_replacements
             )
         elif parent_select_node.group_bys:
             new_group_bys = parent_select_node.group_bys
@@ -634,7 +658,7 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
         return SqlSelectStatementNode(
             description="\n".join([parent_select_node.description, node_with_reduced_parents.description]),
             select_columns=SqlRewritingSubQueryReducerVisitor._rewrite_select_columns(
-                old_select_columns=node.select_columns, column_replacements=column_replacements
+                old_select_columns=node_with_reduced_parents.select_columns, column_replacements=column_replacements
             ),
             from_source=parent_select_node.from_source,
             from_source_alias=parent_select_node.from_source_alias,
@@ -643,7 +667,7 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
             order_bys=tuple(new_order_bys),
             where=SqlRewritingSubQueryReducerVisitor._rewrite_where(
                 column_replacements=column_replacements,
-                node_where=node.where,
+                node_where=node_with_reduced_parents.where,
                 parent_node_where=parent_select_node.where,
             ),
             limit=new_limit,
@@ -656,6 +680,9 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
     def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
         return node
 
+    def visit_cte_from_clause_node(self, node: SqlCteFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
+        return node
+
 
 class SqlGroupByRewritingVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
     """Re-writes the GROUP BY to use a SqlColumnAliasReferenceExpression."""
@@ -670,7 +697,9 @@ class SqlGroupByRewritingVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
                 return select_column
         return None
 
-    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlQueryPlanNode:  # noqa: D
+    @staticmethod
+    def rewrite_group_bys(node: SqlSelectStatementNode) -> Tuple[SqlSelectColumn, ...]:
+        """Return the GROUP BY of the given node with expressions replaced by references to the matching SELECT."""
         new_group_bys = []
         for group_by in node.group_bys:
             matching_select_column = SqlGroupByRewritingVisitor._find_matching_select(
@@ -686,7 +715,9 @@ class SqlGroupByRewritingVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
             else:
                 logger.error(f"Did not find matching select for {group_by} in {node}")
                 new_group_bys.append(group_by)
+        return tuple(new_group_bys)
 
+    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlQueryPlanNode:  # noqa: D
         return SqlSelectStatementNode(
             description=node.description,
             select_columns=node.select_columns,
@@ -701,11 +732,12 @@ class SqlGroupByRewritingVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
                 )
                 for x in node.join_descs
             ),
-            group_bys=tuple(new_group_bys),
+            group_bys=SqlGroupByRewritingVisitor.rewrite_group_bys(node),
             order_bys=node.order_bys,
             where=node.where,
             limit=node.limit,
             distinct=node.distinct,
+            qualify=node.qualify,
         )
 
     def visit_table_from_clause_node(self, node: SqlTableFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
@@ -714,6 +746,9 @@ class SqlGroupByRewritingVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
     def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
         return node
 
+    def visit_cte_from_clause_node(self, node: SqlCteFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
+        return node
+
 
 class SqlRewritingSubQueryReducer(SqlQueryPlanOptimizer):
     """Simplify queries by eliminating sub-queries when possible by rewriting expressions.
@@ -744,3 +779,48 @@ class SqlRewritingSubQueryReducer(SqlQueryPlanOptimizer):
         if self._use_column_alias_in_group_bys:
             return result.accept(SqlGroupByRewritingVisitor())
         return result
+
+
+class SqlColumnPruningSubQueryReducerVisitor(SqlColumnPrunerVisitor):
+    """Prunes columns and reduces sub-queries in a single traversal of the SQL query plan.
+
+    Columns are pruned on the way to the parents, and the sub-queries are reduced on the way back, so a node is reduced
+    after its parents have been pruned and reduced. This produces the same result as running the pruner on the whole
+    plan followed by SqlRewritingSubQueryReducerVisitor.
+    """
+
+    def __init__(self, required_column_aliases: Set[str]) -> None:  # noqa: D
+        super().__init__(required_column_aliases=required_column_aliases)
+        self._sub_query_reducer = SqlRewritingSubQueryReducerVisitor()
+
+    def _prune_parent(  # noqa: D
+        self, parent_node: SqlQueryPlanNode, required_column_aliases: Set[str]
+    ) -> SqlQueryPlanNode:
+        return parent_node.accept(
+            SqlColumnPruningSubQueryReducerVisitor(required_column_aliases=required_column_aliases)
+        )
+
+    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlQueryPlanNode:  # noqa: D
+        pruned_node = super().visit_select_statement_node(node).as_select_node
+        assert pruned_node, f"Pruning a SELECT statement should return a SELECT statement. Got: {pruned_node}"
+        return self._sub_query_reducer.reduce_node_with_reduced_parents(pruned_node)
+
+
+class SqlColumnPruningSubQueryReducer(SqlQueryPlanOptimizer):
+    """Removes unnecessary columns and then simplifies sub-queries, but with a single traversal of the plan.
+
+    This is equivalent to running SqlColumnPrunerOptimizer followed by SqlRewritingSubQueryReducer. Rewriting the GROUP
+    BY to use column aliases needs to be done after all sub-queries are reduced, so it's supported by
+    SqlTableAliasSimplifier instead.
+    """
+
+    def optimize(self, node: SqlQueryPlanNode) -> SqlQueryPlanNode:  # noqa: D
+        # Can't prune columns without knowing the structure of the query. The reducer also leaves those nodes as is.
+        if not node.as_select_node:
+            return node
+
+        return node.accept(
+            SqlColumnPruningSubQueryReducerVisitor(
+                required_column_aliases={x.column_alias for x in node.as_select_node.select_columns}
+            )
+        )
@@ -6,6 +6,7 @@ from typing import List, Optional
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
 from metricflow.sql.sql_exprs import SqlColumnReference, SqlColumnReferenceExpression
 from metricflow.sql.sql_plan import (
+    SqlCteFromClauseNode,
     SqlJoinDescription,
     SqlOrderByDescription,
     SqlQueryPlanNode,
@@ -45,6 +46,7 @@ class SqlSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
             where=node.where,
             limit=node.limit,
             distinct=node.distinct,
+            qualify=node.qualify,
         )
 
     def _reduce_is_possible(self, node: SqlSelectStatementNode) -> bool:  # noqa: D
@@ -80,6 +82,10 @@ class SqlSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
         if node.where:
             return False
 
+        # Same with QUALIFY, and a QUALIFY in the parent needs to be evaluated before the expressions in this node.
+        if node.qualify or parent_select_node.qualify:
+            return False
+
         # Group bys are hard to reduce.
         if len(node.group_bys) > 0:
             return False
@@ -193,6 +199,9 @@ class SqlSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
     def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
         return node
 
+    def visit_cte_from_clause_node(self, node: SqlCteFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
+        return node
+
 
 class SqlSubQueryReducer(SqlQueryPlanOptimizer):
     """Simplify queries by eliminating sub-queries when possible.
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import logging
 
+from metricflow.sql.optimizer.rewriting_sub_query_reducer import SqlGroupByRewritingVisitor
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
 from metricflow.sql.sql_plan import (
+    SqlCteFromClauseNode,
     SqlJoinDescription,
     SqlOrderByDescription,
     SqlQueryPlanNode,
@@ -20,7 +22,20 @@ logger = logging.getLogger(__name__)
 class SqlTableAliasSimplifierVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
     """Visits the SQL query plan to see if table aliases can be omitted when rendering column references."""
 
+    def __init__(self, rewrite_group_bys_to_column_aliases: bool = False) -> None:
+        """Constructor.
+
+        Args:
+            rewrite_group_bys_to_column_aliases: If set, the GROUP BY is also rewritten to reference the column aliases
+            in the SELECT, as SqlGroupByRewritingVisitor does. Both are done in the same traversal.
+        """
+        self._rewrite_group_bys_to_column_aliases = rewrite_group_bys_to_column_aliases
+
     def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlQueryPlanNode:  # noqa: D
+        group_bys = node.group_bys
+        if self._rewrite_group_bys_to_column_aliases:
+            group_bys = SqlGroupByRewritingVisitor.rewrite_group_bys(node)
+
         # If there is only a single parent, no table aliases are required since there's no ambiguity.
         should_simplify_table_aliases = len(node.parent_nodes) <= 1
 
@@ -36,7 +51,7 @@ class SqlTableAliasSimplifierVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
                 joins_descs=(),
                 group_bys=tuple(
                     SqlSelectColumn(expr=x.expr.rewrite(should_render_table_alias=False), column_alias=x.column_alias)
-                    for x in node.group_bys
+                    for x in group_bys
                 ),
                 order_bys=tuple(
                     SqlOrderByDescription(expr=x.expr.rewrite(should_render_table_alias=False), desc=x.desc)
@@ -45,6 +60,7 @@ class SqlTableAliasSimplifierVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
                 where=node.where.rewrite(should_render_table_alias=False) if node.where else None,
                 limit=node.limit,
                 distinct=node.distinct,
+                qualify=node.qualify.rewrite(should_render_table_alias=False) if node.qualify else None,
             )
 
         return SqlSelectStatementNode(
@@ -61,11 +77,12 @@ class SqlTableAliasSimplifierVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
                 )
                 for x in node.join_descs
             ),
-            group_bys=node.group_bys,
+            group_bys=group_bys,
             order_bys=node.order_bys,
             where=node.where,
             limit=node.limit,
             distinct=node.distinct,
+            qualify=node.qualify,
         )
 
     def visit_table_from_clause_node(self, node: SqlTableFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
@@ -74,6 +91,9 @@ class SqlTableAliasSimplifierVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
     def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
         return node
 
+    def visit_cte_from_clause_node(self, node: SqlCteFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
+        return node
+
 
 class SqlTableAliasSimplifier(SqlQueryPlanOptimizer):
     """Simplify queries by eliminating table aliases when possible.
@@ -93,5 +113,12 @@ class SqlTableAliasSimplifier(SqlQueryPlanOptimizer):
     ) b
     """
 
+    def __init__(self, rewrite_group_bys_to_column_aliases: bool = False) -> None:  # noqa: D
+        self._rewrite_group_bys_to_column_aliases = rewrite_group_bys_to_column_aliases
+
     def optimize(self, node: SqlQueryPlanNode) -> SqlQueryPlanNode:  # noqa: D
-        return node.accept(SqlTableAliasSimplifierVisitor())
+        return node.accept(
+            SqlTableAliasSimplifierVisitor(
+                rewrite_group_bys_to_column_aliases=self._rewrite_group_bys_to_column_aliases
+            )
+        )
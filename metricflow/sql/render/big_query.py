@@ -188,3 +188,8 @@ class BigQuerySqlQueryPlanRenderer(DefaultSqlQueryPlanRenderer):
     @override
     def expr_renderer(self) -> SqlExpressionRenderer:
         return self.EXPR_RENDERER
+
+    @property
+    @override
+    def supports_qualify(self) -> bool:
+        return True
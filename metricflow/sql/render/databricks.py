@@ -74,3 +74,8 @@ class DatabricksSqlQueryPlanRenderer(DefaultSqlQueryPlanRenderer):
     @override
     def expr_renderer(self) -> SqlExpressionRenderer:
         return self.EXPR_RENDERER
+
+    @property
+    @override
+    def supports_qualify(self) -> bool:
+        return True
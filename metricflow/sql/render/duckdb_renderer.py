@@ -95,3 +95,8 @@ class DuckDbSqlQueryPlanRenderer(DefaultSqlQueryPlanRenderer):
     @override
     def expr_renderer(self) -> SqlExpressionRenderer:
         return self.EXPR_RENDERER
+
+    @property
+    @override
+    def supports_qualify(self) -> bool:
+        return True
@@ -248,9 +248,12 @@ class DefaultSqlExpressionRenderer(SqlExpressionRenderer):
 
     def visit_is_null_expr(self, node: SqlIsNullExpression) -> SqlExpressionRenderResult:  # noqa: D
         arg_rendered = self.render_sql_expr(node.arg)
+        operator = "IS NOT NULL" if node.negated else "IS NULL"
 
         return SqlExpressionRenderResult(
-            sql=f"{arg_rendered.sql} IS NULL" if not node.arg.requires_parenthesis else f"({arg_rendered.sql}) IS NULL",
+            sql=f"{arg_rendered.sql} {operator}"
+            if not node.arg.requires_parenthesis
+            else f"({arg_rendered.sql}) {operator}",
             bind_parameters=arg_rendered.bind_parameters,
         )
 
@@ -367,7 +370,7 @@ class DefaultSqlExpressionRenderer(SqlExpressionRenderer):
                         for rendered_result, x in order_by_args_rendered.items()
                     ]
                 )
-                + " ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING"
+                + f" {node.frame.sql}"
             )
             if order_by_args_rendered
             else ""
@@ -82,3 +82,8 @@ class SnowflakeSqlQueryPlanRenderer(DefaultSqlQueryPlanRenderer):
     @override
     def expr_renderer(self) -> SqlExpressionRenderer:
         return self.EXPR_RENDERER
+
+    @property
+    @override
+    def supports_qualify(self) -> bool:
+        return True
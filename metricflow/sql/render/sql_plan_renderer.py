@@ -3,8 +3,9 @@ from __future__ import annotations
 import logging
 import textwrap
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from metricflow.sql.render.expr_renderer import (
     DefaultSqlExpressionRenderer,
@@ -12,8 +13,12 @@ from metricflow.sql.render.expr_renderer import (
     SqlExpressionRenderResult,
 )
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql.sql_exprs import SqlColumnReference, SqlColumnReferenceExpression
 from metricflow.sql.sql_plan import (
+    SqlCommonTableExpression,
+    SqlCteFromClauseNode,
     SqlJoinDescription,
+    SqlOrderByDescription,
     SqlQueryPlan,
     SqlQueryPlanNode,
     SqlQueryPlanNodeVisitor,
@@ -37,11 +42,176 @@ class SqlPlanRenderResult:  # noqa: D
 class SqlQueryPlanRenderer(SqlQueryPlanNodeVisitor[SqlPlanRenderResult], ABC):
     """Renders SQL plans to a string."""
 
+    # The prefix for the names of the CTEs that are created for sub-queries that are used more than once.
+    SHARED_SUB_QUERY_CTE_PREFIX = "shared_subq"
+
+    def __init__(self, render_shared_sub_queries_as_ctes: bool = False) -> None:
+        """Constructor.
+
+        Args:
+            render_shared_sub_queries_as_ctes: If set, sub-queries that are used in more than one place in the query
+            (i.e. the same node is reached through different paths, or different nodes render to the same SQL) are
+            rendered once in the WITH clause, and read from there instead of being repeated.
+        """
+        self._render_shared_sub_queries_as_ctes = render_shared_sub_queries_as_ctes
+
+    @property
+    def render_shared_sub_queries_as_ctes(self) -> bool:  # noqa: D
+        return self._render_shared_sub_queries_as_ctes
+
     def _render_node(self, node: SqlQueryPlanNode) -> SqlPlanRenderResult:  # noqa: D
         return node.accept(self)
 
-    def render_sql_query_plan(self, sql_query_plan: SqlQueryPlan) -> SqlPlanRenderResult:  # noqa: D
-        return self._render_node(sql_query_plan.render_node)
+    def render_sql_query_plan(self, sql_query_plan: SqlQueryPlan) -> SqlPlanRenderResult:
+        """Render the plan, with the common table expressions of the plan in a WITH clause before the query.
+
+        e.g.
+        WITH cte_0 AS (
+          SELECT ...
+        )
+        SELECT ...
+        FROM cte_0 subq_1
+        """
+        if self._render_shared_sub_queries_as_ctes:
+            sql_query_plan = self._extract_shared_sub_queries(sql_query_plan)
+
+        render_result = self._render_node(sql_query_plan.render_node)
+        if len(sql_query_plan.common_table_expressions) == 0:
+            return render_result
+
+        params = SqlBindParameters()
+        with_section_lines: List[str] = []
+        for i, common_table_expression in enumerate(sql_query_plan.common_table_expressions):
+            cte_render_result = self._render_node(common_table_expression.select_node)
+            params = params.combine(cte_render_result.bind_parameters)
+            with_section_lines.append(f"{'WITH' if i == 0 else ','} {common_table_expression.name} AS (")
+            with_section_lines.append(textwrap.indent(cte_render_result.sql, prefix="  "))
+            with_section_lines.append(")")
+
+        return SqlPlanRenderResult(
+            sql="\n".join(with_section_lines + [render_result.sql]),
+            bind_parameters=params.combine(render_result.bind_parameters),
+        )
+
+    def _extract_shared_sub_queries(self, sql_query_plan: SqlQueryPlan) -> SqlQueryPlan:
+        """Return a plan where the sub-queries that are used more than once are replaced by reads from CTEs.
+
+        Sub-queries are considered to be the same if they're structurally identical, i.e. they render to the same SQL
+        and bind parameters, and read from the same sources. Occurrences within a sub-query that is itself repeated are
+        only counted once, since that sub-query will only be rendered once.
+        """
+        # Maps the sub-queries in the plan to a key that's the same for structurally identical sub-queries.
+        node_to_key: Dict[SqlQueryPlanNode, Tuple[str, SqlBindParameters]] = {}
+        key_to_reference_count: Dict[Tuple[str, SqlBindParameters], int] = defaultdict(int)
+
+        # Numbers the distinct keys, so that the key of a sub-query can refer to the keys of its sources.
+        key_to_index: Dict[Tuple[str, SqlBindParameters], int] = {}
+
+        def structural_key(node: SqlQueryPlanNode) -> Tuple[str, SqlBindParameters]:
+            key = node_to_key.get(node)
+            if key is not None:
+                return key
+
+            # Only the node itself is rendered, with each sub-query source replaced by a placeholder for its key, so
+            # the SQL for a nested sub-query isn't rendered again for every sub-query that contains it.
+            def placeholder_source(source_node: SqlQueryPlanNode) -> SqlQueryPlanNode:
+                if source_node.is_table:
+                    return source_node
+                return SqlCteFromClauseNode(cte_name=f"sub_query_{key_to_index[structural_key(source_node)]}")
+
+            select_node = node.as_select_node
+            render_result = self._render_node(
+                self._replace_sources(select_node, placeholder_source) if select_node is not None else node
+            )
+            key = (render_result.sql, render_result.bind_parameters)
+            key_to_index.setdefault(key, len(key_to_index))
+            node_to_key[node] = key
+            return key
+
+        def count_references(node: SqlQueryPlanNode) -> None:
+            for parent_node in node.parent_nodes:
+                if parent_node.is_table:
+                    continue
+                key = structural_key(parent_node)
+                key_to_reference_count[key] += 1
+                if key_to_reference_count[key] == 1:
+                    count_references(parent_node)
+
+        for common_table_expression in sql_query_plan.common_table_expressions:
+            count_references(common_table_expression.select_node)
+        count_references(sql_query_plan.render_node)
+
+        if all(reference_count == 1 for reference_count in key_to_reference_count.values()):
+            return sql_query_plan
+
+        common_table_expressions: List[SqlCommonTableExpression] = []
+        key_to_cte_name: Dict[Tuple[str, SqlBindParameters], str] = {}
+
+        def replace_source(source_node: SqlQueryPlanNode) -> SqlQueryPlanNode:
+            if source_node.is_table:
+                return source_node
+            key = node_to_key[source_node]
+            if key_to_reference_count[key] == 1:
+                return replace_shared_sources(source_node)
+
+            if key not in key_to_cte_name:
+                # The CTEs that this sub-query reads from are added to the list first.
+                select_node = replace_shared_sources(source_node)
+                cte_name = f"{self.SHARED_SUB_QUERY_CTE_PREFIX}_{len(key_to_cte_name)}"
+                common_table_expressions.append(SqlCommonTableExpression(name=cte_name, select_node=select_node))
+                key_to_cte_name[key] = cte_name
+            return SqlCteFromClauseNode(cte_name=key_to_cte_name[key])
+
+        def replace_shared_sources(node: SqlQueryPlanNode) -> SqlQueryPlanNode:
+            select_node = node.as_select_node
+            if select_node is None:
+                return node
+            return self._replace_sources(select_node, replace_source)
+
+        for common_table_expression in sql_query_plan.common_table_expressions:
+            common_table_expressions.append(
+                SqlCommonTableExpression(
+                    name=common_table_expression.name,
+                    select_node=replace_shared_sources(common_table_expression.select_node),
+                )
+            )
+        render_node = replace_shared_sources(sql_query_plan.render_node)
+
+        return SqlQueryPlan(
+            plan_id=sql_query_plan.dag_id.id_str,
+            render_node=render_node,
+            common_table_expressions=common_table_expressions,
+        )
+
+    @staticmethod
+    def _replace_sources(
+        select_node: SqlSelectStatementNode, replace_source: Callable[[SqlQueryPlanNode], SqlQueryPlanNode]
+    ) -> SqlSelectStatementNode:
+        """Return the SELECT statement with the FROM and join sources replaced using the given function."""
+        from_source = replace_source(select_node.from_source)
+        join_descs = tuple(
+            replace(join_desc, right_source=replace_source(join_desc.right_source))
+            for join_desc in select_node.join_descs
+        )
+        if from_source is select_node.from_source and all(
+            new_join_desc.right_source is join_desc.right_source
+            for new_join_desc, join_desc in zip(join_descs, select_node.join_descs)
+        ):
+            return select_node
+
+        return SqlSelectStatementNode(
+            description=select_node.description,
+            select_columns=select_node.select_columns,
+            from_source=from_source,
+            from_source_alias=select_node.from_source_alias,
+            joins_descs=join_descs,
+            group_bys=select_node.group_bys,
+            order_bys=select_node.order_bys,
+            where=select_node.where,
+            limit=select_node.limit,
+            distinct=select_node.distinct,
+            qualify=select_node.qualify,
+        )
 
     @property
     @abstractmethod
@@ -49,6 +219,27 @@ class SqlQueryPlanRenderer(SqlQueryPlanNodeVisitor[SqlPlanRenderResult], ABC):
         """Return the renderer that this uses to render expressions."""
         pass
 
+    @property
+    def supports_qualify(self) -> bool:
+        """Returns true if the engine supports the QUALIFY clause.
+
+        If not, SELECT statements with a QUALIFY are rendered as a sub-query that computes the condition as a column,
+        and an outer query that filters on that column.
+        """
+        return False
+
+    @property
+    def supports_window_functions(self) -> bool:
+        """Returns true if the engine supports window functions with frames.
+
+        e.g. SUM(bookings) OVER (PARTITION BY country ORDER BY ds ROWS BETWEEN 6 PRECEDING AND CURRENT ROW)
+
+        If so, MetricFlowEngine computes cumulative metrics with additive measures using window functions over the
+        daily aggregates, and selects the rows for semi-additive measures with a window function instead of joining the
+        input to an aggregation of itself.
+        """
+        return True
+
 
 @dataclass
 class StringJoinDescription:
@@ -67,6 +258,10 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
     EXPR_RENDERER = DefaultSqlExpressionRenderer()
     # The amount to indent when formatting SQL
     INDENT = "  "
+    # When QUALIFY isn't supported, the column and source aliases used for the sub-query that computes the condition.
+    QUALIFY_CONDITION_COLUMN_ALIAS = "qualify_condition"
+    QUALIFY_SUB_QUERY_ALIAS = "qualify_subq"
+    QUALIFY_ORDER_BY_COLUMN_ALIAS_PREFIX = "qualify_order_by"
 
     def _render_select_columns_section(
         self,
@@ -210,7 +405,99 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
 
         return "\n".join(group_by_section_lines), params
 
+    def _qualify_as_sub_query(self, node: SqlSelectStatementNode) -> SqlSelectStatementNode:
+        """Return a SELECT statement without a QUALIFY that's equivalent to the given one.
+
+        e.g.
+        SELECT a.col0 AS col0
+        FROM foo a
+        QUALIFY a.col1 = MAX(a.col1) OVER (PARTITION BY a.col0)
+
+        is converted to:
+
+        SELECT qualify_subq.col0 AS col0
+        FROM (
+          SELECT
+            a.col0 AS col0
+            , a.col1 = MAX(a.col1) OVER (PARTITION BY a.col0) AS qualify_condition
+          FROM foo a
+        ) qualify_subq
+        WHERE qualify_subq.qualify_condition
+        """
+        assert node.qualify is not None
+        # ORDER BY and LIMIT are evaluated after QUALIFY, so they're moved to the outer query. Ordering expressions that
+        # aren't already selected are passed through the sub-query as additional columns.
+        order_by_columns: List[SqlSelectColumn] = []
+        outer_order_bys: List[SqlOrderByDescription] = []
+        for order_by in node.order_bys:
+            matching_column = next(
+                (
+                    select_column
+                    for select_column in tuple(node.select_columns) + tuple(order_by_columns)
+                    if select_column.expr.matches(order_by.expr)
+                ),
+                None,
+            )
+            if matching_column is None:
+                matching_column = SqlSelectColumn(
+                    expr=order_by.expr,
+                    column_alias=f"{self.QUALIFY_ORDER_BY_COLUMN_ALIAS_PREFIX}_{len(order_by_columns)}",
+                )
+                order_by_columns.append(matching_column)
+            outer_order_bys.append(
+                SqlOrderByDescription(
+                    expr=SqlColumnReferenceExpression(
+                        SqlColumnReference(
+                            table_alias=self.QUALIFY_SUB_QUERY_ALIAS, column_name=matching_column.column_alias
+                        )
+                    ),
+                    desc=order_by.desc,
+                )
+            )
+
+        sub_query = SqlSelectStatementNode(
+            description=node.description,
+            select_columns=tuple(node.select_columns)
+            + tuple(order_by_columns)
+            + (SqlSelectColumn(expr=node.qualify, column_alias=self.QUALIFY_CONDITION_COLUMN_ALIAS),),
+            from_source=node.from_source,
+            from_source_alias=node.from_source_alias,
+            joins_descs=node.join_descs,
+            group_bys=node.group_bys,
+            order_bys=(),
+            where=node.where,
+        )
+        return SqlSelectStatementNode(
+            description="Filter Rows Using The Window Function Condition",
+            select_columns=tuple(
+                SqlSelectColumn(
+                    expr=SqlColumnReferenceExpression(
+                        SqlColumnReference(
+                            table_alias=self.QUALIFY_SUB_QUERY_ALIAS, column_name=select_column.column_alias
+                        )
+                    ),
+                    column_alias=select_column.column_alias,
+                )
+                for select_column in node.select_columns
+            ),
+            from_source=sub_query,
+            from_source_alias=self.QUALIFY_SUB_QUERY_ALIAS,
+            joins_descs=(),
+            group_bys=(),
+            order_bys=tuple(outer_order_bys),
+            where=SqlColumnReferenceExpression(
+                SqlColumnReference(
+                    table_alias=self.QUALIFY_SUB_QUERY_ALIAS, column_name=self.QUALIFY_CONDITION_COLUMN_ALIAS
+                )
+            ),
+            limit=node.limit,
+            distinct=node.distinct,
+        )
+
     def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlPlanRenderResult:  # noqa: D
+        if node.qualify is not None and not self.supports_qualify:
+            return self._render_node(self._qualify_as_sub_query(node))
+
         # Keep track of all execution parameters for all expressions
         combined_params = SqlBindParameters()
 
@@ -242,6 +529,13 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
             combined_params = combined_params.combine(where_render_result.bind_parameters)
             where_section = f"WHERE {where_render_result.sql}"
 
+        # Render "QUALIFY" section
+        qualify_section = None
+        if node.qualify:
+            qualify_render_result = self.EXPR_RENDERER.render_sql_expr(node.qualify)
+            combined_params = combined_params.combine(qualify_render_result.bind_parameters)
+            qualify_section = f"QUALIFY {qualify_render_result.sql}"
+
         # Render "ORDER BY" section
         order_by_section = None
         if node.order_bys:
@@ -276,6 +570,9 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
         if group_by_section:
             sections_to_render.append(group_by_section)
 
+        if qualify_section:
+            sections_to_render.append(qualify_section)
+
         if order_by_section:
             sections_to_render.append(order_by_section)
 
@@ -299,6 +596,12 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
             bind_parameters=SqlBindParameters(),
         )
 
+    def visit_cte_from_clause_node(self, node: SqlCteFromClauseNode) -> SqlPlanRenderResult:  # noqa: D
+        return SqlPlanRenderResult(
+            sql=node.cte_name,
+            bind_parameters=SqlBindParameters(),
+        )
+
     @property
     def expr_renderer(self) -> SqlExpressionRenderer:  # noqa :D
         return self.EXPR_RENDERER
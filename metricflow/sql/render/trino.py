@@ -92,8 +92,15 @@ class TrinoSqlExpressionRenderer(DefaultSqlExpressionRenderer):
         bind_parameters = bind_parameters.combine(rendered_start_expr.bind_parameters)
         bind_parameters = bind_parameters.combine(rendered_end_expr.bind_parameters)
 
+        # Bounds that are bind parameters (e.g. for a parameterized time range constraint) are passed as strings, which
+        # Trino doesn't implicitly cast.
+        if rendered_start_expr.bind_parameters.param_dict:
+            sql = (
+                f"{rendered_column_arg.sql} BETWEEN CAST({rendered_start_expr.sql} AS timestamp) "
+                f"AND CAST({rendered_end_expr.sql} AS timestamp)"
+            )
         # Handle timestamp literals differently.
-        if parse(rendered_start_expr.sql):
+        elif parse(rendered_start_expr.sql):
             sql = f"{rendered_column_arg.sql} BETWEEN timestamp {rendered_start_expr.sql} AND timestamp {rendered_end_expr.sql}"
         else:
             sql = f"{rendered_column_arg.sql} BETWEEN {rendered_start_expr.sql} AND {rendered_end_expr.sql}"
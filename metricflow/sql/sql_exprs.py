@@ -44,6 +44,7 @@ class SqlExpressionNode(DagNode, Visitable, ABC):
 
     def __init__(self, node_id: NodeId, parent_nodes: List[SqlExpressionNode]) -> None:  # noqa: D
         self._parent_nodes = parent_nodes
+        self._lineage: Optional[SqlExpressionTreeLineage] = None
         super().__init__(node_id=node_id)
 
     @property
@@ -104,9 +105,19 @@ class SqlExpressionNode(DagNode, Visitable, ABC):
         pass
 
     @property
-    @abstractmethod
     def lineage(self) -> SqlExpressionTreeLineage:
-        """Returns all nodes in the paths from this node to the root nodes."""
+        """Returns all nodes in the paths from this node to the root nodes.
+
+        Expressions are immutable, so this is only computed once. The optimizers check the lineage of the same
+        expressions many times, so recomputing it on every access is slow for queries with many columns.
+        """
+        if self._lineage is None:
+            self._lineage = self._compute_lineage()
+        return self._lineage
+
+    @abstractmethod
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:
+        """Compute the lineage of this node. The lineage of the parent nodes should be retrieved through lineage."""
         pass
 
     def _parents_match(self, other: SqlExpressionNode) -> bool:  # noqa: D
@@ -320,8 +331,7 @@ class SqlStringExpression(SqlExpressionNode):
             raise NotImplementedError()
         return self
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage(string_exprs=(self,))
 
     def matches(self, other: SqlExpressionNode) -> bool:  # noqa: D
@@ -383,8 +393,7 @@ class SqlStringLiteralExpression(SqlExpressionNode):
     ) -> SqlExpressionNode:
         return self
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage(other_exprs=(self,))
 
     def matches(self, other: SqlExpressionNode) -> bool:  # noqa: D
@@ -480,8 +489,7 @@ class SqlColumnReferenceExpression(SqlExpressionNode):
             col_ref=self.col_ref, should_render_table_alias=self.should_render_table_alias
         )
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage(column_reference_exprs=(self,))
 
     @property
@@ -543,8 +551,7 @@ class SqlColumnAliasReferenceExpression(SqlExpressionNode):
             raise NotImplementedError()
         return self
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage(column_alias_reference_exprs=(self,))
 
     def matches(self, other: SqlExpressionNode) -> bool:  # noqa: D
@@ -626,8 +633,7 @@ class SqlComparisonExpression(SqlExpressionNode):
             right_expr=self.right_expr.rewrite(column_replacements, should_render_table_alias),
         )
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine(
             tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(other_exprs=(self,)),)
         )
@@ -822,8 +828,7 @@ class SqlAggregateFunctionExpression(SqlFunctionExpression):
     def is_aggregate_function(self) -> bool:  # noqa: D
         return True
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine(
             tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(function_exprs=(self,)),)
         )
@@ -943,8 +948,7 @@ class SqlPercentileExpression(SqlFunctionExpression):
     def is_aggregate_function(self) -> bool:  # noqa: D
         return True
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine(
             tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(function_exprs=(self,)),)
         )
@@ -963,6 +967,10 @@ class SqlWindowFunction(Enum):
 
     FIRST_VALUE = "first_value"
     ROW_NUMBER = "row_number"
+    SUM = "sum"
+    COUNT = "count"
+    MIN = "min"
+    MAX = "max"
 
 
 @dataclass(frozen=True)
@@ -984,6 +992,34 @@ class SqlWindowOrderByArgument:
         return " ".join(result)
 
 
+@dataclass(frozen=True)
+class SqlWindowFrame:
+    """The rows in a partition that a window function is computed over, relative to the current row.
+
+    If preceding_rows / following_rows is None, the frame is unbounded in that direction. The default is the whole
+    partition.
+    """
+
+    preceding_rows: Optional[int] = None
+    following_rows: Optional[int] = None
+
+    @staticmethod
+    def _bound_sql(row_count: Optional[int], direction: str) -> str:
+        if row_count is None:
+            return f"UNBOUNDED {direction}"
+        if row_count == 0:
+            return "CURRENT ROW"
+        return f"{row_count} {direction}"
+
+    @property
+    def sql(self) -> str:
+        """The frame clause used in rendering e.g. ROWS BETWEEN 6 PRECEDING AND CURRENT ROW."""
+        return (
+            f"ROWS BETWEEN {SqlWindowFrame._bound_sql(self.preceding_rows, 'PRECEDING')} "
+            f"AND {SqlWindowFrame._bound_sql(self.following_rows, 'FOLLOWING')}"
+        )
+
+
 class SqlWindowFunctionExpression(SqlFunctionExpression):
     """A window function expression like SUM(foo) OVER bar."""
 
@@ -993,6 +1029,7 @@ class SqlWindowFunctionExpression(SqlFunctionExpression):
         sql_function_args: Optional[List[SqlExpressionNode]] = None,
         partition_by_args: Optional[List[SqlExpressionNode]] = None,
         order_by_args: Optional[List[SqlWindowOrderByArgument]] = None,
+        frame: SqlWindowFrame = SqlWindowFrame(),
     ) -> None:
         """Constructor.
 
@@ -1003,11 +1040,13 @@ class SqlWindowFunctionExpression(SqlFunctionExpression):
             partition_by_args: The arguments to partition the rows. e.g. PARTITION BY expr1, expr2,
                                the args are "expr1", "expr2".
             order_by_args: The expr to order the partitions by.
+            frame: The rows that the function is computed over when order_by_args is specified.
         """
         self._sql_function = sql_function
         self._sql_function_args = sql_function_args
         self._partition_by_args = partition_by_args
         self._order_by_args = order_by_args
+        self._frame = frame
         parent_nodes = []
         if sql_function_args:
             parent_nodes.extend(sql_function_args)
@@ -1058,6 +1097,10 @@ class SqlWindowFunctionExpression(SqlFunctionExpression):
     def order_by_args(self) -> List[SqlWindowOrderByArgument]:  # noqa: D
         return self._order_by_args or []
 
+    @property
+    def frame(self) -> SqlWindowFrame:  # noqa: D
+        return self._frame
+
     @property
     def is_aggregate_function(self) -> bool:  # noqa: D
         return False
@@ -1086,10 +1129,10 @@ class SqlWindowFunctionExpression(SqlFunctionExpression):
                 )
                 for x in self.order_by_args
             ],
+            frame=self.frame,
         )
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine(
             tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(function_exprs=(self,)),)
         )
@@ -1100,6 +1143,7 @@ class SqlWindowFunctionExpression(SqlFunctionExpression):
         return (
             self.sql_function == other.sql_function
             and self.order_by_args == other.order_by_args
+            and self.frame == other.frame
             and self._parents_match(other)
         )
 
@@ -1132,8 +1176,7 @@ class SqlNullExpression(SqlExpressionNode):
     ) -> SqlExpressionNode:
         return self
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage(other_exprs=(self,))
 
     def matches(self, other: SqlExpressionNode) -> bool:  # noqa: D
@@ -1190,8 +1233,7 @@ class SqlLogicalExpression(SqlExpressionNode):
             args=tuple(x.rewrite(column_replacements, should_render_table_alias) for x in self.args),
         )
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine(
             tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(other_exprs=(self,)),)
         )
@@ -1203,10 +1245,11 @@ class SqlLogicalExpression(SqlExpressionNode):
 
 
 class SqlIsNullExpression(SqlExpressionNode):
-    """An IS NULL expression like "foo IS NULL"."""
+    """An IS NULL expression like "foo IS NULL", or "foo IS NOT NULL" if negated."""
 
-    def __init__(self, arg: SqlExpressionNode) -> None:  # noqa: D
+    def __init__(self, arg: SqlExpressionNode, negated: bool = False) -> None:  # noqa: D
         self._arg = arg
+        self._negated = negated
         super().__init__(node_id=self.create_unique_id(), parent_nodes=[arg])
 
     @classmethod
@@ -1222,27 +1265,32 @@ class SqlIsNullExpression(SqlExpressionNode):
 
     @property
     def description(self) -> str:  # noqa: D
-        return "IS NULL Expression"
+        return "IS NOT NULL Expression" if self.negated else "IS NULL Expression"
 
     @property
     def arg(self) -> SqlExpressionNode:  # noqa: D
         return self._arg
 
+    @property
+    def negated(self) -> bool:  # noqa: D
+        return self._negated
+
     def rewrite(  # noqa: D
         self,
         column_replacements: Optional[SqlColumnReplacements] = None,
         should_render_table_alias: Optional[bool] = None,
     ) -> SqlExpressionNode:
-        return SqlIsNullExpression(arg=self.arg.rewrite(column_replacements, should_render_table_alias))
+        return SqlIsNullExpression(
+            arg=self.arg.rewrite(column_replacements, should_render_table_alias), negated=self.negated
+        )
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine([self.arg.lineage, SqlExpressionTreeLineage(other_exprs=(self,))])
 
     def matches(self, other: SqlExpressionNode) -> bool:  # noqa: D
         if not isinstance(other, SqlIsNullExpression):
             return False
-        return self._parents_match(other)
+        return self.negated == other.negated and self._parents_match(other)
 
 
 class SqlSubtractTimeIntervalExpression(SqlExpressionNode):
@@ -1303,8 +1351,7 @@ class SqlSubtractTimeIntervalExpression(SqlExpressionNode):
             granularity=self.granularity,
         )
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine(
             tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(other_exprs=(self,)),)
         )
@@ -1348,8 +1395,7 @@ class SqlCastToTimestampExpression(SqlExpressionNode):
     ) -> SqlExpressionNode:
         return SqlCastToTimestampExpression(arg=self.arg.rewrite(column_replacements, should_render_table_alias))
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine(
             tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(other_exprs=(self,)),)
         )
@@ -1406,8 +1452,7 @@ class SqlDateTruncExpression(SqlExpressionNode):
             time_granularity=self.time_granularity, arg=self.arg.rewrite(column_replacements, should_render_table_alias)
         )
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine(
             tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(other_exprs=(self,)),)
         )
@@ -1464,8 +1509,7 @@ class SqlExtractExpression(SqlExpressionNode):
             date_part=self.date_part, arg=self.arg.rewrite(column_replacements, should_render_table_alias)
         )
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine(
             tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(other_exprs=(self,)),)
         )
@@ -1529,8 +1573,7 @@ class SqlRatioComputationExpression(SqlExpressionNode):
             denominator=self.denominator.rewrite(column_replacements, should_render_table_alias),
         )
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine(
             tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(other_exprs=(self,)),)
         )
@@ -1590,8 +1633,7 @@ class SqlBetweenExpression(SqlExpressionNode):
             end_expr=self.end_expr.rewrite(column_replacements, should_render_table_alias),
         )
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage.combine(
             tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(other_exprs=(self,)),)
         )
@@ -1641,8 +1683,7 @@ class SqlGenerateUuidExpression(SqlExpressionNode):
     ) -> SqlExpressionNode:
         return self
 
-    @property
-    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+    def _compute_lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
         return SqlExpressionTreeLineage(other_exprs=(self,))
 
     def matches(self, other: SqlExpressionNode) -> bool:  # noqa: D
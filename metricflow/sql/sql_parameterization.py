@@ -0,0 +1,225 @@
+"""Helpers for the bind parameters of time range constraints, and for filling bind parameters in on the client.
+
+Placeholders for bind parameters are rendered using the SQLAlchemy-style syntax ":key", which is what
+SqlClient.render_bind_parameter_key() returns for the supported clients.
+"""
+from __future__ import annotations
+
+import datetime
+import math
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from metricflow.errors.errors import SqlBindParametersNotSupportedError
+from metricflow.filters.time_constraint import TimeRangeConstraint
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql.sql_column_type import SqlColumnType
+from metricflow.time.time_constants import ISO8601_PYTHON_FORMAT
+
+# Prefix for the keys of bind parameters that are generated by MetricFlow.
+GENERATED_BIND_PARAMETER_KEY_PREFIX = "mf_param"
+# Prefixes for the keys of generated bind parameters for the start / end of a time range constraint. These allow the
+# plans for a query to be reused for a different time range by replacing the values.
+TIME_RANGE_START_BIND_PARAMETER_KEY_PREFIX = f"{GENERATED_BIND_PARAMETER_KEY_PREFIX}_time_range_start"
+TIME_RANGE_END_BIND_PARAMETER_KEY_PREFIX = f"{GENERATED_BIND_PARAMETER_KEY_PREFIX}_time_range_end"
+
+_GENERATED_BIND_PARAMETER_KEY_PATTERN = re.compile(
+    rf"^(?P<prefix>{GENERATED_BIND_PARAMETER_KEY_PREFIX}(?:_time_range_start|_time_range_end)?)_\d+$"
+)
+
+# Matches ":key", but not the "::" cast operator or path expressions like "col:field".
+_PLACEHOLDER_PATTERN = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+
+
+@dataclass(frozen=True)
+class _SqlSegment:
+    """A part of a SQL statement.
+
+    Attributes:
+        text: The SQL for the segment.
+        is_code: False if the segment is a string literal, a quoted identifier, or a comment.
+    """
+
+    text: str
+    is_code: bool
+
+
+def _split_sql(sql: str, backslash_escapes: bool) -> Iterator[_SqlSegment]:
+    """Split the SQL into code and non-code segments, so that changes are only made to code.
+
+    If backslash_escapes is set, a backslash in a string literal escapes the next character, e.g. a quote.
+    """
+    code_start = 0
+    index = 0
+    while index < len(sql):
+        char = sql[index]
+        end = -1
+        if char == "'":
+            end = index + 1
+            while end < len(sql):
+                if backslash_escapes and sql[end] == "\\":
+                    end += 2
+                    continue
+                if sql[end] == "'":
+                    # A doubled quote is an escaped quote.
+                    if end + 1 < len(sql) and sql[end + 1] == "'":
+                        end += 2
+                        continue
+                    break
+                end += 1
+            end = min(end, len(sql)) + 1
+        elif char in ('"', "`"):
+            end = sql.find(char, index + 1)
+            end = len(sql) if end == -1 else end + 1
+        elif sql.startswith("--", index):
+            end = sql.find("\n", index)
+            end = len(sql) if end == -1 else end
+        elif sql.startswith("/*", index):
+            end = sql.find("*/", index + 2)
+            end = len(sql) if end == -1 else end + 2
+
+        if end == -1:
+            index += 1
+            continue
+
+        if code_start < index:
+            yield _SqlSegment(text=sql[code_start:index], is_code=True)
+        yield _SqlSegment(text=sql[index:end], is_code=False)
+        code_start = end
+        index = end
+
+    if code_start < len(sql):
+        yield _SqlSegment(text=sql[code_start:], is_code=True)
+
+
+def canonicalize_generated_bind_parameter_keys(
+    sql: str,
+    bind_parameters: SqlBindParameters,
+    bind_parameter_key_renderer: Callable[[str], str],
+    backslash_escapes: bool = False,
+) -> Tuple[str, SqlBindParameters]:
+    """Renumber the keys of generated bind parameters in the order that they appear in the SQL.
+
+    Generated keys are unique across all queries, so this makes the SQL the same for queries that only differ in the
+    values of the bind parameters. This allows the SQL to be used as a template.
+    """
+    generated_key_to_prefix: Dict[str, str] = {}
+    for key in bind_parameters.param_dict:
+        match = _GENERATED_BIND_PARAMETER_KEY_PATTERN.match(key)
+        if match:
+            generated_key_to_prefix[key] = match.group("prefix")
+    if len(generated_key_to_prefix) == 0:
+        return sql, bind_parameters
+
+    placeholder_to_key = {bind_parameter_key_renderer(key): key for key in generated_key_to_prefix}
+    key_replacements: Dict[str, str] = {}
+    canonical_sql_parts: List[str] = []
+    placeholder_pattern = re.compile(
+        "(?:"
+        + "|".join(re.escape(placeholder) for placeholder in sorted(placeholder_to_key, key=len, reverse=True))
+        + r")(?!\w)"
+    )
+
+    def _replace_placeholder(match: re.Match[str]) -> str:
+        key = placeholder_to_key[match.group(0)]
+        if key not in key_replacements:
+            key_replacements[key] = f"{generated_key_to_prefix[key]}_{len(key_replacements)}"
+        return bind_parameter_key_renderer(key_replacements[key])
+
+    for segment in _split_sql(sql, backslash_escapes=backslash_escapes):
+        canonical_sql_parts.append(
+            placeholder_pattern.sub(_replace_placeholder, segment.text) if segment.is_code else segment.text
+        )
+    # Keys without a placeholder in the SQL also need to be renumbered so that they don't conflict with the new keys.
+    for key, prefix in generated_key_to_prefix.items():
+        if key not in key_replacements:
+            key_replacements[key] = f"{prefix}_{len(key_replacements)}"
+
+    return "".join(canonical_sql_parts), SqlBindParameters.create_from_dict(
+        {key_replacements.get(key, key): value for key, value in bind_parameters.param_dict.items()}
+    )
+
+
+def time_range_bind_parameter_value(time: datetime.datetime) -> str:
+    """Return the value of the bind parameter for the start / end of a time range constraint."""
+    return time.strftime(ISO8601_PYTHON_FORMAT)
+
+
+def bind_time_range_constraint(
+    bind_parameters: SqlBindParameters, time_range_constraint: TimeRangeConstraint
+) -> SqlBindParameters:
+    """Return the bind parameters with the values for the start / end of time range constraints replaced."""
+    param_dict: Dict[str, SqlColumnType] = {}
+    for key, value in bind_parameters.param_dict.items():
+        if key.startswith(TIME_RANGE_START_BIND_PARAMETER_KEY_PREFIX):
+            value = time_range_bind_parameter_value(time_range_constraint.start_time)
+        elif key.startswith(TIME_RANGE_END_BIND_PARAMETER_KEY_PREFIX):
+            value = time_range_bind_parameter_value(time_range_constraint.end_time)
+        param_dict[key] = value
+    return SqlBindParameters.create_from_dict(param_dict)
+
+
+def _render_literal(value: SqlColumnType, timestamp_data_type: str, backslash_escapes: bool) -> str:
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    elif isinstance(value, int):
+        return str(value)
+    elif isinstance(value, float):
+        if not math.isfinite(value):
+            raise SqlBindParametersNotSupportedError(f"Can't render the non-finite float {value} as a SQL literal")
+        return repr(value)
+    elif isinstance(value, datetime.datetime):
+        return f"CAST('{value.isoformat(sep=' ')}' AS {timestamp_data_type})"
+    elif isinstance(value, datetime.date):
+        return f"CAST('{value.isoformat()}' AS DATE)"
+    elif isinstance(value, str):
+        if "\x00" in value:
+            raise SqlBindParametersNotSupportedError("Can't render a string containing a null character as a literal")
+        if backslash_escapes:
+            return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+        return "'" + value.replace("'", "''") + "'"
+    raise SqlBindParametersNotSupportedError(f"Can't render a value of type {type(value)} as a SQL literal")
+
+
+def substitute_bind_parameters(
+    sql: str,
+    bind_parameters: SqlBindParameters,
+    timestamp_data_type: str = "TIMESTAMP",
+    backslash_escapes: bool = False,
+) -> str:
+    """Replace the placeholders for the bind parameters with literals, for clients that can't bind parameters.
+
+    Values are rendered as escaped literals, and placeholders in string literals, quoted identifiers, and comments are
+    not replaced, so the values can't change the structure of the statement.
+
+    Args:
+        sql: The SQL with ":key" placeholders.
+        bind_parameters: The values for the placeholders.
+        timestamp_data_type: The name of the timestamp type for the engine, used to render datetime values.
+        backslash_escapes: Whether the engine treats backslashes in string literals as escape characters.
+    """
+    param_dict = bind_parameters.param_dict
+    if len(param_dict) == 0:
+        return sql
+
+    missing_keys = set(param_dict)
+
+    def _replace_placeholder(match: re.Match[str]) -> str:
+        key = match.group(1)
+        if key not in param_dict:
+            return match.group(0)
+        missing_keys.discard(key)
+        return _render_literal(
+            param_dict[key], timestamp_data_type=timestamp_data_type, backslash_escapes=backslash_escapes
+        )
+
+    substituted_sql = "".join(
+        _PLACEHOLDER_PATTERN.sub(_replace_placeholder, segment.text) if segment.is_code else segment.text
+        for segment in _split_sql(sql, backslash_escapes=backslash_escapes)
+    )
+    if missing_keys:
+        raise SqlBindParametersNotSupportedError(
+            f"Bind parameters {sorted(missing_keys)} don't have a placeholder in the SQL:\n{sql}"
+        )
+    return substituted_sql
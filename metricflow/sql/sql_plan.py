@@ -9,6 +9,7 @@ from enum import Enum
 from typing import Generic, List, Optional, Sequence, Tuple
 
 from metricflow.dag.id_generation import (
+    SQL_PLAN_CTE_FROM_CLAUSE_ID_PREFIX,
     SQL_PLAN_SELECT_STATEMENT_ID_PREFIX,
     SQL_PLAN_TABLE_FROM_CLAUSE_ID_PREFIX,
 )
@@ -78,6 +79,10 @@ class SqlQueryPlanNodeVisitor(Generic[VisitorOutputT], ABC):
     def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> VisitorOutputT:  # noqa: D
         pass
 
+    @abstractmethod
+    def visit_cte_from_clause_node(self, node: SqlCteFromClauseNode) -> VisitorOutputT:  # noqa: D
+        pass
+
 
 @dataclass(frozen=True)
 class SqlSelectColumn:
@@ -123,7 +128,7 @@ class SqlOrderByDescription:  # noqa: D
 class SqlSelectStatementNode(SqlQueryPlanNode):
     """Represents an SQL Select statement."""
 
-    def __init__(  # noqa: D
+    def __init__(
         self,
         description: str,
         select_columns: Tuple[SqlSelectColumn, ...],
@@ -135,7 +140,13 @@ class SqlSelectStatementNode(SqlQueryPlanNode):
         where: Optional[SqlExpressionNode] = None,
         limit: Optional[int] = None,
         distinct: bool = False,
+        qualify: Optional[SqlExpressionNode] = None,
     ) -> None:
+        """Constructor.
+
+        The qualify expression filters rows after window functions are computed (i.e. a QUALIFY clause). Renderers for
+        engines without QUALIFY render an equivalent sub-query instead.
+        """
         self._description = description
         assert select_columns
         self._select_columns = select_columns
@@ -147,6 +158,7 @@ class SqlSelectStatementNode(SqlQueryPlanNode):
         self._where = where
         self._order_bys = order_bys
         self._distinct = distinct
+        self._qualify = qualify
 
         if limit is not None:
             assert limit >= 0
@@ -176,6 +188,7 @@ class SqlSelectStatementNode(SqlQueryPlanNode):
             + [DisplayedProperty("where", self._where)]
             + [DisplayedProperty(f"order_by{i}", order_by) for i, order_by in enumerate(self._order_bys)]
             + [DisplayedProperty("distinct", self._distinct)]
+            + ([DisplayedProperty("qualify", self._qualify)] if self._qualify else [])
         )
 
     @property
@@ -225,6 +238,10 @@ class SqlSelectStatementNode(SqlQueryPlanNode):
     def distinct(self) -> bool:  # noqa: D
         return self._distinct
 
+    @property
+    def qualify(self) -> Optional[SqlExpressionNode]:  # noqa: D
+        return self._qualify
+
 
 class SqlTableFromClauseNode(SqlQueryPlanNode):
     """An SQL table that can go in the FROM clause."""
@@ -294,19 +311,83 @@ class SqlSelectQueryFromClauseNode(SqlQueryPlanNode):
         return None
 
 
+class SqlCteFromClauseNode(SqlQueryPlanNode):
+    """A common table expression (CTE) defined in the WITH clause of the query that can go in the FROM clause.
+
+    The select statement for the CTE is not a parent of this node, as it's rendered once in the WITH clause of the
+    query instead of in every place that it's read from.
+    """
+
+    def __init__(self, cte_name: str) -> None:  # noqa: D
+        self._cte_name = cte_name
+        super().__init__(node_id=self.create_unique_id(), parent_nodes=[])
+
+    @classmethod
+    def id_prefix(cls) -> str:  # noqa: D
+        return SQL_PLAN_CTE_FROM_CLAUSE_ID_PREFIX
+
+    @property
+    def description(self) -> str:  # noqa: D
+        return f"Read from {self._cte_name}"
+
+    @property
+    def displayed_properties(self) -> List[DisplayedProperty]:  # noqa: D
+        return super().displayed_properties + [
+            DisplayedProperty("cte_name", self._cte_name),
+        ]
+
+    def accept(self, visitor: SqlQueryPlanNodeVisitor[VisitorOutputT]) -> VisitorOutputT:  # noqa: D
+        return visitor.visit_cte_from_clause_node(self)
+
+    @property
+    def cte_name(self) -> str:  # noqa: D
+        return self._cte_name
+
+    @property
+    def is_table(self) -> bool:  # noqa: D
+        return True
+
+    @property
+    def as_select_node(self) -> Optional[SqlSelectStatementNode]:  # noqa: D
+        return None
+
+
+@dataclass(frozen=True)
+class SqlCommonTableExpression:
+    """A query that's defined once in the WITH clause, and then read by name through SqlCteFromClauseNode."""
+
+    name: str
+    select_node: SqlQueryPlanNode
+
+
 class SqlQueryPlan(MetricFlowDag[SqlQueryPlanNode]):  # noqa: D
     """Model for an SQL Query as a DAG."""
 
-    def __init__(self, plan_id: str, render_node: SqlQueryPlanNode) -> None:
+    def __init__(
+        self,
+        plan_id: str,
+        render_node: SqlQueryPlanNode,
+        common_table_expressions: Sequence[SqlCommonTableExpression] = (),
+    ) -> None:
         """Constructor.
 
         Args:
             plan_id: The ID to associate with this plan.
             render_node: The node from which to start rendering the SQL query.
+            common_table_expressions: The CTEs to render in the WITH clause of the query. A CTE can read from the CTEs
+            that come before it.
         """
         self._render_node = render_node
-        super().__init__(dag_id=DagId.from_str(plan_id), sink_nodes=[self._render_node])
+        self._common_table_expressions = tuple(common_table_expressions)
+        super().__init__(
+            dag_id=DagId.from_str(plan_id),
+            sink_nodes=[self._render_node] + [cte.select_node for cte in self._common_table_expressions],
+        )
 
     @property
     def render_node(self) -> SqlQueryPlanNode:  # noqa: D
         return self._render_node
+
+    @property
+    def common_table_expressions(self) -> Tuple[SqlCommonTableExpression, ...]:  # noqa: D
+        return self._common_table_expressions
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from dbt_semantic_interfaces.validations.validator_helpers import SemanticManifestValidationResults
 
 from metricflow.api.metricflow_client import MetricFlowClient
@@ -68,6 +70,27 @@ def test_explain(mf_client: MetricFlowClient, mf_test_session_state: MetricFlowT
     assert result.output_table == output_table
 
 
+def test_aquery(mf_client: MetricFlowClient) -> None:  # noqa: D
+    result = asyncio.run(
+        mf_client.aquery(
+            ["bookings"],
+            ["metric_time"],
+            limit=2,
+            start_time="2019-01-01",
+            end_time="2024-01-01",
+        )
+    )
+    assert result.sql
+    assert result.result_df is not None
+    assert len(result.result_df) == 2
+
+
+def test_aexplain(mf_client: MetricFlowClient) -> None:  # noqa: D
+    result = asyncio.run(mf_client.aexplain(["bookings"], ["metric_time"]))
+    assert result.query_spec == mf_client.explain(["bookings"], ["metric_time"]).query_spec
+    assert result.rendered_sql.sql_query
+
+
 def test_list_metrics(mf_client: MetricFlowClient) -> None:  # noqa: D
     metrics = mf_client.list_metrics()
     assert metrics
@@ -13,7 +13,7 @@ from dbt_semantic_interfaces.parsing.dir_to_model import (
     parse_yaml_files_to_validation_ready_semantic_manifest,
 )
 from dbt_semantic_interfaces.parsing.objects import YamlConfigFile
-from dbt_semantic_interfaces.test_utils import base_semantic_manifest_file
+from dbt_semantic_interfaces.test_utils import as_datetime, base_semantic_manifest_file
 
 from metricflow.cli.cli_context import CLIContext
 from metricflow.cli.main import (
@@ -26,11 +26,14 @@ from metricflow.cli.main import (
     tutorial,
     validate_configs,
 )
+from metricflow.dataflow.builder.cost_model import TableStatisticsCostModel
+from metricflow.engine.metricflow_engine import MetricFlowEngine
 from metricflow.protocols.sql_client import SqlClient, SqlEngine
 from metricflow.test.fixtures.cli_fixtures import MetricFlowCliRunner
 from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
 from metricflow.test.model.example_project_configuration import EXAMPLE_PROJECT_CONFIGURATION_YAML_CONFIG_FILE
 from metricflow.test.snapshot_utils import assert_str_snapshot_equal
+from metricflow.test.time.configurable_time_source import ConfigurableTimeSource
 
 logger = logging.getLogger(__name__)
 
@@ -262,6 +265,20 @@ def test_saved_query_explain(  # noqa: D
     assert resp.exit_code == 0
 
 
+def test_explain_with_cost_estimate(cli_context: CLIContext, cli_runner: MetricFlowCliRunner) -> None:
+    """Checks that the explain output includes the cost estimate when the engine has a cost model."""
+    cli_context._mf = MetricFlowEngine(
+        semantic_manifest_lookup=cli_context.semantic_manifest_lookup,
+        sql_client=cli_context.sql_client,
+        time_source=ConfigurableTimeSource(as_datetime("2020-01-01")),
+        cost_model=TableStatisticsCostModel(table_row_counts={}, default_row_count=100),
+    )
+    resp = cli_runner.run(query, args=["--explain", "--metrics", "bookings", "--group-by", "metric_time"])
+
+    assert resp.exit_code == 0
+    assert "-- Estimated rows read: 100" in resp.output
+
+
 @pytest.mark.sql_engine_snapshot
 def test_saved_query_with_cumulative_metric(  # noqa: D
     request: FixtureRequest,
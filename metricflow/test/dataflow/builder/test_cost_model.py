@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+
+import pytest
+from dbt_semantic_interfaces.references import SemanticModelReference
+from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
+
+from metricflow.dataflow.builder.cost_model import DataflowCostModel, TableStatisticsCostModel
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.builder.source_node import SourceNodeBuilder
+from metricflow.dataflow.dataflow_plan import BaseOutput, CombineAggregatedOutputsNode
+from metricflow.dataflow.sql_column import SqlColumn
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.dataset.convert_semantic_model import SemanticModelToDataSetConverter
+from metricflow.inference.context.data_warehouse import (
+    ColumnProperties,
+    DataWarehouseInferenceContext,
+    InferenceColumnType,
+    TableProperties,
+)
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.plan_conversion.column_resolver import DunderColumnAssociationResolver
+from metricflow.plan_conversion.rollup_table import RollupTable
+from metricflow.specs.specs import EntityReference, MetricFlowQuerySpec, MetricSpec, TimeDimensionSpec
+from metricflow.test.fixtures.model_fixtures import ConsistentIdObjectRepository
+from metricflow.test.time.metric_time_dimension import MTD_SPEC_DAY
+
+ROLLUP_TABLE = SqlTable(schema_name="rollup_schema", table_name="bookings_by_day")
+
+
+def _tables_read(cost_model: DataflowCostModel, dataflow_plan_builder: DataflowPlanBuilder) -> Sequence[str]:
+    dataflow_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(metric_specs=(MetricSpec(element_name="bookings"),), time_dimension_specs=(MTD_SPEC_DAY,))
+    )
+    return [
+        table_scan_estimate.sql_table.sql
+        for table_scan_estimate in cost_model.estimate_plan_cost(dataflow_plan).table_scan_estimates
+    ]
+
+
+def _fct_bookings_table(semantic_manifest_lookup: SemanticManifestLookup) -> SqlTable:
+    bookings_source = semantic_manifest_lookup.semantic_model_lookup.get_by_reference(
+        SemanticModelReference(semantic_model_name="bookings_source")
+    )
+    assert bookings_source is not None
+    return SqlTable.from_string(bookings_source.node_relation.relation_name)
+
+
+def _create_dataflow_plan_builder(
+    semantic_manifest_lookup: SemanticManifestLookup,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    cost_model: DataflowCostModel,
+) -> DataflowPlanBuilder:
+    rollup_source_nodes = SourceNodeBuilder(semantic_manifest_lookup).create_from_rollup_tables(
+        rollup_tables=(
+            RollupTable(
+                sql_table=ROLLUP_TABLE,
+                semantic_model_name="bookings_source",
+                measure_names=("bookings",),
+                time_dimension_name="ds",
+            ),
+        ),
+        data_set_converter=SemanticModelToDataSetConverter(DunderColumnAssociationResolver(semantic_manifest_lookup)),
+    )
+    return DataflowPlanBuilder(
+        source_nodes=consistent_id_object_repository.simple_model_source_nodes,
+        read_nodes=list(consistent_id_object_repository.simple_model_read_nodes.values()),
+        semantic_manifest_lookup=semantic_manifest_lookup,
+        time_spine_source_node=consistent_id_object_repository.simple_model_time_spine_source_node,
+        rollup_source_nodes=rollup_source_nodes,
+        cost_model=cost_model,
+    )
+
+
+@pytest.mark.parametrize(
+    ("rollup_row_count", "expected_table_name"),
+    # The rollup table is used when it's estimated to have the same number of rows.
+    [(1_000, ROLLUP_TABLE.table_name), (10_000_000, ROLLUP_TABLE.table_name), (10_000_000_000, "fct_bookings")],
+)
+def test_source_with_fewest_rows_is_used(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    rollup_row_count: int,
+    expected_table_name: str,
+) -> None:
+    """Checks that the source node with the lowest estimated cost is used when multiple ones have the measure."""
+    fct_bookings = _fct_bookings_table(simple_semantic_manifest_lookup)
+    cost_model = TableStatisticsCostModel(table_row_counts={ROLLUP_TABLE: rollup_row_count, fct_bookings: 10_000_000})
+    dataflow_plan_builder = _create_dataflow_plan_builder(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        consistent_id_object_repository=consistent_id_object_repository,
+        cost_model=cost_model,
+    )
+
+    tables_read = _tables_read(cost_model, dataflow_plan_builder)
+    assert len(tables_read) == 1
+    assert tables_read[0].endswith(expected_table_name)
+
+
+@pytest.mark.parametrize("fct_bookings_row_count", [10, 10_000_000_000])
+def test_rollup_table_without_statistics_is_used(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    fct_bookings_row_count: int,
+) -> None:
+    """Checks that a rollup table without statistics is used instead of being estimated to have the default size."""
+    cost_model = TableStatisticsCostModel(
+        table_row_counts={_fct_bookings_table(simple_semantic_manifest_lookup): fct_bookings_row_count}
+    )
+    dataflow_plan_builder = _create_dataflow_plan_builder(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        consistent_id_object_repository=consistent_id_object_repository,
+        cost_model=cost_model,
+    )
+
+    tables_read = _tables_read(cost_model, dataflow_plan_builder)
+    assert len(tables_read) == 1
+    assert tables_read[0].endswith(ROLLUP_TABLE.table_name)
+
+
+def test_cost_estimate_for_joins(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    dataflow_plan_builder: DataflowPlanBuilder,
+) -> None:
+    """Checks that the estimate for a plan includes the rows of the tables that are joined."""
+    cost_model = TableStatisticsCostModel(table_row_counts={}, default_row_count=100)
+    dataflow_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="bookings"),),
+            time_dimension_specs=(
+                MTD_SPEC_DAY,
+                TimeDimensionSpec(
+                    element_name="created_at",
+                    entity_links=(EntityReference("listing"),),
+                    time_granularity=TimeGranularity.DAY,
+                ),
+            ),
+        )
+    )
+    cost_estimate = cost_model.estimate_plan_cost(dataflow_plan)
+    assert cost_estimate.row_count == 200
+    assert "Estimated rows read: 200" in cost_estimate.text
+
+
+def test_cost_estimate_for_shared_nodes(dataflow_plan_builder: DataflowPlanBuilder) -> None:
+    """Checks that a node shared by branches is counted once, and that the estimate for a node is cached."""
+    table_row_count_requests = []
+
+    class _RecordingCostModel(TableStatisticsCostModel):
+        def estimate_table_row_count(self, sql_table: SqlTable) -> int:
+            table_row_count_requests.append(sql_table)
+            return super().estimate_table_row_count(sql_table)
+
+    cost_model = _RecordingCostModel(table_row_counts={}, default_row_count=100)
+    sink_node = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(metric_specs=(MetricSpec(element_name="bookings"),))
+    ).sink_output_nodes[0]
+    aggregated_node = sink_node.parent_nodes[0]
+    assert isinstance(aggregated_node, BaseOutput)
+
+    cost_estimate = cost_model.estimate_node_cost(aggregated_node)
+    assert cost_estimate.row_count == 100
+    combined_cost_estimate = cost_model.estimate_node_cost(
+        CombineAggregatedOutputsNode(parent_nodes=[aggregated_node, aggregated_node])
+    )
+    assert combined_cost_estimate.row_count == 100
+    assert cost_model.estimate_node_cost(aggregated_node) is cost_estimate
+    assert len(table_row_count_requests) == 2
+
+
+def test_cost_model_from_inference_context() -> None:  # noqa: D
+    def _table_properties(sql_table: SqlTable, column_row_counts: Mapping[str, int]) -> TableProperties:
+        return TableProperties(
+            table=sql_table,
+            column_props=[
+                ColumnProperties(
+                    column=SqlColumn(table=sql_table, column_name=column_name),
+                    type=InferenceColumnType.INTEGER,
+                    row_count=row_count,
+                    distinct_row_count=row_count,
+                    is_nullable=False,
+                    null_count=0,
+                    min_value=None,
+                    max_value=None,
+                )
+                for column_name, row_count in column_row_counts.items()
+            ],
+        )
+
+    large_table = SqlTable(schema_name="some_schema", table_name="large_table")
+    empty_table = SqlTable(schema_name="some_schema", table_name="empty_table")
+    cost_model = TableStatisticsCostModel.from_inference_context(
+        DataWarehouseInferenceContext(
+            table_props=[
+                _table_properties(large_table, {"id": 10_000_000_000, "name": 10_000_000_000}),
+                _table_properties(empty_table, {"id": 0}),
+            ]
+        ),
+        default_row_count=5,
+    )
+    assert cost_model.estimate_table_row_count(large_table) == 10_000_000_000
+    assert cost_model.estimate_table_row_count(empty_table) == 0
+    assert cost_model.estimate_table_row_count(SqlTable(schema_name="some_schema", table_name="other_table")) == 5
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import datetime
+import re
+
+import pytest
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.builder.dataflow_recipe_cache import DataflowRecipeCache
+from metricflow.filters.time_constraint import TimeRangeConstraint
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.specs.specs import DimensionSpec, EntityReference, MetricFlowQuerySpec, MetricSpec
+from metricflow.test.fixtures.model_fixtures import ConsistentIdObjectRepository
+
+
+def _create_query_spec(start_date: datetime.datetime) -> MetricFlowQuerySpec:
+    return MetricFlowQuerySpec(
+        metric_specs=(MetricSpec(element_name="bookings"),),
+        dimension_specs=(DimensionSpec(element_name="country_latest", entity_links=(EntityReference("listing"),)),),
+        time_range_constraint=TimeRangeConstraint(start_time=start_date, end_time=datetime.datetime(2020, 1, 3)),
+    )
+
+
+def _plan_structure_without_ids(dataflow_plan_builder: DataflowPlanBuilder, query_spec: MetricFlowQuerySpec) -> str:
+    return re.sub(r"_\d+", "", dataflow_plan_builder.build_plan(query_spec).text_structure())
+
+
+def test_cached_recipe_with_different_time_range(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    dataflow_plan_builder: DataflowPlanBuilder,
+) -> None:
+    """Checks that a recipe is reused for a query with a different time range, and that it uses the new time range."""
+    dataflow_recipe_cache = DataflowRecipeCache()
+    cached_dataflow_plan_builder = DataflowPlanBuilder(
+        source_nodes=consistent_id_object_repository.simple_model_source_nodes,
+        read_nodes=list(consistent_id_object_repository.simple_model_read_nodes.values()),
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        time_spine_source_node=consistent_id_object_repository.simple_model_time_spine_source_node,
+        dataflow_recipe_cache=dataflow_recipe_cache,
+    )
+
+    cached_dataflow_plan_builder.build_plan(_create_query_spec(datetime.datetime(2019, 12, 1)))
+    assert (dataflow_recipe_cache.hit_count, dataflow_recipe_cache.miss_count, len(dataflow_recipe_cache)) == (0, 1, 1)
+
+    query_spec = _create_query_spec(datetime.datetime(2019, 12, 15))
+    plan_structure = _plan_structure_without_ids(cached_dataflow_plan_builder, query_spec)
+    assert (dataflow_recipe_cache.hit_count, dataflow_recipe_cache.miss_count, len(dataflow_recipe_cache)) == (1, 1, 1)
+    assert "2019-12-15" in plan_structure and "2019-12-01" not in plan_structure
+    assert plan_structure == _plan_structure_without_ids(dataflow_plan_builder, query_spec)
+
+
+def test_cache_size_bound() -> None:  # noqa: D
+    with pytest.raises(ValueError):
+        DataflowRecipeCache(max_size=0)
@@ -12,6 +12,7 @@ from metricflow.dataflow.builder.node_evaluator import (
     JoinLinkableInstancesRecipe,
     LinkableInstanceSatisfiabilityEvaluation,
     NodeEvaluatorForLinkableInstances,
+    NodeJoinMetadataCache,
 )
 from metricflow.dataflow.builder.partitions import PartitionTimeDimensionJoinDescription
 from metricflow.dataflow.dataflow_plan import BaseOutput, ValidityWindowJoinDescription
@@ -236,6 +237,51 @@ def test_node_evaluator_with_joined_spec(  # noqa: D
     )
 
 
+def test_node_evaluator_with_shared_join_metadata_cache(
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    node_evaluator: NodeEvaluatorForLinkableInstances,
+) -> None:
+    """Checks that evaluators sharing a join metadata cache with a different order of nodes get the same results."""
+    node_data_set_resolver = DataflowPlanNodeOutputDataSetResolver(
+        column_association_resolver=DunderColumnAssociationResolver(simple_semantic_manifest_lookup),
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+    )
+    node_join_metadata_cache = NodeJoinMetadataCache(
+        semantic_model_lookup=simple_semantic_manifest_lookup.semantic_model_lookup,
+        node_data_set_resolver=node_data_set_resolver,
+    )
+    source_nodes = tuple(consistent_id_object_repository.simple_model_read_nodes.values())
+    required_linkable_specs = [
+        DimensionSpec(element_name="country_latest", entity_links=(EntityReference(element_name="listing"),)),
+        DimensionSpec(element_name="home_state_latest", entity_links=(EntityReference(element_name="user"),)),
+        DimensionSpec(element_name="verification_type", entity_links=(EntityReference(element_name="verification"),)),
+    ]
+    bookings_source_node = consistent_id_object_repository.simple_model_read_nodes["bookings_source"]
+    expected_evaluation = node_evaluator.evaluate_node(
+        required_linkable_specs=required_linkable_specs,
+        start_node=bookings_source_node,
+        default_join_type=SqlJoinType.LEFT_OUTER,
+    )
+
+    for nodes_available_for_joins in (source_nodes, source_nodes[::-1]):
+        evaluation = NodeEvaluatorForLinkableInstances(
+            semantic_model_lookup=simple_semantic_manifest_lookup.semantic_model_lookup,
+            nodes_available_for_joins=nodes_available_for_joins,
+            node_data_set_resolver=node_data_set_resolver,
+            node_join_metadata_cache=node_join_metadata_cache,
+        ).evaluate_node(
+            required_linkable_specs=required_linkable_specs,
+            start_node=bookings_source_node,
+            default_join_type=SqlJoinType.LEFT_OUTER,
+        )
+        assert evaluation.joinable_linkable_specs == expected_evaluation.joinable_linkable_specs
+        assert evaluation.unjoinable_linkable_specs == expected_evaluation.unjoinable_linkable_specs
+        assert {recipe.node_to_join for recipe in evaluation.join_recipes} == {
+            recipe.node_to_join for recipe in expected_evaluation.join_recipes
+        }
+
+
 def test_node_evaluator_with_joined_spec_on_unique_id(  # noqa: D
     consistent_id_object_repository: ConsistentIdObjectRepository,
     node_evaluator: NodeEvaluatorForLinkableInstances,
@@ -28,6 +28,7 @@ from metricflow.dataflow.dataflow_plan import (
     ReadSqlSourceNode,
     SemiAdditiveJoinNode,
     WhereConstraintNode,
+    WindowOverTimeRangeNode,
     WriteToResultDataframeNode,
     WriteToResultTableNode,
 )
@@ -90,6 +91,9 @@ class ReadSqlSourceNodeCounter(DataflowPlanNodeVisitor[int]):
     def visit_join_over_time_range_node(self, node: JoinOverTimeRangeNode) -> int:  # noqa: D
         return self._sum_parents(node)
 
+    def visit_window_over_time_range_node(self, node: WindowOverTimeRangeNode) -> int:  # noqa: D
+        return self._sum_parents(node)
+
     def visit_semi_additive_join_node(self, node: SemiAdditiveJoinNode) -> int:  # noqa: D
         return self._sum_parents(node)
 
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import List, Set
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.dataflow_plan import (
+    AggregateMeasuresNode,
+    ComputedMetricsOutput,
+    DataflowPlan,
+    DataflowPlanNode,
+)
+from metricflow.dataflow.optimizer.common_subplan_eliminator import CommonSubplanEliminator
+from metricflow.dataset.dataset import DataSet
+from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
+from metricflow.protocols.sql_client import SqlClient, SqlEngine
+from metricflow.specs.specs import MetricFlowQuerySpec, MetricSpec
+from metricflow.sql.sql_plan import SqlQueryPlan
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+from metricflow.test.query_rendering.compare_rendered_query import convert_and_check
+
+
+def _aggregate_measures_nodes(dataflow_plan: DataflowPlan) -> Set[AggregateMeasuresNode]:
+    nodes: Set[AggregateMeasuresNode] = set()
+    nodes_to_visit: List[DataflowPlanNode] = [dataflow_plan.sink_output_node]
+    while nodes_to_visit:
+        node = nodes_to_visit.pop()
+        if isinstance(node, AggregateMeasuresNode):
+            nodes.add(node)
+        nodes_to_visit.extend(node.parent_nodes)
+    return nodes
+
+
+def _convert_to_sql_query_plan(
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter, dataflow_plan: DataflowPlan
+) -> SqlQueryPlan:
+    # The sink node writes to a dataframe, which can't be converted, so convert the node that computes the metrics.
+    computed_metrics_node = dataflow_plan.sink_output_node.parent_nodes[0]
+    assert isinstance(computed_metrics_node, ComputedMetricsOutput)
+    return dataflow_to_sql_converter.convert_to_sql_query_plan(
+        sql_engine_type=SqlEngine.DUCKDB,
+        sql_query_plan_id="plan0",
+        dataflow_plan_node=computed_metrics_node,
+    )
+
+
+def _build_shared_aggregations_plan(dataflow_plan_builder: DataflowPlanBuilder) -> DataflowPlan:
+    # Each of the ratio metrics aggregates the bookings measure.
+    return dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(
+                MetricSpec(element_name="bookings_per_booker"),
+                MetricSpec(element_name="bookings_per_view"),
+                MetricSpec(element_name="bookings_per_listing"),
+            ),
+            time_dimension_specs=(DataSet.metric_time_dimension_spec(TimeGranularity.DAY),),
+        )
+    )
+
+
+def test_shared_aggregations(  # noqa: D
+    dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+) -> None:
+    dataflow_plan = _build_shared_aggregations_plan(dataflow_plan_builder)
+    optimized_dataflow_plan = CommonSubplanEliminator().optimize(dataflow_plan)
+
+    assert len(_aggregate_measures_nodes(dataflow_plan)) == 6
+    assert len(_aggregate_measures_nodes(optimized_dataflow_plan)) == 4
+
+    assert (
+        len(_convert_to_sql_query_plan(dataflow_to_sql_converter, optimized_dataflow_plan).common_table_expressions)
+        == 1
+    )
+    assert len(_convert_to_sql_query_plan(dataflow_to_sql_converter, dataflow_plan).common_table_expressions) == 0
+
+
+@pytest.mark.sql_engine_snapshot
+def test_shared_aggregations_rendering(  # noqa: D
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    optimized_dataflow_plan = CommonSubplanEliminator().optimize(_build_shared_aggregations_plan(dataflow_plan_builder))
+    computed_metrics_node = optimized_dataflow_plan.sink_output_node.parent_nodes[0]
+    assert isinstance(computed_metrics_node, ComputedMetricsOutput)
+
+    convert_and_check(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        node=computed_metrics_node,
+    )
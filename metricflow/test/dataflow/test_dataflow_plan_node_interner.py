@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import gc
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
+from metricflow.dataflow.dataflow_plan_node_interner import DataflowPlanNodeInterner
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.plan_conversion.column_resolver import DunderColumnAssociationResolver
+from metricflow.specs.specs import DimensionSpec, EntityReference, MetricFlowQuerySpec, MetricSpec
+from metricflow.test.fixtures.model_fixtures import ConsistentIdObjectRepository
+
+
+def _create_query_spec(metric_name: str) -> MetricFlowQuerySpec:
+    return MetricFlowQuerySpec(
+        metric_specs=(MetricSpec(element_name=metric_name),),
+        dimension_specs=(DimensionSpec(element_name="country_latest", entity_links=(EntityReference("listing"),)),),
+    )
+
+
+def test_structural_fingerprint(dataflow_plan_builder: DataflowPlanBuilder) -> None:  # noqa: D
+    sink_node = dataflow_plan_builder.build_plan(_create_query_spec("bookings")).sink_output_nodes[0]
+    same_sink_node = dataflow_plan_builder.build_plan(_create_query_spec("bookings")).sink_output_nodes[0]
+    other_sink_node = dataflow_plan_builder.build_plan(_create_query_spec("booking_value")).sink_output_nodes[0]
+
+    assert sink_node is not same_sink_node
+    assert sink_node.structural_fingerprint == same_sink_node.structural_fingerprint
+    assert sink_node.structurally_identical(same_sink_node)
+    assert sink_node.structural_fingerprint != other_sink_node.structural_fingerprint
+    assert not sink_node.structurally_identical(other_sink_node)
+
+
+def test_interned_plans(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+) -> None:
+    """Checks that plans with identical subtrees share nodes when the builder interns them."""
+    node_interner = DataflowPlanNodeInterner()
+    dataflow_plan_builder = DataflowPlanBuilder(
+        source_nodes=consistent_id_object_repository.simple_model_source_nodes,
+        read_nodes=list(consistent_id_object_repository.simple_model_read_nodes.values()),
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        time_spine_source_node=consistent_id_object_repository.simple_model_time_spine_source_node,
+        node_interner=node_interner,
+    )
+
+    sink_node = dataflow_plan_builder.build_plan(_create_query_spec("bookings")).sink_output_nodes[0]
+    interned_node_count = len(node_interner)
+    assert dataflow_plan_builder.build_plan(_create_query_spec("bookings")).sink_output_nodes[0] is sink_node
+    assert len(node_interner) == interned_node_count
+
+    # The plan for a different metric from the same semantic model shares the nodes that read the source.
+    other_sink_node = dataflow_plan_builder.build_plan(_create_query_spec("booking_value")).sink_output_nodes[0]
+    assert other_sink_node is not sink_node
+    assert interned_node_count < len(node_interner) < 2 * interned_node_count
+
+    # Nodes that aren't used anymore are released.
+    del sink_node, other_sink_node
+    gc.collect()
+    assert len(node_interner) < interned_node_count
+
+
+def test_released_fingerprints_are_removed(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+) -> None:
+    """Checks that fingerprints whose nodes have all been released don't accumulate."""
+    node_interner = DataflowPlanNodeInterner(min_fingerprint_count_to_prune=1)
+    dataflow_plan_builder = DataflowPlanBuilder(
+        source_nodes=consistent_id_object_repository.simple_model_source_nodes,
+        read_nodes=list(consistent_id_object_repository.simple_model_read_nodes.values()),
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        time_spine_source_node=consistent_id_object_repository.simple_model_time_spine_source_node,
+        node_interner=node_interner,
+    )
+
+    for metric_name in ("bookings", "booking_value", "instant_bookings", "max_booking_value", "listings"):
+        dataflow_plan_builder.build_plan(_create_query_spec(metric_name))
+    gc.collect()
+    fingerprint_count = node_interner.fingerprint_count
+
+    # Adding a new fingerprint removes the ones without nodes. The plan is kept so that its nodes aren't released.
+    dataflow_plan = dataflow_plan_builder.build_plan(_create_query_spec("bookings"))
+    assert node_interner.fingerprint_count < fingerprint_count
+    assert node_interner.fingerprint_count <= len(node_interner)
+    del dataflow_plan
+
+
+def test_output_data_set_for_identical_nodes(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    dataflow_plan_builder: DataflowPlanBuilder,
+) -> None:
+    """Checks that the output data set is only computed once for structurally identical nodes."""
+    node_data_set_resolver = DataflowPlanNodeOutputDataSetResolver(
+        column_association_resolver=DunderColumnAssociationResolver(simple_semantic_manifest_lookup),
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+    )
+    node = dataflow_plan_builder.build_plan(_create_query_spec("bookings")).sink_output_nodes[0].parent_nodes[0]
+    same_node = dataflow_plan_builder.build_plan(_create_query_spec("bookings")).sink_output_nodes[0].parent_nodes[0]
+
+    assert node is not same_node
+    assert node_data_set_resolver.get_output_data_set(node) is node_data_set_resolver.get_output_data_set(same_node)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import time
+from typing import List
+
+import pytest
+
+from metricflow.execution.execution_plan import ExecutionPlan, ExecutionPlanTask, TaskExecutionResult
+from metricflow.execution.executor import ParallelPlanExecutor
+from metricflow.test.execution.noop_task import NoOpExecutionPlanTask
+
+
+class _SleepExecutionPlanTask(NoOpExecutionPlanTask):
+    """A no-op task that takes a fixed amount of time so that overlapping execution can be detected."""
+
+    def __init__(self, sleep_time: float) -> None:  # noqa: D
+        self._sleep_time = sleep_time
+        super().__init__()
+
+    def execute(self) -> TaskExecutionResult:  # noqa: D
+        start_time = time.time()
+        time.sleep(self._sleep_time)
+        return TaskExecutionResult(start_time=start_time, end_time=time.time())
+
+
+class _RaisingExecutionPlanTask(NoOpExecutionPlanTask):
+    """A task that raises an exception instead of returning a result."""
+
+    def execute(self) -> TaskExecutionResult:  # noqa: D
+        raise RuntimeError("Expected exception")
+
+
+def test_single_task() -> None:
+    """Tests running an execution plan with a single task."""
+    task = NoOpExecutionPlanTask()
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[task])
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+    assert results.get_result(task.task_id)
+    assert task.task_id in results.task_runtimes()
+
+
+def test_task_with_parents() -> None:
+    """Tests a plan with a task that has 2 direct parents."""
+    parent_task1 = NoOpExecutionPlanTask()
+    parent_task2 = NoOpExecutionPlanTask()
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+
+    leaf_result = results.get_result(leaf_task.task_id)
+    assert results.get_result(parent_task1.task_id).end_time <= leaf_result.start_time
+    assert results.get_result(parent_task2.task_id).end_time <= leaf_result.start_time
+    assert not results.contains_task_errors
+
+
+def test_shared_parent_runs_once() -> None:
+    """Tests that a task that is the parent of multiple tasks is only run once."""
+    shared_parent_task = NoOpExecutionPlanTask()
+    leaf_task1 = NoOpExecutionPlanTask(parent_tasks=[shared_parent_task])
+    leaf_task2 = NoOpExecutionPlanTask(parent_tasks=[shared_parent_task])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task1, leaf_task2])
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+
+    assert len(results.all_results()) == 3
+    assert not results.contains_task_errors
+
+
+def test_independent_tasks_run_concurrently() -> None:
+    """Tests that tasks without dependencies between them overlap in time."""
+    tasks = [_SleepExecutionPlanTask(sleep_time=0.2) for _ in range(4)]
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=list(tasks))
+    results = ParallelPlanExecutor(max_workers=4).execute_plan(execution_plan)
+
+    start_times = [results.get_result(task.task_id).start_time for task in tasks]
+    end_times = [results.get_result(task.task_id).end_time for task in tasks]
+    assert max(start_times) < min(end_times)
+
+
+def test_parent_task_error() -> None:
+    """Check that a child task is not run if a parent task fails."""
+    parent_task1 = NoOpExecutionPlanTask(should_error=True)
+    parent_task2 = NoOpExecutionPlanTask()
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+    assert results.contains_task_errors
+    assert results.get_result(parent_task1.task_id).errors[0] == NoOpExecutionPlanTask.EXAMPLE_ERROR
+    assert leaf_task.task_id not in results.all_results()
+
+
+def test_pending_tasks_cancelled_after_error() -> None:
+    """Check that tasks waiting for a worker are not run after another task fails."""
+    failing_task = NoOpExecutionPlanTask(should_error=True)
+    blocked_tasks: List[ExecutionPlanTask] = [_SleepExecutionPlanTask(sleep_time=0.05) for _ in range(4)]
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[failing_task] + blocked_tasks)
+
+    results = ParallelPlanExecutor(max_workers=1).execute_plan(execution_plan)
+    assert results.get_result(failing_task.task_id).errors
+    # The worker may pick up the next task before the failure is processed, but the rest should be cancelled.
+    assert len(results.all_results()) <= 2
+
+
+def test_task_exception_is_raised() -> None:
+    """Check that an exception raised by a task is propagated to the caller."""
+    task = _RaisingExecutionPlanTask()
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[task])
+
+    with pytest.raises(RuntimeError, match="Expected exception"):
+        ParallelPlanExecutor().execute_plan(execution_plan)
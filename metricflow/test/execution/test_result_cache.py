@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from metricflow.execution.result_cache import (
+    DiskResultCacheStorage,
+    InMemoryResultCacheStorage,
+    ResultCache,
+    ResultCacheStorage,
+)
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.time.fake_clock import FakeClock
+
+
+@pytest.fixture(params=["in_memory", "disk"])
+def storage(request: pytest.FixtureRequest, tmp_path: Path) -> ResultCacheStorage:  # noqa: D
+    if request.param == "in_memory":
+        return InMemoryResultCacheStorage()
+    return DiskResultCacheStorage(directory=str(tmp_path))
+
+
+_WAREHOUSE_ID = "DuckDB:example"
+_EXAMPLE_DF = pd.DataFrame(columns=["int_col", "str_col"], data=[(1, "a"), (2, "b")])
+
+
+def test_cached_result(storage: ResultCacheStorage) -> None:
+    """Checks that a result is returned for the same SQL and bind parameters only."""
+    result_cache = ResultCache(storage)
+    bind_parameters = SqlBindParameters.create_from_dict({"value": 1})
+    result_cache.put(_WAREHOUSE_ID, "SELECT 1", bind_parameters, _EXAMPLE_DF, semantic_model_names=["bookings_source"])
+
+    cached_df = result_cache.get(_WAREHOUSE_ID, "SELECT 1", bind_parameters)
+    assert cached_df is not None
+    assert_dataframes_equal(actual=cached_df, expected=_EXAMPLE_DF)
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters.create_from_dict({"value": 2})) is None
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 2", bind_parameters) is None
+    assert (result_cache.hit_count, result_cache.miss_count) == (1, 2)
+
+
+def test_result_expires(storage: ResultCacheStorage) -> None:  # noqa: D
+    clock = FakeClock()
+    result_cache = ResultCache(storage, default_ttl_seconds=60, time_function=clock)
+    result_cache.put(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters(), _EXAMPLE_DF, semantic_model_names=())
+    result_cache.put(
+        _WAREHOUSE_ID, "SELECT 2", SqlBindParameters(), _EXAMPLE_DF, semantic_model_names=(), ttl_seconds=120
+    )
+
+    clock.current_time = 60
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters()) is None
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 2", SqlBindParameters()) is not None
+
+
+def test_invalidate_semantic_model(storage: ResultCacheStorage) -> None:  # noqa: D
+    result_cache = ResultCache(storage)
+    result_cache.put(
+        _WAREHOUSE_ID,
+        "SELECT 1",
+        SqlBindParameters(),
+        _EXAMPLE_DF,
+        semantic_model_names=["bookings_source", "listings_latest"],
+    )
+    result_cache.put(
+        _WAREHOUSE_ID, "SELECT 2", SqlBindParameters(), _EXAMPLE_DF, semantic_model_names=["listings_latest"]
+    )
+
+    result_cache.invalidate_semantic_model("bookings_source")
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters()) is None
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 2", SqlBindParameters()) is not None
+
+
+def test_in_memory_storage_size_eviction() -> None:
+    """Checks that the least-recently used results are evicted when the results exceed the size limit."""
+    entry_size = int(_EXAMPLE_DF.memory_usage(deep=True).sum())
+    result_cache = ResultCache(InMemoryResultCacheStorage(max_size_bytes=2 * entry_size))
+    result_cache.put(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters(), _EXAMPLE_DF, semantic_model_names=())
+    result_cache.put(_WAREHOUSE_ID, "SELECT 2", SqlBindParameters(), _EXAMPLE_DF, semantic_model_names=())
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters()) is not None
+    result_cache.put(_WAREHOUSE_ID, "SELECT 3", SqlBindParameters(), _EXAMPLE_DF, semantic_model_names=())
+
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters()) is not None
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 2", SqlBindParameters()) is None
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 3", SqlBindParameters()) is not None
+
+
+def test_disk_storage_size_eviction(tmp_path: Path) -> None:  # noqa: D
+    storage = DiskResultCacheStorage(directory=str(tmp_path))
+    ResultCache(storage).put(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters(), _EXAMPLE_DF, semantic_model_names=())
+    entry_size = sum(path.stat().st_size for path in tmp_path.iterdir())
+
+    result_cache = ResultCache(DiskResultCacheStorage(directory=str(tmp_path), max_size_bytes=entry_size))
+    result_cache.put(_WAREHOUSE_ID, "SELECT 2", SqlBindParameters(), _EXAMPLE_DF, semantic_model_names=())
+
+    assert len(list(tmp_path.iterdir())) == 1
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 2", SqlBindParameters()) is not None
+
+
+def test_cached_result_not_modified(storage: ResultCacheStorage) -> None:
+    """Checks that changes to a dataframe stored in / returned from the cache don't affect the cached result."""
+    result_cache = ResultCache(storage)
+    df = _EXAMPLE_DF.copy()
+    result_cache.put(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters(), df, semantic_model_names=())
+    df.loc[0, "int_col"] = 100
+
+    cached_df = result_cache.get(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters())
+    assert cached_df is not None
+    cached_df.loc[0, "int_col"] = 100
+
+    cached_df = result_cache.get(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters())
+    assert cached_df is not None
+    assert_dataframes_equal(actual=cached_df, expected=_EXAMPLE_DF)
+
+
+def test_subquery_aliases_ignored() -> None:
+    """Checks that queries that only differ in the numbering of the generated subquery aliases share results."""
+    result_cache = ResultCache(InMemoryResultCacheStorage())
+    result_cache.put(
+        _WAREHOUSE_ID,
+        "SELECT subq_3.a FROM (SELECT a FROM t) subq_3",
+        SqlBindParameters(),
+        _EXAMPLE_DF,
+        semantic_model_names=(),
+    )
+
+    assert (
+        result_cache.get(_WAREHOUSE_ID, "SELECT subq_7.a FROM (SELECT a FROM t) subq_7", SqlBindParameters())
+        is not None
+    )
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT subq_7.a FROM (SELECT b FROM t) subq_7", SqlBindParameters()) is None
+
+
+def test_results_for_different_warehouses(storage: ResultCacheStorage) -> None:
+    """Checks that results are not shared between engines for different warehouses that use the same storage."""
+    result_cache = ResultCache(storage)
+    result_cache.put(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters(), _EXAMPLE_DF, semantic_model_names=())
+
+    assert result_cache.get(_WAREHOUSE_ID, "SELECT 1", SqlBindParameters()) is not None
+    assert result_cache.get("DuckDB:other_example", "SELECT 1", SqlBindParameters()) is None
+    assert result_cache.get("Postgres:example", "SELECT 1", SqlBindParameters()) is None
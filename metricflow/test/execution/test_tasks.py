@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import pandas as pd
+import pytest
+from dbt_semantic_interfaces.test_utils import as_datetime
 
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.execution.execution_plan import (
     ExecutionPlan,
+    IncrementalTableWrite,
+    ResultFormat,
     SelectSqlQueryToDataFrameTask,
     SelectSqlQueryToTableTask,
 )
@@ -36,6 +40,34 @@ def test_read_sql_task(sql_client: SqlClient) -> None:  # noqa: D
     )
 
 
+def test_read_sql_task_in_batches(sql_client: SqlClient) -> None:  # noqa: D
+    task = SelectSqlQueryToDataFrameTask(
+        sql_client,
+        "SELECT 1 AS foo UNION ALL SELECT 2 AS foo UNION ALL SELECT 3 AS foo",
+        SqlBindParameters(),
+        batch_size=2,
+    )
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[task])
+
+    results = SequentialPlanExecutor().execute_plan(execution_plan)
+    task_result = results.get_result(task.task_id)
+
+    assert not results.contains_task_errors
+    assert task_result.df is None
+    assert task_result.df_batches is not None
+
+    batches = list(task_result.df_batches)
+    assert all(batch.shape[0] <= 2 for batch in batches)
+    assert_dataframes_equal(
+        actual=pd.concat(batches, ignore_index=True),
+        expected=pd.DataFrame(
+            columns=["foo"],
+            data=[(1,), (2,), (3,)],
+        ),
+        compare_names_using_lowercase=sql_client.sql_engine_type is SqlEngine.SNOWFLAKE,
+    )
+
+
 def test_write_table_task(mf_test_session_state: MetricFlowTestSessionState, sql_client: SqlClient) -> None:  # noqa: D
     output_table = SqlTable(schema_name=mf_test_session_state.mf_system_schema, table_name=f"test_table_{random_id()}")
     task = SelectSqlQueryToTableTask(
@@ -59,3 +91,59 @@ def test_write_table_task(mf_test_session_state: MetricFlowTestSessionState, sql
         compare_names_using_lowercase=sql_client.sql_engine_type is SqlEngine.SNOWFLAKE,
     )
     sql_client.execute(f"DROP TABLE IF EXISTS {output_table.sql}")
+
+
+def test_read_sql_task_as_arrow(sql_client: SqlClient) -> None:  # noqa: D
+    task = SelectSqlQueryToDataFrameTask(
+        sql_client, "SELECT 1 AS foo", SqlBindParameters(), result_format=ResultFormat.ARROW
+    )
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[task])
+
+    results = SequentialPlanExecutor().execute_plan(execution_plan)
+    task_result = results.get_result(task.task_id)
+
+    assert not results.contains_task_errors
+    assert task_result.df is None
+    assert task_result.arrow_table is not None
+    assert_dataframes_equal(
+        actual=task_result.arrow_table.to_pandas(),
+        expected=pd.DataFrame(columns=["foo"], data=[(1,)]),
+        compare_names_using_lowercase=sql_client.sql_engine_type is SqlEngine.SNOWFLAKE,
+    )
+
+
+def test_incremental_write_table_task(  # noqa: D
+    mf_test_session_state: MetricFlowTestSessionState, sql_client: SqlClient
+) -> None:
+    output_table = SqlTable(schema_name=mf_test_session_state.mf_system_schema, table_name=f"test_table_{random_id()}")
+    timestamp_data_type = sql_client.sql_query_plan_renderer.expr_renderer.timestamp_data_type
+    select_row_sql = "SELECT {foo} AS foo, CAST('2020-01-01' AS " + timestamp_data_type + ") AS ds"
+
+    def _write_incrementally(sql_query: str) -> None:
+        SelectSqlQueryToTableTask(
+            sql_client=sql_client,
+            sql_query=sql_query,
+            bind_parameters=SqlBindParameters(),
+            output_table=output_table,
+            incremental_write=IncrementalTableWrite(
+                time_column_name="ds", start_time=as_datetime("2020-01-01"), end_time=as_datetime("2020-01-02")
+            ),
+            column_names=("foo", "ds"),
+        ).execute()
+
+    if not sql_client.sql_engine_type.supports_incremental_writes:
+        with pytest.raises(ValueError):
+            _write_incrementally(select_row_sql.format(foo=2))
+        return
+
+    sql_client.execute(f"CREATE TABLE {output_table.sql} AS {select_row_sql.format(foo=1)}")
+    try:
+        # The existing rows are kept if the query fails.
+        with pytest.raises(Exception):
+            _write_incrementally(select_row_sql.format(foo="bad_col"))
+        assert sql_client.query(f"SELECT foo FROM {output_table.sql}").iloc[:, 0].tolist() == [1]
+
+        _write_incrementally(select_row_sql.format(foo=2))
+        assert sql_client.query(f"SELECT foo FROM {output_table.sql}").iloc[:, 0].tolist() == [2]
+    finally:
+        sql_client.execute(f"DROP TABLE IF EXISTS {output_table.sql}")
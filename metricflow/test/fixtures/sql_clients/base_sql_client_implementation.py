@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Generator, Optional, Sequence, Tuple
 
 import pandas as pd
 
@@ -14,10 +14,14 @@ from metricflow.protocols.sql_client import (
     SqlClient,
 )
 from metricflow.random_id import random_id
+from metricflow.sql.dry_run_batching import DEFAULT_DRY_RUN_BATCH_SIZE, dry_run_in_batches
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.sql_request.sql_request_attributes import SqlJsonTag, SqlRequestId, SqlRequestTagSet
 from metricflow.sql_request.sql_statement_metadata import CombinedSqlTags, SqlStatementCommentMetadata
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,6 +73,35 @@ class BaseSqlClientImplementation(ABC, SqlClient):
         logger.info(f"Finished running the query in {stop - start:.2f}s with {df.shape[0]} row(s) returned")
         return df
 
+    def query_arrow(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> pa.Table:
+        """Query statement, with the result converted from a DataFrame to an Arrow table."""
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(
+            self.query(stmt, sql_bind_parameters=sql_bind_parameters, extra_tags=extra_tags), preserve_index=False
+        )
+
+    def query_batches(
+        self,
+        stmt: str,
+        batch_size: int,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Generator[pd.DataFrame, None, None]:
+        """Query statement, with the result split into DataFrames of up to batch_size rows.
+
+        The whole result is fetched with query() before it's split up, so this doesn't reduce memory usage.
+        """
+        df = self.query(stmt, sql_bind_parameters=sql_bind_parameters, extra_tags=extra_tags)
+        yield df.iloc[0:batch_size]
+        for start_index in range(batch_size, df.shape[0], batch_size):
+            yield df.iloc[start_index : start_index + batch_size]
+
     def execute(  # noqa: D
         self,
         stmt: str,
@@ -115,6 +148,29 @@ class BaseSqlClientImplementation(ABC, SqlClient):
         logger.info(f"Finished running the dry_run in {stop - start:.2f}s")
         return results
 
+    def dry_run_many(
+        self,
+        statements: Sequence[Tuple[str, SqlBindParameters]],
+        max_batch_size: int = DEFAULT_DRY_RUN_BATCH_SIZE,
+    ) -> Tuple[Optional[Exception], ...]:
+        """Dry run many statements, combining them to reduce the number of round trips to the data warehouse.
+
+        Statements are combined into a single probe of up to max_batch_size statements. If the probe fails, the batch is
+        split to find the statements that fail, so the returned exceptions are the same as from calling dry_run().
+
+        Args:
+            statements: The SQL query statements to dry run, with their bind parameters.
+            max_batch_size: The maximum number of statements to combine into a single dry run.
+
+        Returns:
+            The exception for each statement in the same order as statements, or None if the statement is queryable.
+        """
+        return dry_run_in_batches(
+            dry_run=lambda stmt, sql_bind_parameters: self.dry_run(stmt=stmt, sql_bind_parameters=sql_bind_parameters),
+            statements=statements,
+            max_batch_size=max_batch_size,
+        )
+
     @abstractmethod
     def _engine_specific_query_implementation(
         self,
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pandas as pd
+from dbt_semantic_interfaces.test_utils import as_datetime
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.protocols.sql_client import SqlClient, SqlEngine
+from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql_request.sql_request_attributes import SqlJsonTag
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.integration.conftest import IntegrationTestHelpers
+from metricflow.test.time.configurable_time_source import ConfigurableTimeSource
+
+
+class _ThreadedAsyncSqlClient:
+    """An AsyncSqlClient that runs the statements of a blocking client in worker threads, recording the queries."""
+
+    def __init__(self, sql_client: SqlClient) -> None:  # noqa: D
+        self._sql_client = sql_client
+        self.queries: List[str] = []
+
+    @property
+    def sql_engine_type(self) -> SqlEngine:  # noqa: D
+        return self._sql_client.sql_engine_type
+
+    @property
+    def sql_query_plan_renderer(self) -> SqlQueryPlanRenderer:  # noqa: D
+        return self._sql_client.sql_query_plan_renderer
+
+    async def query(  # noqa: D
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> pd.DataFrame:
+        self.queries.append(stmt)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self._sql_client.query(stmt, sql_bind_parameters=sql_bind_parameters, extra_tags=extra_tags)
+        )
+
+    async def execute(  # noqa: D
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self._sql_client.execute(stmt, sql_bind_parameters=sql_bind_parameters, extra_tags=extra_tags)
+        )
+
+    async def dry_run(  # noqa: D
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+    ) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self._sql_client.dry_run(stmt, sql_bind_parameters=sql_bind_parameters)
+        )
+
+    async def close(self) -> None:  # noqa: D
+        pass
+
+
+def test_aquery_with_async_sql_client(
+    it_helpers: IntegrationTestHelpers, simple_semantic_manifest_lookup: SemanticManifestLookup
+) -> None:
+    """Checks that aquery() runs the query through the async client and returns the same data as query()."""
+    async_sql_client = _ThreadedAsyncSqlClient(it_helpers.sql_client)
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=it_helpers.sql_client,
+        time_source=ConfigurableTimeSource(as_datetime("2020-01-01")),
+        async_sql_client=async_sql_client,
+    )
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings"], group_by_names=["metric_time__day"]
+    )
+
+    async def _run_concurrent_queries() -> List[pd.DataFrame]:
+        query_results = await asyncio.gather(*(mf_engine.aquery(mf_request) for _ in range(3)))
+        return [query_result.result_df for query_result in query_results if query_result.result_df is not None]
+
+    result_dfs = asyncio.run(_run_concurrent_queries())
+
+    assert len(async_sql_client.queries) == 3
+    expected_df = mf_engine.query(mf_request).result_df
+    assert expected_df is not None
+    assert len(result_dfs) == 3
+    for result_df in result_dfs:
+        assert_dataframes_equal(actual=result_df, expected=expected_df)
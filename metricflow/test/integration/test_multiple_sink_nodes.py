@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from metricflow.dataflow.dataflow_plan import DataflowPlan
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.integration.conftest import IntegrationTestHelpers
+
+
+def test_execute_plan_with_multiple_sink_nodes(it_helpers: IntegrationTestHelpers) -> None:
+    """Checks that a plan with multiple sink nodes returns a result for each sink node, in order."""
+    mf_requests = (
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["metric_time__day"]
+        ),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["listings"], group_by_names=["metric_time__month"]
+        ),
+    )
+    explain_results = [it_helpers.mf_engine.explain(mf_request) for mf_request in mf_requests]
+    dataflow_plan = DataflowPlan(
+        plan_id="multiple_sink_plan",
+        sink_output_nodes=[explain_result.dataflow_plan.sink_output_node for explain_result in explain_results],
+    )
+
+    query_results = it_helpers.mf_engine.execute_dataflow_plan(
+        query_specs=[explain_result.query_spec for explain_result in explain_results], dataflow_plan=dataflow_plan
+    )
+
+    assert len(query_results) == len(mf_requests)
+    for mf_request, explain_result, query_result in zip(mf_requests, explain_results, query_results):
+        assert query_result.query_spec == explain_result.query_spec
+        expected_df = it_helpers.mf_engine.query(mf_request).result_df
+        assert query_result.result_df is not None and expected_df is not None
+        assert_dataframes_equal(actual=query_result.result_df, expected=expected_df)
+
+
+def test_execute_plan_with_missing_query_specs(it_helpers: IntegrationTestHelpers) -> None:
+    """Checks that a query spec is required for each sink node."""
+    explain_result = it_helpers.mf_engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["metric_time__day"]
+        )
+    )
+    dataflow_plan = DataflowPlan(
+        plan_id="multiple_sink_plan",
+        sink_output_nodes=[
+            explain_result.dataflow_plan.sink_output_node,
+            explain_result.dataflow_plan.sink_output_node,
+        ],
+    )
+
+    with pytest.raises(ValueError):
+        it_helpers.mf_engine.execute_dataflow_plan(query_specs=[explain_result.query_spec], dataflow_plan=dataflow_plan)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from dbt_semantic_interfaces.test_utils import as_datetime
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.integration.conftest import IntegrationTestHelpers
+from metricflow.test.time.configurable_time_source import ConfigurableTimeSource
+
+
+def test_query_many(
+    it_helpers: IntegrationTestHelpers, simple_semantic_manifest_lookup: SemanticManifestLookup
+) -> None:
+    """Checks that requests that are run together return the same results as when they're run separately."""
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=it_helpers.sql_client,
+        time_source=ConfigurableTimeSource(as_datetime("2020-01-01")),
+    )
+    group_by_names = ["metric_time__day", "listing__country_latest"]
+    mf_requests = [
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=group_by_names),
+        # These metrics are computed from the same scan of bookings_source as the previous one, so they're combined.
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["booking_value", "bookers"], group_by_names=group_by_names
+        ),
+        # A limit can't be applied to the combined result, so this is run on its own.
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["booking_value"], group_by_names=group_by_names, limit=1
+        ),
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=group_by_names),
+        # These have different group-by items from the previous ones. They can't be combined as views and bookings are
+        # computed separately, so views is only NULL in rows that have bookings.
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings_per_view"], group_by_names=["metric_time__day"]
+        ),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["views"], group_by_names=["metric_time__day"]
+        ),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["views"], group_by_names=["metric_time__day"]
+        ),
+    ]
+
+    results = mf_engine.query_many(mf_requests)
+
+    assert len(results) == len(mf_requests)
+    assert results[0].sql == results[1].sql == results[3].sql
+    assert results[5].sql == results[6].sql
+    assert len({results[0].sql, results[2].sql, results[4].sql, results[5].sql}) == 4
+    for mf_request, result in zip(mf_requests, results):
+        expected_result = mf_engine.query(mf_request)
+        assert expected_result.result_df is not None and result.result_df is not None
+        assert_dataframes_equal(actual=result.result_df, expected=expected_result.result_df, sort_columns=True)
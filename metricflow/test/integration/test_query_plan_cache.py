@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from dbt_semantic_interfaces.test_utils import as_datetime
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.engine.query_plan_cache import QueryPlanCache
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.integration.conftest import IntegrationTestHelpers
+from metricflow.test.time.configurable_time_source import ConfigurableTimeSource
+from metricflow.test.time.fake_clock import FakeClock
+
+
+def _create_engine(
+    it_helpers: IntegrationTestHelpers,
+    semantic_manifest_lookup: SemanticManifestLookup,
+    query_plan_cache: QueryPlanCache,
+) -> MetricFlowEngine:
+    return MetricFlowEngine(
+        semantic_manifest_lookup=semantic_manifest_lookup,
+        sql_client=it_helpers.sql_client,
+        time_source=ConfigurableTimeSource(as_datetime("2020-01-01")),
+        query_plan_cache=query_plan_cache,
+    )
+
+
+def test_cached_plan_reused(
+    it_helpers: IntegrationTestHelpers, simple_semantic_manifest_lookup: SemanticManifestLookup
+) -> None:
+    """Checks that requests that only differ in the request ID and in the case of names share the plans."""
+    query_plan_cache = QueryPlanCache()
+    mf_engine = _create_engine(it_helpers, simple_semantic_manifest_lookup, query_plan_cache)
+
+    first_result = mf_engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["metric_time__day"]
+        )
+    )
+    second_result = mf_engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["BOOKINGS"], group_by_names=["metric_time__day"]
+        )
+    )
+
+    assert (query_plan_cache.hit_count, query_plan_cache.miss_count) == (1, 1)
+    assert second_result.dataflow_plan is first_result.dataflow_plan
+    assert first_result.result_df is not None and second_result.result_df is not None
+    assert_dataframes_equal(actual=second_result.result_df, expected=first_result.result_df)
+
+    mf_engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["metric_time__day"], limit=1
+        )
+    )
+    assert (query_plan_cache.hit_count, query_plan_cache.miss_count) == (1, 2)
+    assert len(query_plan_cache) == 2
+
+
+def test_least_recently_used_plan_evicted(  # noqa: D
+    it_helpers: IntegrationTestHelpers, simple_semantic_manifest_lookup: SemanticManifestLookup
+) -> None:
+    query_plan_cache = QueryPlanCache(max_size=1)
+    mf_engine = _create_engine(it_helpers, simple_semantic_manifest_lookup, query_plan_cache)
+    bookings_request = MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"])
+    listings_request = MetricFlowQueryRequest.create_with_random_request_id(metric_names=["listings"])
+
+    mf_engine.explain(bookings_request)
+    mf_engine.explain(listings_request)
+    mf_engine.explain(bookings_request)
+
+    assert (query_plan_cache.hit_count, query_plan_cache.miss_count) == (0, 3)
+    assert len(query_plan_cache) == 1
+
+
+def test_cached_plan_expires(  # noqa: D
+    it_helpers: IntegrationTestHelpers, simple_semantic_manifest_lookup: SemanticManifestLookup
+) -> None:
+    clock = FakeClock()
+    query_plan_cache = QueryPlanCache(ttl_seconds=60, time_function=clock)
+    mf_engine = _create_engine(it_helpers, simple_semantic_manifest_lookup, query_plan_cache)
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"])
+
+    mf_engine.explain(mf_request)
+    clock.current_time = 59
+    mf_engine.explain(mf_request)
+    assert (query_plan_cache.hit_count, query_plan_cache.miss_count) == (1, 1)
+
+    clock.current_time = 60
+    mf_engine.explain(mf_request)
+    assert (query_plan_cache.hit_count, query_plan_cache.miss_count) == (1, 2)
+
+
+def test_cached_plan_reused_across_time_ranges(  # noqa: D
+    it_helpers: IntegrationTestHelpers, simple_semantic_manifest_lookup: SemanticManifestLookup
+) -> None:
+    query_plan_cache = QueryPlanCache()
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=it_helpers.sql_client,
+        time_source=ConfigurableTimeSource(as_datetime("2020-01-01")),
+        query_plan_cache=query_plan_cache,
+        parameterize_time_constraints=True,
+    )
+    uncached_mf_engine = _create_engine(it_helpers, simple_semantic_manifest_lookup, QueryPlanCache(max_size=1))
+
+    def _create_request(start_date: str) -> MetricFlowQueryRequest:
+        return MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"],
+            group_by_names=["metric_time__day"],
+            time_constraint_start=as_datetime(start_date),
+            time_constraint_end=as_datetime("2020-01-02"),
+        )
+
+    first_result = mf_engine.query(_create_request("2019-12-01"))
+    second_result = mf_engine.query(_create_request("2020-01-01"))
+    assert (query_plan_cache.hit_count, query_plan_cache.miss_count) == (1, 1)
+    assert second_result.dataflow_plan is first_result.dataflow_plan
+
+    first_sql = mf_engine.explain(_create_request("2019-12-01")).rendered_sql
+    second_sql = mf_engine.explain(_create_request("2020-01-01")).rendered_sql
+    assert first_sql.sql_query == second_sql.sql_query
+    assert first_sql.bind_parameters != second_sql.bind_parameters
+
+    for start_date, result in (("2019-12-01", first_result), ("2020-01-01", second_result)):
+        expected_result = uncached_mf_engine.query(_create_request(start_date))
+        assert result.result_df is not None and expected_result.result_df is not None
+        assert_dataframes_equal(actual=result.result_df, expected=expected_result.result_df, sort_columns=True)
+    assert first_result.result_df is not None and second_result.result_df is not None
+    assert len(first_result.result_df) > len(second_result.result_df)
+
+
+def test_cumulative_plan_not_reused_across_time_ranges(  # noqa: D
+    it_helpers: IntegrationTestHelpers, simple_semantic_manifest_lookup: SemanticManifestLookup
+) -> None:
+    query_plan_cache = QueryPlanCache()
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=it_helpers.sql_client,
+        time_source=ConfigurableTimeSource(as_datetime("2020-01-01")),
+        query_plan_cache=query_plan_cache,
+        parameterize_time_constraints=True,
+    )
+
+    for start_date in ("2019-12-01", "2020-01-01"):
+        mf_engine.explain(
+            MetricFlowQueryRequest.create_with_random_request_id(
+                metric_names=["trailing_2_months_revenue"],
+                group_by_names=["metric_time__day"],
+                time_constraint_start=as_datetime(start_date),
+                time_constraint_end=as_datetime("2020-01-02"),
+            )
+        )
+    assert (query_plan_cache.hit_count, query_plan_cache.miss_count) == (0, 2)
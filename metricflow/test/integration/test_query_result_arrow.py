@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+from metricflow.execution.execution_plan import ResultFormat
+from metricflow.query.query_exceptions import InvalidQueryException
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.integration.conftest import IntegrationTestHelpers
+
+
+def test_query_result_as_arrow(it_helpers: IntegrationTestHelpers) -> None:
+    """Checks that returning the result as an Arrow table returns the same data as a query for a dataframe."""
+    query_result = it_helpers.mf_engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["metric_time__day"], result_format=ResultFormat.ARROW
+        )
+    )
+    assert query_result.result_df is None
+    assert query_result.result_arrow_table is not None
+
+    expected_df = it_helpers.mf_engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["metric_time__day"]
+        )
+    ).result_df
+    assert expected_df is not None
+    assert_dataframes_equal(actual=query_result.result_arrow_table.to_pandas(), expected=expected_df)
+
+
+def test_arrow_result_in_batches_not_supported(it_helpers: IntegrationTestHelpers) -> None:  # noqa: D
+    with pytest.raises(InvalidQueryException):
+        it_helpers.mf_engine.query(
+            MetricFlowQueryRequest.create_with_random_request_id(
+                metric_names=["bookings"], result_batch_size=3, result_format=ResultFormat.ARROW
+            )
+        )
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import contextlib
+
+import pandas as pd
+
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.integration.conftest import IntegrationTestHelpers
+
+
+def test_query_result_in_batches(it_helpers: IntegrationTestHelpers) -> None:
+    """Checks that streaming the result in batches returns the same data as a query for the full result."""
+    query_result = it_helpers.mf_engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["metric_time__day"], result_batch_size=3
+        )
+    )
+    assert query_result.result_df is None
+    assert query_result.result_df_batches is not None
+    batches = list(query_result.result_df_batches)
+    assert query_result.result_df_batches.end_time is not None
+    assert len(batches) > 1
+    assert all(batch.shape[0] <= 3 for batch in batches)
+
+    expected_df = it_helpers.mf_engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["metric_time__day"]
+        )
+    ).result_df
+    assert expected_df is not None
+    assert_dataframes_equal(actual=pd.concat(batches, ignore_index=True), expected=expected_df)
+
+
+def test_close_query_result_batches(it_helpers: IntegrationTestHelpers) -> None:
+    """Checks that streaming the result can be stopped before all batches are consumed."""
+    query_result = it_helpers.mf_engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["metric_time__day"], result_batch_size=1
+        )
+    )
+    df_batches = query_result.result_df_batches
+    assert df_batches is not None
+    with contextlib.closing(df_batches):
+        assert next(df_batches).shape[0] == 1
+        assert df_batches.end_time is None
+    assert df_batches.end_time is not None
+    assert list(df_batches) == []
+
+    # The connection was released, so other queries can run.
+    assert it_helpers.sql_client.query("SELECT 1 AS one").shape == (1, 1)
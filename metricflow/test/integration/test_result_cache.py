@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from dbt_semantic_interfaces.test_utils import as_datetime
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.execution.result_cache import InMemoryResultCacheStorage, ResultCache
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.integration.conftest import IntegrationTestHelpers
+from metricflow.test.time.configurable_time_source import ConfigurableTimeSource
+
+
+def test_query_result_cached(
+    it_helpers: IntegrationTestHelpers, simple_semantic_manifest_lookup: SemanticManifestLookup
+) -> None:
+    """Checks that the result of a repeated query comes from the cache until the semantic model is invalidated."""
+    result_cache = ResultCache(InMemoryResultCacheStorage())
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=it_helpers.sql_client,
+        time_source=ConfigurableTimeSource(as_datetime("2020-01-01")),
+        result_cache=result_cache,
+    )
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings"], group_by_names=["metric_time__day"]
+    )
+
+    first_result = mf_engine.query(mf_request)
+    second_result = mf_engine.query(mf_request)
+    assert (result_cache.hit_count, result_cache.miss_count) == (1, 1)
+    assert first_result.result_df is not None and second_result.result_df is not None
+    assert_dataframes_equal(actual=second_result.result_df, expected=first_result.result_df)
+
+    result_cache.invalidate_semantic_model("listings_latest")
+    mf_engine.query(mf_request)
+    assert (result_cache.hit_count, result_cache.miss_count) == (2, 1)
+
+    result_cache.invalidate_semantic_model("bookings_source")
+    mf_engine.query(mf_request)
+    assert (result_cache.hit_count, result_cache.miss_count) == (2, 2)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import datetime
 import textwrap
 
+import pytest
+from dbt_semantic_interfaces.test_utils import as_datetime
+
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+from metricflow.execution.execution_plan import SelectSqlQueryToTableTask
 from metricflow.protocols.sql_client import SqlEngine
+from metricflow.query.query_exceptions import InvalidQueryException
 from metricflow.random_id import random_id
 from metricflow.test.compare_df import assert_dataframes_equal
 from metricflow.test.integration.conftest import IntegrationTestHelpers
@@ -46,3 +52,70 @@ def test_write_to_table(it_helpers: IntegrationTestHelpers) -> None:  # noqa: D
         )
     finally:
         it_helpers.sql_client.execute(f"DROP TABLE IF EXISTS {output_table.sql}")
+
+
+def test_write_to_table_incrementally(it_helpers: IntegrationTestHelpers) -> None:
+    """Checks that an incremental write only replaces the rows from the high-water mark minus the lookback onwards."""
+    output_table = SqlTable(schema_name=it_helpers.mf_system_schema, table_name=f"test_table_{random_id()}")
+    if not it_helpers.sql_client.sql_engine_type.supports_incremental_writes:
+        with pytest.raises(InvalidQueryException):
+            it_helpers.mf_engine.query(
+                MetricFlowQueryRequest.create_with_random_request_id(
+                    metric_names=["bookings"],
+                    group_by_names=["metric_time__day"],
+                    output_table=output_table.sql,
+                    incremental_lookback=datetime.timedelta(days=1),
+                )
+            )
+        return
+
+    try:
+        # The table doesn't exist yet, so it's fully built with bookings up to 2020-01-01.
+        it_helpers.mf_engine.query(
+            MetricFlowQueryRequest.create_with_random_request_id(
+                metric_names=["bookings"],
+                group_by_names=["metric_time__day"],
+                time_constraint_end=as_datetime("2020-01-01"),
+                output_table=output_table.sql,
+                incremental_lookback=datetime.timedelta(days=1),
+            )
+        )
+        # Overwrite the existing rows to check which ones are replaced.
+        it_helpers.sql_client.execute(f"UPDATE {output_table.sql} SET bookings = -1")
+
+        incremental_request = MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"],
+            group_by_names=["metric_time__day"],
+            output_table=output_table.sql,
+            incremental_lookback=datetime.timedelta(days=1),
+        )
+        # The output table is only read when the query is run.
+        explain_result = it_helpers.mf_engine.explain(incremental_request)
+        task = explain_result.execution_plan.sink_nodes[0]
+        assert isinstance(task, SelectSqlQueryToTableTask)
+        assert task.incremental_write is None
+        query_result = it_helpers.mf_engine.query(incremental_request)
+        time_range_constraint = query_result.query_spec.time_range_constraint
+        assert time_range_constraint is not None
+        assert time_range_constraint.start_time == as_datetime("2019-12-31")
+
+        expected = it_helpers.mf_engine.query(
+            MetricFlowQueryRequest.create_with_random_request_id(
+                metric_names=["bookings"], group_by_names=["metric_time__day"]
+            )
+        ).result_df
+        assert expected is not None
+        actual = it_helpers.sql_client.query(f"SELECT bookings, metric_time__day FROM {output_table.sql}")
+        if it_helpers.sql_client.sql_engine_type is SqlEngine.SNOWFLAKE:
+            actual.columns = [column_name.lower() for column_name in actual.columns]
+
+        in_window = actual["metric_time__day"] >= as_datetime("2019-12-31")
+        assert (~in_window).any()
+        assert (actual[~in_window]["bookings"] == -1).all()
+        assert_dataframes_equal(
+            actual=actual[in_window],
+            expected=expected[expected["metric_time__day"] >= as_datetime("2019-12-31")],
+            sort_columns=True,
+        )
+    finally:
+        it_helpers.sql_client.execute(f"DROP TABLE IF EXISTS {output_table.sql}")
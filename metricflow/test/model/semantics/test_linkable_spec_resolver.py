@@ -123,3 +123,53 @@ def test_cyclic_join_manifest(  # noqa: D
             without_any_of=frozenset(),
         ),
     )
+
+
+def test_warm_up_in_background(simple_semantic_manifest_lookup: SemanticManifestLookup) -> None:
+    """Checks that a resolver warmed up in the background returns the same elements as one that computes them lazily."""
+    warmed_up_resolver = ValidLinkableSpecResolver(
+        semantic_manifest=simple_semantic_manifest_lookup.semantic_manifest,
+        semantic_model_lookup=simple_semantic_manifest_lookup.semantic_model_lookup,
+        max_entity_links=MAX_JOIN_HOPS,
+        warm_up_in_background=True,
+    )
+    lazy_resolver = ValidLinkableSpecResolver(
+        semantic_manifest=simple_semantic_manifest_lookup.semantic_manifest,
+        semantic_model_lookup=simple_semantic_manifest_lookup.semantic_model_lookup,
+        max_entity_links=MAX_JOIN_HOPS,
+    )
+    warmed_up_resolver.wait_for_warm_up()
+
+    for metric in simple_semantic_manifest_lookup.semantic_manifest.metrics:
+        metric_references = [MetricReference(element_name=metric.name)]
+        assert warmed_up_resolver.get_linkable_elements_for_metrics(
+            metric_references=metric_references,
+            with_any_of=LinkableElementProperties.all_properties(),
+            without_any_of=frozenset(),
+        ) == lazy_resolver.get_linkable_elements_for_metrics(
+            metric_references=metric_references,
+            with_any_of=LinkableElementProperties.all_properties(),
+            without_any_of=frozenset(),
+        )
+
+
+def test_deeper_join_paths(simple_semantic_manifest_lookup: SemanticManifestLookup) -> None:
+    """Checks that allowing longer join paths only adds elements, and that path expansion stops without cycles."""
+    linkable_element_sets = []
+    for max_entity_links in (MAX_JOIN_HOPS, MAX_JOIN_HOPS + 3):
+        resolver = ValidLinkableSpecResolver(
+            semantic_manifest=simple_semantic_manifest_lookup.semantic_manifest,
+            semantic_model_lookup=simple_semantic_manifest_lookup.semantic_model_lookup,
+            max_entity_links=max_entity_links,
+        )
+        linkable_element_sets.append(
+            resolver.get_linkable_elements_for_metrics(
+                metric_references=[MetricReference(element_name="bookings")],
+                with_any_of=LinkableElementProperties.all_properties(),
+                without_any_of=frozenset(),
+            )
+        )
+
+    shallow_set, deep_set = linkable_element_sets
+    assert set(shallow_set.path_key_to_linkable_dimensions).issubset(deep_set.path_key_to_linkable_dimensions)
+    assert set(shallow_set.path_key_to_linkable_entities).issubset(deep_set.path_key_to_linkable_entities)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import Tuple
+from functools import partial
+from typing import List, Tuple
 
 import pytest
 from _pytest.fixtures import FixtureRequest
@@ -77,6 +78,45 @@ def test_task_runner(sql_client: SqlClient, mf_test_session_state: MetricFlowTes
     assert err_msg_bad in issues.errors[0].message
 
 
+def test_concurrent_task_runner(  # noqa: D
+    sql_client: SqlClient, mf_test_session_state: MetricFlowTestSessionState
+) -> None:
+    def query(table_name: str) -> Tuple[str, SqlBindParameters]:
+        return (f"SELECT 1 AS col1 FROM {table_name}", SqlBindParameters())
+
+    def bad_task(index: int, on_fail_subtasks: List[DataWarehouseValidationTask]) -> DataWarehouseValidationTask:
+        return DataWarehouseValidationTask(
+            query_and_params_callable=partial(query, f"doesnt_exist_{index}"),
+            error_message=f"Bad task {index}",
+            on_fail_subtasks=on_fail_subtasks,
+        )
+
+    good_task = DataWarehouseValidationTask(
+        query_and_params_callable=lambda: ("SELECT 'foo' AS foo", SqlBindParameters()), error_message="Good task"
+    )
+    tasks = [
+        bad_task(0, on_fail_subtasks=[good_task, bad_task(1, on_fail_subtasks=[bad_task(2, on_fail_subtasks=[])])]),
+        good_task,
+        bad_task(3, on_fail_subtasks=[]),
+    ]
+    # The issues should be in the same order as if the tasks were run one after another.
+    expected_messages = ["Bad task 0", "Bad task 1", "Bad task 2", "Bad task 3"]
+    for max_workers in (1, 4):
+        issues = DataWarehouseModelValidator(sql_client=sql_client, max_workers=max_workers).run_tasks(tasks=tasks)
+        assert [issue.message.split("\n")[0] for issue in issues.all_issues] == expected_messages
+
+
+def test_task_runner_timeout(sql_client: SqlClient) -> None:  # noqa: D
+    tasks = [
+        DataWarehouseValidationTask(
+            query_and_params_callable=lambda: ("SELECT 'foo' AS foo", SqlBindParameters()), error_message="Good task"
+        )
+    ]
+    issues = DataWarehouseModelValidator(sql_client=sql_client, max_workers=2).run_tasks(tasks=tasks, timeout=-1)
+    assert len(issues.warnings) == 1
+    assert "Completed 0/1 tasks" in issues.warnings[0].message
+
+
 def test_validate_semantic_models(  # noqa: D
     dw_backed_warehouse_validation_model: PydanticSemanticManifest,
     sql_client: SqlClient,
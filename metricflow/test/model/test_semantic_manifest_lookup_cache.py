@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+from dbt_semantic_interfaces.references import MetricReference
+
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.model.semantic_manifest_lookup_cache import SemanticManifestLookupCache
+from metricflow.model.semantics.linkable_element_properties import LinkableElementProperties
+
+
+def _element_names(semantic_manifest_lookup: SemanticManifestLookup) -> List[str]:
+    return [
+        spec.qualified_name
+        for spec in semantic_manifest_lookup.metric_lookup.element_specs_for_metrics(
+            [MetricReference(element_name="bookings")],
+            with_any_property=LinkableElementProperties.all_properties(),
+        )
+    ]
+
+
+def test_snapshot_reused(simple_semantic_manifest: SemanticManifest, tmp_path: Path) -> None:
+    """Checks that a snapshot is written on the first load, and that lookups from it return the same elements."""
+    cache = SemanticManifestLookupCache(str(tmp_path))
+    first_lookup = cache.load_or_create_lookup(simple_semantic_manifest)
+    snapshot_paths = list(tmp_path.iterdir())
+    assert len(snapshot_paths) == 1
+
+    second_lookup = cache.load_or_create_lookup(simple_semantic_manifest)
+    assert _element_names(second_lookup) == _element_names(first_lookup)
+    assert _element_names(second_lookup) == _element_names(SemanticManifestLookup(simple_semantic_manifest))
+    assert list(tmp_path.iterdir()) == snapshot_paths
+
+
+def test_corrupt_snapshot_rebuilt(simple_semantic_manifest: SemanticManifest, tmp_path: Path) -> None:  # noqa: D
+    cache = SemanticManifestLookupCache(str(tmp_path))
+    cache.load_or_create_lookup(simple_semantic_manifest)
+    (snapshot_path,) = tmp_path.iterdir()
+    snapshot_path.write_bytes(b"not a pickle")
+
+    semantic_manifest_lookup = cache.load_or_create_lookup(simple_semantic_manifest)
+    assert _element_names(semantic_manifest_lookup) == _element_names(SemanticManifestLookup(simple_semantic_manifest))
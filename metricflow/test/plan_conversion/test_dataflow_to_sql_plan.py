@@ -29,6 +29,8 @@ from metricflow.dataflow.dataflow_plan import (
     WriteToResultDataframeNode,
 )
 from metricflow.filters.time_constraint import TimeRangeConstraint
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.plan_conversion.column_resolver import DunderColumnAssociationResolver
 from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
 from metricflow.protocols.sql_client import SqlClient
 from metricflow.query.query_parser import MetricFlowQueryParser
@@ -936,6 +938,114 @@ def test_semi_additive_join_node_with_grouping(
     )
 
 
+@pytest.fixture
+def window_function_dataflow_to_sql_converter(  # noqa: D
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+) -> DataflowToSqlQueryPlanConverter:
+    return DataflowToSqlQueryPlanConverter(
+        column_association_resolver=DunderColumnAssociationResolver(simple_semantic_manifest_lookup),
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        use_window_functions_for_semi_additive_joins=True,
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_semi_additive_join_node_with_window_functions(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    window_function_dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests converting a SemiAdditiveJoinNode to SQL that filters rows with a window function.
+
+    Engines that don't support QUALIFY render the filter as a sub-query.
+    """
+    non_additive_dimension_spec = NonAdditiveDimensionSpec(name="ds", window_choice=AggregationType.MIN)
+    time_dimension_spec = TimeDimensionSpec(element_name="ds", entity_links=())
+
+    measure_source_node = consistent_id_object_repository.simple_model_read_nodes["accounts_source"]
+    semi_additive_join_node = SemiAdditiveJoinNode(
+        parent_node=measure_source_node,
+        entity_specs=tuple(),
+        time_dimension_spec=time_dimension_spec,
+        agg_by_function=non_additive_dimension_spec.window_choice,
+    )
+
+    convert_and_check(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dataflow_to_sql_converter=window_function_dataflow_to_sql_converter,
+        sql_client=sql_client,
+        node=semi_additive_join_node,
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_semi_additive_join_node_with_queried_group_by_and_window_functions(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    window_function_dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests converting a SemiAdditiveJoinNode with a queried time granularity using a window function."""
+    non_additive_dimension_spec = NonAdditiveDimensionSpec(name="ds", window_choice=AggregationType.MIN)
+    time_dimension_spec = TimeDimensionSpec(element_name="ds", entity_links=())
+    queried_time_dimension_spec = TimeDimensionSpec(
+        element_name="ds", entity_links=(), time_granularity=TimeGranularity.WEEK
+    )
+
+    measure_source_node = consistent_id_object_repository.simple_model_read_nodes["accounts_source"]
+    semi_additive_join_node = SemiAdditiveJoinNode(
+        parent_node=measure_source_node,
+        entity_specs=tuple(),
+        time_dimension_spec=time_dimension_spec,
+        agg_by_function=non_additive_dimension_spec.window_choice,
+        queried_time_dimension_spec=queried_time_dimension_spec,
+    )
+    convert_and_check(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dataflow_to_sql_converter=window_function_dataflow_to_sql_converter,
+        sql_client=sql_client,
+        node=semi_additive_join_node,
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_semi_additive_join_node_with_grouping_and_window_functions(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    window_function_dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests converting a SemiAdditiveJoinNode with a window_grouping using a window function."""
+    non_additive_dimension_spec = NonAdditiveDimensionSpec(
+        name="ds",
+        window_choice=AggregationType.MAX,
+        window_groupings=("user",),
+    )
+    entity_spec = LinklessEntitySpec(element_name="user", entity_links=())
+    time_dimension_spec = TimeDimensionSpec(element_name="ds", entity_links=())
+
+    measure_source_node = consistent_id_object_repository.simple_model_read_nodes["accounts_source"]
+    semi_additive_join_node = SemiAdditiveJoinNode(
+        parent_node=measure_source_node,
+        entity_specs=(entity_spec,),
+        time_dimension_spec=time_dimension_spec,
+        agg_by_function=non_additive_dimension_spec.window_choice,
+    )
+    convert_and_check(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dataflow_to_sql_converter=window_function_dataflow_to_sql_converter,
+        sql_client=sql_client,
+        node=semi_additive_join_node,
+    )
+
+
 @pytest.mark.sql_engine_snapshot
 def test_constrain_time_range_node(
     request: FixtureRequest,
@@ -11,6 +11,7 @@ from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
 
 from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
 from metricflow.filters.time_constraint import TimeRangeConstraint
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
 from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
 from metricflow.protocols.sql_client import SqlClient
 from metricflow.query.query_parser import MetricFlowQueryParser
@@ -23,7 +24,7 @@ from metricflow.specs.specs import (
 from metricflow.test.fixtures.model_fixtures import ConsistentIdObjectRepository
 from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
 from metricflow.test.query_rendering.compare_rendered_query import convert_and_check
-from metricflow.test.time.metric_time_dimension import MTD_SPEC_MONTH
+from metricflow.test.time.metric_time_dimension import MTD_SPEC_DAY, MTD_SPEC_MONTH
 
 
 @pytest.mark.sql_engine_snapshot
@@ -295,3 +296,137 @@ def test_cumulative_metric_month(
         sql_client=sql_client,
         node=dataflow_plan.sink_output_nodes[0].parent_node,
     )
+
+
+@pytest.fixture
+def window_function_dataflow_plan_builder(  # noqa: D
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+) -> DataflowPlanBuilder:
+    return DataflowPlanBuilder(
+        source_nodes=consistent_id_object_repository.simple_model_source_nodes,
+        read_nodes=list(consistent_id_object_repository.simple_model_read_nodes.values()),
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        time_spine_source_node=consistent_id_object_repository.simple_model_time_spine_source_node,
+        use_window_functions_for_cumulative_metrics=True,
+    )
+
+
+@pytest.fixture
+def extended_date_window_function_dataflow_plan_builder(  # noqa: D
+    extended_date_semantic_manifest_lookup: SemanticManifestLookup,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+) -> DataflowPlanBuilder:
+    return DataflowPlanBuilder(
+        source_nodes=consistent_id_object_repository.extended_date_model_source_nodes,
+        read_nodes=list(consistent_id_object_repository.extended_date_model_read_nodes.values()),
+        semantic_manifest_lookup=extended_date_semantic_manifest_lookup,
+        time_spine_source_node=consistent_id_object_repository.extended_date_model_time_spine_source_node,
+        use_window_functions_for_cumulative_metrics=True,
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_cumulative_metric_with_window_functions(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    window_function_dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests rendering an all-time cumulative metric using a window function over the daily aggregates."""
+    dataflow_plan = window_function_dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="revenue_all_time"),),
+            time_dimension_specs=(MTD_SPEC_DAY,),
+            time_range_constraint=TimeRangeConstraint(
+                start_time=as_datetime("2020-01-03"), end_time=as_datetime("2020-01-05")
+            ),
+        )
+    )
+
+    convert_and_check(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        node=dataflow_plan.sink_output_nodes[0].parent_node,
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_cumulative_metric_grain_to_date_with_window_functions(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    window_function_dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests rendering a grain-to-date cumulative metric using a window function partitioned by the grain."""
+    dataflow_plan = window_function_dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="revenue_mtd"),),
+            time_dimension_specs=(MTD_SPEC_DAY,),
+        )
+    )
+
+    convert_and_check(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        node=dataflow_plan.sink_output_nodes[0].parent_node,
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_cumulative_metric_window_of_days_with_window_functions(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    extended_date_window_function_dataflow_plan_builder: DataflowPlanBuilder,
+    extended_date_dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests rendering a cumulative metric with a window of days using a window function over a frame of rows."""
+    dataflow_plan = extended_date_window_function_dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="weekly_bookers"),),
+            time_dimension_specs=(MTD_SPEC_DAY,),
+            time_range_constraint=TimeRangeConstraint(
+                start_time=as_datetime("2020-01-03"), end_time=as_datetime("2020-01-20")
+            ),
+        )
+    )
+
+    convert_and_check(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dataflow_to_sql_converter=extended_date_dataflow_to_sql_converter,
+        sql_client=sql_client,
+        node=dataflow_plan.sink_output_nodes[0].parent_node,
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_cumulative_metric_with_window_functions_and_other_group_by_items(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    window_function_dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests rendering a cumulative metric using a window function partitioned by the other group-by items."""
+    query_spec = query_parser.parse_and_validate_query(
+        metric_names=("revenue_all_time",),
+        group_by_names=("metric_time__day", "user__home_state_latest"),
+    )
+    dataflow_plan = window_function_dataflow_plan_builder.build_plan(query_spec)
+
+    convert_and_check(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        node=dataflow_plan.sink_output_nodes[0].parent_node,
+    )
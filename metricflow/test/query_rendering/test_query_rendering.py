@@ -30,9 +30,11 @@ from metricflow.specs.specs import (
     MetricSpec,
     TimeDimensionSpec,
 )
+from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
 from metricflow.test.fixtures.model_fixtures import ConsistentIdObjectRepository
 from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
 from metricflow.test.query_rendering.compare_rendered_query import convert_and_check
+from metricflow.test.snapshot_utils import assert_plan_snapshot_text_equal, make_schema_replacement_function
 from metricflow.test.time.metric_time_dimension import MTD_SPEC_DAY
 
 
@@ -56,6 +58,18 @@ def scd_dataflow_to_sql_converter(  # noqa: D
     )
 
 
+@pytest.fixture
+def parameterized_dataflow_to_sql_converter(  # noqa: D
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+) -> DataflowToSqlQueryPlanConverter:
+    return DataflowToSqlQueryPlanConverter(
+        column_association_resolver=DunderColumnAssociationResolver(simple_semantic_manifest_lookup),
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        bind_parameter_key_renderer=sql_client.render_bind_parameter_key,
+    )
+
+
 @pytest.mark.sql_engine_snapshot
 def test_multihop_node(
     request: FixtureRequest,
@@ -557,3 +571,70 @@ def test_min_max_only_time_quarter(
         sql_client=sql_client,
         node=dataflow_plan.sink_output_nodes[0].parent_node,
     )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_parameterized_time_constraint(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    dataflow_plan_builder: DataflowPlanBuilder,
+    parameterized_dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests that the bounds of a time constraint are rendered as bind parameters, and filter literals as written."""
+    query_spec = query_parser.parse_and_validate_query(
+        metric_names=("bookings",),
+        group_by_names=(METRIC_TIME_ELEMENT_NAME,),
+        time_constraint_start=as_datetime("2019-12-01"),
+        time_constraint_end=as_datetime("2020-01-03"),
+        where_constraint=PydanticWhereFilter(
+            where_sql_template="{{ Dimension('booking__is_instant') }} = 'false'",
+        ),
+    )
+    dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
+
+    convert_and_check(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dataflow_to_sql_converter=parameterized_dataflow_to_sql_converter,
+        sql_client=sql_client,
+        node=dataflow_plan.sink_output_nodes[0].parent_node,
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_shared_sub_queries_as_ctes(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests rendering the sub-queries that appear more than once in a query as CTEs."""
+    # The ratio metrics each read the same columns from the bookings source before joining to listings.
+    query_spec = query_parser.parse_and_validate_query(
+        metric_names=("bookings_per_view", "bookings_per_listing"),
+        group_by_names=("metric_time__day", "listing__country_latest"),
+    )
+    dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
+    sql_query_plan = dataflow_to_sql_converter.convert_to_sql_query_plan(
+        sql_engine_type=sql_client.sql_engine_type,
+        sql_query_plan_id="plan0_optimized",
+        dataflow_plan_node=dataflow_plan.sink_output_nodes[0].parent_node,
+        optimization_level=SqlQueryOptimizationLevel.O4,
+    )
+    sql_plan_renderer = type(sql_client.sql_query_plan_renderer)(render_shared_sub_queries_as_ctes=True)
+
+    assert_plan_snapshot_text_equal(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        plan=sql_query_plan,
+        plan_snapshot_text=sql_plan_renderer.render_sql_query_plan(sql_query_plan).sql,
+        plan_snapshot_file_extension=".sql",
+        incomparable_strings_replacement_function=make_schema_replacement_function(
+            system_schema=mf_test_session_state.mf_system_schema, source_schema=mf_test_session_state.mf_source_schema
+        ),
+        additional_sub_directories_for_snapshots=(sql_client.sql_engine_type.value,),
+    )
@@ -0,0 +1,324 @@
+"""Tests reading measures from rollup tables, mostly by comparing rendered output against snapshot files."""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+from dbt_semantic_interfaces.implementations.filters.where_filter import PydanticWhereFilter
+from dbt_semantic_interfaces.test_utils import as_datetime
+from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.builder.source_node import SourceNodeBuilder
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.dataset.convert_semantic_model import SemanticModelToDataSetConverter
+from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow.plan_conversion.column_resolver import DunderColumnAssociationResolver
+from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
+from metricflow.plan_conversion.rollup_table import RollupTable
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.query.query_parser import MetricFlowQueryParser
+from metricflow.test.fixtures.model_fixtures import ConsistentIdObjectRepository
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+from metricflow.test.query_rendering.compare_rendered_query import convert_and_check
+
+_BOOKINGS_ROLLUP_MEASURE_NAMES = ("bookings", "instant_bookings", "booking_value", "max_booking_value")
+
+ROLLUP_TABLES = (
+    RollupTable(
+        sql_table=SqlTable(schema_name="rollup_schema", table_name="bookings_by_day"),
+        semantic_model_name="bookings_source",
+        measure_names=_BOOKINGS_ROLLUP_MEASURE_NAMES,
+        time_dimension_name="ds",
+        dimension_names=("is_instant",),
+        entity_names=("listing",),
+    ),
+    RollupTable(
+        sql_table=SqlTable(schema_name="rollup_schema", table_name="bookings_by_month"),
+        semantic_model_name="bookings_source",
+        measure_names=_BOOKINGS_ROLLUP_MEASURE_NAMES,
+        time_dimension_name="ds",
+        time_granularity=TimeGranularity.MONTH,
+    ),
+    RollupTable(
+        sql_table=SqlTable(schema_name="rollup_schema", table_name="revenue_by_month"),
+        semantic_model_name="revenue",
+        measure_names=("txn_revenue",),
+        time_dimension_name="ds",
+        time_granularity=TimeGranularity.MONTH,
+    ),
+)
+
+
+@pytest.fixture
+def rollup_dataflow_plan_builder(  # noqa: D
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+) -> DataflowPlanBuilder:
+    rollup_source_nodes = SourceNodeBuilder(simple_semantic_manifest_lookup).create_from_rollup_tables(
+        rollup_tables=ROLLUP_TABLES,
+        data_set_converter=SemanticModelToDataSetConverter(
+            DunderColumnAssociationResolver(simple_semantic_manifest_lookup)
+        ),
+    )
+    return DataflowPlanBuilder(
+        source_nodes=consistent_id_object_repository.simple_model_source_nodes,
+        read_nodes=list(consistent_id_object_repository.simple_model_read_nodes.values()),
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        time_spine_source_node=consistent_id_object_repository.simple_model_time_spine_source_node,
+        rollup_source_nodes=rollup_source_nodes,
+    )
+
+
+def _convert_and_check_query(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+    metric_names: Sequence[str],
+    group_by_names: Sequence[str],
+    where_sql_template: Optional[str] = None,
+    time_constraint_start: Optional[str] = None,
+    time_constraint_end: Optional[str] = None,
+) -> None:
+    query_spec = query_parser.parse_and_validate_query(
+        metric_names=metric_names,
+        group_by_names=group_by_names,
+        where_constraint=(
+            PydanticWhereFilter(where_sql_template=where_sql_template) if where_sql_template is not None else None
+        ),
+        time_constraint_start=as_datetime(time_constraint_start) if time_constraint_start is not None else None,
+        time_constraint_end=as_datetime(time_constraint_end) if time_constraint_end is not None else None,
+    )
+    dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
+
+    convert_and_check(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        node=dataflow_plan.sink_output_nodes[0].parent_node,
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_rollup_table(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    rollup_dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests reading measures from a daily rollup table and aggregating them again by a dimension in the rollup."""
+    _convert_and_check_query(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        query_parser=query_parser,
+        dataflow_plan_builder=rollup_dataflow_plan_builder,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        metric_names=("booking_value", "max_booking_value", "instant_bookings"),
+        group_by_names=("metric_time__day", "booking__is_instant"),
+        where_sql_template="{{ TimeDimension('metric_time', 'day') }} >= '2020-01-02'",
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_rollup_table_with_join(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    rollup_dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests joining a rollup table to another semantic model through an entity in the rollup."""
+    _convert_and_check_query(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        query_parser=query_parser,
+        dataflow_plan_builder=rollup_dataflow_plan_builder,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        metric_names=("bookings",),
+        group_by_names=("listing__country_latest",),
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_smallest_rollup_table_is_used(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    rollup_dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests that the monthly rollup table is used instead of the daily one when both satisfy the query."""
+    _convert_and_check_query(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        query_parser=query_parser,
+        dataflow_plan_builder=rollup_dataflow_plan_builder,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        metric_names=("bookings",),
+        group_by_names=("metric_time__month",),
+        time_constraint_start="2019-12-01",
+        time_constraint_end="2020-01-31",
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_rollup_table_with_time_constraint_within_grain(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    rollup_dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests that the daily rollup table is used when the time constraint doesn't start on a month boundary."""
+    _convert_and_check_query(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        query_parser=query_parser,
+        dataflow_plan_builder=rollup_dataflow_plan_builder,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        metric_names=("bookings",),
+        group_by_names=(),
+        time_constraint_start="2019-12-15",
+        time_constraint_end="2020-01-31",
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_rollup_table_not_used_for_missing_dimension(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    rollup_dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests that the table of the semantic model is read when a group-by item isn't in any rollup table."""
+    _convert_and_check_query(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        query_parser=query_parser,
+        dataflow_plan_builder=rollup_dataflow_plan_builder,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        metric_names=("bookings",),
+        group_by_names=("metric_time__week", "booking__paid_at__day"),
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_rollup_table_with_coarser_grain(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    rollup_dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests reading a measure from a monthly rollup table when the query is at the same grain."""
+    _convert_and_check_query(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        query_parser=query_parser,
+        dataflow_plan_builder=rollup_dataflow_plan_builder,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        metric_names=("revenue",),
+        group_by_names=("metric_time__month",),
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_rollup_table_not_used_for_cumulative_metric(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    rollup_dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests that a cumulative metric isn't read from a rollup table that's coarser than its time dimension.
+
+    The time range join is at the granularity of the aggregation time dimension, so the monthly rollup can't be used even
+    though the time constraint starts and ends on month boundaries.
+    """
+    _convert_and_check_query(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        query_parser=query_parser,
+        dataflow_plan_builder=rollup_dataflow_plan_builder,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        metric_names=("trailing_2_months_revenue",),
+        group_by_names=("metric_time__day",),
+        time_constraint_start="2020-01-01",
+        time_constraint_end="2020-12-31",
+    )
+
+
+@pytest.mark.sql_engine_snapshot
+def test_rollup_table_with_offset_metric(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    query_parser: MetricFlowQueryParser,
+    rollup_dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests that the offset input of a derived metric is read from a rollup table at the aggregation time grain.
+
+    The offset is applied by joining to the time spine at the granularity of the aggregation time dimension, so the
+    offset input is read from the daily rollup table while the other input is read from the monthly one.
+    """
+    _convert_and_check_query(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        query_parser=query_parser,
+        dataflow_plan_builder=rollup_dataflow_plan_builder,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        metric_names=("bookings_growth_2_weeks",),
+        group_by_names=("metric_time__month",),
+    )
+
+
+@pytest.mark.parametrize(
+    ("measure_names", "match"),
+    [
+        (("bookings", "bookers"), "can't be aggregated again"),
+        (("booking_payments",), "aggregation time dimension 'paid_at'"),
+        (("bookings", "does_not_exist"), "does not exist"),
+    ],
+)
+def test_invalid_rollup_table(  # noqa: D
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    measure_names: Sequence[str],
+    match: str,
+) -> None:
+    rollup_table = RollupTable(
+        sql_table=SqlTable(schema_name="rollup_schema", table_name="bookings_rollup"),
+        semantic_model_name="bookings_source",
+        measure_names=tuple(measure_names),
+        time_dimension_name="ds",
+    )
+    with pytest.raises(ValueError, match=match):
+        SourceNodeBuilder(simple_semantic_manifest_lookup).create_from_rollup_tables(
+            rollup_tables=(rollup_table,),
+            data_set_converter=SemanticModelToDataSetConverter(
+                DunderColumnAssociationResolver(simple_semantic_manifest_lookup)
+            ),
+        )
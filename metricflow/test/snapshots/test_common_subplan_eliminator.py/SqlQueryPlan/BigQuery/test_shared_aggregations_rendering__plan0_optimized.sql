@@ -0,0 +1,115 @@
+WITH cte_36 AS (
+  -- Aggregate Measures
+  -- Compute Metrics via Expressions
+  SELECT
+    metric_time__day
+    , SUM(bookings) AS bookings
+  FROM (
+    -- Read Elements From Semantic Model 'bookings_source'
+    -- Metric Time Dimension 'ds'
+    -- Pass Only Elements: ['bookings', 'metric_time__day']
+    SELECT
+      DATE_TRUNC(ds, day) AS metric_time__day
+      , 1 AS bookings
+    FROM ***************************.fct_bookings bookings_source_src_10001
+  ) subq_34
+  GROUP BY
+    metric_time__day
+)
+-- Combine Aggregated Outputs
+SELECT
+  COALESCE(subq_44.metric_time__day, subq_53.metric_time__day, subq_62.metric_time__day) AS metric_time__day
+  , MAX(CAST(subq_44.bookings AS FLOAT64) / CAST(NULLIF(subq_44.bookers, 0) AS FLOAT64)) AS bookings_per_booker
+  , MAX(CAST(subq_53.bookings AS FLOAT64) / CAST(NULLIF(subq_53.views, 0) AS FLOAT64)) AS bookings_per_view
+  , MAX(CAST(subq_62.bookings AS FLOAT64) / CAST(NULLIF(subq_62.listings, 0) AS FLOAT64)) AS bookings_per_listing
+FROM (
+  -- Combine Aggregated Outputs
+  SELECT
+    COALESCE(subq_37.metric_time__day, subq_43.metric_time__day) AS metric_time__day
+    , MAX(subq_37.bookings) AS bookings
+    , MAX(subq_43.bookers) AS bookers
+  FROM cte_36 subq_37
+  FULL OUTER JOIN (
+    -- Read Elements From Semantic Model 'bookings_source'
+    -- Metric Time Dimension 'ds'
+    -- Pass Only Elements: ['bookers', 'metric_time__day']
+    -- Aggregate Measures
+    -- Compute Metrics via Expressions
+    SELECT
+      DATE_TRUNC(ds, day) AS metric_time__day
+      , COUNT(DISTINCT guest_id) AS bookers
+    FROM ***************************.fct_bookings bookings_source_src_10001
+    GROUP BY
+      metric_time__day
+  ) subq_43
+  ON
+    subq_37.metric_time__day = subq_43.metric_time__day
+  GROUP BY
+    metric_time__day
+) subq_44
+FULL OUTER JOIN (
+  -- Combine Aggregated Outputs
+  SELECT
+    COALESCE(subq_46.metric_time__day, subq_52.metric_time__day) AS metric_time__day
+    , MAX(subq_46.bookings) AS bookings
+    , MAX(subq_52.views) AS views
+  FROM cte_36 subq_46
+  FULL OUTER JOIN (
+    -- Aggregate Measures
+    -- Compute Metrics via Expressions
+    SELECT
+      metric_time__day
+      , SUM(views) AS views
+    FROM (
+      -- Read Elements From Semantic Model 'views_source'
+      -- Metric Time Dimension 'ds'
+      -- Pass Only Elements: ['views', 'metric_time__day']
+      SELECT
+        DATE_TRUNC(ds, day) AS metric_time__day
+        , 1 AS views
+      FROM ***************************.fct_views views_source_src_10010
+    ) subq_50
+    GROUP BY
+      metric_time__day
+  ) subq_52
+  ON
+    subq_46.metric_time__day = subq_52.metric_time__day
+  GROUP BY
+    metric_time__day
+) subq_53
+ON
+  subq_44.metric_time__day = subq_53.metric_time__day
+FULL OUTER JOIN (
+  -- Combine Aggregated Outputs
+  SELECT
+    COALESCE(subq_55.metric_time__day, subq_61.metric_time__day) AS metric_time__day
+    , MAX(subq_55.bookings) AS bookings
+    , MAX(subq_61.listings) AS listings
+  FROM cte_36 subq_55
+  FULL OUTER JOIN (
+    -- Aggregate Measures
+    -- Compute Metrics via Expressions
+    SELECT
+      metric_time__day
+      , SUM(listings) AS listings
+    FROM (
+      -- Read Elements From Semantic Model 'listings_latest'
+      -- Metric Time Dimension 'ds'
+      -- Pass Only Elements: ['listings', 'metric_time__day']
+      SELECT
+        DATE_TRUNC(created_at, day) AS metric_time__day
+        , 1 AS listings
+      FROM ***************************.dim_listings_latest listings_latest_src_10005
+    ) subq_59
+    GROUP BY
+      metric_time__day
+  ) subq_61
+  ON
+    subq_55.metric_time__day = subq_61.metric_time__day
+  GROUP BY
+    metric_time__day
+) subq_62
+ON
+  COALESCE(subq_44.metric_time__day, subq_53.metric_time__day) = subq_62.metric_time__day
+GROUP BY
+  metric_time__day
@@ -0,0 +1,804 @@
+WITH cte_4 AS (
+  -- Compute Metrics via Expressions
+  SELECT
+    subq_3.metric_time__day
+    , subq_3.bookings
+  FROM (
+    -- Aggregate Measures
+    SELECT
+      subq_2.metric_time__day
+      , SUM(subq_2.bookings) AS bookings
+    FROM (
+      -- Pass Only Elements: ['bookings', 'metric_time__day']
+      SELECT
+        subq_1.metric_time__day
+        , subq_1.bookings
+      FROM (
+        -- Metric Time Dimension 'ds'
+        SELECT
+          subq_0.ds__day
+          , subq_0.ds__week
+          , subq_0.ds__month
+          , subq_0.ds__quarter
+          , subq_0.ds__year
+          , subq_0.ds__extract_year
+          , subq_0.ds__extract_quarter
+          , subq_0.ds__extract_month
+          , subq_0.ds__extract_day
+          , subq_0.ds__extract_dow
+          , subq_0.ds__extract_doy
+          , subq_0.ds_partitioned__day
+          , subq_0.ds_partitioned__week
+          , subq_0.ds_partitioned__month
+          , subq_0.ds_partitioned__quarter
+          , subq_0.ds_partitioned__year
+          , subq_0.ds_partitioned__extract_year
+          , subq_0.ds_partitioned__extract_quarter
+          , subq_0.ds_partitioned__extract_month
+          , subq_0.ds_partitioned__extract_day
+          , subq_0.ds_partitioned__extract_dow
+          , subq_0.ds_partitioned__extract_doy
+          , subq_0.paid_at__day
+          , subq_0.paid_at__week
+          , subq_0.paid_at__month
+          , subq_0.paid_at__quarter
+          , subq_0.paid_at__year
+          , subq_0.paid_at__extract_year
+          , subq_0.paid_at__extract_quarter
+          , subq_0.paid_at__extract_month
+          , subq_0.paid_at__extract_day
+          , subq_0.paid_at__extract_dow
+          , subq_0.paid_at__extract_doy
+          , subq_0.booking__ds__day
+          , subq_0.booking__ds__week
+          , subq_0.booking__ds__month
+          , subq_0.booking__ds__quarter
+          , subq_0.booking__ds__year
+          , subq_0.booking__ds__extract_year
+          , subq_0.booking__ds__extract_quarter
+          , subq_0.booking__ds__extract_month
+          , subq_0.booking__ds__extract_day
+          , subq_0.booking__ds__extract_dow
+          , subq_0.booking__ds__extract_doy
+          , subq_0.booking__ds_partitioned__day
+          , subq_0.booking__ds_partitioned__week
+          , subq_0.booking__ds_partitioned__month
+          , subq_0.booking__ds_partitioned__quarter
+          , subq_0.booking__ds_partitioned__year
+          , subq_0.booking__ds_partitioned__extract_year
+          , subq_0.booking__ds_partitioned__extract_quarter
+          , subq_0.booking__ds_partitioned__extract_month
+          , subq_0.booking__ds_partitioned__extract_day
+          , subq_0.booking__ds_partitioned__extract_dow
+          , subq_0.booking__ds_partitioned__extract_doy
+          , subq_0.booking__paid_at__day
+          , subq_0.booking__paid_at__week
+          , subq_0.booking__paid_at__month
+          , subq_0.booking__paid_at__quarter
+          , subq_0.booking__paid_at__year
+          , subq_0.booking__paid_at__extract_year
+          , subq_0.booking__paid_at__extract_quarter
+          , subq_0.booking__paid_at__extract_month
+          , subq_0.booking__paid_at__extract_day
+          , subq_0.booking__paid_at__extract_dow
+          , subq_0.booking__paid_at__extract_doy
+          , subq_0.ds__day AS metric_time__day
+          , subq_0.ds__week AS metric_time__week
+          , subq_0.ds__month AS metric_time__month
+          , subq_0.ds__quarter AS metric_time__quarter
+          , subq_0.ds__year AS metric_time__year
+          , subq_0.ds__extract_year AS metric_time__extract_year
+          , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+          , subq_0.ds__extract_month AS metric_time__extract_month
+          , subq_0.ds__extract_day AS metric_time__extract_day
+          , subq_0.ds__extract_dow AS metric_time__extract_dow
+          , subq_0.ds__extract_doy AS metric_time__extract_doy
+          , subq_0.listing
+          , subq_0.guest
+          , subq_0.host
+          , subq_0.booking__listing
+          , subq_0.booking__guest
+          , subq_0.booking__host
+          , subq_0.is_instant
+          , subq_0.booking__is_instant
+          , subq_0.bookings
+          , subq_0.instant_bookings
+          , subq_0.booking_value
+          , subq_0.max_booking_value
+          , subq_0.min_booking_value
+          , subq_0.bookers
+          , subq_0.average_booking_value
+          , subq_0.referred_bookings
+          , subq_0.median_booking_value
+          , subq_0.booking_value_p99
+          , subq_0.discrete_booking_value_p99
+          , subq_0.approximate_continuous_booking_value_p99
+          , subq_0.approximate_discrete_booking_value_p99
+        FROM (
+          -- Read Elements From Semantic Model 'bookings_source'
+          SELECT
+            1 AS bookings
+            , CASE WHEN is_instant THEN 1 ELSE 0 END AS instant_bookings
+            , bookings_source_src_10001.booking_value
+            , bookings_source_src_10001.booking_value AS max_booking_value
+            , bookings_source_src_10001.booking_value AS min_booking_value
+            , bookings_source_src_10001.guest_id AS bookers
+            , bookings_source_src_10001.booking_value AS average_booking_value
+            , bookings_source_src_10001.booking_value AS booking_payments
+            , CASE WHEN referrer_id IS NOT NULL THEN 1 ELSE 0 END AS referred_bookings
+            , bookings_source_src_10001.booking_value AS median_booking_value
+            , bookings_source_src_10001.booking_value AS booking_value_p99
+            , bookings_source_src_10001.booking_value AS discrete_booking_value_p99
+            , bookings_source_src_10001.booking_value AS approximate_continuous_booking_value_p99
+            , bookings_source_src_10001.booking_value AS approximate_discrete_booking_value_p99
+            , bookings_source_src_10001.is_instant
+            , DATE_TRUNC('day', bookings_source_src_10001.ds) AS ds__day
+            , DATE_TRUNC('week', bookings_source_src_10001.ds) AS ds__week
+            , DATE_TRUNC('month', bookings_source_src_10001.ds) AS ds__month
+            , DATE_TRUNC('quarter', bookings_source_src_10001.ds) AS ds__quarter
+            , DATE_TRUNC('year', bookings_source_src_10001.ds) AS ds__year
+            , EXTRACT(year FROM bookings_source_src_10001.ds) AS ds__extract_year
+            , EXTRACT(quarter FROM bookings_source_src_10001.ds) AS ds__extract_quarter
+            , EXTRACT(month FROM bookings_source_src_10001.ds) AS ds__extract_month
+            , EXTRACT(day FROM bookings_source_src_10001.ds) AS ds__extract_day
+            , EXTRACT(isodow FROM bookings_source_src_10001.ds) AS ds__extract_dow
+            , EXTRACT(doy FROM bookings_source_src_10001.ds) AS ds__extract_doy
+            , DATE_TRUNC('day', bookings_source_src_10001.ds_partitioned) AS ds_partitioned__day
+            , DATE_TRUNC('week', bookings_source_src_10001.ds_partitioned) AS ds_partitioned__week
+            , DATE_TRUNC('month', bookings_source_src_10001.ds_partitioned) AS ds_partitioned__month
+            , DATE_TRUNC('quarter', bookings_source_src_10001.ds_partitioned) AS ds_partitioned__quarter
+            , DATE_TRUNC('year', bookings_source_src_10001.ds_partitioned) AS ds_partitioned__year
+            , EXTRACT(year FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_year
+            , EXTRACT(quarter FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_quarter
+            , EXTRACT(month FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_month
+            , EXTRACT(day FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_day
+            , EXTRACT(isodow FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_dow
+            , EXTRACT(doy FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_doy
+            , DATE_TRUNC('day', bookings_source_src_10001.paid_at) AS paid_at__day
+            , DATE_TRUNC('week', bookings_source_src_10001.paid_at) AS paid_at__week
+            , DATE_TRUNC('month', bookings_source_src_10001.paid_at) AS paid_at__month
+            , DATE_TRUNC('quarter', bookings_source_src_10001.paid_at) AS paid_at__quarter
+            , DATE_TRUNC('year', bookings_source_src_10001.paid_at) AS paid_at__year
+            , EXTRACT(year FROM bookings_source_src_10001.paid_at) AS paid_at__extract_year
+            , EXTRACT(quarter FROM bookings_source_src_10001.paid_at) AS paid_at__extract_quarter
+            , EXTRACT(month FROM bookings_source_src_10001.paid_at) AS paid_at__extract_month
+            , EXTRACT(day FROM bookings_source_src_10001.paid_at) AS paid_at__extract_day
+            , EXTRACT(isodow FROM bookings_source_src_10001.paid_at) AS paid_at__extract_dow
+            , EXTRACT(doy FROM bookings_source_src_10001.paid_at) AS paid_at__extract_doy
+            , bookings_source_src_10001.is_instant AS booking__is_instant
+            , DATE_TRUNC('day', bookings_source_src_10001.ds) AS booking__ds__day
+            , DATE_TRUNC('week', bookings_source_src_10001.ds) AS booking__ds__week
+            , DATE_TRUNC('month', bookings_source_src_10001.ds) AS booking__ds__month
+            , DATE_TRUNC('quarter', bookings_source_src_10001.ds) AS booking__ds__quarter
+            , DATE_TRUNC('year', bookings_source_src_10001.ds) AS booking__ds__year
+            , EXTRACT(year FROM bookings_source_src_10001.ds) AS booking__ds__extract_year
+            , EXTRACT(quarter FROM bookings_source_src_10001.ds) AS booking__ds__extract_quarter
+            , EXTRACT(month FROM bookings_source_src_10001.ds) AS booking__ds__extract_month
+            , EXTRACT(day FROM bookings_source_src_10001.ds) AS booking__ds__extract_day
+            , EXTRACT(isodow FROM bookings_source_src_10001.ds) AS booking__ds__extract_dow
+            , EXTRACT(doy FROM bookings_source_src_10001.ds) AS booking__ds__extract_doy
+            , DATE_TRUNC('day', bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__day
+            , DATE_TRUNC('week', bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__week
+            , DATE_TRUNC('month', bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__month
+            , DATE_TRUNC('quarter', bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__quarter
+            , DATE_TRUNC('year', bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__year
+            , EXTRACT(year FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_year
+            , EXTRACT(quarter FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_quarter
+            , EXTRACT(month FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_month
+            , EXTRACT(day FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_day
+            , EXTRACT(isodow FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_dow
+            , EXTRACT(doy FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_doy
+            , DATE_TRUNC('day', bookings_source_src_10001.paid_at) AS booking__paid_at__day
+            , DATE_TRUNC('week', bookings_source_src_10001.paid_at) AS booking__paid_at__week
+            , DATE_TRUNC('month', bookings_source_src_10001.paid_at) AS booking__paid_at__month
+            , DATE_TRUNC('quarter', bookings_source_src_10001.paid_at) AS booking__paid_at__quarter
+            , DATE_TRUNC('year', bookings_source_src_10001.paid_at) AS booking__paid_at__year
+            , EXTRACT(year FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_year
+            , EXTRACT(quarter FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_quarter
+            , EXTRACT(month FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_month
+            , EXTRACT(day FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_day
+            , EXTRACT(isodow FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_dow
+            , EXTRACT(doy FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_doy
+            , bookings_source_src_10001.listing_id AS listing
+            , bookings_source_src_10001.guest_id AS guest
+            , bookings_source_src_10001.host_id AS host
+            , bookings_source_src_10001.listing_id AS booking__listing
+            , bookings_source_src_10001.guest_id AS booking__guest
+            , bookings_source_src_10001.host_id AS booking__host
+          FROM ***************************.fct_bookings bookings_source_src_10001
+        ) subq_0
+      ) subq_1
+    ) subq_2
+    GROUP BY
+      subq_2.metric_time__day
+  ) subq_3
+)
+-- Combine Aggregated Outputs
+SELECT
+  COALESCE(subq_13.metric_time__day, subq_22.metric_time__day, subq_31.metric_time__day) AS metric_time__day
+  , MAX(subq_13.bookings_per_booker) AS bookings_per_booker
+  , MAX(subq_22.bookings_per_view) AS bookings_per_view
+  , MAX(subq_31.bookings_per_listing) AS bookings_per_listing
+FROM (
+  -- Compute Metrics via Expressions
+  SELECT
+    subq_12.metric_time__day
+    , CAST(subq_12.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_12.bookers, 0) AS DOUBLE PRECISION) AS bookings_per_booker
+  FROM (
+    -- Combine Aggregated Outputs
+    SELECT
+      COALESCE(subq_6.metric_time__day, subq_11.metric_time__day) AS metric_time__day
+      , MAX(subq_6.bookings) AS bookings
+      , MAX(subq_11.bookers) AS bookers
+    FROM (
+      -- Read From cte_4
+      SELECT
+        subq_5.metric_time__day
+        , subq_5.bookings
+      FROM cte_4 subq_5
+    ) subq_6
+    FULL OUTER JOIN (
+      -- Compute Metrics via Expressions
+      SELECT
+        subq_10.metric_time__day
+        , subq_10.bookers
+      FROM (
+        -- Aggregate Measures
+        SELECT
+          subq_9.metric_time__day
+          , COUNT(DISTINCT subq_9.bookers) AS bookers
+        FROM (
+          -- Pass Only Elements: ['bookers', 'metric_time__day']
+          SELECT
+            subq_8.metric_time__day
+            , subq_8.bookers
+          FROM (
+            -- Metric Time Dimension 'ds'
+            SELECT
+              subq_7.ds__day
+              , subq_7.ds__week
+              , subq_7.ds__month
+              , subq_7.ds__quarter
+              , subq_7.ds__year
+              , subq_7.ds__extract_year
+              , subq_7.ds__extract_quarter
+              , subq_7.ds__extract_month
+              , subq_7.ds__extract_day
+              , subq_7.ds__extract_dow
+              , subq_7.ds__extract_doy
+              , subq_7.ds_partitioned__day
+              , subq_7.ds_partitioned__week
+              , subq_7.ds_partitioned__month
+              , subq_7.ds_partitioned__quarter
+              , subq_7.ds_partitioned__year
+              , subq_7.ds_partitioned__extract_year
+              , subq_7.ds_partitioned__extract_quarter
+              , subq_7.ds_partitioned__extract_month
+              , subq_7.ds_partitioned__extract_day
+              , subq_7.ds_partitioned__extract_dow
+              , subq_7.ds_partitioned__extract_doy
+              , subq_7.paid_at__day
+              , subq_7.paid_at__week
+              , subq_7.paid_at__month
+              , subq_7.paid_at__quarter
+              , subq_7.paid_at__year
+              , subq_7.paid_at__extract_year
+              , subq_7.paid_at__extract_quarter
+              , subq_7.paid_at__extract_month
+              , subq_7.paid_at__extract_day
+              , subq_7.paid_at__extract_dow
+              , subq_7.paid_at__extract_doy
+              , subq_7.booking__ds__day
+              , subq_7.booking__ds__week
+              , subq_7.booking__ds__month
+              , subq_7.booking__ds__quarter
+              , subq_7.booking__ds__year
+              , subq_7.booking__ds__extract_year
+              , subq_7.booking__ds__extract_quarter
+              , subq_7.booking__ds__extract_month
+              , subq_7.booking__ds__extract_day
+              , subq_7.booking__ds__extract_dow
+              , subq_7.booking__ds__extract_doy
+              , subq_7.booking__ds_partitioned__day
+              , subq_7.booking__ds_partitioned__week
+              , subq_7.booking__ds_partitioned__month
+              , subq_7.booking__ds_partitioned__quarter
+              , subq_7.booking__ds_partitioned__year
+              , subq_7.booking__ds_partitioned__extract_year
+              , subq_7.booking__ds_partitioned__extract_quarter
+              , subq_7.booking__ds_partitioned__extract_month
+              , subq_7.booking__ds_partitioned__extract_day
+              , subq_7.booking__ds_partitioned__extract_dow
+              , subq_7.booking__ds_partitioned__extract_doy
+              , subq_7.booking__paid_at__day
+              , subq_7.booking__paid_at__week
+              , subq_7.booking__paid_at__month
+              , subq_7.booking__paid_at__quarter
+              , subq_7.booking__paid_at__year
+              , subq_7.booking__paid_at__extract_year
+              , subq_7.booking__paid_at__extract_quarter
+              , subq_7.booking__paid_at__extract_month
+              , subq_7.booking__paid_at__extract_day
+              , subq_7.booking__paid_at__extract_dow
+              , subq_7.booking__paid_at__extract_doy
+              , subq_7.ds__day AS metric_time__day
+              , subq_7.ds__week AS metric_time__week
+              , subq_7.ds__month AS metric_time__month
+              , subq_7.ds__quarter AS metric_time__quarter
+              , subq_7.ds__year AS metric_time__year
+              , subq_7.ds__extract_year AS metric_time__extract_year
+              , subq_7.ds__extract_quarter AS metric_time__extract_quarter
+              , subq_7.ds__extract_month AS metric_time__extract_month
+              , subq_7.ds__extract_day AS metric_time__extract_day
+              , subq_7.ds__extract_dow AS metric_time__extract_dow
+              , subq_7.ds__extract_doy AS metric_time__extract_doy
+              , subq_7.listing
+              , subq_7.guest
+              , subq_7.host
+              , subq_7.booking__listing
+              , subq_7.booking__guest
+              , subq_7.booking__host
+              , subq_7.is_instant
+              , subq_7.booking__is_instant
+              , subq_7.bookings
+              , subq_7.instant_bookings
+              , subq_7.booking_value
+              , subq_7.max_booking_value
+              , subq_7.min_booking_value
+              , subq_7.bookers
+              , subq_7.average_booking_value
+              , subq_7.referred_bookings
+              , subq_7.median_booking_value
+              , subq_7.booking_value_p99
+              , subq_7.discrete_booking_value_p99
+              , subq_7.approximate_continuous_booking_value_p99
+              , subq_7.approximate_discrete_booking_value_p99
+            FROM (
+              -- Read Elements From Semantic Model 'bookings_source'
+              SELECT
+                1 AS bookings
+                , CASE WHEN is_instant THEN 1 ELSE 0 END AS instant_bookings
+                , bookings_source_src_10001.booking_value
+                , bookings_source_src_10001.booking_value AS max_booking_value
+                , bookings_source_src_10001.booking_value AS min_booking_value
+                , bookings_source_src_10001.guest_id AS bookers
+                , bookings_source_src_10001.booking_value AS average_booking_value
+                , bookings_source_src_10001.booking_value AS booking_payments
+                , CASE WHEN referrer_id IS NOT NULL THEN 1 ELSE 0 END AS referred_bookings
+                , bookings_source_src_10001.booking_value AS median_booking_value
+                , bookings_source_src_10001.booking_value AS booking_value_p99
+                , bookings_source_src_10001.booking_value AS discrete_booking_value_p99
+                , bookings_source_src_10001.booking_value AS approximate_continuous_booking_value_p99
+                , bookings_source_src_10001.booking_value AS approximate_discrete_booking_value_p99
+                , bookings_source_src_10001.is_instant
+                , DATE_TRUNC('day', bookings_source_src_10001.ds) AS ds__day
+                , DATE_TRUNC('week', bookings_source_src_10001.ds) AS ds__week
+                , DATE_TRUNC('month', bookings_source_src_10001.ds) AS ds__month
+                , DATE_TRUNC('quarter', bookings_source_src_10001.ds) AS ds__quarter
+                , DATE_TRUNC('year', bookings_source_src_10001.ds) AS ds__year
+                , EXTRACT(year FROM bookings_source_src_10001.ds) AS ds__extract_year
+                , EXTRACT(quarter FROM bookings_source_src_10001.ds) AS ds__extract_quarter
+                , EXTRACT(month FROM bookings_source_src_10001.ds) AS ds__extract_month
+                , EXTRACT(day FROM bookings_source_src_10001.ds) AS ds__extract_day
+                , EXTRACT(isodow FROM bookings_source_src_10001.ds) AS ds__extract_dow
+                , EXTRACT(doy FROM bookings_source_src_10001.ds) AS ds__extract_doy
+                , DATE_TRUNC('day', bookings_source_src_10001.ds_partitioned) AS ds_partitioned__day
+                , DATE_TRUNC('week', bookings_source_src_10001.ds_partitioned) AS ds_partitioned__week
+                , DATE_TRUNC('month', bookings_source_src_10001.ds_partitioned) AS ds_partitioned__month
+                , DATE_TRUNC('quarter', bookings_source_src_10001.ds_partitioned) AS ds_partitioned__quarter
+                , DATE_TRUNC('year', bookings_source_src_10001.ds_partitioned) AS ds_partitioned__year
+                , EXTRACT(year FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_year
+                , EXTRACT(quarter FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_quarter
+                , EXTRACT(month FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_month
+                , EXTRACT(day FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_day
+                , EXTRACT(isodow FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_dow
+                , EXTRACT(doy FROM bookings_source_src_10001.ds_partitioned) AS ds_partitioned__extract_doy
+                , DATE_TRUNC('day', bookings_source_src_10001.paid_at) AS paid_at__day
+                , DATE_TRUNC('week', bookings_source_src_10001.paid_at) AS paid_at__week
+                , DATE_TRUNC('month', bookings_source_src_10001.paid_at) AS paid_at__month
+                , DATE_TRUNC('quarter', bookings_source_src_10001.paid_at) AS paid_at__quarter
+                , DATE_TRUNC('year', bookings_source_src_10001.paid_at) AS paid_at__year
+                , EXTRACT(year FROM bookings_source_src_10001.paid_at) AS paid_at__extract_year
+                , EXTRACT(quarter FROM bookings_source_src_10001.paid_at) AS paid_at__extract_quarter
+                , EXTRACT(month FROM bookings_source_src_10001.paid_at) AS paid_at__extract_month
+                , EXTRACT(day FROM bookings_source_src_10001.paid_at) AS paid_at__extract_day
+                , EXTRACT(isodow FROM bookings_source_src_10001.paid_at) AS paid_at__extract_dow
+                , EXTRACT(doy FROM bookings_source_src_10001.paid_at) AS paid_at__extract_doy
+                , bookings_source_src_10001.is_instant AS booking__is_instant
+                , DATE_TRUNC('day', bookings_source_src_10001.ds) AS booking__ds__day
+                , DATE_TRUNC('week', bookings_source_src_10001.ds) AS booking__ds__week
+                , DATE_TRUNC('month', bookings_source_src_10001.ds) AS booking__ds__month
+                , DATE_TRUNC('quarter', bookings_source_src_10001.ds) AS booking__ds__quarter
+                , DATE_TRUNC('year', bookings_source_src_10001.ds) AS booking__ds__year
+                , EXTRACT(year FROM bookings_source_src_10001.ds) AS booking__ds__extract_year
+                , EXTRACT(quarter FROM bookings_source_src_10001.ds) AS booking__ds__extract_quarter
+                , EXTRACT(month FROM bookings_source_src_10001.ds) AS booking__ds__extract_month
+                , EXTRACT(day FROM bookings_source_src_10001.ds) AS booking__ds__extract_day
+                , EXTRACT(isodow FROM bookings_source_src_10001.ds) AS booking__ds__extract_dow
+                , EXTRACT(doy FROM bookings_source_src_10001.ds) AS booking__ds__extract_doy
+                , DATE_TRUNC('day', bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__day
+                , DATE_TRUNC('week', bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__week
+                , DATE_TRUNC('month', bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__month
+                , DATE_TRUNC('quarter', bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__quarter
+                , DATE_TRUNC('year', bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__year
+                , EXTRACT(year FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_year
+                , EXTRACT(quarter FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_quarter
+                , EXTRACT(month FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_month
+                , EXTRACT(day FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_day
+                , EXTRACT(isodow FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_dow
+                , EXTRACT(doy FROM bookings_source_src_10001.ds_partitioned) AS booking__ds_partitioned__extract_doy
+                , DATE_TRUNC('day', bookings_source_src_10001.paid_at) AS booking__paid_at__day
+                , DATE_TRUNC('week', bookings_source_src_10001.paid_at) AS booking__paid_at__week
+                , DATE_TRUNC('month', bookings_source_src_10001.paid_at) AS booking__paid_at__month
+                , DATE_TRUNC('quarter', bookings_source_src_10001.paid_at) AS booking__paid_at__quarter
+                , DATE_TRUNC('year', bookings_source_src_10001.paid_at) AS booking__paid_at__year
+                , EXTRACT(year FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_year
+                , EXTRACT(quarter FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_quarter
+                , EXTRACT(month FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_month
+                , EXTRACT(day FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_day
+                , EXTRACT(isodow FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_dow
+                , EXTRACT(doy FROM bookings_source_src_10001.paid_at) AS booking__paid_at__extract_doy
+                , bookings_source_src_10001.listing_id AS listing
+                , bookings_source_src_10001.guest_id AS guest
+                , bookings_source_src_10001.host_id AS host
+                , bookings_source_src_10001.listing_id AS booking__listing
+                , bookings_source_src_10001.guest_id AS booking__guest
+                , bookings_source_src_10001.host_id AS booking__host
+              FROM ***************************.fct_bookings bookings_source_src_10001
+            ) subq_7
+          ) subq_8
+        ) subq_9
+        GROUP BY
+          subq_9.metric_time__day
+      ) subq_10
+    ) subq_11
+    ON
+      subq_6.metric_time__day = subq_11.metric_time__day
+    GROUP BY
+      COALESCE(subq_6.metric_time__day, subq_11.metric_time__day)
+  ) subq_12
+) subq_13
+FULL OUTER JOIN (
+  -- Compute Metrics via Expressions
+  SELECT
+    subq_21.metric_time__day
+    , CAST(subq_21.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_21.views, 0) AS DOUBLE PRECISION) AS bookings_per_view
+  FROM (
+    -- Combine Aggregated Outputs
+    SELECT
+      COALESCE(subq_15.metric_time__day, subq_20.metric_time__day) AS metric_time__day
+      , MAX(subq_15.bookings) AS bookings
+      , MAX(subq_20.views) AS views
+    FROM (
+      -- Read From cte_4
+      SELECT
+        subq_14.metric_time__day
+        , subq_14.bookings
+      FROM cte_4 subq_14
+    ) subq_15
+    FULL OUTER JOIN (
+      -- Compute Metrics via Expressions
+      SELECT
+        subq_19.metric_time__day
+        , subq_19.views
+      FROM (
+        -- Aggregate Measures
+        SELECT
+          subq_18.metric_time__day
+          , SUM(subq_18.views) AS views
+        FROM (
+          -- Pass Only Elements: ['views', 'metric_time__day']
+          SELECT
+            subq_17.metric_time__day
+            , subq_17.views
+          FROM (
+            -- Metric Time Dimension 'ds'
+            SELECT
+              subq_16.ds__day
+              , subq_16.ds__week
+              , subq_16.ds__month
+              , subq_16.ds__quarter
+              , subq_16.ds__year
+              , subq_16.ds__extract_year
+              , subq_16.ds__extract_quarter
+              , subq_16.ds__extract_month
+              , subq_16.ds__extract_day
+              , subq_16.ds__extract_dow
+              , subq_16.ds__extract_doy
+              , subq_16.ds_partitioned__day
+              , subq_16.ds_partitioned__week
+              , subq_16.ds_partitioned__month
+              , subq_16.ds_partitioned__quarter
+              , subq_16.ds_partitioned__year
+              , subq_16.ds_partitioned__extract_year
+              , subq_16.ds_partitioned__extract_quarter
+              , subq_16.ds_partitioned__extract_month
+              , subq_16.ds_partitioned__extract_day
+              , subq_16.ds_partitioned__extract_dow
+              , subq_16.ds_partitioned__extract_doy
+              , subq_16.view__ds__day
+              , subq_16.view__ds__week
+              , subq_16.view__ds__month
+              , subq_16.view__ds__quarter
+              , subq_16.view__ds__year
+              , subq_16.view__ds__extract_year
+              , subq_16.view__ds__extract_quarter
+              , subq_16.view__ds__extract_month
+              , subq_16.view__ds__extract_day
+              , subq_16.view__ds__extract_dow
+              , subq_16.view__ds__extract_doy
+              , subq_16.view__ds_partitioned__day
+              , subq_16.view__ds_partitioned__week
+              , subq_16.view__ds_partitioned__month
+              , subq_16.view__ds_partitioned__quarter
+              , subq_16.view__ds_partitioned__year
+              , subq_16.view__ds_partitioned__extract_year
+              , subq_16.view__ds_partitioned__extract_quarter
+              , subq_16.view__ds_partitioned__extract_month
+              , subq_16.view__ds_partitioned__extract_day
+              , subq_16.view__ds_partitioned__extract_dow
+              , subq_16.view__ds_partitioned__extract_doy
+              , subq_16.ds__day AS metric_time__day
+              , subq_16.ds__week AS metric_time__week
+              , subq_16.ds__month AS metric_time__month
+              , subq_16.ds__quarter AS metric_time__quarter
+              , subq_16.ds__year AS metric_time__year
+              , subq_16.ds__extract_year AS metric_time__extract_year
+              , subq_16.ds__extract_quarter AS metric_time__extract_quarter
+              , subq_16.ds__extract_month AS metric_time__extract_month
+              , subq_16.ds__extract_day AS metric_time__extract_day
+              , subq_16.ds__extract_dow AS metric_time__extract_dow
+              , subq_16.ds__extract_doy AS metric_time__extract_doy
+              , subq_16.listing
+              , subq_16.user
+              , subq_16.view__listing
+              , subq_16.view__user
+              , subq_16.views
+            FROM (
+              -- Read Elements From Semantic Model 'views_source'
+              SELECT
+                1 AS views
+                , DATE_TRUNC('day', views_source_src_10010.ds) AS ds__day
+                , DATE_TRUNC('week', views_source_src_10010.ds) AS ds__week
+                , DATE_TRUNC('month', views_source_src_10010.ds) AS ds__month
+                , DATE_TRUNC('quarter', views_source_src_10010.ds) AS ds__quarter
+                , DATE_TRUNC('year', views_source_src_10010.ds) AS ds__year
+                , EXTRACT(year FROM views_source_src_10010.ds) AS ds__extract_year
+                , EXTRACT(quarter FROM views_source_src_10010.ds) AS ds__extract_quarter
+                , EXTRACT(month FROM views_source_src_10010.ds) AS ds__extract_month
+                , EXTRACT(day FROM views_source_src_10010.ds) AS ds__extract_day
+                , EXTRACT(isodow FROM views_source_src_10010.ds) AS ds__extract_dow
+                , EXTRACT(doy FROM views_source_src_10010.ds) AS ds__extract_doy
+                , DATE_TRUNC('day', views_source_src_10010.ds_partitioned) AS ds_partitioned__day
+                , DATE_TRUNC('week', views_source_src_10010.ds_partitioned) AS ds_partitioned__week
+                , DATE_TRUNC('month', views_source_src_10010.ds_partitioned) AS ds_partitioned__month
+                , DATE_TRUNC('quarter', views_source_src_10010.ds_partitioned) AS ds_partitioned__quarter
+                , DATE_TRUNC('year', views_source_src_10010.ds_partitioned) AS ds_partitioned__year
+                , EXTRACT(year FROM views_source_src_10010.ds_partitioned) AS ds_partitioned__extract_year
+                , EXTRACT(quarter FROM views_source_src_10010.ds_partitioned) AS ds_partitioned__extract_quarter
+                , EXTRACT(month FROM views_source_src_10010.ds_partitioned) AS ds_partitioned__extract_month
+                , EXTRACT(day FROM views_source_src_10010.ds_partitioned) AS ds_partitioned__extract_day
+                , EXTRACT(isodow FROM views_source_src_10010.ds_partitioned) AS ds_partitioned__extract_dow
+                , EXTRACT(doy FROM views_source_src_10010.ds_partitioned) AS ds_partitioned__extract_doy
+                , DATE_TRUNC('day', views_source_src_10010.ds) AS view__ds__day
+                , DATE_TRUNC('week', views_source_src_10010.ds) AS view__ds__week
+                , DATE_TRUNC('month', views_source_src_10010.ds) AS view__ds__month
+                , DATE_TRUNC('quarter', views_source_src_10010.ds) AS view__ds__quarter
+                , DATE_TRUNC('year', views_source_src_10010.ds) AS view__ds__year
+                , EXTRACT(year FROM views_source_src_10010.ds) AS view__ds__extract_year
+                , EXTRACT(quarter FROM views_source_src_10010.ds) AS view__ds__extract_quarter
+                , EXTRACT(month FROM views_source_src_10010.ds) AS view__ds__extract_month
+                , EXTRACT(day FROM views_source_src_10010.ds) AS view__ds__extract_day
+                , EXTRACT(isodow FROM views_source_src_10010.ds) AS view__ds__extract_dow
+                , EXTRACT(doy FROM views_source_src_10010.ds) AS view__ds__extract_doy
+                , DATE_TRUNC('day', views_source_src_10010.ds_partitioned) AS view__ds_partitioned__day
+                , DATE_TRUNC('week', views_source_src_10010.ds_partitioned) AS view__ds_partitioned__week
+                , DATE_TRUNC('month', views_source_src_10010.ds_partitioned) AS view__ds_partitioned__month
+                , DATE_TRUNC('quarter', views_source_src_10010.ds_partitioned) AS view__ds_partitioned__quarter
+                , DATE_TRUNC('year', views_source_src_10010.ds_partitioned) AS view__ds_partitioned__year
+                , EXTRACT(year FROM views_source_src_10010.ds_partitioned) AS view__ds_partitioned__extract_year
+                , EXTRACT(quarter FROM views_source_src_10010.ds_partitioned) AS view__ds_partitioned__extract_quarter
+                , EXTRACT(month FROM views_source_src_10010.ds_partitioned) AS view__ds_partitioned__extract_month
+                , EXTRACT(day FROM views_source_src_10010.ds_partitioned) AS view__ds_partitioned__extract_day
+                , EXTRACT(isodow FROM views_source_src_10010.ds_partitioned) AS view__ds_partitioned__extract_dow
+                , EXTRACT(doy FROM views_source_src_10010.ds_partitioned) AS view__ds_partitioned__extract_doy
+                , views_source_src_10010.listing_id AS listing
+                , views_source_src_10010.user_id AS user
+                , views_source_src_10010.listing_id AS view__listing
+                , views_source_src_10010.user_id AS view__user
+              FROM ***************************.fct_views views_source_src_10010
+            ) subq_16
+          ) subq_17
+        ) subq_18
+        GROUP BY
+          subq_18.metric_time__day
+      ) subq_19
+    ) subq_20
+    ON
+      subq_15.metric_time__day = subq_20.metric_time__day
+    GROUP BY
+      COALESCE(subq_15.metric_time__day, subq_20.metric_time__day)
+  ) subq_21
+) subq_22
+ON
+  subq_13.metric_time__day = subq_22.metric_time__day
+FULL OUTER JOIN (
+  -- Compute Metrics via Expressions
+  SELECT
+    subq_30.metric_time__day
+    , CAST(subq_30.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_30.listings, 0) AS DOUBLE PRECISION) AS bookings_per_listing
+  FROM (
+    -- Combine Aggregated Outputs
+    SELECT
+      COALESCE(subq_24.metric_time__day, subq_29.metric_time__day) AS metric_time__day
+      , MAX(subq_24.bookings) AS bookings
+      , MAX(subq_29.listings) AS listings
+    FROM (
+      -- Read From cte_4
+      SELECT
+        subq_23.metric_time__day
+        , subq_23.bookings
+      FROM cte_4 subq_23
+    ) subq_24
+    FULL OUTER JOIN (
+      -- Compute Metrics via Expressions
+      SELECT
+        subq_28.metric_time__day
+        , subq_28.listings
+      FROM (
+        -- Aggregate Measures
+        SELECT
+          subq_27.metric_time__day
+          , SUM(subq_27.listings) AS listings
+        FROM (
+          -- Pass Only Elements: ['listings', 'metric_time__day']
+          SELECT
+            subq_26.metric_time__day
+            , subq_26.listings
+          FROM (
+            -- Metric Time Dimension 'ds'
+            SELECT
+              subq_25.ds__day
+              , subq_25.ds__week
+              , subq_25.ds__month
+              , subq_25.ds__quarter
+              , subq_25.ds__year
+              , subq_25.ds__extract_year
+              , subq_25.ds__extract_quarter
+              , subq_25.ds__extract_month
+              , subq_25.ds__extract_day
+              , subq_25.ds__extract_dow
+              , subq_25.ds__extract_doy
+              , subq_25.created_at__day
+              , subq_25.created_at__week
+              , subq_25.created_at__month
+              , subq_25.created_at__quarter
+              , subq_25.created_at__year
+              , subq_25.created_at__extract_year
+              , subq_25.created_at__extract_quarter
+              , subq_25.created_at__extract_month
+              , subq_25.created_at__extract_day
+              , subq_25.created_at__extract_dow
+              , subq_25.created_at__extract_doy
+              , subq_25.listing__ds__day
+              , subq_25.listing__ds__week
+              , subq_25.listing__ds__month
+              , subq_25.listing__ds__quarter
+              , subq_25.listing__ds__year
+              , subq_25.listing__ds__extract_year
+              , subq_25.listing__ds__extract_quarter
+              , subq_25.listing__ds__extract_month
+              , subq_25.listing__ds__extract_day
+              , subq_25.listing__ds__extract_dow
+              , subq_25.listing__ds__extract_doy
+              , subq_25.listing__created_at__day
+              , subq_25.listing__created_at__week
+              , subq_25.listing__created_at__month
+              , subq_25.listing__created_at__quarter
+              , subq_25.listing__created_at__year
+              , subq_25.listing__created_at__extract_year
+              , subq_25.listing__created_at__extract_quarter
+              , subq_25.listing__created_at__extract_month
+              , subq_25.listing__created_at__extract_day
+              , subq_25.listing__created_at__extract_dow
+              , subq_25.listing__created_at__extract_doy
+              , subq_25.ds__day AS metric_time__day
+              , subq_25.ds__week AS metric_time__week
+              , subq_25.ds__month AS metric_time__month
+              , subq_25.ds__quarter AS metric_time__quarter
+              , subq_25.ds__year AS metric_time__year
+              , subq_25.ds__extract_year AS metric_time__extract_year
+              , subq_25.ds__extract_quarter AS metric_time__extract_quarter
+              , subq_25.ds__extract_month AS metric_time__extract_month
+              , subq_25.ds__extract_day AS metric_time__extract_day
+              , subq_25.ds__extract_dow AS metric_time__extract_dow
+              , subq_25.ds__extract_doy AS metric_time__extract_doy
+              , subq_25.listing
+              , subq_25.user
+              , subq_25.listing__user
+              , subq_25.country_latest
+              , subq_25.is_lux_latest
+              , subq_25.capacity_latest
+              , subq_25.listing__country_latest
+              , subq_25.listing__is_lux_latest
+              , subq_25.listing__capacity_latest
+              , subq_25.listings
+              , subq_25.largest_listing
+              , subq_25.smallest_listing
+            FROM (
+              -- Read Elements From Semantic Model 'listings_latest'
+              SELECT
+                1 AS listings
+                , listings_latest_src_10005.capacity AS largest_listing
+                , listings_latest_src_10005.capacity AS smallest_listing
+                , DATE_TRUNC('day', listings_latest_src_10005.created_at) AS ds__day
+                , DATE_TRUNC('week', listings_latest_src_10005.created_at) AS ds__week
+                , DATE_TRUNC('month', listings_latest_src_10005.created_at) AS ds__month
+                , DATE_TRUNC('quarter', listings_latest_src_10005.created_at) AS ds__quarter
+                , DATE_TRUNC('year', listings_latest_src_10005.created_at) AS ds__year
+                , EXTRACT(year FROM listings_latest_src_10005.created_at) AS ds__extract_year
+                , EXTRACT(quarter FROM listings_latest_src_10005.created_at) AS ds__extract_quarter
+                , EXTRACT(month FROM listings_latest_src_10005.created_at) AS ds__extract_month
+                , EXTRACT(day FROM listings_latest_src_10005.created_at) AS ds__extract_day
+                , EXTRACT(isodow FROM listings_latest_src_10005.created_at) AS ds__extract_dow
+                , EXTRACT(doy FROM listings_latest_src_10005.created_at) AS ds__extract_doy
+                , DATE_TRUNC('day', listings_latest_src_10005.created_at) AS created_at__day
+                , DATE_TRUNC('week', listings_latest_src_10005.created_at) AS created_at__week
+                , DATE_TRUNC('month', listings_latest_src_10005.created_at) AS created_at__month
+                , DATE_TRUNC('quarter', listings_latest_src_10005.created_at) AS created_at__quarter
+                , DATE_TRUNC('year', listings_latest_src_10005.created_at) AS created_at__year
+                , EXTRACT(year FROM listings_latest_src_10005.created_at) AS created_at__extract_year
+                , EXTRACT(quarter FROM listings_latest_src_10005.created_at) AS created_at__extract_quarter
+                , EXTRACT(month FROM listings_latest_src_10005.created_at) AS created_at__extract_month
+                , EXTRACT(day FROM listings_latest_src_10005.created_at) AS created_at__extract_day
+                , EXTRACT(isodow FROM listings_latest_src_10005.created_at) AS created_at__extract_dow
+                , EXTRACT(doy FROM listings_latest_src_10005.created_at) AS created_at__extract_doy
+                , listings_latest_src_10005.country AS country_latest
+                , listings_latest_src_10005.is_lux AS is_lux_latest
+                , listings_latest_src_10005.capacity AS capacity_latest
+                , DATE_TRUNC('day', listings_latest_src_10005.created_at) AS listing__ds__day
+                , DATE_TRUNC('week', listings_latest_src_10005.created_at) AS listing__ds__week
+                , DATE_TRUNC('month', listings_latest_src_10005.created_at) AS listing__ds__month
+                , DATE_TRUNC('quarter', listings_latest_src_10005.created_at) AS listing__ds__quarter
+                , DATE_TRUNC('year', listings_latest_src_10005.created_at) AS listing__ds__year
+                , EXTRACT(year FROM listings_latest_src_10005.created_at) AS listing__ds__extract_year
+                , EXTRACT(quarter FROM listings_latest_src_10005.created_at) AS listing__ds__extract_quarter
+                , EXTRACT(month FROM listings_latest_src_10005.created_at) AS listing__ds__extract_month
+                , EXTRACT(day FROM listings_latest_src_10005.created_at) AS listing__ds__extract_day
+                , EXTRACT(isodow FROM listings_latest_src_10005.created_at) AS listing__ds__extract_dow
+                , EXTRACT(doy FROM listings_latest_src_10005.created_at) AS listing__ds__extract_doy
+                , DATE_TRUNC('day', listings_latest_src_10005.created_at) AS listing__created_at__day
+                , DATE_TRUNC('week', listings_latest_src_10005.created_at) AS listing__created_at__week
+                , DATE_TRUNC('month', listings_latest_src_10005.created_at) AS listing__created_at__month
+                , DATE_TRUNC('quarter', listings_latest_src_10005.created_at) AS listing__created_at__quarter
+                , DATE_TRUNC('year', listings_latest_src_10005.created_at) AS listing__created_at__year
+                , EXTRACT(year FROM listings_latest_src_10005.created_at) AS listing__created_at__extract_year
+                , EXTRACT(quarter FROM listings_latest_src_10005.created_at) AS listing__created_at__extract_quarter
+                , EXTRACT(month FROM listings_latest_src_10005.created_at) AS listing__created_at__extract_month
+                , EXTRACT(day FROM listings_latest_src_10005.created_at) AS listing__created_at__extract_day
+                , EXTRACT(isodow FROM listings_latest_src_10005.created_at) AS listing__created_at__extract_dow
+                , EXTRACT(doy FROM listings_latest_src_10005.created_at) AS listing__created_at__extract_doy
+                , listings_latest_src_10005.country AS listing__country_latest
+                , listings_latest_src_10005.is_lux AS listing__is_lux_latest
+                , listings_latest_src_10005.capacity AS listing__capacity_latest
+                , listings_latest_src_10005.listing_id AS listing
+                , listings_latest_src_10005.user_id AS user
+                , listings_latest_src_10005.user_id AS listing__user
+              FROM ***************************.dim_listings_latest listings_latest_src_10005
+            ) subq_25
+          ) subq_26
+        ) subq_27
+        GROUP BY
+          subq_27.metric_time__day
+      ) subq_28
+    ) subq_29
+    ON
+      subq_24.metric_time__day = subq_29.metric_time__day
+    GROUP BY
+      COALESCE(subq_24.metric_time__day, subq_29.metric_time__day)
+  ) subq_30
+) subq_31
+ON
+  COALESCE(subq_13.metric_time__day, subq_22.metric_time__day) = subq_31.metric_time__day
+GROUP BY
+  COALESCE(subq_13.metric_time__day, subq_22.metric_time__day, subq_31.metric_time__day)
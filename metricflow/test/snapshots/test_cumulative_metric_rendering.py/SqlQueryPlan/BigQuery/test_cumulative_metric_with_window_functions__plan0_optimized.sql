@@ -0,0 +1,41 @@
+-- Remove Days Without Rows In Window
+-- Constrain Time Range to [2020-01-03T00:00:00, 2020-01-05T00:00:00]
+-- Compute Metrics via Expressions
+SELECT
+  metric_time__day
+  , txn_revenue AS revenue_all_time
+FROM (
+  -- Window Over Time Range
+  SELECT
+    subq_15.metric_time__day AS metric_time__day
+    , count(subq_16.metric_time__day) OVER (ORDER BY subq_15.metric_time__day ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS metric_time__day__row_count
+    , sum(subq_16.txn_revenue) OVER (ORDER BY subq_15.metric_time__day ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS txn_revenue
+  FROM (
+    -- Time Spine
+    SELECT
+      ds AS metric_time__day
+    FROM ***************************.mf_time_spine subq_14
+    WHERE ds BETWEEN '2000-01-01' AND '2020-01-05'
+  ) subq_15
+  LEFT OUTER JOIN (
+    -- Read Elements From Semantic Model 'revenue'
+    -- Metric Time Dimension 'ds'
+    -- Constrain Time Range to [2000-01-01T00:00:00, 2020-01-05T00:00:00]
+    -- Pass Only Elements: ['txn_revenue', 'metric_time__day']
+    -- Aggregate Measures
+    SELECT
+      DATE_TRUNC(created_at, day) AS metric_time__day
+      , SUM(revenue) AS txn_revenue
+    FROM ***************************.fct_revenue revenue_src_10007
+    WHERE DATE_TRUNC(created_at, day) BETWEEN '2000-01-01' AND '2020-01-05'
+    GROUP BY
+      metric_time__day
+  ) subq_16
+  ON
+    subq_15.metric_time__day = subq_16.metric_time__day
+) subq_17
+WHERE (
+  metric_time__day BETWEEN '2020-01-03' AND '2020-01-05'
+) AND (
+  metric_time__day__row_count > 0
+)
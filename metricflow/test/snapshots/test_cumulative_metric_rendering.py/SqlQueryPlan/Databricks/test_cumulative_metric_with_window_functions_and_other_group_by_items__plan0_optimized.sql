@@ -0,0 +1,61 @@
+WITH cte_26 AS (
+  -- Join Standard Outputs
+  -- Pass Only Elements: ['txn_revenue', 'user__home_state_latest', 'metric_time__day']
+  -- Aggregate Measures
+  SELECT
+    DATE_TRUNC('day', revenue_src_10007.created_at) AS metric_time__day
+    , users_latest_src_10009.home_state_latest AS user__home_state_latest
+    , SUM(revenue_src_10007.revenue) AS txn_revenue
+  FROM ***************************.fct_revenue revenue_src_10007
+  LEFT OUTER JOIN
+    ***************************.dim_users_latest users_latest_src_10009
+  ON
+    revenue_src_10007.user_id = users_latest_src_10009.user_id
+  GROUP BY
+    DATE_TRUNC('day', revenue_src_10007.created_at)
+    , users_latest_src_10009.home_state_latest
+)
+-- Remove Days Without Rows In Window
+-- Compute Metrics via Expressions
+SELECT
+  metric_time__day
+  , user__home_state_latest
+  , txn_revenue AS revenue_all_time
+FROM (
+  -- Window Over Time Range
+  SELECT
+    subq_24.ds AS metric_time__day
+    , subq_29.user__home_state_latest AS user__home_state_latest
+    , count(subq_28.metric_time__day) OVER (PARTITION BY subq_29.user__home_state_latest ORDER BY subq_24.ds ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS metric_time__day__row_count
+    , sum(subq_28.txn_revenue) OVER (PARTITION BY subq_29.user__home_state_latest ORDER BY subq_24.ds ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS txn_revenue
+  FROM ***************************.mf_time_spine subq_24
+  INNER JOIN (
+    -- Read From cte_26
+    -- Find The First Day Of Each Group
+    SELECT
+      user__home_state_latest
+      , MIN(metric_time__day) AS metric_time__day__first_day
+    FROM cte_26 subq_27
+    GROUP BY
+      user__home_state_latest
+  ) subq_29
+  ON
+    subq_24.ds >= subq_29.metric_time__day__first_day
+  LEFT OUTER JOIN
+    cte_26 subq_28
+  ON
+    (
+      (
+        subq_29.user__home_state_latest = subq_28.user__home_state_latest
+      ) OR (
+        (
+          subq_29.user__home_state_latest IS NULL
+        ) AND (
+          subq_28.user__home_state_latest IS NULL
+        )
+      )
+    ) AND (
+      subq_24.ds = subq_28.metric_time__day
+    )
+) subq_32
+WHERE metric_time__day__row_count > 0
@@ -0,0 +1,28 @@
+-- Remove Days Without Rows In Window
+-- Compute Metrics via Expressions
+SELECT
+  metric_time__day
+  , txn_revenue AS revenue_mtd
+FROM (
+  -- Window Over Time Range
+  SELECT
+    subq_11.ds AS metric_time__day
+    , count(subq_13.metric_time__day) OVER (PARTITION BY DATE_TRUNC('month', subq_11.ds) ORDER BY subq_11.ds ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS metric_time__day__row_count
+    , sum(subq_13.txn_revenue) OVER (PARTITION BY DATE_TRUNC('month', subq_11.ds) ORDER BY subq_11.ds ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS txn_revenue
+  FROM ***************************.mf_time_spine subq_11
+  LEFT OUTER JOIN (
+    -- Read Elements From Semantic Model 'revenue'
+    -- Metric Time Dimension 'ds'
+    -- Pass Only Elements: ['txn_revenue', 'metric_time__day']
+    -- Aggregate Measures
+    SELECT
+      DATE_TRUNC('day', created_at) AS metric_time__day
+      , SUM(revenue) AS txn_revenue
+    FROM ***************************.fct_revenue revenue_src_10007
+    GROUP BY
+      DATE_TRUNC('day', created_at)
+  ) subq_13
+  ON
+    subq_11.ds = subq_13.metric_time__day
+) subq_14
+WHERE metric_time__day__row_count > 0
@@ -0,0 +1,165 @@
+-- Compute Metrics via Expressions
+SELECT
+  subq_9.metric_time__day
+  , subq_9.bookings AS weekly_bookers
+FROM (
+  -- Constrain Time Range to [2020-01-03T00:00:00, 2020-01-20T00:00:00]
+  SELECT
+    subq_8.metric_time__day
+    , subq_8.bookings
+  FROM (
+    -- Remove Days Without Rows In Window
+    SELECT
+      subq_7.metric_time__day
+      , subq_7.bookings
+    FROM (
+      -- Window Over Time Range
+      SELECT
+        subq_5.metric_time__day AS metric_time__day
+        , count(subq_6.metric_time__day) OVER (ORDER BY subq_5.metric_time__day ROWS BETWEEN 6 PRECEDING AND CURRENT ROW) AS metric_time__day__row_count
+        , sum(subq_6.bookings) OVER (ORDER BY subq_5.metric_time__day ROWS BETWEEN 6 PRECEDING AND CURRENT ROW) AS bookings
+      FROM (
+        -- Time Spine
+        SELECT
+          subq_4.ds AS metric_time__day
+        FROM ***************************.mf_time_spine subq_4
+        WHERE subq_4.ds BETWEEN '2019-12-27' AND '2020-01-20'
+      ) subq_5
+      LEFT OUTER JOIN (
+        -- Aggregate Measures
+        SELECT
+          subq_3.metric_time__day
+          , SUM(subq_3.bookings) AS bookings
+        FROM (
+          -- Pass Only Elements: ['bookings', 'metric_time__day']
+          SELECT
+            subq_2.metric_time__day
+            , subq_2.bookings
+          FROM (
+            -- Constrain Time Range to [2019-12-27T00:00:00, 2020-01-20T00:00:00]
+            SELECT
+              subq_1.ds__day
+              , subq_1.ds__week
+              , subq_1.ds__month
+              , subq_1.ds__quarter
+              , subq_1.ds__year
+              , subq_1.ds__extract_year
+              , subq_1.ds__extract_quarter
+              , subq_1.ds__extract_month
+              , subq_1.ds__extract_day
+              , subq_1.ds__extract_dow
+              , subq_1.ds__extract_doy
+              , subq_1.booking__ds__day
+              , subq_1.booking__ds__week
+              , subq_1.booking__ds__month
+              , subq_1.booking__ds__quarter
+              , subq_1.booking__ds__year
+              , subq_1.booking__ds__extract_year
+              , subq_1.booking__ds__extract_quarter
+              , subq_1.booking__ds__extract_month
+              , subq_1.booking__ds__extract_day
+              , subq_1.booking__ds__extract_dow
+              , subq_1.booking__ds__extract_doy
+              , subq_1.metric_time__day
+              , subq_1.metric_time__week
+              , subq_1.metric_time__month
+              , subq_1.metric_time__quarter
+              , subq_1.metric_time__year
+              , subq_1.metric_time__extract_year
+              , subq_1.metric_time__extract_quarter
+              , subq_1.metric_time__extract_month
+              , subq_1.metric_time__extract_day
+              , subq_1.metric_time__extract_dow
+              , subq_1.metric_time__extract_doy
+              , subq_1.booking
+              , subq_1.listing
+              , subq_1.booking__listing
+              , subq_1.bookings
+              , subq_1.unique_listings_booked
+            FROM (
+              -- Metric Time Dimension 'ds'
+              SELECT
+                subq_0.ds__day
+                , subq_0.ds__week
+                , subq_0.ds__month
+                , subq_0.ds__quarter
+                , subq_0.ds__year
+                , subq_0.ds__extract_year
+                , subq_0.ds__extract_quarter
+                , subq_0.ds__extract_month
+                , subq_0.ds__extract_day
+                , subq_0.ds__extract_dow
+                , subq_0.ds__extract_doy
+                , subq_0.booking__ds__day
+                , subq_0.booking__ds__week
+                , subq_0.booking__ds__month
+                , subq_0.booking__ds__quarter
+                , subq_0.booking__ds__year
+                , subq_0.booking__ds__extract_year
+                , subq_0.booking__ds__extract_quarter
+                , subq_0.booking__ds__extract_month
+                , subq_0.booking__ds__extract_day
+                , subq_0.booking__ds__extract_dow
+                , subq_0.booking__ds__extract_doy
+                , subq_0.ds__day AS metric_time__day
+                , subq_0.ds__week AS metric_time__week
+                , subq_0.ds__month AS metric_time__month
+                , subq_0.ds__quarter AS metric_time__quarter
+                , subq_0.ds__year AS metric_time__year
+                , subq_0.ds__extract_year AS metric_time__extract_year
+                , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+                , subq_0.ds__extract_month AS metric_time__extract_month
+                , subq_0.ds__extract_day AS metric_time__extract_day
+                , subq_0.ds__extract_dow AS metric_time__extract_dow
+                , subq_0.ds__extract_doy AS metric_time__extract_doy
+                , subq_0.booking
+                , subq_0.listing
+                , subq_0.booking__listing
+                , subq_0.bookings
+                , subq_0.unique_listings_booked
+              FROM (
+                -- Read Elements From Semantic Model 'extended_bookings_source'
+                SELECT
+                  1 AS bookings
+                  , extended_bookings_source_src_10027.listing_id AS unique_listings_booked
+                  , DATE_TRUNC('day', extended_bookings_source_src_10027.ds) AS ds__day
+                  , DATE_TRUNC('week', extended_bookings_source_src_10027.ds) AS ds__week
+                  , DATE_TRUNC('month', extended_bookings_source_src_10027.ds) AS ds__month
+                  , DATE_TRUNC('quarter', extended_bookings_source_src_10027.ds) AS ds__quarter
+                  , DATE_TRUNC('year', extended_bookings_source_src_10027.ds) AS ds__year
+                  , EXTRACT(year FROM extended_bookings_source_src_10027.ds) AS ds__extract_year
+                  , EXTRACT(quarter FROM extended_bookings_source_src_10027.ds) AS ds__extract_quarter
+                  , EXTRACT(month FROM extended_bookings_source_src_10027.ds) AS ds__extract_month
+                  , EXTRACT(day FROM extended_bookings_source_src_10027.ds) AS ds__extract_day
+                  , CASE WHEN EXTRACT(dow FROM extended_bookings_source_src_10027.ds) = 0 THEN EXTRACT(dow FROM extended_bookings_source_src_10027.ds) + 7 ELSE EXTRACT(dow FROM extended_bookings_source_src_10027.ds) END AS ds__extract_dow
+                  , EXTRACT(doy FROM extended_bookings_source_src_10027.ds) AS ds__extract_doy
+                  , DATE_TRUNC('day', extended_bookings_source_src_10027.ds) AS booking__ds__day
+                  , DATE_TRUNC('week', extended_bookings_source_src_10027.ds) AS booking__ds__week
+                  , DATE_TRUNC('month', extended_bookings_source_src_10027.ds) AS booking__ds__month
+                  , DATE_TRUNC('quarter', extended_bookings_source_src_10027.ds) AS booking__ds__quarter
+                  , DATE_TRUNC('year', extended_bookings_source_src_10027.ds) AS booking__ds__year
+                  , EXTRACT(year FROM extended_bookings_source_src_10027.ds) AS booking__ds__extract_year
+                  , EXTRACT(quarter FROM extended_bookings_source_src_10027.ds) AS booking__ds__extract_quarter
+                  , EXTRACT(month FROM extended_bookings_source_src_10027.ds) AS booking__ds__extract_month
+                  , EXTRACT(day FROM extended_bookings_source_src_10027.ds) AS booking__ds__extract_day
+                  , CASE WHEN EXTRACT(dow FROM extended_bookings_source_src_10027.ds) = 0 THEN EXTRACT(dow FROM extended_bookings_source_src_10027.ds) + 7 ELSE EXTRACT(dow FROM extended_bookings_source_src_10027.ds) END AS booking__ds__extract_dow
+                  , EXTRACT(doy FROM extended_bookings_source_src_10027.ds) AS booking__ds__extract_doy
+                  , extended_bookings_source_src_10027.booking_id AS booking
+                  , extended_bookings_source_src_10027.listing_id AS listing
+                  , extended_bookings_source_src_10027.listing_id AS booking__listing
+                FROM ***************************.fct_bookings_extended extended_bookings_source_src_10027
+              ) subq_0
+            ) subq_1
+            WHERE subq_1.metric_time__day BETWEEN '2019-12-27' AND '2020-01-20'
+          ) subq_2
+        ) subq_3
+        GROUP BY
+          subq_3.metric_time__day
+      ) subq_6
+      ON
+        subq_5.metric_time__day = subq_6.metric_time__day
+    ) subq_7
+    WHERE subq_7.metric_time__day__row_count > 0
+  ) subq_8
+  WHERE subq_8.metric_time__day BETWEEN '2020-01-03' AND '2020-01-20'
+) subq_9
@@ -0,0 +1,207 @@
+WITH cte_9 AS (
+  -- Aggregate Measures
+  SELECT
+    subq_6.metric_time__day
+    , subq_6.user__home_state_latest
+    , SUM(subq_6.txn_revenue) AS txn_revenue
+  FROM (
+    -- Pass Only Elements: ['txn_revenue', 'user__home_state_latest', 'metric_time__day']
+    SELECT
+      subq_5.metric_time__day
+      , subq_5.user__home_state_latest
+      , subq_5.txn_revenue
+    FROM (
+      -- Join Standard Outputs
+      SELECT
+        subq_2.metric_time__day AS metric_time__day
+        , subq_2.user AS user
+        , subq_4.home_state_latest AS user__home_state_latest
+        , subq_2.txn_revenue AS txn_revenue
+      FROM (
+        -- Pass Only Elements: ['txn_revenue', 'metric_time__day', 'user']
+        SELECT
+          subq_1.metric_time__day
+          , subq_1.user
+          , subq_1.txn_revenue
+        FROM (
+          -- Metric Time Dimension 'ds'
+          SELECT
+            subq_0.ds__day
+            , subq_0.ds__week
+            , subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds__extract_year
+            , subq_0.ds__extract_quarter
+            , subq_0.ds__extract_month
+            , subq_0.ds__extract_day
+            , subq_0.ds__extract_dow
+            , subq_0.ds__extract_doy
+            , subq_0.revenue_instance__ds__day
+            , subq_0.revenue_instance__ds__week
+            , subq_0.revenue_instance__ds__month
+            , subq_0.revenue_instance__ds__quarter
+            , subq_0.revenue_instance__ds__year
+            , subq_0.revenue_instance__ds__extract_year
+            , subq_0.revenue_instance__ds__extract_quarter
+            , subq_0.revenue_instance__ds__extract_month
+            , subq_0.revenue_instance__ds__extract_day
+            , subq_0.revenue_instance__ds__extract_dow
+            , subq_0.revenue_instance__ds__extract_doy
+            , subq_0.ds__day AS metric_time__day
+            , subq_0.ds__week AS metric_time__week
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.ds__extract_year AS metric_time__extract_year
+            , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_0.ds__extract_month AS metric_time__extract_month
+            , subq_0.ds__extract_day AS metric_time__extract_day
+            , subq_0.ds__extract_dow AS metric_time__extract_dow
+            , subq_0.ds__extract_doy AS metric_time__extract_doy
+            , subq_0.user
+            , subq_0.revenue_instance__user
+            , subq_0.txn_revenue
+          FROM (
+            -- Read Elements From Semantic Model 'revenue'
+            SELECT
+              revenue_src_10007.revenue AS txn_revenue
+              , DATE_TRUNC('day', revenue_src_10007.created_at) AS ds__day
+              , DATE_TRUNC('week', revenue_src_10007.created_at) AS ds__week
+              , DATE_TRUNC('month', revenue_src_10007.created_at) AS ds__month
+              , DATE_TRUNC('quarter', revenue_src_10007.created_at) AS ds__quarter
+              , DATE_TRUNC('year', revenue_src_10007.created_at) AS ds__year
+              , EXTRACT(year FROM revenue_src_10007.created_at) AS ds__extract_year
+              , EXTRACT(quarter FROM revenue_src_10007.created_at) AS ds__extract_quarter
+              , EXTRACT(month FROM revenue_src_10007.created_at) AS ds__extract_month
+              , EXTRACT(day FROM revenue_src_10007.created_at) AS ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM revenue_src_10007.created_at) = 0 THEN EXTRACT(dow FROM revenue_src_10007.created_at) + 7 ELSE EXTRACT(dow FROM revenue_src_10007.created_at) END AS ds__extract_dow
+              , EXTRACT(doy FROM revenue_src_10007.created_at) AS ds__extract_doy
+              , DATE_TRUNC('day', revenue_src_10007.created_at) AS revenue_instance__ds__day
+              , DATE_TRUNC('week', revenue_src_10007.created_at) AS revenue_instance__ds__week
+              , DATE_TRUNC('month', revenue_src_10007.created_at) AS revenue_instance__ds__month
+              , DATE_TRUNC('quarter', revenue_src_10007.created_at) AS revenue_instance__ds__quarter
+              , DATE_TRUNC('year', revenue_src_10007.created_at) AS revenue_instance__ds__year
+              , EXTRACT(year FROM revenue_src_10007.created_at) AS revenue_instance__ds__extract_year
+              , EXTRACT(quarter FROM revenue_src_10007.created_at) AS revenue_instance__ds__extract_quarter
+              , EXTRACT(month FROM revenue_src_10007.created_at) AS revenue_instance__ds__extract_month
+              , EXTRACT(day FROM revenue_src_10007.created_at) AS revenue_instance__ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM revenue_src_10007.created_at) = 0 THEN EXTRACT(dow FROM revenue_src_10007.created_at) + 7 ELSE EXTRACT(dow FROM revenue_src_10007.created_at) END AS revenue_instance__ds__extract_dow
+              , EXTRACT(doy FROM revenue_src_10007.created_at) AS revenue_instance__ds__extract_doy
+              , revenue_src_10007.user_id AS user
+              , revenue_src_10007.user_id AS revenue_instance__user
+            FROM ***************************.fct_revenue revenue_src_10007
+          ) subq_0
+        ) subq_1
+      ) subq_2
+      LEFT OUTER JOIN (
+        -- Pass Only Elements: ['home_state_latest', 'user']
+        SELECT
+          subq_3.user
+          , subq_3.home_state_latest
+        FROM (
+          -- Read Elements From Semantic Model 'users_latest'
+          SELECT
+            DATE_TRUNC('day', users_latest_src_10009.ds) AS ds_latest__day
+            , DATE_TRUNC('week', users_latest_src_10009.ds) AS ds_latest__week
+            , DATE_TRUNC('month', users_latest_src_10009.ds) AS ds_latest__month
+            , DATE_TRUNC('quarter', users_latest_src_10009.ds) AS ds_latest__quarter
+            , DATE_TRUNC('year', users_latest_src_10009.ds) AS ds_latest__year
+            , EXTRACT(year FROM users_latest_src_10009.ds) AS ds_latest__extract_year
+            , EXTRACT(quarter FROM users_latest_src_10009.ds) AS ds_latest__extract_quarter
+            , EXTRACT(month FROM users_latest_src_10009.ds) AS ds_latest__extract_month
+            , EXTRACT(day FROM users_latest_src_10009.ds) AS ds_latest__extract_day
+            , CASE WHEN EXTRACT(dow FROM users_latest_src_10009.ds) = 0 THEN EXTRACT(dow FROM users_latest_src_10009.ds) + 7 ELSE EXTRACT(dow FROM users_latest_src_10009.ds) END AS ds_latest__extract_dow
+            , EXTRACT(doy FROM users_latest_src_10009.ds) AS ds_latest__extract_doy
+            , users_latest_src_10009.home_state_latest
+            , DATE_TRUNC('day', users_latest_src_10009.ds) AS user__ds_latest__day
+            , DATE_TRUNC('week', users_latest_src_10009.ds) AS user__ds_latest__week
+            , DATE_TRUNC('month', users_latest_src_10009.ds) AS user__ds_latest__month
+            , DATE_TRUNC('quarter', users_latest_src_10009.ds) AS user__ds_latest__quarter
+            , DATE_TRUNC('year', users_latest_src_10009.ds) AS user__ds_latest__year
+            , EXTRACT(year FROM users_latest_src_10009.ds) AS user__ds_latest__extract_year
+            , EXTRACT(quarter FROM users_latest_src_10009.ds) AS user__ds_latest__extract_quarter
+            , EXTRACT(month FROM users_latest_src_10009.ds) AS user__ds_latest__extract_month
+            , EXTRACT(day FROM users_latest_src_10009.ds) AS user__ds_latest__extract_day
+            , CASE WHEN EXTRACT(dow FROM users_latest_src_10009.ds) = 0 THEN EXTRACT(dow FROM users_latest_src_10009.ds) + 7 ELSE EXTRACT(dow FROM users_latest_src_10009.ds) END AS user__ds_latest__extract_dow
+            , EXTRACT(doy FROM users_latest_src_10009.ds) AS user__ds_latest__extract_doy
+            , users_latest_src_10009.home_state_latest AS user__home_state_latest
+            , users_latest_src_10009.user_id AS user
+          FROM ***************************.dim_users_latest users_latest_src_10009
+        ) subq_3
+      ) subq_4
+      ON
+        subq_2.user = subq_4.user
+    ) subq_5
+  ) subq_6
+  GROUP BY
+    subq_6.metric_time__day
+    , subq_6.user__home_state_latest
+)
+-- Compute Metrics via Expressions
+SELECT
+  subq_16.metric_time__day
+  , subq_16.user__home_state_latest
+  , subq_16.txn_revenue AS revenue_all_time
+FROM (
+  -- Remove Days Without Rows In Window
+  SELECT
+    subq_15.metric_time__day
+    , subq_15.user__home_state_latest
+    , subq_15.txn_revenue
+  FROM (
+    -- Window Over Time Range
+    SELECT
+      subq_8.metric_time__day AS metric_time__day
+      , subq_12.user__home_state_latest AS user__home_state_latest
+      , count(subq_14.metric_time__day) OVER (PARTITION BY subq_12.user__home_state_latest ORDER BY subq_8.metric_time__day ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS metric_time__day__row_count
+      , sum(subq_14.txn_revenue) OVER (PARTITION BY subq_12.user__home_state_latest ORDER BY subq_8.metric_time__day ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS txn_revenue
+    FROM (
+      -- Time Spine
+      SELECT
+        subq_7.ds AS metric_time__day
+      FROM ***************************.mf_time_spine subq_7
+    ) subq_8
+    INNER JOIN (
+      -- Find The First Day Of Each Group
+      SELECT
+        subq_13.user__home_state_latest
+        , MIN(subq_13.metric_time__day) AS metric_time__day__first_day
+      FROM (
+        -- Read From cte_9
+        SELECT
+          subq_10.metric_time__day
+          , subq_10.user__home_state_latest
+          , subq_10.txn_revenue
+        FROM cte_9 subq_10
+      ) subq_13
+      GROUP BY
+        subq_13.user__home_state_latest
+    ) subq_12
+    ON
+      subq_8.metric_time__day >= subq_12.metric_time__day__first_day
+    LEFT OUTER JOIN (
+      -- Read From cte_9
+      SELECT
+        subq_11.metric_time__day
+        , subq_11.user__home_state_latest
+        , subq_11.txn_revenue
+      FROM cte_9 subq_11
+    ) subq_14
+    ON
+      (
+        (
+          subq_12.user__home_state_latest = subq_14.user__home_state_latest
+        ) OR (
+          (
+            subq_12.user__home_state_latest IS NULL
+          ) AND (
+            subq_14.user__home_state_latest IS NULL
+          )
+        )
+      ) AND (
+        subq_8.metric_time__day = subq_14.metric_time__day
+      )
+  ) subq_15
+  WHERE subq_15.metric_time__day__row_count > 0
+) subq_16
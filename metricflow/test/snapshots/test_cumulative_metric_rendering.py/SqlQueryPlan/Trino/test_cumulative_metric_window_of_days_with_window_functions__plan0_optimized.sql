@@ -0,0 +1,46 @@
+-- Remove Days Without Rows In Window
+-- Constrain Time Range to [2020-01-03T00:00:00, 2020-01-20T00:00:00]
+-- Compute Metrics via Expressions
+SELECT
+  metric_time__day
+  , bookings AS weekly_bookers
+FROM (
+  -- Window Over Time Range
+  SELECT
+    subq_15.metric_time__day AS metric_time__day
+    , count(subq_16.metric_time__day) OVER (ORDER BY subq_15.metric_time__day ROWS BETWEEN 6 PRECEDING AND CURRENT ROW) AS metric_time__day__row_count
+    , sum(subq_16.bookings) OVER (ORDER BY subq_15.metric_time__day ROWS BETWEEN 6 PRECEDING AND CURRENT ROW) AS bookings
+  FROM (
+    -- Time Spine
+    SELECT
+      ds AS metric_time__day
+    FROM ***************************.mf_time_spine subq_14
+    WHERE ds BETWEEN timestamp '2019-12-27' AND timestamp '2020-01-20'
+  ) subq_15
+  LEFT OUTER JOIN (
+    -- Aggregate Measures
+    SELECT
+      metric_time__day
+      , SUM(bookings) AS bookings
+    FROM (
+      -- Read Elements From Semantic Model 'extended_bookings_source'
+      -- Metric Time Dimension 'ds'
+      -- Constrain Time Range to [2019-12-27T00:00:00, 2020-01-20T00:00:00]
+      -- Pass Only Elements: ['bookings', 'metric_time__day']
+      SELECT
+        DATE_TRUNC('day', ds) AS metric_time__day
+        , 1 AS bookings
+      FROM ***************************.fct_bookings_extended extended_bookings_source_src_10027
+      WHERE DATE_TRUNC('day', ds) BETWEEN timestamp '2019-12-27' AND timestamp '2020-01-20'
+    ) subq_13
+    GROUP BY
+      metric_time__day
+  ) subq_16
+  ON
+    subq_15.metric_time__day = subq_16.metric_time__day
+) subq_17
+WHERE (
+  metric_time__day BETWEEN timestamp '2020-01-03' AND timestamp '2020-01-20'
+) AND (
+  metric_time__day__row_count > 0
+)
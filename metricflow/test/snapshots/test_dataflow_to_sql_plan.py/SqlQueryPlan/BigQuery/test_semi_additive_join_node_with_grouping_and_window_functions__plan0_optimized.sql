@@ -0,0 +1,67 @@
+-- Join on MAX(ds) and ['user'] grouping by None
+SELECT
+  ds__day
+  , ds__week
+  , ds__month
+  , ds__quarter
+  , ds__year
+  , ds__extract_year
+  , ds__extract_quarter
+  , ds__extract_month
+  , ds__extract_day
+  , ds__extract_dow
+  , ds__extract_doy
+  , account__ds__day
+  , account__ds__week
+  , account__ds__month
+  , account__ds__quarter
+  , account__ds__year
+  , account__ds__extract_year
+  , account__ds__extract_quarter
+  , account__ds__extract_month
+  , account__ds__extract_day
+  , account__ds__extract_dow
+  , account__ds__extract_doy
+  , subq_1.user
+  , account__user
+  , account_type
+  , account__account_type
+  , account_balance
+  , total_account_balance_first_day
+  , current_account_balance_by_user
+FROM (
+  -- Read Elements From Semantic Model 'accounts_source'
+  SELECT
+    account_balance
+    , account_balance AS total_account_balance_first_day
+    , account_balance AS current_account_balance_by_user
+    , DATE_TRUNC(ds, day) AS ds__day
+    , DATE_TRUNC(ds, isoweek) AS ds__week
+    , DATE_TRUNC(ds, month) AS ds__month
+    , DATE_TRUNC(ds, quarter) AS ds__quarter
+    , DATE_TRUNC(ds, year) AS ds__year
+    , EXTRACT(year FROM ds) AS ds__extract_year
+    , EXTRACT(quarter FROM ds) AS ds__extract_quarter
+    , EXTRACT(month FROM ds) AS ds__extract_month
+    , EXTRACT(day FROM ds) AS ds__extract_day
+    , IF(EXTRACT(dayofweek FROM ds) = 1, 7, EXTRACT(dayofweek FROM ds) - 1) AS ds__extract_dow
+    , EXTRACT(dayofyear FROM ds) AS ds__extract_doy
+    , account_type
+    , DATE_TRUNC(ds, day) AS account__ds__day
+    , DATE_TRUNC(ds, isoweek) AS account__ds__week
+    , DATE_TRUNC(ds, month) AS account__ds__month
+    , DATE_TRUNC(ds, quarter) AS account__ds__quarter
+    , DATE_TRUNC(ds, year) AS account__ds__year
+    , EXTRACT(year FROM ds) AS account__ds__extract_year
+    , EXTRACT(quarter FROM ds) AS account__ds__extract_quarter
+    , EXTRACT(month FROM ds) AS account__ds__extract_month
+    , EXTRACT(day FROM ds) AS account__ds__extract_day
+    , IF(EXTRACT(dayofweek FROM ds) = 1, 7, EXTRACT(dayofweek FROM ds) - 1) AS account__ds__extract_dow
+    , EXTRACT(dayofyear FROM ds) AS account__ds__extract_doy
+    , account_type AS account__account_type
+    , user_id AS user
+    , user_id AS account__user
+  FROM ***************************.fct_accounts accounts_source_src_10000
+) subq_1
+WHERE (ds__day IS NOT NULL) AND (subq_1.user IS NOT NULL)
+QUALIFY ds__day = max(ds__day) OVER (PARTITION BY subq_1.user)
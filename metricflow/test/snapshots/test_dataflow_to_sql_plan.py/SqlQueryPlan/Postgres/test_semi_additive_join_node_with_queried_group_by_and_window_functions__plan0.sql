@@ -0,0 +1,101 @@
+-- Filter Rows Using The Window Function Condition
+SELECT
+  qualify_subq.ds__day
+  , qualify_subq.ds__week
+  , qualify_subq.ds__month
+  , qualify_subq.ds__quarter
+  , qualify_subq.ds__year
+  , qualify_subq.ds__extract_year
+  , qualify_subq.ds__extract_quarter
+  , qualify_subq.ds__extract_month
+  , qualify_subq.ds__extract_day
+  , qualify_subq.ds__extract_dow
+  , qualify_subq.ds__extract_doy
+  , qualify_subq.account__ds__day
+  , qualify_subq.account__ds__week
+  , qualify_subq.account__ds__month
+  , qualify_subq.account__ds__quarter
+  , qualify_subq.account__ds__year
+  , qualify_subq.account__ds__extract_year
+  , qualify_subq.account__ds__extract_quarter
+  , qualify_subq.account__ds__extract_month
+  , qualify_subq.account__ds__extract_day
+  , qualify_subq.account__ds__extract_dow
+  , qualify_subq.account__ds__extract_doy
+  , qualify_subq.user
+  , qualify_subq.account__user
+  , qualify_subq.account_type
+  , qualify_subq.account__account_type
+  , qualify_subq.account_balance
+  , qualify_subq.total_account_balance_first_day
+  , qualify_subq.current_account_balance_by_user
+FROM (
+  -- Join on MIN(ds) and [] grouping by ds
+  SELECT
+    subq_0.ds__day
+    , subq_0.ds__week
+    , subq_0.ds__month
+    , subq_0.ds__quarter
+    , subq_0.ds__year
+    , subq_0.ds__extract_year
+    , subq_0.ds__extract_quarter
+    , subq_0.ds__extract_month
+    , subq_0.ds__extract_day
+    , subq_0.ds__extract_dow
+    , subq_0.ds__extract_doy
+    , subq_0.account__ds__day
+    , subq_0.account__ds__week
+    , subq_0.account__ds__month
+    , subq_0.account__ds__quarter
+    , subq_0.account__ds__year
+    , subq_0.account__ds__extract_year
+    , subq_0.account__ds__extract_quarter
+    , subq_0.account__ds__extract_month
+    , subq_0.account__ds__extract_day
+    , subq_0.account__ds__extract_dow
+    , subq_0.account__ds__extract_doy
+    , subq_0.user
+    , subq_0.account__user
+    , subq_0.account_type
+    , subq_0.account__account_type
+    , subq_0.account_balance
+    , subq_0.total_account_balance_first_day
+    , subq_0.current_account_balance_by_user
+    , subq_0.ds__day = min(subq_0.ds__day) OVER (PARTITION BY subq_0.ds__week) AS qualify_condition
+  FROM (
+    -- Read Elements From Semantic Model 'accounts_source'
+    SELECT
+      accounts_source_src_10000.account_balance
+      , accounts_source_src_10000.account_balance AS total_account_balance_first_day
+      , accounts_source_src_10000.account_balance AS current_account_balance_by_user
+      , DATE_TRUNC('day', accounts_source_src_10000.ds) AS ds__day
+      , DATE_TRUNC('week', accounts_source_src_10000.ds) AS ds__week
+      , DATE_TRUNC('month', accounts_source_src_10000.ds) AS ds__month
+      , DATE_TRUNC('quarter', accounts_source_src_10000.ds) AS ds__quarter
+      , DATE_TRUNC('year', accounts_source_src_10000.ds) AS ds__year
+      , EXTRACT(year FROM accounts_source_src_10000.ds) AS ds__extract_year
+      , EXTRACT(quarter FROM accounts_source_src_10000.ds) AS ds__extract_quarter
+      , EXTRACT(month FROM accounts_source_src_10000.ds) AS ds__extract_month
+      , EXTRACT(day FROM accounts_source_src_10000.ds) AS ds__extract_day
+      , EXTRACT(isodow FROM accounts_source_src_10000.ds) AS ds__extract_dow
+      , EXTRACT(doy FROM accounts_source_src_10000.ds) AS ds__extract_doy
+      , accounts_source_src_10000.account_type
+      , DATE_TRUNC('day', accounts_source_src_10000.ds) AS account__ds__day
+      , DATE_TRUNC('week', accounts_source_src_10000.ds) AS account__ds__week
+      , DATE_TRUNC('month', accounts_source_src_10000.ds) AS account__ds__month
+      , DATE_TRUNC('quarter', accounts_source_src_10000.ds) AS account__ds__quarter
+      , DATE_TRUNC('year', accounts_source_src_10000.ds) AS account__ds__year
+      , EXTRACT(year FROM accounts_source_src_10000.ds) AS account__ds__extract_year
+      , EXTRACT(quarter FROM accounts_source_src_10000.ds) AS account__ds__extract_quarter
+      , EXTRACT(month FROM accounts_source_src_10000.ds) AS account__ds__extract_month
+      , EXTRACT(day FROM accounts_source_src_10000.ds) AS account__ds__extract_day
+      , EXTRACT(isodow FROM accounts_source_src_10000.ds) AS account__ds__extract_dow
+      , EXTRACT(doy FROM accounts_source_src_10000.ds) AS account__ds__extract_doy
+      , accounts_source_src_10000.account_type AS account__account_type
+      , accounts_source_src_10000.user_id AS user
+      , accounts_source_src_10000.user_id AS account__user
+    FROM ***************************.fct_accounts accounts_source_src_10000
+  ) subq_0
+  WHERE subq_0.ds__day IS NOT NULL
+) qualify_subq
+WHERE qualify_subq.qualify_condition
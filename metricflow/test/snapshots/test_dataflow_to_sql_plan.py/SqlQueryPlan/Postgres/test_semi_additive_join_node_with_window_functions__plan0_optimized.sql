@@ -0,0 +1,101 @@
+-- Filter Rows Using The Window Function Condition
+SELECT
+  qualify_subq.ds__day
+  , qualify_subq.ds__week
+  , qualify_subq.ds__month
+  , qualify_subq.ds__quarter
+  , qualify_subq.ds__year
+  , qualify_subq.ds__extract_year
+  , qualify_subq.ds__extract_quarter
+  , qualify_subq.ds__extract_month
+  , qualify_subq.ds__extract_day
+  , qualify_subq.ds__extract_dow
+  , qualify_subq.ds__extract_doy
+  , qualify_subq.account__ds__day
+  , qualify_subq.account__ds__week
+  , qualify_subq.account__ds__month
+  , qualify_subq.account__ds__quarter
+  , qualify_subq.account__ds__year
+  , qualify_subq.account__ds__extract_year
+  , qualify_subq.account__ds__extract_quarter
+  , qualify_subq.account__ds__extract_month
+  , qualify_subq.account__ds__extract_day
+  , qualify_subq.account__ds__extract_dow
+  , qualify_subq.account__ds__extract_doy
+  , qualify_subq.user
+  , qualify_subq.account__user
+  , qualify_subq.account_type
+  , qualify_subq.account__account_type
+  , qualify_subq.account_balance
+  , qualify_subq.total_account_balance_first_day
+  , qualify_subq.current_account_balance_by_user
+FROM (
+  -- Join on MIN(ds) and [] grouping by None
+  SELECT
+    ds__day
+    , ds__week
+    , ds__month
+    , ds__quarter
+    , ds__year
+    , ds__extract_year
+    , ds__extract_quarter
+    , ds__extract_month
+    , ds__extract_day
+    , ds__extract_dow
+    , ds__extract_doy
+    , account__ds__day
+    , account__ds__week
+    , account__ds__month
+    , account__ds__quarter
+    , account__ds__year
+    , account__ds__extract_year
+    , account__ds__extract_quarter
+    , account__ds__extract_month
+    , account__ds__extract_day
+    , account__ds__extract_dow
+    , account__ds__extract_doy
+    , subq_1.user
+    , account__user
+    , account_type
+    , account__account_type
+    , account_balance
+    , total_account_balance_first_day
+    , current_account_balance_by_user
+    , ds__day = min(ds__day) OVER () AS qualify_condition
+  FROM (
+    -- Read Elements From Semantic Model 'accounts_source'
+    SELECT
+      account_balance
+      , account_balance AS total_account_balance_first_day
+      , account_balance AS current_account_balance_by_user
+      , DATE_TRUNC('day', ds) AS ds__day
+      , DATE_TRUNC('week', ds) AS ds__week
+      , DATE_TRUNC('month', ds) AS ds__month
+      , DATE_TRUNC('quarter', ds) AS ds__quarter
+      , DATE_TRUNC('year', ds) AS ds__year
+      , EXTRACT(year FROM ds) AS ds__extract_year
+      , EXTRACT(quarter FROM ds) AS ds__extract_quarter
+      , EXTRACT(month FROM ds) AS ds__extract_month
+      , EXTRACT(day FROM ds) AS ds__extract_day
+      , EXTRACT(isodow FROM ds) AS ds__extract_dow
+      , EXTRACT(doy FROM ds) AS ds__extract_doy
+      , account_type
+      , DATE_TRUNC('day', ds) AS account__ds__day
+      , DATE_TRUNC('week', ds) AS account__ds__week
+      , DATE_TRUNC('month', ds) AS account__ds__month
+      , DATE_TRUNC('quarter', ds) AS account__ds__quarter
+      , DATE_TRUNC('year', ds) AS account__ds__year
+      , EXTRACT(year FROM ds) AS account__ds__extract_year
+      , EXTRACT(quarter FROM ds) AS account__ds__extract_quarter
+      , EXTRACT(month FROM ds) AS account__ds__extract_month
+      , EXTRACT(day FROM ds) AS account__ds__extract_day
+      , EXTRACT(isodow FROM ds) AS account__ds__extract_dow
+      , EXTRACT(doy FROM ds) AS account__ds__extract_doy
+      , account_type AS account__account_type
+      , user_id AS user
+      , user_id AS account__user
+    FROM ***************************.fct_accounts accounts_source_src_10000
+  ) subq_1
+  WHERE ds__day IS NOT NULL
+) qualify_subq
+WHERE qualify_subq.qualify_condition
@@ -0,0 +1,28 @@
+-- Constrain Output with WHERE
+-- Pass Only Elements: ['bookings', 'metric_time__day']
+-- Aggregate Measures
+-- Compute Metrics via Expressions
+SELECT
+  metric_time__day
+  , SUM(bookings) AS bookings
+FROM (
+  -- Constrain Time Range
+  -- Pass Only Elements: ['bookings', 'booking__is_instant', 'metric_time__day']
+  SELECT
+    metric_time__day
+    , booking__is_instant
+    , bookings
+  FROM (
+    -- Read Elements From Semantic Model 'bookings_source'
+    -- Metric Time Dimension 'ds'
+    SELECT
+      DATE_TRUNC('day', ds) AS metric_time__day
+      , is_instant AS booking__is_instant
+      , 1 AS bookings
+    FROM ***************************.fct_bookings bookings_source_src_10001
+  ) subq_8
+  WHERE metric_time__day BETWEEN :mf_param_time_range_start_2 AND :mf_param_time_range_end_3
+) subq_10
+WHERE booking__is_instant = 'false'
+GROUP BY
+  metric_time__day
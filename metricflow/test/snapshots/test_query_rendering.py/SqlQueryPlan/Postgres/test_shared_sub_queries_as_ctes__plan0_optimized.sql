@@ -0,0 +1,143 @@
+WITH shared_subq_0 AS (
+  -- Read Elements From Semantic Model 'bookings_source'
+  -- Metric Time Dimension 'ds'
+  -- Pass Only Elements: ['bookings', 'metric_time__day', 'listing']
+  SELECT
+    DATE_TRUNC('day', ds) AS metric_time__day
+    , listing_id AS listing
+    , 1 AS bookings
+  FROM ***************************.fct_bookings bookings_source_src_10001
+)
+-- Combine Aggregated Outputs
+SELECT
+  COALESCE(subq_20.metric_time__day, subq_37.metric_time__day) AS metric_time__day
+  , COALESCE(subq_20.listing__country_latest, subq_37.listing__country_latest) AS listing__country_latest
+  , MAX(CAST(subq_20.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_20.views, 0) AS DOUBLE PRECISION)) AS bookings_per_view
+  , MAX(CAST(subq_37.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_37.listings, 0) AS DOUBLE PRECISION)) AS bookings_per_listing
+FROM (
+  -- Combine Aggregated Outputs
+  SELECT
+    COALESCE(subq_9.metric_time__day, subq_19.metric_time__day) AS metric_time__day
+    , COALESCE(subq_9.listing__country_latest, subq_19.listing__country_latest) AS listing__country_latest
+    , MAX(subq_9.bookings) AS bookings
+    , MAX(subq_19.views) AS views
+  FROM (
+    -- Join Standard Outputs
+    -- Pass Only Elements: ['bookings', 'listing__country_latest', 'metric_time__day']
+    -- Aggregate Measures
+    -- Compute Metrics via Expressions
+    SELECT
+      subq_2.metric_time__day AS metric_time__day
+      , listings_latest_src_10005.country AS listing__country_latest
+      , SUM(subq_2.bookings) AS bookings
+    FROM shared_subq_0 subq_2
+    LEFT OUTER JOIN
+      ***************************.dim_listings_latest listings_latest_src_10005
+    ON
+      subq_2.listing = listings_latest_src_10005.listing_id
+    GROUP BY
+      subq_2.metric_time__day
+      , listings_latest_src_10005.country
+  ) subq_9
+  FULL OUTER JOIN (
+    -- Join Standard Outputs
+    -- Pass Only Elements: ['views', 'listing__country_latest', 'metric_time__day']
+    -- Aggregate Measures
+    -- Compute Metrics via Expressions
+    SELECT
+      subq_12.metric_time__day AS metric_time__day
+      , listings_latest_src_10005.country AS listing__country_latest
+      , SUM(subq_12.views) AS views
+    FROM (
+      -- Read Elements From Semantic Model 'views_source'
+      -- Metric Time Dimension 'ds'
+      -- Pass Only Elements: ['views', 'metric_time__day', 'listing']
+      SELECT
+        DATE_TRUNC('day', ds) AS metric_time__day
+        , listing_id AS listing
+        , 1 AS views
+      FROM ***************************.fct_views views_source_src_10010
+    ) subq_12
+    LEFT OUTER JOIN
+      ***************************.dim_listings_latest listings_latest_src_10005
+    ON
+      subq_12.listing = listings_latest_src_10005.listing_id
+    GROUP BY
+      subq_12.metric_time__day
+      , listings_latest_src_10005.country
+  ) subq_19
+  ON
+    (
+      subq_9.listing__country_latest = subq_19.listing__country_latest
+    ) AND (
+      subq_9.metric_time__day = subq_19.metric_time__day
+    )
+  GROUP BY
+    COALESCE(subq_9.metric_time__day, subq_19.metric_time__day)
+    , COALESCE(subq_9.listing__country_latest, subq_19.listing__country_latest)
+) subq_20
+FULL OUTER JOIN (
+  -- Combine Aggregated Outputs
+  SELECT
+    COALESCE(subq_31.metric_time__day, subq_36.metric_time__day) AS metric_time__day
+    , COALESCE(subq_31.listing__country_latest, subq_36.listing__country_latest) AS listing__country_latest
+    , MAX(subq_31.bookings) AS bookings
+    , MAX(subq_36.listings) AS listings
+  FROM (
+    -- Join Standard Outputs
+    -- Pass Only Elements: ['bookings', 'listing__country_latest', 'metric_time__day']
+    -- Aggregate Measures
+    -- Compute Metrics via Expressions
+    SELECT
+      subq_24.metric_time__day AS metric_time__day
+      , listings_latest_src_10005.country AS listing__country_latest
+      , SUM(subq_24.bookings) AS bookings
+    FROM shared_subq_0 subq_24
+    LEFT OUTER JOIN
+      ***************************.dim_listings_latest listings_latest_src_10005
+    ON
+      subq_24.listing = listings_latest_src_10005.listing_id
+    GROUP BY
+      subq_24.metric_time__day
+      , listings_latest_src_10005.country
+  ) subq_31
+  FULL OUTER JOIN (
+    -- Aggregate Measures
+    -- Compute Metrics via Expressions
+    SELECT
+      metric_time__day
+      , listing__country_latest
+      , SUM(listings) AS listings
+    FROM (
+      -- Read Elements From Semantic Model 'listings_latest'
+      -- Metric Time Dimension 'ds'
+      -- Pass Only Elements: ['listings', 'listing__country_latest', 'metric_time__day']
+      SELECT
+        DATE_TRUNC('day', created_at) AS metric_time__day
+        , country AS listing__country_latest
+        , 1 AS listings
+      FROM ***************************.dim_listings_latest listings_latest_src_10005
+    ) subq_34
+    GROUP BY
+      metric_time__day
+      , listing__country_latest
+  ) subq_36
+  ON
+    (
+      subq_31.listing__country_latest = subq_36.listing__country_latest
+    ) AND (
+      subq_31.metric_time__day = subq_36.metric_time__day
+    )
+  GROUP BY
+    COALESCE(subq_31.metric_time__day, subq_36.metric_time__day)
+    , COALESCE(subq_31.listing__country_latest, subq_36.listing__country_latest)
+) subq_37
+ON
+  (
+    subq_20.listing__country_latest = subq_37.listing__country_latest
+  ) AND (
+    subq_20.metric_time__day = subq_37.metric_time__day
+  )
+GROUP BY
+  COALESCE(subq_20.metric_time__day, subq_37.metric_time__day)
+  , COALESCE(subq_20.listing__country_latest, subq_37.listing__country_latest)
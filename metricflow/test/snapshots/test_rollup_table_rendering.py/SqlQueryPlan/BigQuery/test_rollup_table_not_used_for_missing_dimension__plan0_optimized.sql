@@ -0,0 +1,19 @@
+-- Aggregate Measures
+-- Compute Metrics via Expressions
+SELECT
+  booking__paid_at__day
+  , metric_time__week
+  , SUM(bookings) AS bookings
+FROM (
+  -- Read Elements From Semantic Model 'bookings_source'
+  -- Metric Time Dimension 'ds'
+  -- Pass Only Elements: ['bookings', 'metric_time__week', 'booking__paid_at__day']
+  SELECT
+    DATE_TRUNC(paid_at, day) AS booking__paid_at__day
+    , DATE_TRUNC(ds, isoweek) AS metric_time__week
+    , 1 AS bookings
+  FROM ***************************.fct_bookings bookings_source_src_10001
+) subq_6
+GROUP BY
+  booking__paid_at__day
+  , metric_time__week
@@ -0,0 +1,59 @@
+-- Compute Metrics via Expressions
+SELECT
+  subq_3.metric_time__month
+  , subq_3.txn_revenue AS revenue
+FROM (
+  -- Aggregate Measures
+  SELECT
+    subq_2.metric_time__month
+    , SUM(subq_2.txn_revenue) AS txn_revenue
+  FROM (
+    -- Pass Only Elements: ['txn_revenue', 'metric_time__month']
+    SELECT
+      subq_1.metric_time__month
+      , subq_1.txn_revenue
+    FROM (
+      -- Metric Time Dimension 'ds'
+      SELECT
+        subq_0.ds__month
+        , subq_0.ds__quarter
+        , subq_0.ds__year
+        , subq_0.ds__extract_year
+        , subq_0.ds__extract_quarter
+        , subq_0.ds__extract_month
+        , subq_0.revenue_instance__ds__month
+        , subq_0.revenue_instance__ds__quarter
+        , subq_0.revenue_instance__ds__year
+        , subq_0.revenue_instance__ds__extract_year
+        , subq_0.revenue_instance__ds__extract_quarter
+        , subq_0.revenue_instance__ds__extract_month
+        , subq_0.ds__month AS metric_time__month
+        , subq_0.ds__quarter AS metric_time__quarter
+        , subq_0.ds__year AS metric_time__year
+        , subq_0.ds__extract_year AS metric_time__extract_year
+        , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+        , subq_0.ds__extract_month AS metric_time__extract_month
+        , subq_0.txn_revenue
+      FROM (
+        -- Read Elements From Rollup Table 'rollup_schema.revenue_by_month' for Semantic Model 'revenue'
+        SELECT
+          revenue_src_2.txn_revenue
+          , DATE_TRUNC(revenue_src_2.ds, month) AS ds__month
+          , DATE_TRUNC(revenue_src_2.ds, quarter) AS ds__quarter
+          , DATE_TRUNC(revenue_src_2.ds, year) AS ds__year
+          , EXTRACT(year FROM revenue_src_2.ds) AS ds__extract_year
+          , EXTRACT(quarter FROM revenue_src_2.ds) AS ds__extract_quarter
+          , EXTRACT(month FROM revenue_src_2.ds) AS ds__extract_month
+          , DATE_TRUNC(revenue_src_2.ds, month) AS revenue_instance__ds__month
+          , DATE_TRUNC(revenue_src_2.ds, quarter) AS revenue_instance__ds__quarter
+          , DATE_TRUNC(revenue_src_2.ds, year) AS revenue_instance__ds__year
+          , EXTRACT(year FROM revenue_src_2.ds) AS revenue_instance__ds__extract_year
+          , EXTRACT(quarter FROM revenue_src_2.ds) AS revenue_instance__ds__extract_quarter
+          , EXTRACT(month FROM revenue_src_2.ds) AS revenue_instance__ds__extract_month
+        FROM rollup_schema.revenue_by_month revenue_src_2
+      ) subq_0
+    ) subq_1
+  ) subq_2
+  GROUP BY
+    metric_time__month
+) subq_3
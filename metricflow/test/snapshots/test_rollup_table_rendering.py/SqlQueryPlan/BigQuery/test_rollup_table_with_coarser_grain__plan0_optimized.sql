@@ -0,0 +1,11 @@
+-- Read Elements From Rollup Table 'rollup_schema.revenue_by_month' for Semantic Model 'revenue'
+-- Metric Time Dimension 'ds'
+-- Pass Only Elements: ['txn_revenue', 'metric_time__month']
+-- Aggregate Measures
+-- Compute Metrics via Expressions
+SELECT
+  DATE_TRUNC(ds, month) AS metric_time__month
+  , SUM(txn_revenue) AS revenue
+FROM rollup_schema.revenue_by_month revenue_src_2
+GROUP BY
+  metric_time__month
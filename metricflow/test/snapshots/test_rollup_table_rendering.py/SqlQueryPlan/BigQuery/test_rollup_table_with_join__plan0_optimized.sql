@@ -0,0 +1,14 @@
+-- Join Standard Outputs
+-- Pass Only Elements: ['bookings', 'listing__country_latest']
+-- Aggregate Measures
+-- Compute Metrics via Expressions
+SELECT
+  listings_latest_src_10005.country AS listing__country_latest
+  , SUM(bookings_source_src_0.bookings) AS bookings
+FROM rollup_schema.bookings_by_day bookings_source_src_0
+LEFT OUTER JOIN
+  ***************************.dim_listings_latest listings_latest_src_10005
+ON
+  bookings_source_src_0.listing = listings_latest_src_10005.listing_id
+GROUP BY
+  listing__country_latest
@@ -0,0 +1,10 @@
+-- Read Elements From Rollup Table 'rollup_schema.bookings_by_day' for Semantic Model 'bookings_source'
+-- Metric Time Dimension 'ds'
+-- Constrain Time Range to [2019-12-15T00:00:00, 2020-01-31T00:00:00]
+-- Pass Only Elements: ['bookings',]
+-- Aggregate Measures
+-- Compute Metrics via Expressions
+SELECT
+  SUM(bookings) AS bookings
+FROM rollup_schema.bookings_by_day bookings_source_src_0
+WHERE DATE_TRUNC(ds, day) BETWEEN '2019-12-15' AND '2020-01-31'
@@ -0,0 +1,91 @@
+-- Combine Aggregated Outputs
+SELECT
+  COALESCE(subq_23.metric_time__day, subq_29.metric_time__day, subq_35.metric_time__day) AS metric_time__day
+  , COALESCE(subq_23.booking__is_instant, subq_29.booking__is_instant, subq_35.booking__is_instant) AS booking__is_instant
+  , MAX(subq_23.booking_value) AS booking_value
+  , MAX(subq_29.max_booking_value) AS max_booking_value
+  , MAX(subq_35.instant_bookings) AS instant_bookings
+FROM (
+  -- Constrain Output with WHERE
+  -- Aggregate Measures
+  -- Compute Metrics via Expressions
+  SELECT
+    metric_time__day
+    , booking__is_instant
+    , SUM(booking_value) AS booking_value
+  FROM (
+    -- Read Elements From Rollup Table 'rollup_schema.bookings_by_day' for Semantic Model 'bookings_source'
+    -- Metric Time Dimension 'ds'
+    -- Pass Only Elements: ['booking_value', 'booking__is_instant', 'metric_time__day']
+    SELECT
+      DATE_TRUNC('day', ds) AS metric_time__day
+      , is_instant AS booking__is_instant
+      , booking_value
+    FROM rollup_schema.bookings_by_day bookings_source_src_0
+  ) subq_20
+  WHERE metric_time__day >= '2020-01-02'
+  GROUP BY
+    metric_time__day
+    , booking__is_instant
+) subq_23
+FULL OUTER JOIN (
+  -- Constrain Output with WHERE
+  -- Aggregate Measures
+  -- Compute Metrics via Expressions
+  SELECT
+    metric_time__day
+    , booking__is_instant
+    , MAX(max_booking_value) AS max_booking_value
+  FROM (
+    -- Read Elements From Rollup Table 'rollup_schema.bookings_by_day' for Semantic Model 'bookings_source'
+    -- Metric Time Dimension 'ds'
+    -- Pass Only Elements: ['max_booking_value', 'booking__is_instant', 'metric_time__day']
+    SELECT
+      DATE_TRUNC('day', ds) AS metric_time__day
+      , is_instant AS booking__is_instant
+      , max_booking_value
+    FROM rollup_schema.bookings_by_day bookings_source_src_0
+  ) subq_26
+  WHERE metric_time__day >= '2020-01-02'
+  GROUP BY
+    metric_time__day
+    , booking__is_instant
+) subq_29
+ON
+  (
+    subq_23.booking__is_instant = subq_29.booking__is_instant
+  ) AND (
+    subq_23.metric_time__day = subq_29.metric_time__day
+  )
+FULL OUTER JOIN (
+  -- Constrain Output with WHERE
+  -- Aggregate Measures
+  -- Compute Metrics via Expressions
+  SELECT
+    metric_time__day
+    , booking__is_instant
+    , SUM(instant_bookings) AS instant_bookings
+  FROM (
+    -- Read Elements From Rollup Table 'rollup_schema.bookings_by_day' for Semantic Model 'bookings_source'
+    -- Metric Time Dimension 'ds'
+    -- Pass Only Elements: ['instant_bookings', 'booking__is_instant', 'metric_time__day']
+    SELECT
+      DATE_TRUNC('day', ds) AS metric_time__day
+      , is_instant AS booking__is_instant
+      , instant_bookings
+    FROM rollup_schema.bookings_by_day bookings_source_src_0
+  ) subq_32
+  WHERE metric_time__day >= '2020-01-02'
+  GROUP BY
+    metric_time__day
+    , booking__is_instant
+) subq_35
+ON
+  (
+    COALESCE(subq_23.booking__is_instant, subq_29.booking__is_instant) = subq_35.booking__is_instant
+  ) AND (
+    COALESCE(subq_23.metric_time__day, subq_29.metric_time__day) = subq_35.metric_time__day
+  )
+GROUP BY
+  COALESCE(subq_23.metric_time__day, subq_29.metric_time__day, subq_35.metric_time__day)
+  , COALESCE(subq_23.booking__is_instant, subq_29.booking__is_instant, subq_35.booking__is_instant)
@@ -0,0 +1,139 @@
+-- Compute Metrics via Expressions
+SELECT
+  subq_4.bookings
+FROM (
+  -- Aggregate Measures
+  SELECT
+    SUM(subq_3.bookings) AS bookings
+  FROM (
+    -- Pass Only Elements: ['bookings',]
+    SELECT
+      subq_2.bookings
+    FROM (
+      -- Constrain Time Range to [2019-12-15T00:00:00, 2020-01-31T00:00:00]
+      SELECT
+        subq_1.ds__day
+        , subq_1.ds__week
+        , subq_1.ds__month
+        , subq_1.ds__quarter
+        , subq_1.ds__year
+        , subq_1.ds__extract_year
+        , subq_1.ds__extract_quarter
+        , subq_1.ds__extract_month
+        , subq_1.ds__extract_day
+        , subq_1.ds__extract_dow
+        , subq_1.ds__extract_doy
+        , subq_1.booking__ds__day
+        , subq_1.booking__ds__week
+        , subq_1.booking__ds__month
+        , subq_1.booking__ds__quarter
+        , subq_1.booking__ds__year
+        , subq_1.booking__ds__extract_year
+        , subq_1.booking__ds__extract_quarter
+        , subq_1.booking__ds__extract_month
+        , subq_1.booking__ds__extract_day
+        , subq_1.booking__ds__extract_dow
+        , subq_1.booking__ds__extract_doy
+        , subq_1.metric_time__day
+        , subq_1.metric_time__week
+        , subq_1.metric_time__month
+        , subq_1.metric_time__quarter
+        , subq_1.metric_time__year
+        , subq_1.metric_time__extract_year
+        , subq_1.metric_time__extract_quarter
+        , subq_1.metric_time__extract_month
+        , subq_1.metric_time__extract_day
+        , subq_1.metric_time__extract_dow
+        , subq_1.metric_time__extract_doy
+        , subq_1.listing
+        , subq_1.booking__listing
+        , subq_1.is_instant
+        , subq_1.booking__is_instant
+        , subq_1.bookings
+        , subq_1.instant_bookings
+        , subq_1.booking_value
+        , subq_1.max_booking_value
+      FROM (
+        -- Metric Time Dimension 'ds'
+        SELECT
+          subq_0.ds__day
+          , subq_0.ds__week
+          , subq_0.ds__month
+          , subq_0.ds__quarter
+          , subq_0.ds__year
+          , subq_0.ds__extract_year
+          , subq_0.ds__extract_quarter
+          , subq_0.ds__extract_month
+          , subq_0.ds__extract_day
+          , subq_0.ds__extract_dow
+          , subq_0.ds__extract_doy
+          , subq_0.booking__ds__day
+          , subq_0.booking__ds__week
+          , subq_0.booking__ds__month
+          , subq_0.booking__ds__quarter
+          , subq_0.booking__ds__year
+          , subq_0.booking__ds__extract_year
+          , subq_0.booking__ds__extract_quarter
+          , subq_0.booking__ds__extract_month
+          , subq_0.booking__ds__extract_day
+          , subq_0.booking__ds__extract_dow
+          , subq_0.booking__ds__extract_doy
+          , subq_0.ds__day AS metric_time__day
+          , subq_0.ds__week AS metric_time__week
+          , subq_0.ds__month AS metric_time__month
+          , subq_0.ds__quarter AS metric_time__quarter
+          , subq_0.ds__year AS metric_time__year
+          , subq_0.ds__extract_year AS metric_time__extract_year
+          , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+          , subq_0.ds__extract_month AS metric_time__extract_month
+          , subq_0.ds__extract_day AS metric_time__extract_day
+          , subq_0.ds__extract_dow AS metric_time__extract_dow
+          , subq_0.ds__extract_doy AS metric_time__extract_doy
+          , subq_0.listing
+          , subq_0.booking__listing
+          , subq_0.is_instant
+          , subq_0.booking__is_instant
+          , subq_0.bookings
+          , subq_0.instant_bookings
+          , subq_0.booking_value
+          , subq_0.max_booking_value
+        FROM (
+          -- Read Elements From Rollup Table 'rollup_schema.bookings_by_day' for Semantic Model 'bookings_source'
+          SELECT
+            bookings_source_src_0.bookings
+            , bookings_source_src_0.instant_bookings
+            , bookings_source_src_0.booking_value
+            , bookings_source_src_0.max_booking_value
+            , bookings_source_src_0.is_instant
+            , DATE_TRUNC('day', bookings_source_src_0.ds) AS ds__day
+            , DATE_TRUNC('week', bookings_source_src_0.ds) AS ds__week
+            , DATE_TRUNC('month', bookings_source_src_0.ds) AS ds__month
+            , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS ds__quarter
+            , DATE_TRUNC('year', bookings_source_src_0.ds) AS ds__year
+            , EXTRACT(year FROM bookings_source_src_0.ds) AS ds__extract_year
+            , EXTRACT(quarter FROM bookings_source_src_0.ds) AS ds__extract_quarter
+            , EXTRACT(month FROM bookings_source_src_0.ds) AS ds__extract_month
+            , EXTRACT(day FROM bookings_source_src_0.ds) AS ds__extract_day
+            , EXTRACT(isodow FROM bookings_source_src_0.ds) AS ds__extract_dow
+            , EXTRACT(doy FROM bookings_source_src_0.ds) AS ds__extract_doy
+            , bookings_source_src_0.is_instant AS booking__is_instant
+            , DATE_TRUNC('day', bookings_source_src_0.ds) AS booking__ds__day
+            , DATE_TRUNC('week', bookings_source_src_0.ds) AS booking__ds__week
+            , DATE_TRUNC('month', bookings_source_src_0.ds) AS booking__ds__month
+            , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS booking__ds__quarter
+            , DATE_TRUNC('year', bookings_source_src_0.ds) AS booking__ds__year
+            , EXTRACT(year FROM bookings_source_src_0.ds) AS booking__ds__extract_year
+            , EXTRACT(quarter FROM bookings_source_src_0.ds) AS booking__ds__extract_quarter
+            , EXTRACT(month FROM bookings_source_src_0.ds) AS booking__ds__extract_month
+            , EXTRACT(day FROM bookings_source_src_0.ds) AS booking__ds__extract_day
+            , EXTRACT(isodow FROM bookings_source_src_0.ds) AS booking__ds__extract_dow
+            , EXTRACT(doy FROM bookings_source_src_0.ds) AS booking__ds__extract_doy
+            , bookings_source_src_0.listing
+            , bookings_source_src_0.listing AS booking__listing
+          FROM rollup_schema.bookings_by_day bookings_source_src_0
+        ) subq_0
+      ) subq_1
+      WHERE subq_1.metric_time__day BETWEEN '2019-12-15' AND '2020-01-31'
+    ) subq_2
+  ) subq_3
+) subq_4
@@ -0,0 +1,358 @@
+-- Combine Aggregated Outputs
+SELECT
+  COALESCE(subq_5.metric_time__day, subq_11.metric_time__day, subq_17.metric_time__day) AS metric_time__day
+  , COALESCE(subq_5.booking__is_instant, subq_11.booking__is_instant, subq_17.booking__is_instant) AS booking__is_instant
+  , MAX(subq_5.booking_value) AS booking_value
+  , MAX(subq_11.max_booking_value) AS max_booking_value
+  , MAX(subq_17.instant_bookings) AS instant_bookings
+FROM (
+  -- Compute Metrics via Expressions
+  SELECT
+    subq_4.metric_time__day
+    , subq_4.booking__is_instant
+    , subq_4.booking_value
+  FROM (
+    -- Aggregate Measures
+    SELECT
+      subq_3.metric_time__day
+      , subq_3.booking__is_instant
+      , SUM(subq_3.booking_value) AS booking_value
+    FROM (
+      -- Constrain Output with WHERE
+      SELECT
+        subq_2.metric_time__day
+        , subq_2.booking__is_instant
+        , subq_2.booking_value
+      FROM (
+        -- Pass Only Elements: ['booking_value', 'booking__is_instant', 'metric_time__day']
+        SELECT
+          subq_1.metric_time__day
+          , subq_1.booking__is_instant
+          , subq_1.booking_value
+        FROM (
+          -- Metric Time Dimension 'ds'
+          SELECT
+            subq_0.ds__day
+            , subq_0.ds__week
+            , subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds__extract_year
+            , subq_0.ds__extract_quarter
+            , subq_0.ds__extract_month
+            , subq_0.ds__extract_day
+            , subq_0.ds__extract_dow
+            , subq_0.ds__extract_doy
+            , subq_0.booking__ds__day
+            , subq_0.booking__ds__week
+            , subq_0.booking__ds__month
+            , subq_0.booking__ds__quarter
+            , subq_0.booking__ds__year
+            , subq_0.booking__ds__extract_year
+            , subq_0.booking__ds__extract_quarter
+            , subq_0.booking__ds__extract_month
+            , subq_0.booking__ds__extract_day
+            , subq_0.booking__ds__extract_dow
+            , subq_0.booking__ds__extract_doy
+            , subq_0.ds__day AS metric_time__day
+            , subq_0.ds__week AS metric_time__week
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.ds__extract_year AS metric_time__extract_year
+            , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_0.ds__extract_month AS metric_time__extract_month
+            , subq_0.ds__extract_day AS metric_time__extract_day
+            , subq_0.ds__extract_dow AS metric_time__extract_dow
+            , subq_0.ds__extract_doy AS metric_time__extract_doy
+            , subq_0.listing
+            , subq_0.booking__listing
+            , subq_0.is_instant
+            , subq_0.booking__is_instant
+            , subq_0.bookings
+            , subq_0.instant_bookings
+            , subq_0.booking_value
+            , subq_0.max_booking_value
+          FROM (
+            -- Read Elements From Rollup Table 'rollup_schema.bookings_by_day' for Semantic Model 'bookings_source'
+            SELECT
+              bookings_source_src_0.bookings
+              , bookings_source_src_0.instant_bookings
+              , bookings_source_src_0.booking_value
+              , bookings_source_src_0.max_booking_value
+              , bookings_source_src_0.is_instant
+              , DATE_TRUNC('day', bookings_source_src_0.ds) AS ds__day
+              , DATE_TRUNC('week', bookings_source_src_0.ds) AS ds__week
+              , DATE_TRUNC('month', bookings_source_src_0.ds) AS ds__month
+              , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS ds__quarter
+              , DATE_TRUNC('year', bookings_source_src_0.ds) AS ds__year
+              , EXTRACT(year FROM bookings_source_src_0.ds) AS ds__extract_year
+              , EXTRACT(quarter FROM bookings_source_src_0.ds) AS ds__extract_quarter
+              , EXTRACT(month FROM bookings_source_src_0.ds) AS ds__extract_month
+              , EXTRACT(day FROM bookings_source_src_0.ds) AS ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM bookings_source_src_0.ds) = 0 THEN EXTRACT(dow FROM bookings_source_src_0.ds) + 7 ELSE EXTRACT(dow FROM bookings_source_src_0.ds) END AS ds__extract_dow
+              , EXTRACT(doy FROM bookings_source_src_0.ds) AS ds__extract_doy
+              , bookings_source_src_0.is_instant AS booking__is_instant
+              , DATE_TRUNC('day', bookings_source_src_0.ds) AS booking__ds__day
+              , DATE_TRUNC('week', bookings_source_src_0.ds) AS booking__ds__week
+              , DATE_TRUNC('month', bookings_source_src_0.ds) AS booking__ds__month
+              , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS booking__ds__quarter
+              , DATE_TRUNC('year', bookings_source_src_0.ds) AS booking__ds__year
+              , EXTRACT(year FROM bookings_source_src_0.ds) AS booking__ds__extract_year
+              , EXTRACT(quarter FROM bookings_source_src_0.ds) AS booking__ds__extract_quarter
+              , EXTRACT(month FROM bookings_source_src_0.ds) AS booking__ds__extract_month
+              , EXTRACT(day FROM bookings_source_src_0.ds) AS booking__ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM bookings_source_src_0.ds) = 0 THEN EXTRACT(dow FROM bookings_source_src_0.ds) + 7 ELSE EXTRACT(dow FROM bookings_source_src_0.ds) END AS booking__ds__extract_dow
+              , EXTRACT(doy FROM bookings_source_src_0.ds) AS booking__ds__extract_doy
+              , bookings_source_src_0.listing
+              , bookings_source_src_0.listing AS booking__listing
+            FROM rollup_schema.bookings_by_day bookings_source_src_0
+          ) subq_0
+        ) subq_1
+      ) subq_2
+      WHERE metric_time__day >= '2020-01-02'
+    ) subq_3
+    GROUP BY
+      subq_3.metric_time__day
+      , subq_3.booking__is_instant
+  ) subq_4
+) subq_5
+FULL OUTER JOIN (
+  -- Compute Metrics via Expressions
+  SELECT
+    subq_10.metric_time__day
+    , subq_10.booking__is_instant
+    , subq_10.max_booking_value
+  FROM (
+    -- Aggregate Measures
+    SELECT
+      subq_9.metric_time__day
+      , subq_9.booking__is_instant
+      , MAX(subq_9.max_booking_value) AS max_booking_value
+    FROM (
+      -- Constrain Output with WHERE
+      SELECT
+        subq_8.metric_time__day
+        , subq_8.booking__is_instant
+        , subq_8.max_booking_value
+      FROM (
+        -- Pass Only Elements: ['max_booking_value', 'booking__is_instant', 'metric_time__day']
+        SELECT
+          subq_7.metric_time__day
+          , subq_7.booking__is_instant
+          , subq_7.max_booking_value
+        FROM (
+          -- Metric Time Dimension 'ds'
+          SELECT
+            subq_6.ds__day
+            , subq_6.ds__week
+            , subq_6.ds__month
+            , subq_6.ds__quarter
+            , subq_6.ds__year
+            , subq_6.ds__extract_year
+            , subq_6.ds__extract_quarter
+            , subq_6.ds__extract_month
+            , subq_6.ds__extract_day
+            , subq_6.ds__extract_dow
+            , subq_6.ds__extract_doy
+            , subq_6.booking__ds__day
+            , subq_6.booking__ds__week
+            , subq_6.booking__ds__month
+            , subq_6.booking__ds__quarter
+            , subq_6.booking__ds__year
+            , subq_6.booking__ds__extract_year
+            , subq_6.booking__ds__extract_quarter
+            , subq_6.booking__ds__extract_month
+            , subq_6.booking__ds__extract_day
+            , subq_6.booking__ds__extract_dow
+            , subq_6.booking__ds__extract_doy
+            , subq_6.ds__day AS metric_time__day
+            , subq_6.ds__week AS metric_time__week
+            , subq_6.ds__month AS metric_time__month
+            , subq_6.ds__quarter AS metric_time__quarter
+            , subq_6.ds__year AS metric_time__year
+            , subq_6.ds__extract_year AS metric_time__extract_year
+            , subq_6.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_6.ds__extract_month AS metric_time__extract_month
+            , subq_6.ds__extract_day AS metric_time__extract_day
+            , subq_6.ds__extract_dow AS metric_time__extract_dow
+            , subq_6.ds__extract_doy AS metric_time__extract_doy
+            , subq_6.listing
+            , subq_6.booking__listing
+            , subq_6.is_instant
+            , subq_6.booking__is_instant
+            , subq_6.bookings
+            , subq_6.instant_bookings
+            , subq_6.booking_value
+            , subq_6.max_booking_value
+          FROM (
+            -- Read Elements From Rollup Table 'rollup_schema.bookings_by_day' for Semantic Model 'bookings_source'
+            SELECT
+              bookings_source_src_0.bookings
+              , bookings_source_src_0.instant_bookings
+              , bookings_source_src_0.booking_value
+              , bookings_source_src_0.max_booking_value
+              , bookings_source_src_0.is_instant
+              , DATE_TRUNC('day', bookings_source_src_0.ds) AS ds__day
+              , DATE_TRUNC('week', bookings_source_src_0.ds) AS ds__week
+              , DATE_TRUNC('month', bookings_source_src_0.ds) AS ds__month
+              , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS ds__quarter
+              , DATE_TRUNC('year', bookings_source_src_0.ds) AS ds__year
+              , EXTRACT(year FROM bookings_source_src_0.ds) AS ds__extract_year
+              , EXTRACT(quarter FROM bookings_source_src_0.ds) AS ds__extract_quarter
+              , EXTRACT(month FROM bookings_source_src_0.ds) AS ds__extract_month
+              , EXTRACT(day FROM bookings_source_src_0.ds) AS ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM bookings_source_src_0.ds) = 0 THEN EXTRACT(dow FROM bookings_source_src_0.ds) + 7 ELSE EXTRACT(dow FROM bookings_source_src_0.ds) END AS ds__extract_dow
+              , EXTRACT(doy FROM bookings_source_src_0.ds) AS ds__extract_doy
+              , bookings_source_src_0.is_instant AS booking__is_instant
+              , DATE_TRUNC('day', bookings_source_src_0.ds) AS booking__ds__day
+              , DATE_TRUNC('week', bookings_source_src_0.ds) AS booking__ds__week
+              , DATE_TRUNC('month', bookings_source_src_0.ds) AS booking__ds__month
+              , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS booking__ds__quarter
+              , DATE_TRUNC('year', bookings_source_src_0.ds) AS booking__ds__year
+              , EXTRACT(year FROM bookings_source_src_0.ds) AS booking__ds__extract_year
+              , EXTRACT(quarter FROM bookings_source_src_0.ds) AS booking__ds__extract_quarter
+              , EXTRACT(month FROM bookings_source_src_0.ds) AS booking__ds__extract_month
+              , EXTRACT(day FROM bookings_source_src_0.ds) AS booking__ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM bookings_source_src_0.ds) = 0 THEN EXTRACT(dow FROM bookings_source_src_0.ds) + 7 ELSE EXTRACT(dow FROM bookings_source_src_0.ds) END AS booking__ds__extract_dow
+              , EXTRACT(doy FROM bookings_source_src_0.ds) AS booking__ds__extract_doy
+              , bookings_source_src_0.listing
+              , bookings_source_src_0.listing AS booking__listing
+            FROM rollup_schema.bookings_by_day bookings_source_src_0
+          ) subq_6
+        ) subq_7
+      ) subq_8
+      WHERE metric_time__day >= '2020-01-02'
+    ) subq_9
+    GROUP BY
+      subq_9.metric_time__day
+      , subq_9.booking__is_instant
+  ) subq_10
+) subq_11
+ON
+  (
+    subq_5.booking__is_instant = subq_11.booking__is_instant
+  ) AND (
+    subq_5.metric_time__day = subq_11.metric_time__day
+  )
+FULL OUTER JOIN (
+  -- Compute Metrics via Expressions
+  SELECT
+    subq_16.metric_time__day
+    , subq_16.booking__is_instant
+    , subq_16.instant_bookings
+  FROM (
+    -- Aggregate Measures
+    SELECT
+      subq_15.metric_time__day
+      , subq_15.booking__is_instant
+      , SUM(subq_15.instant_bookings) AS instant_bookings
+    FROM (
+      -- Constrain Output with WHERE
+      SELECT
+        subq_14.metric_time__day
+        , subq_14.booking__is_instant
+        , subq_14.instant_bookings
+      FROM (
+        -- Pass Only Elements: ['instant_bookings', 'booking__is_instant', 'metric_time__day']
+        SELECT
+          subq_13.metric_time__day
+          , subq_13.booking__is_instant
+          , subq_13.instant_bookings
+        FROM (
+          -- Metric Time Dimension 'ds'
+          SELECT
+            subq_12.ds__day
+            , subq_12.ds__week
+            , subq_12.ds__month
+            , subq_12.ds__quarter
+            , subq_12.ds__year
+            , subq_12.ds__extract_year
+            , subq_12.ds__extract_quarter
+            , subq_12.ds__extract_month
+            , subq_12.ds__extract_day
+            , subq_12.ds__extract_dow
+            , subq_12.ds__extract_doy
+            , subq_12.booking__ds__day
+            , subq_12.booking__ds__week
+            , subq_12.booking__ds__month
+            , subq_12.booking__ds__quarter
+            , subq_12.booking__ds__year
+            , subq_12.booking__ds__extract_year
+            , subq_12.booking__ds__extract_quarter
+            , subq_12.booking__ds__extract_month
+            , subq_12.booking__ds__extract_day
+            , subq_12.booking__ds__extract_dow
+            , subq_12.booking__ds__extract_doy
+            , subq_12.ds__day AS metric_time__day
+            , subq_12.ds__week AS metric_time__week
+            , subq_12.ds__month AS metric_time__month
+            , subq_12.ds__quarter AS metric_time__quarter
+            , subq_12.ds__year AS metric_time__year
+            , subq_12.ds__extract_year AS metric_time__extract_year
+            , subq_12.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_12.ds__extract_month AS metric_time__extract_month
+            , subq_12.ds__extract_day AS metric_time__extract_day
+            , subq_12.ds__extract_dow AS metric_time__extract_dow
+            , subq_12.ds__extract_doy AS metric_time__extract_doy
+            , subq_12.listing
+            , subq_12.booking__listing
+            , subq_12.is_instant
+            , subq_12.booking__is_instant
+            , subq_12.bookings
+            , subq_12.instant_bookings
+            , subq_12.booking_value
+            , subq_12.max_booking_value
+          FROM (
+            -- Read Elements From Rollup Table 'rollup_schema.bookings_by_day' for Semantic Model 'bookings_source'
+            SELECT
+              bookings_source_src_0.bookings
+              , bookings_source_src_0.instant_bookings
+              , bookings_source_src_0.booking_value
+              , bookings_source_src_0.max_booking_value
+              , bookings_source_src_0.is_instant
+              , DATE_TRUNC('day', bookings_source_src_0.ds) AS ds__day
+              , DATE_TRUNC('week', bookings_source_src_0.ds) AS ds__week
+              , DATE_TRUNC('month', bookings_source_src_0.ds) AS ds__month
+              , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS ds__quarter
+              , DATE_TRUNC('year', bookings_source_src_0.ds) AS ds__year
+              , EXTRACT(year FROM bookings_source_src_0.ds) AS ds__extract_year
+              , EXTRACT(quarter FROM bookings_source_src_0.ds) AS ds__extract_quarter
+              , EXTRACT(month FROM bookings_source_src_0.ds) AS ds__extract_month
+              , EXTRACT(day FROM bookings_source_src_0.ds) AS ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM bookings_source_src_0.ds) = 0 THEN EXTRACT(dow FROM bookings_source_src_0.ds) + 7 ELSE EXTRACT(dow FROM bookings_source_src_0.ds) END AS ds__extract_dow
+              , EXTRACT(doy FROM bookings_source_src_0.ds) AS ds__extract_doy
+              , bookings_source_src_0.is_instant AS booking__is_instant
+              , DATE_TRUNC('day', bookings_source_src_0.ds) AS booking__ds__day
+              , DATE_TRUNC('week', bookings_source_src_0.ds) AS booking__ds__week
+              , DATE_TRUNC('month', bookings_source_src_0.ds) AS booking__ds__month
+              , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS booking__ds__quarter
+              , DATE_TRUNC('year', bookings_source_src_0.ds) AS booking__ds__year
+              , EXTRACT(year FROM bookings_source_src_0.ds) AS booking__ds__extract_year
+              , EXTRACT(quarter FROM bookings_source_src_0.ds) AS booking__ds__extract_quarter
+              , EXTRACT(month FROM bookings_source_src_0.ds) AS booking__ds__extract_month
+              , EXTRACT(day FROM bookings_source_src_0.ds) AS booking__ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM bookings_source_src_0.ds) = 0 THEN EXTRACT(dow FROM bookings_source_src_0.ds) + 7 ELSE EXTRACT(dow FROM bookings_source_src_0.ds) END AS booking__ds__extract_dow
+              , EXTRACT(doy FROM bookings_source_src_0.ds) AS booking__ds__extract_doy
+              , bookings_source_src_0.listing
+              , bookings_source_src_0.listing AS booking__listing
+            FROM rollup_schema.bookings_by_day bookings_source_src_0
+          ) subq_12
+        ) subq_13
+      ) subq_14
+      WHERE metric_time__day >= '2020-01-02'
+    ) subq_15
+    GROUP BY
+      subq_15.metric_time__day
+      , subq_15.booking__is_instant
+  ) subq_16
+) subq_17
+ON
+  (
+    COALESCE(subq_5.booking__is_instant, subq_11.booking__is_instant) = subq_17.booking__is_instant
+  ) AND (
+    COALESCE(subq_5.metric_time__day, subq_11.metric_time__day) = subq_17.metric_time__day
+  )
+GROUP BY
+  COALESCE(subq_5.metric_time__day, subq_11.metric_time__day, subq_17.metric_time__day)
+  , COALESCE(subq_5.booking__is_instant, subq_11.booking__is_instant, subq_17.booking__is_instant)
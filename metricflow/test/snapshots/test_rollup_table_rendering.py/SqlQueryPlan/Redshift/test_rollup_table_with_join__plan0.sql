@@ -0,0 +1,251 @@
+-- Compute Metrics via Expressions
+SELECT
+  subq_8.listing__country_latest
+  , subq_8.bookings
+FROM (
+  -- Aggregate Measures
+  SELECT
+    subq_7.listing__country_latest
+    , SUM(subq_7.bookings) AS bookings
+  FROM (
+    -- Pass Only Elements: ['bookings', 'listing__country_latest']
+    SELECT
+      subq_6.listing__country_latest
+      , subq_6.bookings
+    FROM (
+      -- Join Standard Outputs
+      SELECT
+        subq_2.listing AS listing
+        , subq_5.country_latest AS listing__country_latest
+        , subq_2.bookings AS bookings
+      FROM (
+        -- Pass Only Elements: ['bookings', 'listing']
+        SELECT
+          subq_1.listing
+          , subq_1.bookings
+        FROM (
+          -- Metric Time Dimension 'ds'
+          SELECT
+            subq_0.ds__day
+            , subq_0.ds__week
+            , subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds__extract_year
+            , subq_0.ds__extract_quarter
+            , subq_0.ds__extract_month
+            , subq_0.ds__extract_day
+            , subq_0.ds__extract_dow
+            , subq_0.ds__extract_doy
+            , subq_0.booking__ds__day
+            , subq_0.booking__ds__week
+            , subq_0.booking__ds__month
+            , subq_0.booking__ds__quarter
+            , subq_0.booking__ds__year
+            , subq_0.booking__ds__extract_year
+            , subq_0.booking__ds__extract_quarter
+            , subq_0.booking__ds__extract_month
+            , subq_0.booking__ds__extract_day
+            , subq_0.booking__ds__extract_dow
+            , subq_0.booking__ds__extract_doy
+            , subq_0.ds__day AS metric_time__day
+            , subq_0.ds__week AS metric_time__week
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.ds__extract_year AS metric_time__extract_year
+            , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_0.ds__extract_month AS metric_time__extract_month
+            , subq_0.ds__extract_day AS metric_time__extract_day
+            , subq_0.ds__extract_dow AS metric_time__extract_dow
+            , subq_0.ds__extract_doy AS metric_time__extract_doy
+            , subq_0.listing
+            , subq_0.booking__listing
+            , subq_0.is_instant
+            , subq_0.booking__is_instant
+            , subq_0.bookings
+            , subq_0.instant_bookings
+            , subq_0.booking_value
+            , subq_0.max_booking_value
+          FROM (
+            -- Read Elements From Rollup Table 'rollup_schema.bookings_by_day' for Semantic Model 'bookings_source'
+            SELECT
+              bookings_source_src_0.bookings
+              , bookings_source_src_0.instant_bookings
+              , bookings_source_src_0.booking_value
+              , bookings_source_src_0.max_booking_value
+              , bookings_source_src_0.is_instant
+              , DATE_TRUNC('day', bookings_source_src_0.ds) AS ds__day
+              , DATE_TRUNC('week', bookings_source_src_0.ds) AS ds__week
+              , DATE_TRUNC('month', bookings_source_src_0.ds) AS ds__month
+              , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS ds__quarter
+              , DATE_TRUNC('year', bookings_source_src_0.ds) AS ds__year
+              , EXTRACT(year FROM bookings_source_src_0.ds) AS ds__extract_year
+              , EXTRACT(quarter FROM bookings_source_src_0.ds) AS ds__extract_quarter
+              , EXTRACT(month FROM bookings_source_src_0.ds) AS ds__extract_month
+              , EXTRACT(day FROM bookings_source_src_0.ds) AS ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM bookings_source_src_0.ds) = 0 THEN EXTRACT(dow FROM bookings_source_src_0.ds) + 7 ELSE EXTRACT(dow FROM bookings_source_src_0.ds) END AS ds__extract_dow
+              , EXTRACT(doy FROM bookings_source_src_0.ds) AS ds__extract_doy
+              , bookings_source_src_0.is_instant AS booking__is_instant
+              , DATE_TRUNC('day', bookings_source_src_0.ds) AS booking__ds__day
+              , DATE_TRUNC('week', bookings_source_src_0.ds) AS booking__ds__week
+              , DATE_TRUNC('month', bookings_source_src_0.ds) AS booking__ds__month
+              , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS booking__ds__quarter
+              , DATE_TRUNC('year', bookings_source_src_0.ds) AS booking__ds__year
+              , EXTRACT(year FROM bookings_source_src_0.ds) AS booking__ds__extract_year
+              , EXTRACT(quarter FROM bookings_source_src_0.ds) AS booking__ds__extract_quarter
+              , EXTRACT(month FROM bookings_source_src_0.ds) AS booking__ds__extract_month
+              , EXTRACT(day FROM bookings_source_src_0.ds) AS booking__ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM bookings_source_src_0.ds) = 0 THEN EXTRACT(dow FROM bookings_source_src_0.ds) + 7 ELSE EXTRACT(dow FROM bookings_source_src_0.ds) END AS booking__ds__extract_dow
+              , EXTRACT(doy FROM bookings_source_src_0.ds) AS booking__ds__extract_doy
+              , bookings_source_src_0.listing
+              , bookings_source_src_0.listing AS booking__listing
+            FROM rollup_schema.bookings_by_day bookings_source_src_0
+          ) subq_0
+        ) subq_1
+      ) subq_2
+      LEFT OUTER JOIN (
+        -- Pass Only Elements: ['country_latest', 'listing']
+        SELECT
+          subq_4.listing
+          , subq_4.country_latest
+        FROM (
+          -- Metric Time Dimension 'ds'
+          SELECT
+            subq_3.ds__day
+            , subq_3.ds__week
+            , subq_3.ds__month
+            , subq_3.ds__quarter
+            , subq_3.ds__year
+            , subq_3.ds__extract_year
+            , subq_3.ds__extract_quarter
+            , subq_3.ds__extract_month
+            , subq_3.ds__extract_day
+            , subq_3.ds__extract_dow
+            , subq_3.ds__extract_doy
+            , subq_3.created_at__day
+            , subq_3.created_at__week
+            , subq_3.created_at__month
+            , subq_3.created_at__quarter
+            , subq_3.created_at__year
+            , subq_3.created_at__extract_year
+            , subq_3.created_at__extract_quarter
+            , subq_3.created_at__extract_month
+            , subq_3.created_at__extract_day
+            , subq_3.created_at__extract_dow
+            , subq_3.created_at__extract_doy
+            , subq_3.listing__ds__day
+            , subq_3.listing__ds__week
+            , subq_3.listing__ds__month
+            , subq_3.listing__ds__quarter
+            , subq_3.listing__ds__year
+            , subq_3.listing__ds__extract_year
+            , subq_3.listing__ds__extract_quarter
+            , subq_3.listing__ds__extract_month
+            , subq_3.listing__ds__extract_day
+            , subq_3.listing__ds__extract_dow
+            , subq_3.listing__ds__extract_doy
+            , subq_3.listing__created_at__day
+            , subq_3.listing__created_at__week
+            , subq_3.listing__created_at__month
+            , subq_3.listing__created_at__quarter
+            , subq_3.listing__created_at__year
+            , subq_3.listing__created_at__extract_year
+            , subq_3.listing__created_at__extract_quarter
+            , subq_3.listing__created_at__extract_month
+            , subq_3.listing__created_at__extract_day
+            , subq_3.listing__created_at__extract_dow
+            , subq_3.listing__created_at__extract_doy
+            , subq_3.ds__day AS metric_time__day
+            , subq_3.ds__week AS metric_time__week
+            , subq_3.ds__month AS metric_time__month
+            , subq_3.ds__quarter AS metric_time__quarter
+            , subq_3.ds__year AS metric_time__year
+            , subq_3.ds__extract_year AS metric_time__extract_year
+            , subq_3.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_3.ds__extract_month AS metric_time__extract_month
+            , subq_3.ds__extract_day AS metric_time__extract_day
+            , subq_3.ds__extract_dow AS metric_time__extract_dow
+            , subq_3.ds__extract_doy AS metric_time__extract_doy
+            , subq_3.listing
+            , subq_3.user
+            , subq_3.listing__user
+            , subq_3.country_latest
+            , subq_3.is_lux_latest
+            , subq_3.capacity_latest
+            , subq_3.listing__country_latest
+            , subq_3.listing__is_lux_latest
+            , subq_3.listing__capacity_latest
+            , subq_3.listings
+            , subq_3.largest_listing
+            , subq_3.smallest_listing
+          FROM (
+            -- Read Elements From Semantic Model 'listings_latest'
+            SELECT
+              1 AS listings
+              , listings_latest_src_10005.capacity AS largest_listing
+              , listings_latest_src_10005.capacity AS smallest_listing
+              , DATE_TRUNC('day', listings_latest_src_10005.created_at) AS ds__day
+              , DATE_TRUNC('week', listings_latest_src_10005.created_at) AS ds__week
+              , DATE_TRUNC('month', listings_latest_src_10005.created_at) AS ds__month
+              , DATE_TRUNC('quarter', listings_latest_src_10005.created_at) AS ds__quarter
+              , DATE_TRUNC('year', listings_latest_src_10005.created_at) AS ds__year
+              , EXTRACT(year FROM listings_latest_src_10005.created_at) AS ds__extract_year
+              , EXTRACT(quarter FROM listings_latest_src_10005.created_at) AS ds__extract_quarter
+              , EXTRACT(month FROM listings_latest_src_10005.created_at) AS ds__extract_month
+              , EXTRACT(day FROM listings_latest_src_10005.created_at) AS ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM listings_latest_src_10005.created_at) = 0 THEN EXTRACT(dow FROM listings_latest_src_10005.created_at) + 7 ELSE EXTRACT(dow FROM listings_latest_src_10005.created_at) END AS ds__extract_dow
+              , EXTRACT(doy FROM listings_latest_src_10005.created_at) AS ds__extract_doy
+              , DATE_TRUNC('day', listings_latest_src_10005.created_at) AS created_at__day
+              , DATE_TRUNC('week', listings_latest_src_10005.created_at) AS created_at__week
+              , DATE_TRUNC('month', listings_latest_src_10005.created_at) AS created_at__month
+              , DATE_TRUNC('quarter', listings_latest_src_10005.created_at) AS created_at__quarter
+              , DATE_TRUNC('year', listings_latest_src_10005.created_at) AS created_at__year
+              , EXTRACT(year FROM listings_latest_src_10005.created_at) AS created_at__extract_year
+              , EXTRACT(quarter FROM listings_latest_src_10005.created_at) AS created_at__extract_quarter
+              , EXTRACT(month FROM listings_latest_src_10005.created_at) AS created_at__extract_month
+              , EXTRACT(day FROM listings_latest_src_10005.created_at) AS created_at__extract_day
+              , CASE WHEN EXTRACT(dow FROM listings_latest_src_10005.created_at) = 0 THEN EXTRACT(dow FROM listings_latest_src_10005.created_at) + 7 ELSE EXTRACT(dow FROM listings_latest_src_10005.created_at) END AS created_at__extract_dow
+              , EXTRACT(doy FROM listings_latest_src_10005.created_at) AS created_at__extract_doy
+              , listings_latest_src_10005.country AS country_latest
+              , listings_latest_src_10005.is_lux AS is_lux_latest
+              , listings_latest_src_10005.capacity AS capacity_latest
+              , DATE_TRUNC('day', listings_latest_src_10005.created_at) AS listing__ds__day
+              , DATE_TRUNC('week', listings_latest_src_10005.created_at) AS listing__ds__week
+              , DATE_TRUNC('month', listings_latest_src_10005.created_at) AS listing__ds__month
+              , DATE_TRUNC('quarter', listings_latest_src_10005.created_at) AS listing__ds__quarter
+              , DATE_TRUNC('year', listings_latest_src_10005.created_at) AS listing__ds__year
+              , EXTRACT(year FROM listings_latest_src_10005.created_at) AS listing__ds__extract_year
+              , EXTRACT(quarter FROM listings_latest_src_10005.created_at) AS listing__ds__extract_quarter
+              , EXTRACT(month FROM listings_latest_src_10005.created_at) AS listing__ds__extract_month
+              , EXTRACT(day FROM listings_latest_src_10005.created_at) AS listing__ds__extract_day
+              , CASE WHEN EXTRACT(dow FROM listings_latest_src_10005.created_at) = 0 THEN EXTRACT(dow FROM listings_latest_src_10005.created_at) + 7 ELSE EXTRACT(dow FROM listings_latest_src_10005.created_at) END AS listing__ds__extract_dow
+              , EXTRACT(doy FROM listings_latest_src_10005.created_at) AS listing__ds__extract_doy
+              , DATE_TRUNC('day', listings_latest_src_10005.created_at) AS listing__created_at__day
+              , DATE_TRUNC('week', listings_latest_src_10005.created_at) AS listing__created_at__week
+              , DATE_TRUNC('month', listings_latest_src_10005.created_at) AS listing__created_at__month
+              , DATE_TRUNC('quarter', listings_latest_src_10005.created_at) AS listing__created_at__quarter
+              , DATE_TRUNC('year', listings_latest_src_10005.created_at) AS listing__created_at__year
+              , EXTRACT(year FROM listings_latest_src_10005.created_at) AS listing__created_at__extract_year
+              , EXTRACT(quarter FROM listings_latest_src_10005.created_at) AS listing__created_at__extract_quarter
+              , EXTRACT(month FROM listings_latest_src_10005.created_at) AS listing__created_at__extract_month
+              , EXTRACT(day FROM listings_latest_src_10005.created_at) AS listing__created_at__extract_day
+              , CASE WHEN EXTRACT(dow FROM listings_latest_src_10005.created_at) = 0 THEN EXTRACT(dow FROM listings_latest_src_10005.created_at) + 7 ELSE EXTRACT(dow FROM listings_latest_src_10005.created_at) END AS listing__created_at__extract_dow
+              , EXTRACT(doy FROM listings_latest_src_10005.created_at) AS listing__created_at__extract_doy
+              , listings_latest_src_10005.country AS listing__country_latest
+              , listings_latest_src_10005.is_lux AS listing__is_lux_latest
+              , listings_latest_src_10005.capacity AS listing__capacity_latest
+              , listings_latest_src_10005.listing_id AS listing
+              , listings_latest_src_10005.user_id AS user
+              , listings_latest_src_10005.user_id AS listing__user
+            FROM ***************************.dim_listings_latest listings_latest_src_10005
+          ) subq_3
+        ) subq_4
+      ) subq_5
+      ON
+        subq_2.listing = subq_5.listing
+    ) subq_6
+  ) subq_7
+  GROUP BY
+    subq_7.listing__country_latest
+) subq_8
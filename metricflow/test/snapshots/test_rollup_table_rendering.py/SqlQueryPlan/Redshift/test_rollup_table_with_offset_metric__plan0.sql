@@ -0,0 +1,225 @@
+-- Compute Metrics via Expressions
+SELECT
+  subq_13.metric_time__month
+  , bookings - bookings_2_weeks_ago AS bookings_growth_2_weeks
+FROM (
+  -- Combine Aggregated Outputs
+  SELECT
+    COALESCE(subq_4.metric_time__month, subq_12.metric_time__month) AS metric_time__month
+    , MAX(subq_4.bookings) AS bookings
+    , MAX(subq_12.bookings_2_weeks_ago) AS bookings_2_weeks_ago
+  FROM (
+    -- Compute Metrics via Expressions
+    SELECT
+      subq_3.metric_time__month
+      , subq_3.bookings
+    FROM (
+      -- Aggregate Measures
+      SELECT
+        subq_2.metric_time__month
+        , SUM(subq_2.bookings) AS bookings
+      FROM (
+        -- Pass Only Elements: ['bookings', 'metric_time__month']
+        SELECT
+          subq_1.metric_time__month
+          , subq_1.bookings
+        FROM (
+          -- Metric Time Dimension 'ds'
+          SELECT
+            subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds__extract_year
+            , subq_0.ds__extract_quarter
+            , subq_0.ds__extract_month
+            , subq_0.booking__ds__month
+            , subq_0.booking__ds__quarter
+            , subq_0.booking__ds__year
+            , subq_0.booking__ds__extract_year
+            , subq_0.booking__ds__extract_quarter
+            , subq_0.booking__ds__extract_month
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.ds__extract_year AS metric_time__extract_year
+            , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_0.ds__extract_month AS metric_time__extract_month
+            , subq_0.bookings
+            , subq_0.instant_bookings
+            , subq_0.booking_value
+            , subq_0.max_booking_value
+          FROM (
+            -- Read Elements From Rollup Table 'rollup_schema.bookings_by_month' for Semantic Model 'bookings_source'
+            SELECT
+              bookings_source_src_1.bookings
+              , bookings_source_src_1.instant_bookings
+              , bookings_source_src_1.booking_value
+              , bookings_source_src_1.max_booking_value
+              , DATE_TRUNC('month', bookings_source_src_1.ds) AS ds__month
+              , DATE_TRUNC('quarter', bookings_source_src_1.ds) AS ds__quarter
+              , DATE_TRUNC('year', bookings_source_src_1.ds) AS ds__year
+              , EXTRACT(year FROM bookings_source_src_1.ds) AS ds__extract_year
+              , EXTRACT(quarter FROM bookings_source_src_1.ds) AS ds__extract_quarter
+              , EXTRACT(month FROM bookings_source_src_1.ds) AS ds__extract_month
+              , DATE_TRUNC('month', bookings_source_src_1.ds) AS booking__ds__month
+              , DATE_TRUNC('quarter', bookings_source_src_1.ds) AS booking__ds__quarter
+              , DATE_TRUNC('year', bookings_source_src_1.ds) AS booking__ds__year
+              , EXTRACT(year FROM bookings_source_src_1.ds) AS booking__ds__extract_year
+              , EXTRACT(quarter FROM bookings_source_src_1.ds) AS booking__ds__extract_quarter
+              , EXTRACT(month FROM bookings_source_src_1.ds) AS booking__ds__extract_month
+            FROM rollup_schema.bookings_by_month bookings_source_src_1
+          ) subq_0
+        ) subq_1
+      ) subq_2
+      GROUP BY
+        subq_2.metric_time__month
+    ) subq_3
+  ) subq_4
+  FULL OUTER JOIN (
+    -- Compute Metrics via Expressions
+    SELECT
+      subq_11.metric_time__month
+      , subq_11.bookings AS bookings_2_weeks_ago
+    FROM (
+      -- Aggregate Measures
+      SELECT
+        subq_10.metric_time__month
+        , SUM(subq_10.bookings) AS bookings
+      FROM (
+        -- Pass Only Elements: ['bookings', 'metric_time__month']
+        SELECT
+          subq_9.metric_time__month
+          , subq_9.bookings
+        FROM (
+          -- Join to Time Spine Dataset
+          SELECT
+            DATE_TRUNC('month', subq_7.metric_time__day) AS metric_time__month
+            , subq_6.ds__day AS ds__day
+            , subq_6.ds__week AS ds__week
+            , subq_6.ds__month AS ds__month
+            , subq_6.ds__quarter AS ds__quarter
+            , subq_6.ds__year AS ds__year
+            , subq_6.ds__extract_year AS ds__extract_year
+            , subq_6.ds__extract_quarter AS ds__extract_quarter
+            , subq_6.ds__extract_month AS ds__extract_month
+            , subq_6.ds__extract_day AS ds__extract_day
+            , subq_6.ds__extract_dow AS ds__extract_dow
+            , subq_6.ds__extract_doy AS ds__extract_doy
+            , subq_6.booking__ds__day AS booking__ds__day
+            , subq_6.booking__ds__week AS booking__ds__week
+            , subq_6.booking__ds__month AS booking__ds__month
+            , subq_6.booking__ds__quarter AS booking__ds__quarter
+            , subq_6.booking__ds__year AS booking__ds__year
+            , subq_6.booking__ds__extract_year AS booking__ds__extract_year
+            , subq_6.booking__ds__extract_quarter AS booking__ds__extract_quarter
+            , subq_6.booking__ds__extract_month AS booking__ds__extract_month
+            , subq_6.booking__ds__extract_day AS booking__ds__extract_day
+            , subq_6.booking__ds__extract_dow AS booking__ds__extract_dow
+            , subq_6.booking__ds__extract_doy AS booking__ds__extract_doy
+            , subq_6.listing AS listing
+            , subq_6.booking__listing AS booking__listing
+            , subq_6.is_instant AS is_instant
+            , subq_6.booking__is_instant AS booking__is_instant
+            , subq_6.bookings AS bookings
+            , subq_6.instant_bookings AS instant_bookings
+            , subq_6.booking_value AS booking_value
+            , subq_6.max_booking_value AS max_booking_value
+          FROM (
+            -- Time Spine
+            SELECT
+              subq_8.ds AS metric_time__day
+            FROM ***************************.mf_time_spine subq_8
+          ) subq_7
+          INNER JOIN (
+            -- Metric Time Dimension 'ds'
+            SELECT
+              subq_5.ds__day
+              , subq_5.ds__week
+              , subq_5.ds__month
+              , subq_5.ds__quarter
+              , subq_5.ds__year
+              , subq_5.ds__extract_year
+              , subq_5.ds__extract_quarter
+              , subq_5.ds__extract_month
+              , subq_5.ds__extract_day
+              , subq_5.ds__extract_dow
+              , subq_5.ds__extract_doy
+              , subq_5.booking__ds__day
+              , subq_5.booking__ds__week
+              , subq_5.booking__ds__month
+              , subq_5.booking__ds__quarter
+              , subq_5.booking__ds__year
+              , subq_5.booking__ds__extract_year
+              , subq_5.booking__ds__extract_quarter
+              , subq_5.booking__ds__extract_month
+              , subq_5.booking__ds__extract_day
+              , subq_5.booking__ds__extract_dow
+              , subq_5.booking__ds__extract_doy
+              , subq_5.ds__day AS metric_time__day
+              , subq_5.ds__week AS metric_time__week
+              , subq_5.ds__month AS metric_time__month
+              , subq_5.ds__quarter AS metric_time__quarter
+              , subq_5.ds__year AS metric_time__year
+              , subq_5.ds__extract_year AS metric_time__extract_year
+              , subq_5.ds__extract_quarter AS metric_time__extract_quarter
+              , subq_5.ds__extract_month AS metric_time__extract_month
+              , subq_5.ds__extract_day AS metric_time__extract_day
+              , subq_5.ds__extract_dow AS metric_time__extract_dow
+              , subq_5.ds__extract_doy AS metric_time__extract_doy
+              , subq_5.listing
+              , subq_5.booking__listing
+              , subq_5.is_instant
+              , subq_5.booking__is_instant
+              , subq_5.bookings
+              , subq_5.instant_bookings
+              , subq_5.booking_value
+              , subq_5.max_booking_value
+            FROM (
+              -- Read Elements From Rollup Table 'rollup_schema.bookings_by_day' for Semantic Model 'bookings_source'
+              SELECT
+                bookings_source_src_0.bookings
+                , bookings_source_src_0.instant_bookings
+                , bookings_source_src_0.booking_value
+                , bookings_source_src_0.max_booking_value
+                , bookings_source_src_0.is_instant
+                , DATE_TRUNC('day', bookings_source_src_0.ds) AS ds__day
+                , DATE_TRUNC('week', bookings_source_src_0.ds) AS ds__week
+                , DATE_TRUNC('month', bookings_source_src_0.ds) AS ds__month
+                , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS ds__quarter
+                , DATE_TRUNC('year', bookings_source_src_0.ds) AS ds__year
+                , EXTRACT(year FROM bookings_source_src_0.ds) AS ds__extract_year
+                , EXTRACT(quarter FROM bookings_source_src_0.ds) AS ds__extract_quarter
+                , EXTRACT(month FROM bookings_source_src_0.ds) AS ds__extract_month
+                , EXTRACT(day FROM bookings_source_src_0.ds) AS ds__extract_day
+                , CASE WHEN EXTRACT(dow FROM bookings_source_src_0.ds) = 0 THEN EXTRACT(dow FROM bookings_source_src_0.ds) + 7 ELSE EXTRACT(dow FROM bookings_source_src_0.ds) END AS ds__extract_dow
+                , EXTRACT(doy FROM bookings_source_src_0.ds) AS ds__extract_doy
+                , bookings_source_src_0.is_instant AS booking__is_instant
+                , DATE_TRUNC('day', bookings_source_src_0.ds) AS booking__ds__day
+                , DATE_TRUNC('week', bookings_source_src_0.ds) AS booking__ds__week
+                , DATE_TRUNC('month', bookings_source_src_0.ds) AS booking__ds__month
+                , DATE_TRUNC('quarter', bookings_source_src_0.ds) AS booking__ds__quarter
+                , DATE_TRUNC('year', bookings_source_src_0.ds) AS booking__ds__year
+                , EXTRACT(year FROM bookings_source_src_0.ds) AS booking__ds__extract_year
+                , EXTRACT(quarter FROM bookings_source_src_0.ds) AS booking__ds__extract_quarter
+                , EXTRACT(month FROM bookings_source_src_0.ds) AS booking__ds__extract_month
+                , EXTRACT(day FROM bookings_source_src_0.ds) AS booking__ds__extract_day
+                , CASE WHEN EXTRACT(dow FROM bookings_source_src_0.ds) = 0 THEN EXTRACT(dow FROM bookings_source_src_0.ds) + 7 ELSE EXTRACT(dow FROM bookings_source_src_0.ds) END AS booking__ds__extract_dow
+                , EXTRACT(doy FROM bookings_source_src_0.ds) AS booking__ds__extract_doy
+                , bookings_source_src_0.listing
+                , bookings_source_src_0.listing AS booking__listing
+              FROM rollup_schema.bookings_by_day bookings_source_src_0
+            ) subq_5
+          ) subq_6
+          ON
+            DATEADD(day, -14, subq_7.metric_time__day) = subq_6.metric_time__day
+        ) subq_9
+      ) subq_10
+      GROUP BY
+        subq_10.metric_time__month
+    ) subq_11
+  ) subq_12
+  ON
+    subq_4.metric_time__month = subq_12.metric_time__month
+  GROUP BY
+    COALESCE(subq_4.metric_time__month, subq_12.metric_time__month)
+) subq_13
@@ -0,0 +1,44 @@
+-- Compute Metrics via Expressions
+SELECT
+  metric_time__month
+  , bookings - bookings_2_weeks_ago AS bookings_growth_2_weeks
+FROM (
+  -- Combine Aggregated Outputs
+  SELECT
+    COALESCE(subq_18.metric_time__month, subq_26.metric_time__month) AS metric_time__month
+    , MAX(subq_18.bookings) AS bookings
+    , MAX(subq_26.bookings_2_weeks_ago) AS bookings_2_weeks_ago
+  FROM (
+    -- Read Elements From Rollup Table 'rollup_schema.bookings_by_month' for Semantic Model 'bookings_source'
+    -- Metric Time Dimension 'ds'
+    -- Pass Only Elements: ['bookings', 'metric_time__month']
+    -- Aggregate Measures
+    -- Compute Metrics via Expressions
+    SELECT
+      DATE_TRUNC('month', ds) AS metric_time__month
+      , SUM(bookings) AS bookings
+    FROM rollup_schema.bookings_by_month bookings_source_src_1
+    GROUP BY
+      DATE_TRUNC('month', ds)
+  ) subq_18
+  FULL OUTER JOIN (
+    -- Join to Time Spine Dataset
+    -- Pass Only Elements: ['bookings', 'metric_time__month']
+    -- Aggregate Measures
+    -- Compute Metrics via Expressions
+    SELECT
+      DATE_TRUNC('month', subq_22.ds) AS metric_time__month
+      , SUM(bookings_source_src_0.bookings) AS bookings_2_weeks_ago
+    FROM ***************************.mf_time_spine subq_22
+    INNER JOIN
+      rollup_schema.bookings_by_day bookings_source_src_0
+    ON
+      DATEADD(day, -14, subq_22.ds) = DATE_TRUNC('day', bookings_source_src_0.ds)
+    GROUP BY
+      DATE_TRUNC('month', subq_22.ds)
+  ) subq_26
+  ON
+    subq_18.metric_time__month = subq_26.metric_time__month
+  GROUP BY
+    COALESCE(subq_18.metric_time__month, subq_26.metric_time__month)
+) subq_27
@@ -0,0 +1,92 @@
+-- Compute Metrics via Expressions
+SELECT
+  subq_4.metric_time__month
+  , subq_4.bookings
+FROM (
+  -- Aggregate Measures
+  SELECT
+    subq_3.metric_time__month
+    , SUM(subq_3.bookings) AS bookings
+  FROM (
+    -- Pass Only Elements: ['bookings', 'metric_time__month']
+    SELECT
+      subq_2.metric_time__month
+      , subq_2.bookings
+    FROM (
+      -- Constrain Time Range to [2019-12-01T00:00:00, 2020-01-31T00:00:00]
+      SELECT
+        subq_1.ds__month
+        , subq_1.ds__quarter
+        , subq_1.ds__year
+        , subq_1.ds__extract_year
+        , subq_1.ds__extract_quarter
+        , subq_1.ds__extract_month
+        , subq_1.booking__ds__month
+        , subq_1.booking__ds__quarter
+        , subq_1.booking__ds__year
+        , subq_1.booking__ds__extract_year
+        , subq_1.booking__ds__extract_quarter
+        , subq_1.booking__ds__extract_month
+        , subq_1.metric_time__month
+        , subq_1.metric_time__quarter
+        , subq_1.metric_time__year
+        , subq_1.metric_time__extract_year
+        , subq_1.metric_time__extract_quarter
+        , subq_1.metric_time__extract_month
+        , subq_1.bookings
+        , subq_1.instant_bookings
+        , subq_1.booking_value
+        , subq_1.max_booking_value
+      FROM (
+        -- Metric Time Dimension 'ds'
+        SELECT
+          subq_0.ds__month
+          , subq_0.ds__quarter
+          , subq_0.ds__year
+          , subq_0.ds__extract_year
+          , subq_0.ds__extract_quarter
+          , subq_0.ds__extract_month
+          , subq_0.booking__ds__month
+          , subq_0.booking__ds__quarter
+          , subq_0.booking__ds__year
+          , subq_0.booking__ds__extract_year
+          , subq_0.booking__ds__extract_quarter
+          , subq_0.booking__ds__extract_month
+          , subq_0.ds__month AS metric_time__month
+          , subq_0.ds__quarter AS metric_time__quarter
+          , subq_0.ds__year AS metric_time__year
+          , subq_0.ds__extract_year AS metric_time__extract_year
+          , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+          , subq_0.ds__extract_month AS metric_time__extract_month
+          , subq_0.bookings
+          , subq_0.instant_bookings
+          , subq_0.booking_value
+          , subq_0.max_booking_value
+        FROM (
+          -- Read Elements From Rollup Table 'rollup_schema.bookings_by_month' for Semantic Model 'bookings_source'
+          SELECT
+            bookings_source_src_1.bookings
+            , bookings_source_src_1.instant_bookings
+            , bookings_source_src_1.booking_value
+            , bookings_source_src_1.max_booking_value
+            , DATE_TRUNC('month', bookings_source_src_1.ds) AS ds__month
+            , DATE_TRUNC('quarter', bookings_source_src_1.ds) AS ds__quarter
+            , DATE_TRUNC('year', bookings_source_src_1.ds) AS ds__year
+            , EXTRACT(year FROM bookings_source_src_1.ds) AS ds__extract_year
+            , EXTRACT(quarter FROM bookings_source_src_1.ds) AS ds__extract_quarter
+            , EXTRACT(month FROM bookings_source_src_1.ds) AS ds__extract_month
+            , DATE_TRUNC('month', bookings_source_src_1.ds) AS booking__ds__month
+            , DATE_TRUNC('quarter', bookings_source_src_1.ds) AS booking__ds__quarter
+            , DATE_TRUNC('year', bookings_source_src_1.ds) AS booking__ds__year
+            , EXTRACT(year FROM bookings_source_src_1.ds) AS booking__ds__extract_year
+            , EXTRACT(quarter FROM bookings_source_src_1.ds) AS booking__ds__extract_quarter
+            , EXTRACT(month FROM bookings_source_src_1.ds) AS booking__ds__extract_month
+          FROM rollup_schema.bookings_by_month bookings_source_src_1
+        ) subq_0
+      ) subq_1
+      WHERE subq_1.metric_time__month BETWEEN '2019-12-01' AND '2020-01-31'
+    ) subq_2
+  ) subq_3
+  GROUP BY
+    subq_3.metric_time__month
+) subq_4
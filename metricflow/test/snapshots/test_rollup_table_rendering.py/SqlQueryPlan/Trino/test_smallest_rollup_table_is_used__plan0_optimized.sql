@@ -0,0 +1,13 @@
+-- Read Elements From Rollup Table 'rollup_schema.bookings_by_month' for Semantic Model 'bookings_source'
+-- Metric Time Dimension 'ds'
+-- Constrain Time Range to [2019-12-01T00:00:00, 2020-01-31T00:00:00]
+-- Pass Only Elements: ['bookings', 'metric_time__month']
+-- Aggregate Measures
+-- Compute Metrics via Expressions
+SELECT
+  DATE_TRUNC('month', ds) AS metric_time__month
+  , SUM(bookings) AS bookings
+FROM rollup_schema.bookings_by_month bookings_source_src_1
+WHERE DATE_TRUNC('month', ds) BETWEEN timestamp '2019-12-01' AND timestamp '2020-01-31'
+GROUP BY
+  DATE_TRUNC('month', ds)
@@ -4,7 +4,12 @@ import pytest
 from _pytest.fixtures import FixtureRequest
 
 from metricflow.dataflow.sql_table import SqlTable
-from metricflow.sql.optimizer.rewriting_sub_query_reducer import SqlRewritingSubQueryReducer
+from metricflow.sql.optimizer.column_pruner import SqlColumnPrunerOptimizer
+from metricflow.sql.optimizer.rewriting_sub_query_reducer import (
+    SqlColumnPruningSubQueryReducer,
+    SqlRewritingSubQueryReducer,
+)
+from metricflow.sql.render.sql_plan_renderer import DefaultSqlQueryPlanRenderer
 from metricflow.sql.sql_exprs import (
     SqlAggregateFunctionExpression,
     SqlColumnReference,
@@ -19,6 +24,7 @@ from metricflow.sql.sql_plan import (
     SqlJoinDescription,
     SqlJoinType,
     SqlOrderByDescription,
+    SqlQueryPlan,
     SqlSelectColumn,
     SqlSelectStatementNode,
     SqlTableFromClauseNode,
@@ -1118,3 +1124,29 @@ def test_rewriting_distinct_select_node_is_not_reduced(
         sql_plan_node=sub_query_reducer.optimize(select_node),
         plan_id="after_reducing",
     )
+
+
+@pytest.mark.parametrize(
+    "select_statement_fixture_name",
+    (
+        "base_select_statement",
+        "join_select_statement",
+        "colliding_select_statement",
+        "reduce_all_join_select_statement",
+        "reducing_join_statement",
+    ),
+)
+def test_pruning_and_reducing_in_one_pass(request: FixtureRequest, select_statement_fixture_name: str) -> None:
+    """Checks that the fused optimizer produces the same SQL as running the pruner and then the reducer."""
+    select_statement: SqlSelectStatementNode = request.getfixturevalue(select_statement_fixture_name)
+    renderer = DefaultSqlQueryPlanRenderer()
+
+    sequentially_optimized = SqlRewritingSubQueryReducer().optimize(
+        SqlColumnPrunerOptimizer().optimize(select_statement)
+    )
+    optimized_in_one_pass = SqlColumnPruningSubQueryReducer().optimize(select_statement)
+
+    assert (
+        renderer.render_sql_query_plan(SqlQueryPlan(plan_id="plan0", render_node=optimized_in_one_pass)).sql
+        == renderer.render_sql_query_plan(SqlQueryPlan(plan_id="plan0", render_node=sequentially_optimized)).sql
+    )
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+from metricflow.sql.dry_run_batching import dry_run_in_batches, render_dry_run_probe
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+
+
+class _RecordingDryRun:
+    """Records the statements that are dry run, and fails the ones that contain "bad"."""
+
+    def __init__(self) -> None:  # noqa: D
+        self.statements: List[str] = []
+
+    def __call__(self, stmt: str, sql_bind_parameters: SqlBindParameters) -> None:  # noqa: D
+        self.statements.append(stmt)
+        if "bad" in stmt:
+            raise ValueError(f"Bad statement: {stmt}")
+
+
+def test_render_dry_run_probe() -> None:  # noqa: D
+    assert render_dry_run_probe(["SELECT 1 AS foo;", "SELECT 2 AS bar -- comment"]) == (
+        "SELECT 1 AS mf_dry_run_probe FROM (\nSELECT 1 AS foo\n) mf_dry_run_probe_0\nWHERE 1 = 0\n"
+        "UNION ALL\n"
+        "SELECT 1 AS mf_dry_run_probe FROM (\nSELECT 2 AS bar -- comment\n) mf_dry_run_probe_1\nWHERE 1 = 0"
+    )
+
+
+def test_successful_batch() -> None:
+    """Checks that valid statements are dry run in a single call per batch."""
+    dry_run = _RecordingDryRun()
+    exceptions = dry_run_in_batches(dry_run, [(f"SELECT {i}", SqlBindParameters()) for i in range(5)], max_batch_size=3)
+
+    assert exceptions == (None,) * 5
+    assert len(dry_run.statements) == 2
+
+
+def test_failures_located() -> None:
+    """Checks that failing statements in a batch are found and dry run individually."""
+    dry_run = _RecordingDryRun()
+    statements = [(f"SELECT {i}", SqlBindParameters()) for i in range(8)]
+    statements[5] = ("SELECT bad", SqlBindParameters())
+    exceptions = dry_run_in_batches(dry_run, statements)
+
+    assert [i for i, exception in enumerate(exceptions) if exception is not None] == [5]
+    assert str(exceptions[5]) == "Bad statement: SELECT bad"
+    # 1 for the whole batch, and 2 for each level of splitting the failing half.
+    assert len(dry_run.statements) == 7
+
+
+def test_conflicting_bind_parameters_in_separate_batches() -> None:  # noqa: D
+    dry_run = _RecordingDryRun()
+    exceptions = dry_run_in_batches(
+        dry_run,
+        [
+            ("SELECT :key", SqlBindParameters.create_from_dict({"key": 1})),
+            ("SELECT :key", SqlBindParameters.create_from_dict({"key": 2})),
+        ],
+    )
+    assert exceptions == (None, None)
+    assert dry_run.statements == ["SELECT :key", "SELECT :key"]
+
+
+def test_invalid_batch_size() -> None:  # noqa: D
+    with pytest.raises(ValueError):
+        dry_run_in_batches(_RecordingDryRun(), [], max_batch_size=0)
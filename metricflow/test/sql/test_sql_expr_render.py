@@ -27,6 +27,7 @@ from metricflow.sql.sql_exprs import (
     SqlRatioComputationExpression,
     SqlStringExpression,
     SqlStringLiteralExpression,
+    SqlWindowFrame,
     SqlWindowFunction,
     SqlWindowFunctionExpression,
     SqlWindowOrderByArgument,
@@ -188,6 +189,13 @@ def test_is_null_expr(default_expr_renderer: DefaultSqlExpressionRenderer) -> No
     assert actual == "foo IS NULL"
 
 
+def test_is_not_null_expr(default_expr_renderer: DefaultSqlExpressionRenderer) -> None:  # noqa: D
+    actual = default_expr_renderer.render_sql_expr(
+        SqlIsNullExpression(SqlStringExpression("foo", requires_parenthesis=False), negated=True)
+    ).sql
+    assert actual == "foo IS NOT NULL"
+
+
 def test_date_trunc_expr(default_expr_renderer: DefaultSqlExpressionRenderer) -> None:  # noqa: D
     actual = default_expr_renderer.render_sql_expr(
         SqlDateTruncExpression(time_granularity=TimeGranularity.MONTH, arg=SqlStringExpression("ds"))
@@ -279,3 +287,15 @@ def test_window_function_expr(default_expr_renderer: DefaultSqlExpressionRendere
         actual
         == "first_value(a.col0) OVER (PARTITION BY b.col0, b.col1 ORDER BY a.col0 DESC NULLS FIRST, b.col0 ASC NULLS LAST ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING)"
     )
+
+
+def test_window_function_expr_with_frame(default_expr_renderer: DefaultSqlExpressionRenderer) -> None:  # noqa: D
+    actual = default_expr_renderer.render_sql_expr(
+        SqlWindowFunctionExpression(
+            sql_function=SqlWindowFunction.SUM,
+            sql_function_args=[SqlColumnReferenceExpression(SqlColumnReference("a", "col0"))],
+            order_by_args=[SqlWindowOrderByArgument(expr=SqlColumnReferenceExpression(SqlColumnReference("a", "ds")))],
+            frame=SqlWindowFrame(preceding_rows=6, following_rows=0),
+        )
+    ).sql
+    assert actual == "sum(a.col0) OVER (ORDER BY a.ds ROWS BETWEEN 6 PRECEDING AND CURRENT ROW)"
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import datetime
+
+import pytest
+
+from metricflow.errors.errors import SqlBindParametersNotSupportedError
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql.sql_parameterization import (
+    canonicalize_generated_bind_parameter_keys,
+    substitute_bind_parameters,
+)
+
+
+def _render_key(key: str) -> str:
+    return f":{key}"
+
+
+def test_substitute_bind_parameters() -> None:  # noqa: D
+    bind_parameters = SqlBindParameters.create_from_dict(
+        {
+            "str_param": "it's",
+            "int_param": 3,
+            "bool_param": True,
+            "ts_param": datetime.datetime(2020, 1, 2, 3, 4, 5),
+            "date_param": datetime.date(2020, 1, 2),
+        }
+    )
+    sql = (
+        "SELECT a::VARCHAR FROM t "
+        "WHERE s = :str_param AND i > :int_param AND b = :bool_param AND ts >= :ts_param AND d < :date_param"
+    )
+    assert substitute_bind_parameters(sql, bind_parameters) == (
+        "SELECT a::VARCHAR FROM t "
+        "WHERE s = 'it''s' AND i > 3 AND b = TRUE AND ts >= CAST('2020-01-02 03:04:05' AS TIMESTAMP) "
+        "AND d < CAST('2020-01-02' AS DATE)"
+    )
+
+
+def test_substitution_only_in_code() -> None:
+    """Checks that placeholders in string literals, quoted identifiers, and comments are left as they are."""
+    bind_parameters = SqlBindParameters.create_from_dict({"key": "value"})
+    sql = "-- :key\nSELECT ':key' AS \":key\" /* :key */ FROM t WHERE a = :key"
+    assert substitute_bind_parameters(sql, bind_parameters) == (
+        "-- :key\nSELECT ':key' AS \":key\" /* :key */ FROM t WHERE a = 'value'"
+    )
+
+
+def test_substitution_escapes_backslashes() -> None:  # noqa: D
+    bind_parameters = SqlBindParameters.create_from_dict({"key": "a\\' OR 1=1 --"})
+    assert substitute_bind_parameters("a = :key", bind_parameters) == "a = 'a\\'' OR 1=1 --'"
+    assert substitute_bind_parameters("a = :key", bind_parameters, backslash_escapes=True) == (
+        "a = 'a\\\\\\' OR 1=1 --'"
+    )
+
+
+def test_substitution_errors() -> None:  # noqa: D
+    with pytest.raises(SqlBindParametersNotSupportedError):
+        substitute_bind_parameters("a = 1", SqlBindParameters.create_from_dict({"key": 1}))
+    with pytest.raises(SqlBindParametersNotSupportedError):
+        substitute_bind_parameters("a = :key", SqlBindParameters.create_from_dict({"key": float("nan")}))
+
+
+def test_canonicalize_generated_bind_parameter_keys() -> None:  # noqa: D
+    sql, bind_parameters = canonicalize_generated_bind_parameter_keys(
+        sql="a = :mf_param_12 AND b = :mf_param_3 AND c = :other AND d = ':mf_param_3'",
+        bind_parameters=SqlBindParameters.create_from_dict({"mf_param_3": "x", "mf_param_12": "y", "other": 1}),
+        bind_parameter_key_renderer=_render_key,
+    )
+    assert sql == "a = :mf_param_0 AND b = :mf_param_1 AND c = :other AND d = ':mf_param_3'"
+    assert bind_parameters == SqlBindParameters.create_from_dict({"mf_param_1": "x", "mf_param_0": "y", "other": 1})
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import logging
-from typing import List
+from typing import List, Type
 
 import pytest
 from _pytest.fixtures import FixtureRequest
 
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.protocols.sql_client import SqlClient
+from metricflow.sql.render.big_query import BigQuerySqlQueryPlanRenderer
+from metricflow.sql.render.databricks import DatabricksSqlQueryPlanRenderer
+from metricflow.sql.render.duckdb_renderer import DuckDbSqlQueryPlanRenderer
+from metricflow.sql.render.postgres import PostgresSQLSqlQueryPlanRenderer
+from metricflow.sql.render.redshift import RedshiftSqlQueryPlanRenderer
+from metricflow.sql.render.snowflake import SnowflakeSqlQueryPlanRenderer
+from metricflow.sql.render.sql_plan_renderer import (
+    DefaultSqlQueryPlanRenderer,
+    SqlPlanRenderResult,
+    SqlQueryPlanRenderer,
+)
+from metricflow.sql.render.trino import TrinoSqlQueryPlanRenderer
 from metricflow.sql.sql_exprs import (
     SqlAggregateFunctionExpression,
     SqlColumnReference,
@@ -16,11 +28,14 @@ from metricflow.sql.sql_exprs import (
     SqlComparisonExpression,
     SqlFunction,
     SqlStringExpression,
+    SqlWindowFunction,
+    SqlWindowFunctionExpression,
 )
 from metricflow.sql.sql_plan import (
     SqlJoinDescription,
     SqlJoinType,
     SqlOrderByDescription,
+    SqlQueryPlan,
     SqlSelectColumn,
     SqlSelectStatementNode,
     SqlTableFromClauseNode,
@@ -339,3 +354,223 @@ def test_render_limit(  # noqa: D
         plan_id="plan0",
         sql_client=sql_client,
     )
+
+
+@pytest.mark.parametrize(
+    "sql_plan_renderer_class",
+    (
+        DefaultSqlQueryPlanRenderer,
+        BigQuerySqlQueryPlanRenderer,
+        DatabricksSqlQueryPlanRenderer,
+        DuckDbSqlQueryPlanRenderer,
+        PostgresSQLSqlQueryPlanRenderer,
+        RedshiftSqlQueryPlanRenderer,
+        SnowflakeSqlQueryPlanRenderer,
+        TrinoSqlQueryPlanRenderer,
+    ),
+)
+def test_render_shared_sub_queries_as_ctes(sql_plan_renderer_class: Type[SqlQueryPlanRenderer]) -> None:
+    """Checks that a sub-query that's read from twice is rendered once in a WITH clause."""
+
+    def _create_bookings_sub_query() -> SqlSelectStatementNode:
+        return SqlSelectStatementNode(
+            description="bookings",
+            select_columns=(
+                SqlSelectColumn(
+                    expr=SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="c", column_name="ds")),
+                    column_alias="ds",
+                ),
+            ),
+            from_source=SqlTableFromClauseNode(sql_table=SqlTable(schema_name="demo", table_name="fct_bookings")),
+            from_source_alias="c",
+            joins_descs=(),
+            group_bys=(),
+            order_bys=(),
+        )
+
+    shared_sub_query = _create_bookings_sub_query()
+    select_node = SqlSelectStatementNode(
+        description="test0",
+        select_columns=(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="a", column_name="ds")),
+                column_alias="ds",
+            ),
+        ),
+        from_source=shared_sub_query,
+        from_source_alias="a",
+        joins_descs=(
+            SqlJoinDescription(
+                right_source=shared_sub_query,
+                right_source_alias="b",
+                on_condition=SqlComparisonExpression(
+                    left_expr=SqlColumnReferenceExpression(
+                        col_ref=SqlColumnReference(table_alias="a", column_name="ds")
+                    ),
+                    comparison=SqlComparison.EQUALS,
+                    right_expr=SqlColumnReferenceExpression(
+                        col_ref=SqlColumnReference(table_alias="b", column_name="ds")
+                    ),
+                ),
+                join_type=SqlJoinType.LEFT_OUTER,
+            ),
+            # A different node that renders to the same SQL is read from the CTE as well.
+            SqlJoinDescription(
+                right_source=_create_bookings_sub_query(),
+                right_source_alias="d",
+                join_type=SqlJoinType.CROSS_JOIN,
+            ),
+        ),
+        group_bys=(),
+        order_bys=(),
+    )
+    sql_query_plan = SqlQueryPlan(plan_id="plan0", render_node=select_node)
+
+    rendered_sql = (
+        sql_plan_renderer_class(render_shared_sub_queries_as_ctes=True).render_sql_query_plan(sql_query_plan).sql
+    )
+    assert rendered_sql.startswith("WITH shared_subq_0 AS (\n  -- bookings\n")
+    assert rendered_sql.count("demo.fct_bookings") == 1
+    assert "FROM shared_subq_0 a" in rendered_sql
+    assert "shared_subq_0 b" in rendered_sql
+    assert "shared_subq_0 d" in rendered_sql
+
+    rendered_sql = sql_plan_renderer_class().render_sql_query_plan(sql_query_plan).sql
+    assert "WITH" not in rendered_sql
+    assert rendered_sql.count("demo.fct_bookings") == 3
+
+
+@pytest.mark.parametrize(
+    "sql_plan_renderer_class",
+    (
+        DefaultSqlQueryPlanRenderer,
+        BigQuerySqlQueryPlanRenderer,
+        DatabricksSqlQueryPlanRenderer,
+        DuckDbSqlQueryPlanRenderer,
+        PostgresSQLSqlQueryPlanRenderer,
+        RedshiftSqlQueryPlanRenderer,
+        SnowflakeSqlQueryPlanRenderer,
+        TrinoSqlQueryPlanRenderer,
+    ),
+)
+def test_render_qualify(sql_plan_renderer_class: Type[SqlQueryPlanRenderer]) -> None:
+    """Checks that a QUALIFY is rendered as a sub-query for engines that don't support it."""
+    ds_column_expr = SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="a", column_name="ds"))
+    select_node = SqlSelectStatementNode(
+        description="test0",
+        select_columns=(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="a", column_name="user")),
+                column_alias="user",
+            ),
+            SqlSelectColumn(expr=ds_column_expr, column_alias="ds"),
+        ),
+        from_source=SqlTableFromClauseNode(sql_table=SqlTable(schema_name="demo", table_name="fct_accounts")),
+        from_source_alias="a",
+        joins_descs=(),
+        group_bys=(),
+        order_bys=(),
+        qualify=SqlComparisonExpression(
+            left_expr=ds_column_expr,
+            comparison=SqlComparison.EQUALS,
+            right_expr=SqlWindowFunctionExpression(
+                sql_function=SqlWindowFunction.MAX,
+                sql_function_args=[ds_column_expr],
+                partition_by_args=[
+                    SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="a", column_name="user"))
+                ],
+            ),
+        ),
+    )
+    sql_plan_renderer = sql_plan_renderer_class()
+
+    rendered_sql = sql_plan_renderer.render_sql_query_plan(SqlQueryPlan(plan_id="plan0", render_node=select_node)).sql
+    window_condition_sql = "a.ds = max(a.ds) OVER (PARTITION BY a.user)"
+    if sql_plan_renderer.supports_qualify:
+        assert rendered_sql.endswith(f"FROM demo.fct_accounts a\nQUALIFY {window_condition_sql}")
+    else:
+        assert "QUALIFY" not in rendered_sql
+        assert f", {window_condition_sql} AS qualify_condition\n" in rendered_sql
+        assert rendered_sql.endswith("WHERE qualify_subq.qualify_condition")
+
+
+def test_render_qualify_with_order_by_and_limit() -> None:
+    """Checks that the ORDER BY and LIMIT are moved to the outer query when QUALIFY is rendered as a sub-query."""
+    ds_column_expr = SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="a", column_name="ds"))
+    user_column_expr = SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="a", column_name="user"))
+    select_node = SqlSelectStatementNode(
+        description="test0",
+        select_columns=(SqlSelectColumn(expr=user_column_expr, column_alias="user"),),
+        from_source=SqlTableFromClauseNode(sql_table=SqlTable(schema_name="demo", table_name="fct_accounts")),
+        from_source_alias="a",
+        joins_descs=(),
+        group_bys=(),
+        order_bys=(
+            SqlOrderByDescription(expr=user_column_expr, desc=False),
+            SqlOrderByDescription(expr=ds_column_expr, desc=True),
+        ),
+        qualify=SqlComparisonExpression(
+            left_expr=ds_column_expr,
+            comparison=SqlComparison.EQUALS,
+            right_expr=SqlWindowFunctionExpression(
+                sql_function=SqlWindowFunction.MAX,
+                sql_function_args=[ds_column_expr],
+                partition_by_args=[user_column_expr],
+            ),
+        ),
+        limit=1,
+    )
+
+    rendered_sql = (
+        PostgresSQLSqlQueryPlanRenderer()
+        .render_sql_query_plan(SqlQueryPlan(plan_id="plan0", render_node=select_node))
+        .sql
+    )
+    assert "QUALIFY" not in rendered_sql
+    assert ", a.ds AS qualify_order_by_0\n" in rendered_sql
+    assert rendered_sql.endswith(
+        "WHERE qualify_subq.qualify_condition\nORDER BY qualify_subq.user, qualify_subq.qualify_order_by_0 DESC\nLIMIT 1"
+    )
+
+
+def test_render_shared_sub_queries_renders_each_sub_query_once() -> None:
+    """Checks that finding the shared sub-queries doesn't render nested sub-queries again for each enclosing query."""
+    select_statement_render_count = 0
+
+    class _CountingSqlQueryPlanRenderer(DefaultSqlQueryPlanRenderer):
+        def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlPlanRenderResult:
+            nonlocal select_statement_render_count
+            select_statement_render_count += 1
+            return super().visit_select_statement_node(node)
+
+    select_node = SqlSelectStatementNode(
+        description="test0",
+        select_columns=(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="a", column_name="ds")),
+                column_alias="ds",
+            ),
+        ),
+        from_source=SqlTableFromClauseNode(sql_table=SqlTable(schema_name="demo", table_name="fct_bookings")),
+        from_source_alias="a",
+        joins_descs=(),
+        group_bys=(),
+        order_bys=(),
+    )
+    nesting_depth = 20
+    for _ in range(nesting_depth):
+        select_node = SqlSelectStatementNode(
+            description="test0",
+            select_columns=select_node.select_columns,
+            from_source=select_node,
+            from_source_alias="a",
+            joins_descs=(),
+            group_bys=(),
+            order_bys=(),
+        )
+
+    _CountingSqlQueryPlanRenderer(render_shared_sub_queries_as_ctes=True).render_sql_query_plan(
+        SqlQueryPlan(plan_id="plan0", render_node=select_node)
+    )
+    # Each sub-query is rendered once to find the shared ones, and once more for the query.
+    assert select_statement_render_count == 2 * nesting_depth + 1
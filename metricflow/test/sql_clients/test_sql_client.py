@@ -81,6 +81,44 @@ def test_percent_signs_in_query(sql_client: SqlClient) -> None:
     _check_1col(df, col="foo", vals={"abba"})
 
 
+def test_query_batches(
+    mf_test_session_state: MetricFlowTestSessionState, ddl_sql_client: SqlClientWithDDLMethods
+) -> None:
+    """Checks that the batches contain all rows of the result, with no batch larger than the batch size."""
+    expected_df = pd.DataFrame(columns=["int_col"], data=[(i,) for i in range(5)])
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_system_schema, table_name=_random_table())
+    ddl_sql_client.create_table_from_dataframe(sql_table=sql_table, df=expected_df)
+
+    batches = list(ddl_sql_client.query_batches(f"SELECT int_col FROM {sql_table.sql}", batch_size=2))
+    assert [batch.shape[0] for batch in batches] == [2, 2, 1]
+    assert_dataframes_equal(
+        actual=pd.concat(batches, ignore_index=True),
+        expected=expected_df,
+        compare_names_using_lowercase=ddl_sql_client.sql_engine_type is SqlEngine.SNOWFLAKE,
+    )
+
+    empty_batches = list(ddl_sql_client.query_batches(f"SELECT int_col FROM {sql_table.sql} WHERE 1 = 0", batch_size=2))
+    assert len(empty_batches) == 1
+    assert empty_batches[0].shape == (0, 1)
+
+
+def test_query_arrow(
+    mf_test_session_state: MetricFlowTestSessionState, ddl_sql_client: SqlClientWithDDLMethods
+) -> None:
+    """Checks that the Arrow table contains the same data as the dataframe returned by query()."""
+    expected_df = pd.DataFrame(columns=["int_col", "str_col"], data=[(i, f"value_{i}") for i in range(5)])
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_system_schema, table_name=_random_table())
+    ddl_sql_client.create_table_from_dataframe(sql_table=sql_table, df=expected_df)
+
+    arrow_table = ddl_sql_client.query_arrow(f"SELECT int_col, str_col FROM {sql_table.sql} ORDER BY int_col")
+    assert arrow_table.num_rows == 5
+    assert_dataframes_equal(
+        actual=arrow_table.to_pandas(),
+        expected=expected_df,
+        compare_names_using_lowercase=ddl_sql_client.sql_engine_type is SqlEngine.SNOWFLAKE,
+    )
+
+
 @pytest.fixture()
 def example_df() -> pd.DataFrame:
     """Data frame containing data of different types for testing. DateTime would be good to add."""
@@ -120,6 +158,65 @@ def test_dry_run_of_bad_query_raises_exception(sql_client: SqlClient) -> None:
         sql_client.dry_run(bad_stmt)
 
 
+def test_dry_run_many(sql_client: SqlClient) -> None:  # noqa: D
+    statements = [
+        ("SELECT 1 AS foo", SqlBindParameters()),
+        ("SELECT bad_col", SqlBindParameters()),
+        ("SELECT 'bar' AS bar -- comment", SqlBindParameters()),
+        ("SELECT other_bad_col", SqlBindParameters()),
+    ]
+    exceptions = sql_client.dry_run_many(statements)
+    assert len(exceptions) == len(statements)
+    assert exceptions[0] is None and exceptions[2] is None
+    assert "bad_col" in str(exceptions[1]).lower()
+    assert "other_bad_col" in str(exceptions[3]).lower()
+
+
+def test_table_exists(mf_test_session_state: MetricFlowTestSessionState, sql_client: SqlClient) -> None:  # noqa: D
+    test_table = SqlTable(schema_name=mf_test_session_state.mf_system_schema, table_name=_random_table())
+    assert not sql_client.table_exists(test_table)
+    sql_client.execute(f"CREATE TABLE {test_table.sql} AS SELECT 1 AS foo")
+    try:
+        assert sql_client.table_exists(test_table)
+    finally:
+        sql_client.execute(f"DROP TABLE IF EXISTS {test_table.sql}")
+
+
+def test_execute_in_transaction(  # noqa: D
+    mf_test_session_state: MetricFlowTestSessionState, sql_client: SqlClient
+) -> None:
+    if not sql_client.sql_engine_type.supports_transactions:
+        with pytest.raises(NotImplementedError):
+            sql_client.execute_in_transaction(())
+        return
+
+    test_table = SqlTable(schema_name=mf_test_session_state.mf_system_schema, table_name=_random_table())
+    sql_client.execute(f"CREATE TABLE {test_table.sql} AS SELECT 1 AS y")
+    try:
+        # The DELETE is rolled back as the INSERT fails.
+        with pytest.raises(Exception):
+            sql_client.execute_in_transaction(
+                (
+                    (f"DELETE FROM {test_table.sql}", SqlBindParameters()),
+                    (f"INSERT INTO {test_table.sql} (y) SELECT bad_col", SqlBindParameters()),
+                )
+            )
+        _check_1col(sql_client.query(f"SELECT y FROM {test_table.sql}"))
+
+        sql_client.execute_in_transaction(
+            (
+                (f"DELETE FROM {test_table.sql}", SqlBindParameters()),
+                (
+                    f"INSERT INTO {test_table.sql} (y) SELECT {sql_client.render_bind_parameter_key('y')}",
+                    SqlBindParameters.create_from_dict({"y": 2}),
+                ),
+            )
+        )
+        _check_1col(sql_client.query(f"SELECT y FROM {test_table.sql}"), vals={2})
+    finally:
+        sql_client.execute(f"DROP TABLE IF EXISTS {test_table.sql}")
+
+
 def test_update_params_with_same_item() -> None:  # noqa: D
     bind_params0 = SqlBindParameters.create_from_dict({"key": "value"})
     bind_params1 = SqlBindParameters.create_from_dict({"key": "value"})
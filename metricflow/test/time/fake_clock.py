@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+
+class FakeClock:
+    """A replacement for time.time() that returns a time that only changes when advanced by the test.
+
+    This is for classes that take a time_function, like ResultCache and QueryPlanCache. For classes that use a
+    TimeSource, see ConfigurableTimeSource.
+    """
+
+    def __init__(self) -> None:  # noqa: D
+        self.current_time = 0.0
+
+    def __call__(self) -> float:  # noqa: D
+        return self.current_time